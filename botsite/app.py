@@ -34,16 +34,31 @@ block in ``base.html``.
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
 import os
 import sys
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    JSONResponse,
+    RedirectResponse,
+    Response,
+)
 from fastapi.templating import Jinja2Templates
 
+try:  # optional: a brotli variant of data.js when the package is installed
+    import brotli
+except ImportError:  # pragma: no cover - depends on the deploy image
+    brotli = None
+
 BASE_DIR = Path(__file__).resolve().parent
 # The Claude-Design SPA lives here (NOT a static/ dir — that name is gitignored, the
 # #970 deploy-crash gotcha). index.html/app.js/app.css are copied verbatim from the
@@ -88,6 +103,124 @@ templates = Jinja2Templates(
 )
 
 
+# ---------------------------------------------------------------------------
+# /data.js — rendered once per site.json version, not per request
+#
+# Rendering window.SBDATA (load ~410 KB site.json → build_prototype_data →
+# render_data_js) used to run on every request. It now runs at import (service
+# start) and again only when site.json's (mtime, size) changes; each render is
+# stored with precompressed gzip (+ brotli, when installed) variants and a
+# content hash. The SPA shells reference the hashed URL /data.<hash>.js, which
+# is served ``immutable``; /data.js stays for bookmarks and the static fallback,
+# revalidated by ETag.
+# ---------------------------------------------------------------------------
+
+_IMMUTABLE = "public, max-age=31536000, immutable"
+_JS_MEDIA = "application/javascript; charset=utf-8"
+
+
+@dataclass(frozen=True)
+class RenderedDataJs:
+    """One rendered ``data.js``: identity bytes, precompressed variants, hash."""
+
+    body: bytes
+    gzip: bytes
+    br: bytes | None
+    digest: str  # first 16 hex chars of the body's sha256
+
+    @property
+    def url(self) -> str:
+        return f"/data.{self.digest}.js"
+
+
+_data_js_lock = threading.Lock()
+_data_js_state: dict[str, Any] = {"key": None, "asset": None}
+
+
+def _site_json_key() -> tuple[int, int] | None:
+    try:
+        stat = data_loader.DATA_FILE.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def current_data_js() -> RenderedDataJs:
+    """The rendered ``data.js`` for the current ``site.json`` (rebuilt on change)."""
+    key = _site_json_key()
+    with _data_js_lock:
+        asset = _data_js_state["asset"]
+        if asset is not None and _data_js_state["key"] == key:
+            return asset
+        body = site_data.render_from_site(data_loader.load_site_data()).encode("utf-8")
+        asset = RenderedDataJs(
+            body=body,
+            gzip=gzip.compress(body, compresslevel=9, mtime=0),
+            br=brotli.compress(body, quality=11) if brotli is not None else None,
+            digest=hashlib.sha256(body).hexdigest()[:16],
+        )
+        _data_js_state.update(key=key, asset=asset)
+        return asset
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """Codings named in ``Accept-Encoding`` without an explicit ``q=0``."""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding and params.replace(" ", "") not in ("q=0", "q=0.0"):
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _serve_data_js(
+    request: Request, asset: RenderedDataJs, cache_control: str
+) -> Response:
+    """Serve ``asset`` with a strong per-encoding ETag, 304s and a precompressed body."""
+    accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+    if asset.br is not None and "br" in accepted:
+        coding, body = "br", asset.br
+    elif "gzip" in accepted:
+        coding, body = "gzip", asset.gzip
+    else:
+        coding, body = "", asset.body
+    etag = f'"{asset.digest}-{coding}"' if coding else f'"{asset.digest}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if any(
+        tag.strip().removeprefix("W/").strip('"').split("-", 1)[0]
+        in (asset.digest, "*")
+        for tag in if_none_match.split(",")
+        if tag.strip()
+    ):
+        return Response(status_code=304, headers=headers)
+    if coding:
+        headers["Content-Encoding"] = coding
+    return Response(content=body, media_type=_JS_MEDIA, headers=headers)
+
+
+def _spa_shell(path: Path) -> HTMLResponse:
+    """An SPA ``index.html`` with its ``data.js`` tag pointed at the hashed URL.
+
+    The shells are verbatim design assets, so the reference is rewritten on the
+    way out rather than in the file. ``no-cache`` keeps the shell itself fresh, so
+    a new deploy's hash is picked up on the next visit.
+    """
+    html = path.read_text(encoding="utf-8")
+    url = current_data_js().url
+    for ref in ('src="/data.js"', 'src="data.js"'):
+        html = html.replace(ref, f'src="{url}"')
+    return HTMLResponse(html, headers={"Cache-Control": "no-cache"})
+
+
+# Build once at service start so the first visitor does not pay the render.
+current_data_js()
+
+
 def _render(request: Request, template: str, page: str, **extra: Any) -> HTMLResponse:
     """Render ``template`` with the shared data payload + page marker.
 
@@ -114,7 +247,7 @@ def healthz() -> dict[str, str]:
 
 
 @app.get("/", response_class=HTMLResponse)
-def index() -> FileResponse:
+def index() -> HTMLResponse:
     """Serve the public site front-end (v1 by default; v2 behind the env flip).
 
     Both front-ends are hash-routed SPAs rendering client-side from
@@ -123,10 +256,11 @@ def index() -> FileResponse:
     flips ``/`` to the v2 shell (which references its assets absolutely, so it
     serves identically from ``/`` and ``/v2``). v1 keeps working at its asset
     routes either way — the flip is one env var, and the rollback is unsetting it.
+    Either shell loads its data from the content-hashed ``/data.<hash>.js``.
     """
     if FRONTEND == "v2":
-        return FileResponse(V2_DIR / "index.html", media_type="text/html")
-    return FileResponse(SITE_DIR / "index.html", media_type="text/html")
+        return _spa_shell(V2_DIR / "index.html")
+    return _spa_shell(SITE_DIR / "index.html")
 
 
 @app.get("/app.js")
@@ -142,21 +276,30 @@ def spa_css() -> FileResponse:
 
 
 @app.get("/data.js")
-def spa_data() -> Response:
-    """The SPA data layer — generated **live** from the current ``site.json``.
+def spa_data(request: Request) -> Response:
+    """The SPA data layer — ``window.SBDATA`` for the current ``site.json``.
+
+    This is the dynamic seam (owner goal: "all data should dynamically load"): the
+    body always reflects the latest committed ``site.json`` via ``site_data``,
+    rendered once per version (see :func:`current_data_js`). The committed
+    ``botsite/site/data.js`` is the static fallback for opening the prototype as a
+    bare file; in the running service this route wins. ``no-cache`` + ETag: the
+    browser keeps a copy but revalidates it (a 304 while site.json is unchanged).
+    """
+    return _serve_data_js(request, current_data_js(), "no-cache")
+
+
+@app.get("/data.{digest}.js")
+def spa_data_hashed(request: Request, digest: str) -> Response:
+    """The content-addressed ``data.js`` the SPA shells reference — cached immutably.
 
-    This is the dynamic seam (owner goal: "all data should dynamically load"): each
-    request renders ``window.SBDATA`` from the latest committed ``site.json`` via
-    ``site_data``. The committed ``botsite/site/data.js`` is the static fallback for
-    opening the prototype as a bare file; in the running service this route wins.
+    A stale hash (a shell cached from before a redeploy) redirects to ``/data.js``
+    rather than serving different bytes under the old, immutable URL.
     """
-    js = site_data.render_from_site(data_loader.load_site_data())
-    # No long cache: the data tracks each deploy's site.json.
-    return Response(
-        content=js,
-        media_type="application/javascript",
-        headers={"Cache-Control": "no-cache"},
-    )
+    asset = current_data_js()
+    if digest != asset.digest:
+        return RedirectResponse("/data.js", status_code=307)
+    return _serve_data_js(request, asset, _IMMUTABLE)
 
 
 @app.get("/site-data.json")
@@ -219,9 +362,9 @@ _CONSOLE_ASSETS = {
 
 @app.get("/v2", response_class=HTMLResponse)
 @app.get("/v2/", response_class=HTMLResponse)
-def site_v2() -> FileResponse:
+def site_v2() -> HTMLResponse:
     """The v2 front-end shell (always reachable; `/` flips via BOTSITE_FRONTEND)."""
-    return FileResponse(V2_DIR / "index.html", media_type="text/html")
+    return _spa_shell(V2_DIR / "index.html")
 
 
 @app.get("/v2/{asset}")
@@ -231,6 +374,8 @@ def v2_asset(asset: str) -> Response:
     if entry is None:
         return Response(status_code=404)
     path, media = entry
+    if asset == "index.html":
+        return _spa_shell(path)
     return FileResponse(path, media_type=media)
 
 
@@ -4437,6 +4437,19 @@ const COMMANDS = [
     "examples": [],
     "planned": []
   },
+  {
+    "name": "queries",
+    "area": "other",
+    "status": "finished",
+    "summary": "Top query fingerprints by DB time, or one fingerprint's plan by id.",
+    "description": "Top query fingerprints by DB time, or one fingerprint's plan by id.",
+    "usage": "!queries",
+    "aliases": [],
+    "permissions": "anyone",
+    "cooldown": null,
+    "examples": [],
+    "planned": []
+  },
   {
     "name": "query_logs",
     "area": "admin",
@@ -7136,6 +7149,36 @@ const COMMANDS = [
       }
     ]
   },
+  {
+    "name": "usage",
+    "area": "admin",
+    "status": "in-progress",
+    "summary": "Token and estimated-cost breakdown for this guild, plus its budgets.",
+    "description": "Token and estimated-cost breakdown for this guild, plus its budgets.",
+    "usage": "!usage",
+    "aliases": [],
+    "permissions": "Administrator",
+    "cooldown": null,
+    "examples": [],
+    "planned": [
+      {
+        "status": "idea",
+        "title": "\"Compute, don't refuse\" — a capability sweep over the review log"
+      },
+      {
+        "status": "idea",
+        "title": "Frequency-driven preset suggestions from the review log"
+      },
+      {
+        "status": "idea",
+        "title": "Session follow-up ideas — visual engine + AI-setup wedge arc…"
+      },
+      {
+        "status": "idea",
+        "title": "AI self-curated memory notebook — a write-back learning seam for the…"
+      }
+    ]
+  },
   {
     "name": "use",
     "area": "economy",
@@ -7738,7 +7781,7 @@ const CHANGELOG = [
   {
     "version": "2026.06.19",
     "date": "Jun 19, 2026",
-    "build": "3385cc04",
+    "build": "00daf9b",
     "title": "New public bot website",
     "changes": [
       {
@@ -7750,7 +7793,7 @@ const CHANGELOG = [
   {
     "version": "2026.06.12",
     "date": "Jun 12, 2026",
-    "build": "3385cc04",
+    "build": "00daf9b",
     "title": "Owner review inbox on the dashboard",
     "changes": [
       {
@@ -7762,7 +7805,7 @@ const CHANGELOG = [
   {
     "version": "2026.06.08",
     "date": "Jun 08, 2026",
-    "build": "3385cc04",
+    "build": "00daf9b",
     "title": "Command-alias suggestions",
     "changes": [
       {
@@ -9143,13 +9186,13 @@ const FEATURES = [
 ];
 
 const BUILD = {
-  "commit": "3385cc04",
-  "subject": "docs: 56th Q-0107 reconciliation pass (band-#2393)",
-  "committed_at": "2026-08-10T15:36:37Z"
+  "commit": "00daf9b",
+  "subject": "[user-040] Shed optional pipeline stages when a channel or guild floods",
+  "committed_at": "2026-10-19T13:05:02Z"
 };
 
 const COUNTS = {
-  "commands": 485,
+  "commands": 487,
   "features": 43,
   "games": 12
 };
@@ -18,7 +18,8 @@ So the data flow is one pipeline, source-of-truth in one place::
 
 This module is **stdlib-only and never imports ``disbot``** so it ships *inside*
 ``botsite/`` (Railway deploys only this directory), letting the FastAPI ``/data.js``
-endpoint render it live, per request, from the current ``site.json``.
+endpoint render it from the current ``site.json`` (once per file version — see
+``app.current_data_js``).
 
 The shape it emits is the data contract from the handoff
 (``DATA_CONTRACT.md``): ``ICONS``, ``AREAS``, ``COMMANDS``, ``GAMES``, ``CHANGELOG``,
@@ -14,19 +14,29 @@ Deploy: a second Railway service — see ``dashboard/README.md``.
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import hmac
 import json
 import os
 import secrets
 import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs
 
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
 
+try:  # optional: brotli beats gzip on the JSON-heavy pages, gzip is the fallback
+    import brotli
+except ImportError:  # pragma: no cover - depends on the deploy image
+    brotli = None
+
 BASE_DIR = Path(__file__).resolve().parent
 DATA_FILE = BASE_DIR / "data" / "dashboard.json"
 
@@ -127,6 +137,104 @@ _EMPTY: dict[str, Any] = {
 
 app = FastAPI(title="SuperBot Dashboard", docs_url=None, redoc_url=None)
 
+# Conditional GET + compression for the rendered pages and JSON. Bodies at least
+# this large are compressed (brotli when installed and accepted, else gzip).
+_COMPRESS_MIN_BYTES = 1024
+_CONDITIONAL_TYPES = ("text/html", "application/json")
+# Compressed bodies by representation ETag — most pages render identically for
+# every anonymous visitor, so the same bytes are not re-compressed per request.
+_COMPRESSED_MAX = 64
+_compressed: OrderedDict[str, bytes] = OrderedDict()
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """Codings named in ``Accept-Encoding`` without an explicit ``q=0``."""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding and params.replace(" ", "") not in ("q=0", "q=0.0"):
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """``If-None-Match`` vs our strong tag (any coding suffix / ``W/`` ignored)."""
+    bare = etag.strip('"').split("-", 1)[0]
+    for candidate in header.split(","):
+        candidate = candidate.strip().removeprefix("W/").strip('"')
+        if candidate == "*" or candidate.split("-", 1)[0] == bare:
+            return True
+    return False
+
+
+@app.middleware("http")
+async def _conditional_get(request: Request, call_next):
+    """Strong ``ETag`` + ``If-None-Match`` 304s, then gzip/brotli, on GET pages.
+
+    The tag hashes the rendered (identity) body, so a page that differs per
+    visitor (login state, CSRF token) only 304s when the bytes really match. A
+    compressed variant carries the same tag with a ``-gzip`` / ``-br`` suffix so
+    the tags stay strong per representation.
+    """
+    response = await call_next(request)
+    content_type = response.headers.get("content-type", "")
+    if (
+        request.method != "GET"
+        or response.status_code != 200
+        or not content_type.startswith(_CONDITIONAL_TYPES)
+        or "content-encoding" in response.headers
+    ):
+        return response
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    headers = [
+        (name, value)
+        for name, value in response.raw_headers
+        if name not in (b"content-length", b"etag")
+    ]
+    if b"cache-control" not in {name for name, _ in headers}:
+        headers.append((b"cache-control", b"private, no-cache"))
+    headers.append((b"vary", b"Accept-Encoding, Cookie"))
+
+    coding = ""
+    if len(body) >= _COMPRESS_MIN_BYTES:
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        if brotli is not None and "br" in accepted:
+            coding = "br"
+        elif "gzip" in accepted:
+            coding = "gzip"
+    if coding:
+        etag = f'{etag[:-1]}-{coding}"'
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        not_modified = Response(status_code=304)
+        not_modified.raw_headers = [
+            (name, value) for name, value in headers if name != b"content-type"
+        ] + [(b"etag", etag.encode())]
+        return not_modified
+
+    if coding:
+        cached = _compressed.get(etag)
+        if cached is None:
+            if coding == "br":
+                cached = brotli.compress(body, quality=5)
+            else:
+                cached = gzip.compress(body, compresslevel=6)
+            _compressed[etag] = cached
+            if len(_compressed) > _COMPRESSED_MAX:
+                _compressed.popitem(last=False)
+        else:
+            _compressed.move_to_end(etag)
+        body = cached
+        headers.append((b"content-encoding", coding.encode()))
+    out = Response(content=body, status_code=200)
+    out.raw_headers = headers + [
+        (b"content-length", str(len(body)).encode()),
+        (b"etag", etag.encode()),
+    ]
+    return out
+
 
 def session_context(request: Request) -> dict[str, Any]:
     """Login state merged into every template (the nav login button / avatar).
@@ -155,14 +263,58 @@ async def _form(request: Request) -> dict[str, str]:
     return {key: values[0] for key, values in parsed.items()}
 
 
-def load_data() -> dict[str, Any]:
-    """Load the generated dashboard payload, falling back to an empty shape."""
+# The parsed ``dashboard.json``, keyed by the file's (mtime_ns, size): every page
+# used to re-read and re-decode the ~430 KB payload per request. A redeploy or a
+# fresh export changes the key and the next request reparses. ``derived`` memoises
+# per-document views (the alias collision map, ...) and is dropped with it.
+_data_lock = threading.Lock()
+_data_cache: dict[str, Any] = {"key": None, "data": None, "derived": {}}
+
+
+def _read_data() -> dict[str, Any]:
+    """Read + parse ``dashboard.json`` from disk (uncached), or the empty shape."""
     try:
         return json.loads(DATA_FILE.read_text(encoding="utf-8"))
     except (OSError, json.JSONDecodeError):
         return dict(_EMPTY)
 
 
+def load_data() -> dict[str, Any]:
+    """The generated dashboard payload, parsed once per file version.
+
+    The returned dict is shared across requests — read it, never mutate it.
+    Falls back to the empty shape (uncached, so a half-written file is retried)
+    when the file is missing or unparseable.
+    """
+    try:
+        stat = DATA_FILE.stat()
+    except OSError:
+        return dict(_EMPTY)
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _data_lock:
+        if _data_cache["key"] == key:
+            return _data_cache["data"]
+        try:
+            data = json.loads(DATA_FILE.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return dict(_EMPTY)
+        _data_cache.update(key=key, data=data, derived={})
+        return data
+
+
+def _derived(data: dict[str, Any], name: str, build: Callable[[dict], Any]) -> Any:
+    """``build(data)``, memoised while ``data`` is the cached document."""
+    with _data_lock:
+        derived = _data_cache["derived"] if _data_cache["data"] is data else None
+        if derived is not None and name in derived:
+            return derived[name]
+    value = build(data)
+    if derived is not None:
+        with _data_lock:
+            derived[name] = value
+    return value
+
+
 def _command_names(data: dict[str, Any]) -> list[str]:
     """Sorted, de-duplicated set of every command name across all cogs."""
     return sorted({c["name"] for cog in data.get("cogs", []) for c in cog["commands"]})
@@ -357,8 +509,8 @@ def aliases(request: Request):
         {
             "data": data,
             "page": "aliases",
-            "commands": _command_names(data),
-            "taken": _build_taken_map(data),
+            "commands": _derived(data, "commands", _command_names),
+            "taken": _derived(data, "taken", _build_taken_map),
         },
     )
 
@@ -439,8 +591,8 @@ def commands(request: Request):
             "page": "commands",
             "stats": stats,
             "sysmap": sysmap,
-            "routable": _routable_subsystems(data),
-            "taken": _build_taken_map(data),
+            "routable": _derived(data, "routable", _routable_subsystems),
+            "taken": _derived(data, "taken", _build_taken_map),
             "synonyms_by_canonical": {
                 s["canonical"]: s["synonyms"] for s in data.get("synonyms", [])
             },
@@ -8,6 +8,7 @@ import os
 import signal
 import time
 import uuid
+from typing import Any
 
 import discord
 from discord.ext import commands
@@ -714,28 +715,75 @@ async def force(ctx: commands.Context, command_name: str, *args) -> None:
 
 
 async def _load_cogs() -> None:
-    from core.runtime import startup_outcome
+    """Load ``config.INITIAL_EXTENSIONS`` in dependency-ordered waves.
+
+    Loads within a wave run concurrently (at most
+    ``config.COG_LOAD_CONCURRENCY`` at once); the next wave starts when the
+    whole wave has finished.  Each load's wall time and wave go to the
+    startup-outcome extension recorder, and the slowest are logged.
+    """
+    from core.runtime import extension_waves, startup_outcome
     from services import governance_service
     from utils.subsystem_registry import SUBSYSTEMS
 
+    try:
+        waves = extension_waves.plan_waves(
+            config.INITIAL_EXTENSIONS,
+            first=config.EXTENSIONS_LOAD_FIRST,
+            dependencies=config.EXTENSION_DEPENDENCIES,
+        )
+    except ValueError:
+        logger.exception("Extension dependency plan failed — loading sequentially")
+        waves = [[ext] for ext in config.INITIAL_EXTENSIONS]
+
     failed_exts: set[str] = set()
-    for ext in config.INITIAL_EXTENSIONS:
-        try:
-            await bot.load_extension(ext)
-            startup_outcome.record_extension_success(ext)
-            logger.info("✅ Loaded %s", ext)
-        except Exception as exc:
-            startup_outcome.record_extension_failure(ext, exc)
-            failed_exts.add(ext)
-            logger.error(
-                "❌ Failed to load %s: %s: %s",
+    limit = asyncio.Semaphore(config.COG_LOAD_CONCURRENCY)
+
+    async def _load(ext: str, wave: int) -> None:
+        async with limit:
+            started = time.perf_counter()
+            try:
+                await bot.load_extension(ext)
+            except Exception as exc:
+                startup_outcome.record_extension_failure(
+                    ext,
+                    exc,
+                    duration_ms=(time.perf_counter() - started) * 1000,
+                    wave=wave,
+                )
+                failed_exts.add(ext)
+                logger.error(
+                    "❌ Failed to load %s: %s: %s",
+                    ext,
+                    type(exc).__name__,
+                    exc,
+                    exc_info=True,
+                )
+                if reporter:
+                    await reporter.on_cog_fail(ext, exc)
+                return
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            startup_outcome.record_extension_success(
                 ext,
-                type(exc).__name__,
-                exc,
-                exc_info=True,
+                duration_ms=elapsed_ms,
+                wave=wave,
             )
-            if reporter:
-                await reporter.on_cog_fail(ext, exc)
+            logger.info("✅ Loaded %s (%.0f ms)", ext, elapsed_ms)
+
+    started = time.perf_counter()
+    for wave, extensions in enumerate(waves):
+        await asyncio.gather(*(_load(ext, wave) for ext in extensions))
+    logger.info(
+        "Loaded %d/%d extensions in %d waves, %.0f ms; slowest: %s",
+        len(config.INITIAL_EXTENSIONS) - len(failed_exts),
+        len(config.INITIAL_EXTENSIONS),
+        len(waves),
+        (time.perf_counter() - started) * 1000,
+        ", ".join(
+            f"{o.name} {o.duration_ms:.0f} ms"
+            for o in startup_outcome.slowest_extensions(5)
+        ),
+    )
 
     if failed_exts:
         loaded_command_names = {cmd.name for cmd in bot.commands}
@@ -960,6 +1008,10 @@ async def main() -> None:
         logger.critical("Registry validation failed — aborting startup: %s", exc)
         raise SystemExit(1) from exc
 
+    # Attach the statement profiler before the first query (migrations included).
+    from core.runtime import query_profiler
+
+    query_profiler.install()
     await db.init()
 
     # Acquire the runtime instance lock now that migrations (including
@@ -1107,7 +1159,30 @@ async def main() -> None:
 
             spawn_scheduler(bot)
 
-            await _load_cogs()
+            # Extension imports are most of cold start; time them
+            # (-X importtime style) into the "module_imports" phase.
+            from core.runtime import import_profile, startup_outcome
+
+            import_summary: dict[str, Any] = {}
+            with (
+                startup_outcome.record_phase(
+                    "module_imports",
+                    metadata=import_summary,
+                ),
+                import_profile.capture(import_summary),
+            ):
+                await _load_cogs()
+            logger.info(
+                "Extension imports: %s modules, %s ms; slowest: %s",
+                import_summary.get("modules"),
+                import_summary.get("total_ms"),
+                "; ".join(import_summary.get("slowest", [])[:5]),
+            )
+            if import_summary.get("deferred_loaded"):
+                logger.warning(
+                    "Boot imported modules that should load on first use: %s",
+                    ", ".join(import_summary["deferred_loaded"]),
+                )
 
             # Cross-check subsystem identity surfaces (C1 / INV-B):
             # SUBSYSTEMS keys vs bot commands vs PersistentView SUBSYSTEM
@@ -0,0 +1,141 @@
+"""Pure embed renderers for the AI cog's readiness and usage commands.
+
+Split out of ``cogs/ai_cog.py`` to keep the cog under the cog-size ceiling;
+the cog re-imports these names, so ``from cogs.ai_cog import
+build_readiness_embed`` keeps working for the panel and tests. Nothing here
+touches the gateway or the DB — callers fetch the report / usage rows and pass
+them in.
+"""
+
+from __future__ import annotations
+
+import discord
+
+from core.runtime.ai.budget import BudgetLimits
+from services import ai_usage_service
+
+# Cadence of the token-ledger flush into ``ai_token_usage_daily``. The ledger
+# is in memory between flushes, so this bounds what a crash can lose (budgets
+# are unaffected — they read the in-memory totals) and how stale ``!ai usage``
+# can be.
+USAGE_FLUSH_MINUTES = 5
+
+# ``!ai usage`` lists at most this many (task, model) rows.
+USAGE_EMBED_ROWS = 15
+
+
+_READINESS_STATUS_EMOJI: dict[str, str] = {
+    "ok": "✅",
+    "info": "ℹ️",
+    "warn": "⚠️",
+    "error": "❌",
+    "skipped": "⏭️",
+}
+
+
+def build_readiness_embed(
+    report: object,
+) -> discord.Embed:
+    """Render an :class:`AIReadinessReport` as a Discord embed.
+
+    Kept module-level (rather than a method on the cog) so the panel
+    button handler and tests can build the same embed without spinning
+    up a cog instance. Accepts ``object`` to avoid a top-level import of
+    the readiness service (it imports discord transitively at runtime).
+    """
+    summary = getattr(report, "summary", "—")
+    findings = getattr(report, "findings", ())
+    channel_id = getattr(report, "channel_id", None)
+    color = (
+        discord.Color.green()
+        if all(getattr(f, "status", "") in ("ok", "info") for f in findings)
+        else discord.Color.orange()
+    )
+    if any(getattr(f, "status", "") == "error" for f in findings):
+        color = discord.Color.red()
+    title = "AI Readiness"
+    if channel_id is not None:
+        title += f" — <#{channel_id}>"
+    embed = discord.Embed(
+        title=title,
+        description=summary,
+        color=color,
+    )
+    for finding in findings:
+        name = getattr(finding, "name", "?")
+        status = getattr(finding, "status", "?")
+        detail = getattr(finding, "detail", "")
+        emoji = _READINESS_STATUS_EMOJI.get(status, "•")
+        embed.add_field(
+            name=f"{emoji} {name}",
+            value=detail or "—",
+            inline=False,
+        )
+    return embed
+
+
+def _format_limits(limits: BudgetLimits) -> str:
+    parts = []
+    if limits.soft_usd is not None:
+        parts.append(f"soft ${limits.soft_usd:.2f}")
+    if limits.hard_usd is not None:
+        parts.append(f"hard ${limits.hard_usd:.2f}")
+    return " / ".join(parts)
+
+
+def build_usage_embed(
+    lines: list[ai_usage_service.UsageLine],
+    budgets: list[tuple[str, float, BudgetLimits]],
+    *,
+    days: int,
+) -> discord.Embed:
+    """Per-(task, model) token and estimated-cost breakdown for one guild."""
+    total_cost = sum(line.cost_usd for line in lines)
+    total_input = sum(line.input_tokens + line.cached_input_tokens for line in lines)
+    total_cached = sum(line.cached_input_tokens for line in lines)
+    embed = discord.Embed(
+        title=f"AI Usage — last {days} day(s)",
+        description=(
+            f"Estimated cost **${total_cost:.4f}** · "
+            f"{sum(line.requests for line in lines)} request(s)"
+        ),
+        color=discord.Color.blurple(),
+    )
+    if total_input:
+        embed.description = (
+            f"{embed.description} · "
+            f"{100 * total_cached / total_input:.0f}% of input tokens cached"
+        )
+    if not lines:
+        embed.add_field(
+            name="No usage recorded",
+            value="No provider calls in this window (or none flushed yet).",
+            inline=False,
+        )
+    for line in lines[:USAGE_EMBED_ROWS]:
+        embed.add_field(
+            name=f"{line.task} · {line.model}",
+            value=(
+                f"requests: `{line.requests}`\n"
+                f"input: `{line.input_tokens}` (+`{line.cached_input_tokens}` cached)\n"
+                f"output: `{line.output_tokens}`\n"
+                f"cost: `${line.cost_usd:.4f}`"
+            ),
+            inline=True,
+        )
+    if budgets:
+        embed.add_field(
+            name="Budgets (today, UTC)",
+            value="\n".join(
+                f"`{label}`: ${spent:.4f} of {_format_limits(limits)}"
+                for label, spent, limits in budgets
+            ),
+            inline=False,
+        )
+    embed.set_footer(
+        text=(
+            f"Rolled up every {USAGE_FLUSH_MINUTES} min from the gateway's token "
+            "ledger. Costs are list-price estimates."
+        ),
+    )
+    return embed
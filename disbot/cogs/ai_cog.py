@@ -23,11 +23,16 @@ from typing import Any
 
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 
+from cogs.ai.embeds import (
+    USAGE_FLUSH_MINUTES,
+    build_readiness_embed,
+    build_usage_embed,
+)
 from core.runtime.ai.contracts import AITask
 from core.runtime.permission_checks import admin_or_owner, app_admin_or_owner
-from services import ai_diagnostics_service
+from services import ai_diagnostics_service, ai_usage_service
 from views.ai.panel import AIPanelView, build_ai_panel_embed
 
 logger = logging.getLogger("bot")
@@ -55,56 +60,6 @@ def _relative_time(ts: datetime, *, now: datetime | None = None) -> str:
     return f"{int(delta // 86400)}d ago"
 
 
-_READINESS_STATUS_EMOJI: dict[str, str] = {
-    "ok": "✅",
-    "info": "ℹ️",
-    "warn": "⚠️",
-    "error": "❌",
-    "skipped": "⏭️",
-}
-
-
-def build_readiness_embed(
-    report: object,
-) -> discord.Embed:
-    """Render an :class:`AIReadinessReport` as a Discord embed.
-
-    Kept module-level (rather than a method on the cog) so the panel
-    button handler and tests can build the same embed without spinning
-    up a cog instance. Accepts ``object`` to avoid a top-level import of
-    the readiness service (it imports discord transitively at runtime).
-    """
-    summary = getattr(report, "summary", "—")
-    findings = getattr(report, "findings", ())
-    channel_id = getattr(report, "channel_id", None)
-    color = (
-        discord.Color.green()
-        if all(getattr(f, "status", "") in ("ok", "info") for f in findings)
-        else discord.Color.orange()
-    )
-    if any(getattr(f, "status", "") == "error" for f in findings):
-        color = discord.Color.red()
-    title = "AI Readiness"
-    if channel_id is not None:
-        title += f" — <#{channel_id}>"
-    embed = discord.Embed(
-        title=title,
-        description=summary,
-        color=color,
-    )
-    for finding in findings:
-        name = getattr(finding, "name", "?")
-        status = getattr(finding, "status", "?")
-        detail = getattr(finding, "detail", "")
-        emoji = _READINESS_STATUS_EMOJI.get(status, "•")
-        embed.add_field(
-            name=f"{emoji} {name}",
-            value=detail or "—",
-            inline=False,
-        )
-    return embed
-
-
 async def _attach_readiness_summary(
     embed: discord.Embed,
     guild: discord.Guild,
@@ -344,12 +299,20 @@ class AICog(commands.Cog):
             youtube_renderers.render_compare,
         )
 
+        # Guarded like the router registration above: cog_load may run
+        # twice on one instance and a running loop refuses a second start.
+        if not self._usage_flush_loop.is_running():
+            self._usage_flush_loop.start()
+
     async def cog_unload(self) -> None:
         from core.runtime import message_pipeline
         from core.runtime.ai.natural_language_stage import STAGE_NAME
 
         message_pipeline.unregister(STAGE_NAME)
 
+        self._usage_flush_loop.cancel()
+        await self._flush_usage()
+
         # interaction_router exposes no unregister() API — the module-level
         # _handlers dict holds registrations for the lifetime of the
         # process by design. We cannot remove the "ai" prefix here. The
@@ -358,6 +321,28 @@ class AICog(commands.Cog):
         # cog_load's idempotency guard detects that the handler is already
         # handle_ai_interaction and skips re-registration.
 
+    # ------------------------------------------------------------------
+    # Token ledger flush
+    # ------------------------------------------------------------------
+
+    async def _flush_usage(self) -> None:
+        try:
+            await ai_usage_service.flush()
+        except Exception:  # noqa: BLE001 — rows are restored; retry next tick
+            logger.warning("ai usage: token ledger flush failed", exc_info=True)
+
+    @tasks.loop(minutes=USAGE_FLUSH_MINUTES)
+    async def _usage_flush_loop(self) -> None:
+        await self._flush_usage()
+
+    @_usage_flush_loop.before_loop
+    async def _before_usage_flush_loop(self) -> None:
+        await self.bot.wait_until_ready()
+        try:
+            await ai_usage_service.hydrate()
+        except Exception:  # noqa: BLE001 — budgets then count from zero today
+            logger.warning("ai usage: budget spend hydrate failed", exc_info=True)
+
     # ------------------------------------------------------------------
     # Prefix commands — `!ai`, `!ai status`, `!ai diagnostics`, ...
     # ------------------------------------------------------------------
@@ -513,6 +498,22 @@ class AICog(commands.Cog):
     ) -> None:
         await ctx.send(embed=build_routing_embed(task))
 
+    @ai_group.command(name="usage")  # type: ignore[arg-type]
+    @admin_or_owner()
+    async def ai_usage(self, ctx: commands.Context, days: int = 7) -> None:
+        """Token and estimated-cost breakdown for this guild, plus its budgets.
+
+        ``days`` (1–90, default 7) is the window in UTC days, read from the
+        ``ai_token_usage_daily`` rollup.
+        """
+        if not ctx.guild:
+            await ctx.send("This command requires a guild context.")
+            return
+        days = max(1, min(days, 90))
+        lines = await ai_usage_service.usage_breakdown(ctx.guild.id, days=days)
+        budgets = ai_usage_service.budget_status(ctx.guild.id)
+        await ctx.send(embed=build_usage_embed(lines, budgets, days=days))
+
     @commands.command(name="aimenu")
     @admin_or_owner()
     async def aimenu(self, ctx: commands.Context) -> None:
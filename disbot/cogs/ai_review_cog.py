@@ -29,7 +29,11 @@ from discord.ext import commands
 from core.events import bus
 from core.runtime import message_pipeline
 from core.runtime.guild_resources import resolve_settings_channel
-from core.runtime.message_pipeline import MessagePipelineContext, StageResult
+from core.runtime.message_pipeline import (
+    LoadPolicy,
+    MessagePipelineContext,
+    StageResult,
+)
 from core.runtime.permission_checks import perms_or_owner
 from services import ai_preset_service as presets
 from services import ai_review_log_service as review
@@ -45,6 +49,9 @@ AI_CORRECTION_STAGE_NAME = "ai_correction"
 # Passive tier (50–69): observe-only, runs before the conversational AI stage
 # (order 70) and never short-circuits. See core/runtime/message_pipeline.py.
 AI_CORRECTION_STAGE_ORDER = 55
+# Review bookkeeping is optional; a flooded channel sheds it (see "Load
+# shedding" in core/runtime/message_pipeline.py).
+AI_CORRECTION_LOAD_POLICY = LoadPolicy(channel_per_minute=120.0)
 
 
 class AICorrectionStage:
@@ -60,6 +67,7 @@ class AICorrectionStage:
 
     name = AI_CORRECTION_STAGE_NAME
     order = AI_CORRECTION_STAGE_ORDER
+    load_policy = AI_CORRECTION_LOAD_POLICY
 
     async def process(self, ctx: MessagePipelineContext) -> StageResult:
         # The pipeline already drops bot-authored messages + DMs, so the author
@@ -13,14 +13,27 @@ stays small enough to satisfy the S4.6 cog-size invariant.
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
 import discord
 
-from services import btd6_data_service, btd6_knowledge_service
-from services.btd6_resolver_service import resolve
 from utils.btd6.freshness_render import BUCKET_EMOJI as _BUCKET_EMOJI
 from utils.btd6.mode_rules import summarize_mode_rules
 from utils.btd6.response_embed import response_to_embed
+from utils.lazy_import import lazy_module
+
+# The BTD6 data layer (dataset + knowledge + resolver) loads on the first
+# embed that needs it rather than when the cog is imported.
+if TYPE_CHECKING:
+    from services import (
+        btd6_data_service,
+        btd6_knowledge_service,
+        btd6_resolver_service,
+    )
+else:
+    btd6_data_service = lazy_module("services.btd6_data_service")
+    btd6_knowledge_service = lazy_module("services.btd6_knowledge_service")
+    btd6_resolver_service = lazy_module("services.btd6_resolver_service")
 
 # Useful-first display order for the Live facts block. Kinds not in
 # this tuple are appended alphabetically — operators see the most
@@ -359,7 +372,7 @@ def build_heroes_embed() -> discord.Embed:
 
 def build_test_intent_embed(text: str) -> discord.Embed:
     """Resolver introspection — useful for operators tuning the cog."""
-    intent = resolve(text)
+    intent = btd6_resolver_service.resolve(text)
     embed = discord.Embed(
         title="🐵 BTD6 — test-intent",
         description=f"Resolved intent for: ``{text[:200]}``",
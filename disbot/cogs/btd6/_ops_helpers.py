@@ -15,12 +15,23 @@ Every write still funnels through ``services.btd6_source_mutation`` /
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
 import discord
 
 from cogs.btd6 import _builders
-from services import btd6_ops_readiness_service, btd6_source_mutation
+from services import (
+    btd6_ops_readiness_service,
+    btd6_source_mutation,
+)
 from utils.db import btd6_sources as btd6_db
+from utils.lazy_import import lazy_module
+
+# ~5.8k lines; only the readiness embed reads its memo stats.
+if TYPE_CHECKING:
+    from services import btd6_context_service
+else:
+    btd6_context_service = lazy_module("services.btd6_context_service")
 
 logger = logging.getLogger("bot.cogs.btd6_ops")
 
@@ -33,7 +44,18 @@ ADMIN_DENIED = "🚫 Toggling BTD6 sources requires the Administrator permission
 
 async def readiness_embed() -> discord.Embed:
     verdict = await btd6_ops_readiness_service.evaluate()
-    return _builders.build_readiness_embed(verdict)
+    embed = _builders.build_readiness_embed(verdict)
+    memo = btd6_context_service.reply_memo_stats()
+    embed.add_field(
+        name="Deterministic reply memo",
+        value=(
+            f"hit rate: {memo.hit_rate:.0%} "
+            f"({memo.hits} hits / {memo.misses} misses)\n"
+            f"entries: {memo.size}/{memo.max_size}"
+        ),
+        inline=False,
+    )
+    return embed
 
 
 async def runs_embed(source_key: str | None, limit: int) -> discord.Embed:
@@ -38,6 +38,7 @@ only, never a privilege change.
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
 import discord
 from discord import app_commands
@@ -53,13 +54,20 @@ from cogs.btd6._embeds import response_to_embed as _response_to_embed
 from cogs.btd6._reply import reply_ephemeral
 from core.runtime.interaction_helpers import safe_defer, safe_followup
 from core.runtime.permission_checks import perms_or_owner
-from services import btd6_ai_service
 from utils.discord_permissions import is_administrator_member, is_staff_member
+from utils.lazy_import import lazy_module
 from views.btd6 import strategy_browse
 from views.btd6.panel import BTD6PanelView, build_btd6_panel_embed
 
 logger = logging.getLogger("bot.cogs.btd6")
 
+# Pulls the resolver / knowledge / response-builder stack; load it on the
+# first `/btd6 ask` instead of at cog import.
+if TYPE_CHECKING:
+    from services import btd6_ai_service
+else:
+    btd6_ai_service = lazy_module("services.btd6_ai_service")
+
 
 # ===========================================================================
 # Root groups
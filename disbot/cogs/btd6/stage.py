@@ -36,19 +36,40 @@ import os
 import time
 from collections import deque
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import discord
 
-from core.runtime.message_pipeline import MessagePipelineContext, StageResult
-from services import btd6_ai_service
-from services.btd6_resolver_service import resolve
+from core.runtime.ai.natural_language_stage import is_conversation_followup
+from core.runtime.message_pipeline import (
+    LoadPolicy,
+    MessagePipelineContext,
+    StageResult,
+)
+from utils.lazy_import import lazy_module
 
 logger = logging.getLogger("bot.cogs.btd6.stage")
 
+# The resolver / answer stack loads with the first candidate message.
+if TYPE_CHECKING:
+    from services import btd6_ai_service, btd6_resolver_service
+else:
+    btd6_ai_service = lazy_module("services.btd6_ai_service")
+    btd6_resolver_service = lazy_module("services.btd6_resolver_service")
+
 STAGE_NAME = "btd6_assistant"
 # Conversational tier, after the AI natural-language stage (70). See the
 # canonical stage-order table in core/runtime/message_pipeline.py.
 STAGE_ORDER = 80
+# Passive answers are a nicety: a busy channel/guild sheds all but 10% of
+# them (see "Load shedding" in core/runtime/message_pipeline.py), bar
+# follow-ups in an active conversation with the bot.
+LOAD_POLICY = LoadPolicy(
+    channel_per_minute=40.0,
+    guild_per_minute=400.0,
+    sample=0.1,
+    keep=is_conversation_followup,
+)
 
 _TRUTHY = frozenset({"1", "true", "yes", "on"})
 _DEFAULT_CONFIDENCE_THRESHOLD = 0.34  # ≥ 1 of 3 entities matched
@@ -121,6 +142,8 @@ REASON_CHANNEL_NOT_CONFIGURED = "skip:channel_not_configured"
 REASON_ALREADY_HANDLED = "skip:already_handled"
 REASON_COOLDOWN = "skip:cooldown"
 REASON_LOW_CONFIDENCE = "skip:low_confidence"
+# Recorded by on_shed: the pipeline skipped the stage under load.
+REASON_SHED = "skip:shed_under_load"
 
 
 class BTD6AssistantMessageStage:
@@ -134,6 +157,7 @@ class BTD6AssistantMessageStage:
 
     name = STAGE_NAME
     order = STAGE_ORDER
+    load_policy = LOAD_POLICY
 
     def __init__(self) -> None:
         self._cooldowns: dict[tuple[int, int], float] = {}
@@ -170,8 +194,7 @@ class BTD6AssistantMessageStage:
             self._record_skip(channel_id, REASON_EMPTY, confidence=0.0)
             return StageResult()
 
-        bot = ctx.bot
-        if _looks_like_command(message.content, bot):
+        if ctx.command_prefixed:
             self._record_skip(channel_id, REASON_COMMAND_PREFIX, confidence=0.0)
             return StageResult()
 
@@ -196,7 +219,7 @@ class BTD6AssistantMessageStage:
             self._record_skip(channel_id, REASON_COOLDOWN, confidence=0.0)
             return StageResult()
 
-        intent = resolve(message.content)
+        intent = btd6_resolver_service.resolve(message.content)
         if intent.confidence < confidence_threshold():
             self._record_skip(
                 channel_id,
@@ -226,6 +249,11 @@ class BTD6AssistantMessageStage:
 
         return StageResult()
 
+    def on_shed(self, ctx: MessagePipelineContext) -> None:
+        """Pipeline hook: ``LOAD_POLICY`` skipped this message under load."""
+        channel = ctx.message.channel
+        self._record_skip(channel.id if channel else 0, REASON_SHED, confidence=0.0)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -265,27 +293,6 @@ class BTD6AssistantMessageStage:
         self._cooldowns[(user_id, channel_id)] = time.time()
 
 
-def _looks_like_command(content: str, bot: object) -> bool:
-    """True if ``content`` starts with the bot's command prefix.
-
-    Discord.py's command_prefix may be a string, a list of strings,
-    or a callable. The callable form needs (bot, message), so we
-    fall back to ``"!"`` (SuperBot's default) if extraction fails.
-    """
-    prefix_attr = getattr(bot, "command_prefix", "!")
-    candidates: list[str] = []
-    if isinstance(prefix_attr, str):
-        candidates.append(prefix_attr)
-    elif isinstance(prefix_attr, (list, tuple)):
-        candidates.extend(str(p) for p in prefix_attr if isinstance(p, str))
-    else:
-        candidates.append("!")
-    if not candidates:
-        candidates.append("!")
-    stripped = content.lstrip()
-    return any(stripped.startswith(p) for p in candidates)
-
-
 def _is_system_message(message: discord.Message) -> bool:
     """True if ``message.type`` indicates a system event (pin/join/boost/...)."""
     msg_type = getattr(message, "type", None)
@@ -7,7 +7,7 @@ import discord
 from discord.ext import commands
 from discord.ext.commands import MissingPermissions
 
-from core.runtime import resources
+from core.runtime import resources, tasks
 from core.runtime.interaction_helpers import help_ctx_shim
 from core.runtime.message_pipeline import (
     MessagePipelineContext,
@@ -18,7 +18,7 @@ from services import chain_service, moderation_service
 from utils import db
 from views.base import HubView, interaction_is_admin, send_panel
 
-CHAIN_STAGE_NAME = "chain"
+CHAIN_STAGE_NAME = chain_service.CHAIN_STAGE_NAME
 # Auto-mod tier — last within the tier (after cleanup=10, counting=15). See
 # the canonical stage-order table in core/runtime/message_pipeline.py.
 CHAIN_STAGE_ORDER = 20
@@ -35,6 +35,8 @@ class ChainStage:
 
     Holds a cog reference because the rule check requires the bot's
     command-context lookup (so command messages aren't auto-deleted).
+    Routed: once the chain channels are loaded the pipeline only
+    dispatches this stage in them.
     """
 
     name = CHAIN_STAGE_NAME
@@ -44,7 +46,7 @@ class ChainStage:
         self.cog = cog
 
     async def process(self, ctx: MessagePipelineContext) -> StageResult:
-        deleted = await self.cog._process_chain_message(ctx.message)
+        deleted = await self.cog._process_chain_message(ctx.message, ctx)
         if deleted:
             return StageResult(deleted=True, short_circuit=True)
         return StageResult()
@@ -60,6 +62,14 @@ class ChainCog(commands.Cog):
         from core.runtime import message_pipeline
 
         message_pipeline.register(ChainStage(self))
+        tasks.spawn("chain:load_routes", self._load_routes_when_ready())
+
+    async def _load_routes_when_ready(self) -> None:
+        from core.runtime import message_pipeline
+
+        await self.bot.wait_until_ready()
+        bindings = await db.get_chain_bindings()
+        message_pipeline.load_routes(CHAIN_STAGE_NAME, bindings)
 
     def cog_unload(self) -> None:
         from core.runtime import message_pipeline
@@ -308,7 +318,11 @@ class ChainCog(commands.Cog):
 
         await ctx.send(embed=embed)
 
-    async def _process_chain_message(self, message) -> bool:
+    async def _process_chain_message(
+        self,
+        message,
+        pipeline_ctx: MessagePipelineContext | None = None,
+    ) -> bool:
         """Enforce chain rules and word limits.  Returns True iff deleted.
 
         Called by :class:`ChainStage` from the message pipeline.
@@ -316,8 +330,12 @@ class ChainCog(commands.Cog):
 
         Command messages (resolved via ``bot.get_context``) are passed
         through unchanged — chain rules apply only to plain content.
+        The parse is shared through ``pipeline_ctx`` so it runs at most
+        once per message.
         """
-        ctx = await self.bot.get_context(message)
+        if pipeline_ctx is None:
+            pipeline_ctx = MessagePipelineContext(bot=self.bot, message=message)
+        ctx = await pipeline_ctx.command_context()
         if ctx.valid:
             return False  # Don't process command messages
 
@@ -14,6 +14,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 from cogs.counting import game_logic
+from cogs.counting._stage import sync_routes
 from core.runtime import scope_locks, tasks
 
 # No-argument modes panel can enable directly. ``multiples`` (factor)
@@ -77,6 +78,7 @@ async def enable_channel(cog, guild_id: str, channel_id: str, mode: str) -> bool
         if channel_id in cog.count_data[guild_id]["channels"]:
             return False
         cog.count_data[guild_id]["channels"][channel_id] = default_channel_config(mode)
+        sync_routes(cog, guild_id)
         tasks.spawn(f"counting:save:{guild_id}", cog._save_guild(guild_id))
     return True
 
@@ -91,6 +93,7 @@ async def disable_channel(cog, guild_id: str, channel_id: str) -> bool:
         if channel_id not in channels:
             return False
         del channels[channel_id]
+        sync_routes(cog, guild_id)
         scope_locks.forget(_scope_id(channel_id))
         tasks.spawn(f"counting:save:{guild_id}", cog._save_guild(guild_id))
     return True
@@ -13,12 +13,17 @@ rps_tournament) skip it.
 
 The stage holds a cog reference because the counting state
 (``count_data``, the per-channel scope locks) is per-instance.
+
+Routed: :func:`sync_routes` publishes each guild's active counting
+channels to the pipeline routing table after every load and channel
+add/remove, so the stage is only dispatched in counting channels.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from core.runtime import message_pipeline
 from core.runtime.message_pipeline import (
     MessagePipelineContext,
     StageResult,
@@ -55,3 +60,13 @@ class CountingStage:
         if deleted:
             return StageResult(deleted=True, short_circuit=True)
         return StageResult()
+
+
+def sync_routes(cog: CountingCog, guild_id: str) -> None:
+    """Publish one guild's active counting channels to the routing table."""
+    channels = cog.count_data.get(guild_id, {}).get("channels", {})
+    message_pipeline.set_guild_routes(
+        COUNTING_STAGE_NAME,
+        int(guild_id),
+        (int(channel_id) for channel_id in channels),
+    )
@@ -26,7 +26,7 @@ from discord.ext import commands
 
 from cogs.counting import game_logic, handler
 from cogs.counting import leaderboard as counting_leaderboard
-from cogs.counting._stage import COUNTING_STAGE_NAME, CountingStage
+from cogs.counting._stage import COUNTING_STAGE_NAME, CountingStage, sync_routes
 from core.runtime import resources, scope_locks, tasks
 from core.runtime.interaction_helpers import help_ctx_shim
 from utils import db
@@ -87,6 +87,7 @@ class CountingCog(commands.Cog):
         await self.bot.wait_until_ready()
         for guild in self.bot.guilds:
             self.count_data[str(guild.id)] = await db.get_counting_state(guild.id)
+            sync_routes(self, str(guild.id))
 
     async def _save_guild(self, guild_id_str: str):
         """Persist one guild's counting state.
@@ -364,6 +365,7 @@ class CountingCog(commands.Cog):
                 channel_config["prime_numbers"] = []
 
             self.count_data[guild_id]["channels"][channel_id] = channel_config
+            sync_routes(self, guild_id)
             tasks.spawn(f"counting:save:{guild_id}", self._save_guild(guild_id))
 
         if mode == "skip":
@@ -422,6 +424,7 @@ class CountingCog(commands.Cog):
                 return
 
             del self.count_data[guild_id]["channels"][channel_id]
+            sync_routes(self, guild_id)
             tasks.spawn(f"counting:save:{guild_id}", self._save_guild(guild_id))
 
         await ctx.send(
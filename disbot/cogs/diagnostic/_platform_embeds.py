@@ -43,6 +43,7 @@ from services.diagnostic_embeds import (  # noqa: F401
     build_migrations_embed,
     build_participation_schemas_embed,
     build_provisioning_embed,
+    build_queries_embed,
     build_resource_requirements_embed,
     build_resources_embed,
     build_runtime_embed,
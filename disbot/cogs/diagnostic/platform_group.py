@@ -40,6 +40,7 @@ from cogs.diagnostic._platform_embeds import (
     build_migrations_embed,
     build_participation_schemas_embed,
     build_provisioning_embed,
+    build_queries_embed,
     build_resource_requirements_embed,
     build_resources_embed,
     build_runtime_embed,
@@ -381,6 +382,15 @@ class PlatformCommandsMixin(_MixinBase):
         """Show the most recent slow-path entries (S3.2 ring buffer)."""
         await ctx.send(embed=build_slow_embed(limit))
 
+    @platform_grp.command(name="queries")  # type: ignore[arg-type]
+    @admin_or_owner()
+    async def platform_queries(self, ctx, target: str = "10", sort: str = "total"):
+        """Top query fingerprints by DB time, or one fingerprint's plan by id."""
+        if target.isdigit() and len(target) <= 3:
+            await ctx.send(embed=build_queries_embed(int(target), sort=sort))
+        else:
+            await ctx.send(embed=build_queries_embed(query_id=target))
+
     @platform_grp.command(name="automation")  # type: ignore[arg-type]
     @admin_or_owner()
     async def platform_automation(self, ctx):
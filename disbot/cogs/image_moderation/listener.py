@@ -13,6 +13,13 @@ and only the image **URL** is sent externally — never message text, never the
 author.  Exempt channels/members short-circuit *before* any API call, so an
 operator can keep an art/NSFW-gated channel out of the external pipeline.
 
+A message's images are classified concurrently, under one process-wide limit
+(:data:`_CLASSIFY_CONCURRENCY`) shared by every message.  Each image is first
+fetched from Discord's CDN and fingerprinted (content digest + perceptual
+dHash, :mod:`services.image_moderation_cache`); a reposted or re-encoded image
+reuses the cached scores instead of being classified again.  The downloaded
+bytes never leave the process.
+
 Fail-open discipline (family-plan §3 rule 4): any fault — config read, a missing
 OpenAI key/SDK (``ProviderUnavailableError``), a network error, a malformed
 response — lets the image through (logged).  Image moderation never blocks a
@@ -21,18 +28,23 @@ legitimate upload because of a transient error.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
 
 import discord
 
 from core.runtime.ai.providers.base import ProviderUnavailableError
 from core.runtime.message_pipeline import StageResult
 from services import (
+    image_moderation_cache,
     image_moderation_config,
     image_moderation_service,
     moderation_service,
 )
+from services import metrics as _metrics
 
 logger = logging.getLogger("bot.cogs.image_moderation.listener")
 
@@ -41,6 +53,13 @@ EVT_IMAGE_MODERATION_FLAGGED = "image_moderation.flagged"
 #: A classifier returns OpenAI's per-category scores for an image URL.
 Classifier = Callable[[str], Awaitable[Mapping[str, float]]]
 
+#: Images being fetched + classified at once, across every message.
+_CLASSIFY_CONCURRENCY = 4
+#: Larger uploads are classified by URL without being downloaded/fingerprinted.
+_MAX_FINGERPRINT_BYTES = 10 * 1024 * 1024
+
+_slots: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+
 
 def _default_classifier() -> Classifier:
     """The process-wide OpenAI moderation classifier (lazy, SDK-gated)."""
@@ -81,27 +100,35 @@ async def process_message(
     if _is_exempt(message, policy):
         return StageResult()
 
-    urls = image_moderation_service.image_attachment_urls(message)
-    if not urls:
+    attachments = image_moderation_service.image_attachments(message)
+    if not attachments:
         return StageResult()
 
     classify = classifier if classifier is not None else _default_classifier()
 
-    for url in urls:
-        try:
-            scores = await classify(url)
-        except ProviderUnavailableError as exc:
+    outcomes = await asyncio.gather(
+        *(_scores_for(attachment, classify) for attachment in attachments),
+        return_exceptions=True,
+    )
+    # Walk the results in attachment order so the acted-on image is the first
+    # flagged one, exactly as the serial scan chose it.
+    for outcome in outcomes:
+        if isinstance(outcome, ProviderUnavailableError):
             # No key / SDK — image moderation is simply unavailable; fail open.
-            logger.warning("image_moderation: provider unavailable: %s", exc)
+            logger.warning("image_moderation: provider unavailable: %s", outcome)
             return StageResult()
-        except Exception:  # noqa: BLE001 — fail open on any classify fault
-            logger.exception(
+        if isinstance(outcome, Exception):
+            # Fail open on any classify fault.
+            logger.error(
                 "image_moderation: classify failed for message=%s",
                 getattr(message, "id", "?"),
+                exc_info=outcome,
             )
             continue
+        if isinstance(outcome, BaseException):
+            raise outcome
 
-        verdict = image_moderation_service.evaluate_scores(scores, policy)
+        verdict = image_moderation_service.evaluate_scores(outcome, policy)
         if verdict is not None:
             await _act(message, verdict)
             return StageResult(deleted=True, short_circuit=True)
@@ -109,6 +136,54 @@ async def process_message(
     return StageResult()
 
 
+def _classify_slots() -> asyncio.Semaphore:
+    """The process-wide classification semaphore, bound to the running loop."""
+    global _slots
+    loop = asyncio.get_running_loop()
+    if _slots is None or _slots[0] is not loop:
+        _slots = (loop, asyncio.Semaphore(_CLASSIFY_CONCURRENCY))
+    return _slots[1]
+
+
+async def _scores_for(attachment: Any, classify: Classifier) -> Mapping[str, float]:
+    """Category scores for one image — from the verdict cache when possible."""
+    async with _classify_slots():
+        fingerprint = await _fingerprint(attachment)
+        if fingerprint is not None:
+            cached = image_moderation_cache.lookup(fingerprint)
+            if cached is not None:
+                return cached
+        started = time.perf_counter()
+        scores = await classify(attachment.url)
+        _metrics.image_moderation_classify_seconds.observe(
+            time.perf_counter() - started,
+        )
+        if fingerprint is not None:
+            image_moderation_cache.store(fingerprint, scores)
+        return scores
+
+
+async def _fingerprint(
+    attachment: Any,
+) -> image_moderation_cache.ImageFingerprint | None:
+    """Download + fingerprint ``attachment``; None means "classify uncached".
+
+    Any download or decode fault just skips the cache — the image is still
+    classified by URL, so a CDN hiccup never weakens moderation.
+    """
+    size = getattr(attachment, "size", None)
+    if not isinstance(size, int) or size > _MAX_FINGERPRINT_BYTES:
+        return None
+    try:
+        data = await attachment.read()
+    except Exception:  # noqa: BLE001 — cache is an optimisation; fall through
+        logger.debug("image_moderation: attachment download failed", exc_info=True)
+        return None
+    if not isinstance(data, (bytes, bytearray)):
+        return None
+    return await asyncio.to_thread(image_moderation_cache.fingerprint, bytes(data))
+
+
 def _is_exempt(
     message: discord.Message,
     policy: image_moderation_config.ImageModerationPolicy,
@@ -9,12 +9,13 @@ The decomposition mirrors treasury/fishing:
 
     services/ticket_service.py   — read model + open eligibility (read-only)
     services/ticket_mutation.py  — the audited write boundary
+    services/ticket_transcript.py — transcripts recorded as messages arrive
     utils/db/tickets.py          — the migration-098 CRUD
     views/tickets/               — launcher / control / hub panels
 
 This file holds only commands, the cog lifecycle, the ``ticket.opened`` UI
 listener (the single seam that renders the welcome + control panel for every
-open path), and the Help-menu hook.
+open path), the transcript message-pipeline stage, and the Help-menu hook.
 """
 
 from __future__ import annotations
@@ -25,9 +26,10 @@ import discord
 from discord.ext import commands
 
 from core.events import bus
-from core.runtime import guild_resources
+from core.runtime import guild_resources, message_pipeline, tasks
+from core.runtime.message_pipeline import MessagePipelineContext, StageResult
 from core.runtime.permission_checks import perms_or_owner
-from services import ticket_mutation, ticket_service
+from services import ticket_mutation, ticket_service, ticket_transcript
 from views.tickets import (
     TicketConfirmView,
     TicketControlView,
@@ -42,6 +44,29 @@ from views.tickets import (
 
 logger = logging.getLogger("bot.cogs.ticket")
 
+TICKET_TRANSCRIPT_STAGE_NAME = "ticket_transcript"
+# Passive tier (50–69): observe-only, before the conversational stages (70+)
+# so a ticket message the AI answers is still recorded. See
+# core/runtime/message_pipeline.py.
+TICKET_TRANSCRIPT_STAGE_ORDER = 60
+
+
+class TicketTranscriptStage:
+    """Observe-only pipeline stage: append ticket-channel messages to the transcript.
+
+    A dict lookup outside open ticket channels (no DB work). Never deletes,
+    never short-circuits. Bot and webhook posts never reach the pipeline, so
+    the cog and the ticket panels record the bot's own replies where they send
+    them.
+    """
+
+    name = TICKET_TRANSCRIPT_STAGE_NAME
+    order = TICKET_TRANSCRIPT_STAGE_ORDER
+
+    async def process(self, ctx: MessagePipelineContext) -> StageResult:
+        await ticket_transcript.record_if_tracked(ctx.message)
+        return StageResult()
+
 
 class TicketCog(commands.Cog):
     """Command surface + lifecycle for the support-ticket subsystem."""
@@ -56,6 +81,19 @@ class TicketCog(commands.Cog):
         self.bot.add_view(TicketControlView())
         bus.on("ticket.opened", self._on_ticket_opened)
         bus.on("ticket.open_requested", self._on_ticket_open_requested)
+        message_pipeline.register(TicketTranscriptStage())
+        tasks.spawn("ticket:resume_transcripts", self._resume_transcripts_when_ready())
+
+    async def cog_unload(self) -> None:
+        message_pipeline.unregister(TICKET_TRANSCRIPT_STAGE_NAME)
+
+    async def _resume_transcripts_when_ready(self) -> None:
+        """Track every open ticket and record what was said while we were down."""
+        await self.bot.wait_until_ready()
+        for channel_id, ticket_id in await ticket_transcript.load_open_tickets():
+            channel = self.bot.get_channel(channel_id)
+            if isinstance(channel, discord.TextChannel):
+                await ticket_transcript.backfill(channel, ticket_id)
 
     async def cog_check(self, ctx: commands.Context) -> bool:
         if ctx.guild is None:
@@ -89,7 +127,12 @@ class TicketCog(commands.Cog):
             content = f"<@&{cfg.staff_role_id}>"
         embed = build_welcome_embed(ticket_id, f"<@{opener_id}>", subject)
         try:
-            await channel.send(content=content, embed=embed, view=build_control_view())
+            welcome = await channel.send(
+                content=content,
+                embed=embed,
+                view=build_control_view(),
+            )
+            await ticket_transcript.record_if_tracked(welcome)
         except Exception:  # pragma: no cover — best-effort UI
             logger.exception(
                 "ticket.opened: control panel post failed for %s",
@@ -167,7 +210,9 @@ class TicketCog(commands.Cog):
         ):
             await ctx.send("Only staff or the ticket opener can close this ticket.")
             return
-        await ctx.send("🔒 Closing this ticket…")
+        await ticket_transcript.record_if_tracked(
+            await ctx.send("🔒 Closing this ticket…"),
+        )
         await ticket_mutation.close_ticket(
             ctx.channel,
             ticket,
@@ -189,7 +234,7 @@ class TicketCog(commands.Cog):
             await ctx.send("Only staff can claim tickets.")
             return
         result = await ticket_mutation.claim_ticket(ticket, ctx.author)
-        await ctx.send(result.message)
+        await ticket_transcript.record_if_tracked(await ctx.send(result.message))
 
     @ticket.command(name="add")  # type: ignore[arg-type]
     async def ticket_add(self, ctx: commands.Context, member: discord.Member) -> None:
@@ -205,7 +250,7 @@ class TicketCog(commands.Cog):
             await ctx.send("Only staff can add members.")
             return
         result = await ticket_mutation.add_participant(ctx.channel, member, ctx.author)
-        await ctx.send(result.message)
+        await ticket_transcript.record_if_tracked(await ctx.send(result.message))
 
     @ticket.command(name="remove")  # type: ignore[arg-type]
     async def ticket_remove(
@@ -229,7 +274,7 @@ class TicketCog(commands.Cog):
             member,
             ctx.author,
         )
-        await ctx.send(result.message)
+        await ticket_transcript.record_if_tracked(await ctx.send(result.message))
 
     # ----- admin / setup --------------------------------------------------- #
 
@@ -175,6 +175,45 @@ INITIAL_EXTENSIONS = [
     "cogs.ux_lab_cog",
 ]
 
+# Startup loads INITIAL_EXTENSIONS in dependency-ordered waves, each wave's
+# loads running concurrently (``core.runtime.extension_waves``).  These load
+# alone, in order, before any wave — the access guard above must be installed
+# before any other cog can admit a command.
+EXTENSIONS_LOAD_FIRST = ("cogs.bootstrap_access_cog",)
+# Load-order couplings the subsystem registry's ``dependencies`` cannot see
+# (those are inferred): extension → extensions that must finish loading first.
+EXTENSION_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "cogs.role_grants_cog": ("cogs.role_cog",),
+    "cogs.mining_relay_cog": ("cogs.mining_cog",),
+    "cogs.creature_battle_cog": ("cogs.creature_cog",),
+    "cogs.ai_review_cog": ("cogs.ai_cog",),
+    "cogs.btd6_reference_cog": ("cogs.btd6_cog",),
+    "cogs.btd6_events_cog": ("cogs.btd6_cog",),
+    "cogs.btd6_strategy_cog": ("cogs.btd6_cog",),
+    "cogs.btd6_ops_cog": ("cogs.btd6_cog",),
+    "cogs.paragon_cog": ("cogs.btd6_cog",),
+    "cogs.quicksetup_cog": ("cogs.setup_cog",),
+}
+
+
+def _parse_positive_int(raw: str, default: int) -> int:
+    """Parse an int knob clamped to at least 1, falling back to ``default``
+    when ``raw`` is empty or malformed — like the owner ids above, a typo in
+    the env var must never crash boot.
+    """
+    try:
+        return max(1, int(raw.strip() or default))
+    except ValueError:
+        return default
+
+
+# Most extension loads in flight at once within a wave ("1" restores the old
+# strictly sequential startup).
+COG_LOAD_CONCURRENCY = _parse_positive_int(
+    os.getenv("COG_LOAD_CONCURRENCY", ""),
+    8,
+)
+
 # ==========================
 # Webhook URL (for logs + startup notification)
 # ==========================
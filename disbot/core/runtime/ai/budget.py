@@ -0,0 +1,174 @@
+"""Per-guild and per-task AI spend budgets.
+
+The gateway consults :func:`check` before dispatching a provider call. Spend
+is the estimated USD cost of the tokens the :class:`DiagnosticsCollector`
+ledger recorded for a guild on the current UTC day; the ledger is seeded from
+the ``ai_token_usage_daily`` rollup at boot, so a restart does not hand every
+guild a fresh budget.
+
+Budgets are env-driven, mirroring routing's per-task override shape:
+
+* ``AI_BUDGET_GUILD_DAILY_USD`` — a guild's total daily spend, every task.
+* ``AI_BUDGET_<TASK_NAME>_DAILY_USD`` — a guild's daily spend on one task.
+
+Each value is ``<soft>:<hard>`` or a bare ``<hard>``. Past the soft limit the
+gateway reroutes to the provider's economy model
+(:func:`routing.economy_model_for`); past the hard limit it returns a degraded
+``budget_exhausted`` response without calling the provider, and callers fall
+back to their deterministic floor. Unset or unparseable values mean no budget.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from enum import Enum
+
+from core.runtime.ai.contracts import AITask
+from core.runtime.ai.diagnostics import DiagnosticsCollector
+
+logger = logging.getLogger("bot.runtime.ai.budget")
+
+#: ``fallback_reason`` prefix of a response refused by a hard budget
+#: (``budget_exhausted:guild`` / ``budget_exhausted:task``). Callers match on
+#: it to serve their deterministic floor instead of staying silent.
+BUDGET_EXHAUSTED_REASON = "budget_exhausted"
+
+# List prices in USD per million tokens: (uncached input, cached input,
+# output). Matched by longest model-id prefix. Cache writes are billed at a
+# premium by Anthropic; they are counted as uncached input here, which keeps
+# the estimate within a few percent for the short-lived system-prompt cache.
+_PRICES_PER_MTOK: dict[str, tuple[float, float, float]] = {
+    "claude-haiku": (1.00, 0.10, 5.00),
+    "claude-sonnet": (3.00, 0.30, 15.00),
+    "claude-opus": (15.00, 1.50, 75.00),
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4.1-mini": (0.40, 0.10, 1.60),
+    "gpt-4.1": (2.00, 0.50, 8.00),
+}
+
+# An unrecognised model is priced like a mid-tier model rather than free, so
+# a typo'd or brand-new model id can never slip past a budget.
+_UNKNOWN_MODEL_PRICES = (3.00, 0.30, 15.00)
+
+
+class BudgetLevel(str, Enum):
+    """How far a guild's spend has gone against its budget."""
+
+    OK = "ok"
+    SOFT = "soft"
+    HARD = "hard"
+
+
+@dataclass(frozen=True)
+class BudgetLimits:
+    """One budget's daily limits in USD (``None`` = that limit is unset)."""
+
+    soft_usd: float | None = None
+    hard_usd: float | None = None
+
+
+@dataclass(frozen=True)
+class BudgetVerdict:
+    """Result of :func:`check` — the worst level across the guild's budgets."""
+
+    level: BudgetLevel = BudgetLevel.OK
+    scope: str | None = None  # "guild" | "task" when level is not OK
+    spent_usd: float = 0.0
+    limit_usd: float | None = None
+
+
+def model_prices(model: str) -> tuple[float, float, float]:
+    """USD per million (uncached input, cached input, output) tokens."""
+    best = ""
+    for prefix in _PRICES_PER_MTOK:
+        if model.startswith(prefix) and len(prefix) > len(best):
+            best = prefix
+    return _PRICES_PER_MTOK[best] if best else _UNKNOWN_MODEL_PRICES
+
+
+def cost_micros(
+    model: str,
+    *,
+    input_tokens: int,
+    cached_input_tokens: int,
+    output_tokens: int,
+) -> int:
+    """Estimated cost of one call in micro-USD (tokens × USD/MTok)."""
+    if not (input_tokens or cached_input_tokens or output_tokens):
+        return 0
+    uncached, cached, output = model_prices(model)
+    return round(
+        input_tokens * uncached + cached_input_tokens * cached + output_tokens * output,
+    )
+
+
+def _parse_limits(env_name: str) -> BudgetLimits:
+    raw = os.getenv(env_name, "").strip()
+    if not raw:
+        return BudgetLimits()
+    soft_raw, sep, hard_raw = raw.partition(":")
+    if not sep:
+        soft_raw, hard_raw = "", soft_raw
+    try:
+        soft = float(soft_raw) if soft_raw.strip() else None
+        hard = float(hard_raw) if hard_raw.strip() else None
+    except ValueError:
+        logger.warning("ai budget: ignoring unparseable %s=%r", env_name, raw)
+        return BudgetLimits()
+    return BudgetLimits(soft_usd=soft, hard_usd=hard)
+
+
+def guild_daily_limits() -> BudgetLimits:
+    """Daily limits on a guild's total spend (``AI_BUDGET_GUILD_DAILY_USD``)."""
+    return _parse_limits("AI_BUDGET_GUILD_DAILY_USD")
+
+
+def task_daily_limits(task: AITask) -> BudgetLimits:
+    """Daily limits on a guild's spend for ``task`` (``AI_BUDGET_<TASK>_DAILY_USD``)."""
+    return _parse_limits(f"AI_BUDGET_{task.name}_DAILY_USD")
+
+
+def _level(limits: BudgetLimits, spent_usd: float) -> tuple[BudgetLevel, float | None]:
+    if limits.hard_usd is not None and spent_usd >= limits.hard_usd:
+        return BudgetLevel.HARD, limits.hard_usd
+    if limits.soft_usd is not None and spent_usd >= limits.soft_usd:
+        return BudgetLevel.SOFT, limits.soft_usd
+    return BudgetLevel.OK, None
+
+
+def check(
+    collector: DiagnosticsCollector,
+    guild_id: int | None,
+    task: AITask,
+) -> BudgetVerdict:
+    """Compare the guild's spend today against its guild and task budgets.
+
+    Requests without a guild (DMs, system jobs) are never budgeted. A hard
+    breach on either budget wins over a soft one.
+    """
+    if guild_id is None:
+        return BudgetVerdict()
+    verdict = BudgetVerdict()
+    for scope, limits, task_value in (
+        ("guild", guild_daily_limits(), None),
+        ("task", task_daily_limits(task), task.value),
+    ):
+        if limits.soft_usd is None and limits.hard_usd is None:
+            continue
+        spent_usd = collector.spend_micros(guild_id, task=task_value) / 1_000_000
+        level, limit = _level(limits, spent_usd)
+        if level is BudgetLevel.HARD or (
+            level is BudgetLevel.SOFT and verdict.level is BudgetLevel.OK
+        ):
+            verdict = BudgetVerdict(
+                level=level,
+                scope=scope,
+                spent_usd=spent_usd,
+                limit_usd=limit,
+            )
+        if verdict.level is BudgetLevel.HARD:
+            break
+    return verdict
@@ -65,6 +65,7 @@ class PolicyDenialReason(str, Enum):
     PROVIDER_UNAVAILABLE = "provider_unavailable"
     GROUNDING_FAILED = "grounding_failed"
     GUILD_NOT_CONFIGURED = "guild_not_configured"
+    BUDGET_EXHAUSTED = "budget_exhausted"
 
 
 class AIScope(str, Enum):
@@ -197,12 +198,19 @@ class AIToolBudget:
     historical hop limit, and the remaining caps are ``None`` ("no limit"), so a request that
     does not set a budget behaves exactly as before (hop-bounded only). A policy may tighten
     any field; the adapters enforce them (orchestration plan §11.1).
+
+    ``max_parallel_calls`` caps how many of one assistant turn's tool calls run at once
+    (results are still fed back in call order, so the transcript is unchanged).
+    ``max_call_seconds`` bounds a single handler; the gateway additionally clamps every
+    call to its own ceiling so one hung lookup cannot consume the whole request timeout.
     """
 
     max_hops: int = 4
     max_calls: int | None = None
     max_wall_seconds: float | None = None
     max_result_chars: int | None = None
+    max_parallel_calls: int = 4
+    max_call_seconds: float | None = None
 
 
 @dataclass(frozen=True)
@@ -282,6 +290,37 @@ class AIAnswerWithEvidence:
     warnings: tuple[str, ...] = ()
 
 
+#: Separator a caller places inside ``AIRequest.system_prompt`` to end a
+#: prompt-cacheable prefix: the text before it is stable across turns (the
+#: persona / policy constants, a guild's instruction profiles), and text after
+#: the last marker is per-turn. Providers map each breakpoint onto their
+#: prompt-caching feature (Anthropic ``cache_control`` blocks, an OpenAI
+#: ``prompt_cache_key``) and never forward the marker itself. An ASCII record
+#: separator so it cannot collide with prose and survives redaction untouched.
+PROMPT_CACHE_BREAKPOINT = "\x1e"
+
+
+def split_prompt_cache_segments(system_prompt: str) -> tuple[tuple[str, bool], ...]:
+    """Split ``system_prompt`` at :data:`PROMPT_CACHE_BREAKPOINT` markers.
+
+    Returns ``(text, cacheable)`` pairs, where ``cacheable`` means a breakpoint
+    follows the segment. A prompt without markers comes back unchanged as one
+    cacheable segment (the historical whole-prompt caching). Otherwise each
+    segment is trimmed of the blank lines around its markers and empty segments
+    are dropped; joining the texts with blank lines gives the prompt the model
+    sees.
+    """
+    if PROMPT_CACHE_BREAKPOINT not in system_prompt:
+        return ((system_prompt, True),)
+    pieces = system_prompt.split(PROMPT_CACHE_BREAKPOINT)
+    segments: list[tuple[str, bool]] = []
+    for index, piece in enumerate(pieces):
+        text = piece.strip("\n")
+        if text:
+            segments.append((text, index < len(pieces) - 1))
+    return tuple(segments)
+
+
 @dataclass(frozen=True)
 class AIRequest:
     """Provider-neutral request passed to a future AI gateway."""
@@ -324,7 +363,12 @@ class AISuggestion:
 
 @dataclass(frozen=True)
 class AIResponse:
-    """Provider-neutral response returned by a future AI gateway."""
+    """Provider-neutral response returned by a future AI gateway.
+
+    The token fields carry the usage the provider reported, summed over every
+    tool-loop hop; they stay ``0`` on degraded responses and for providers
+    that report none (the deterministic floor).
+    """
 
     task: AITask
     provider: str
@@ -335,6 +379,9 @@ class AIResponse:
     latency_ms: float | None = None
     degraded: bool = False
     fallback_reason: str | None = None
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
 
 
 @dataclass(frozen=True)
@@ -351,6 +398,10 @@ class AIDiagnosticsSnapshot:
     last_fallback_reason: str | None = None
     requests_observed: int = 0
     failures_observed: int = 0
+    input_tokens_observed: int = 0
+    cached_input_tokens_observed: int = 0
+    output_tokens_observed: int = 0
+    cost_usd_observed: float = 0.0
 
 
 __all__ = [
@@ -369,7 +420,9 @@ __all__ = [
     "AIToolSpec",
     "CalculationEvidence",
     "Confidence",
+    "PROMPT_CACHE_BREAKPOINT",
     "PolicyDenialReason",
     "Severity",
     "ToolRequirementMode",
+    "split_prompt_cache_segments",
 ]
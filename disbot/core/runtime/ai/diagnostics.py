@@ -8,15 +8,62 @@ A snapshot is a :class:`AIDiagnosticsSnapshot` (defined in
 :mod:`core.runtime.ai.contracts`). The collector lives here so the
 gateway's update path and the cog's read path agree on the same
 in-memory representation.
+
+The collector also keeps the token ledger: every provider call's usage,
+keyed by UTC day, guild, task, provider and model. Pending rows are drained
+periodically by ``services.ai_usage_service`` into the
+``ai_token_usage_daily`` rollup table; the per-(day, guild, task) spend
+totals stay in memory for the budget check (:mod:`core.runtime.ai.budget`).
 """
 
 from __future__ import annotations
 
 import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timezone
 
 from core.runtime.ai.contracts import AIDiagnosticsSnapshot
 from core.runtime.ai.feature_flags import ai_default_provider, ai_enabled
 
+#: Ledger guild id for calls made outside a guild (DMs, system jobs), so the
+#: rollup key stays non-null.
+NO_GUILD_ID = 0
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+@dataclass(frozen=True)
+class TokenUsageRow:
+    """One ledger bucket: summed usage for (day, guild, task, provider, model)."""
+
+    day: date
+    guild_id: int
+    task: str
+    provider: str
+    model: str
+    requests: int = 0
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
+    cost_micros: int = 0
+
+    @property
+    def key(self) -> tuple[date, int, str, str, str]:
+        return (self.day, self.guild_id, self.task, self.provider, self.model)
+
+    def merged(self, other: TokenUsageRow) -> TokenUsageRow:
+        return replace(
+            self,
+            requests=self.requests + other.requests,
+            input_tokens=self.input_tokens + other.input_tokens,
+            cached_input_tokens=self.cached_input_tokens + other.cached_input_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+            cost_micros=self.cost_micros + other.cost_micros,
+        )
+
 
 class DiagnosticsCollector:
     """Counts requests and failures observed by the gateway.
@@ -33,6 +80,15 @@ class DiagnosticsCollector:
         self._last_error_type: str | None = None
         self._last_fallback_reason: str | None = None
         self._degraded = False
+        self._input_tokens = 0
+        self._cached_input_tokens = 0
+        self._output_tokens = 0
+        self._cost_micros = 0
+        # Rows not yet flushed to the rollup table.
+        self._pending: dict[tuple[date, int, str, str, str], TokenUsageRow] = {}
+        # Spend so far per (day, guild, task) — flushed or not — for budgets.
+        self._spend: dict[tuple[date, int, str], int] = {}
+        self._spend_day: date | None = None
 
     def record_request(self, *, provider_active: str) -> None:
         with self._lock:
@@ -58,6 +114,108 @@ class DiagnosticsCollector:
             self._last_provider_active = provider_active
             self._degraded = False
 
+    def record_usage(
+        self,
+        *,
+        guild_id: int | None,
+        task: str,
+        provider: str,
+        model: str,
+        input_tokens: int,
+        cached_input_tokens: int,
+        output_tokens: int,
+        cost_micros: int,
+    ) -> None:
+        """Add one provider call's usage to the ledger and the spend totals."""
+        row = TokenUsageRow(
+            day=_utc_today(),
+            guild_id=NO_GUILD_ID if guild_id is None else guild_id,
+            task=task,
+            provider=provider,
+            model=model,
+            requests=1,
+            input_tokens=input_tokens,
+            cached_input_tokens=cached_input_tokens,
+            output_tokens=output_tokens,
+            cost_micros=cost_micros,
+        )
+        with self._lock:
+            self._input_tokens += input_tokens
+            self._cached_input_tokens += cached_input_tokens
+            self._output_tokens += output_tokens
+            self._cost_micros += cost_micros
+            self._merge_pending(row)
+            self._add_spend(row.day, row.guild_id, task, cost_micros)
+
+    def drain_usage(self) -> list[TokenUsageRow]:
+        """Take every pending ledger row (the caller persists them)."""
+        with self._lock:
+            rows = list(self._pending.values())
+            self._pending.clear()
+        return rows
+
+    def restore_usage(self, rows: Iterable[TokenUsageRow]) -> None:
+        """Put drained rows back after a failed flush (spend is unaffected)."""
+        with self._lock:
+            for row in rows:
+                self._merge_pending(row)
+
+    def seed_spend(self, rows: Iterable[TokenUsageRow]) -> None:
+        """Load already-persisted spend (today's rollup) into the budget totals.
+
+        Keeps the larger of the in-memory and persisted total per bucket: the
+        in-memory one already includes everything flushed by this process, so
+        re-seeding (a cog reload) never double counts.
+        """
+        with self._lock:
+            for row in rows:
+                key = (row.day, row.guild_id, row.task)
+                current = self._spend.get(key, 0)
+                if row.cost_micros > current:
+                    self._add_spend(
+                        row.day,
+                        row.guild_id,
+                        row.task,
+                        row.cost_micros - current,
+                    )
+
+    def spend_micros(
+        self,
+        guild_id: int,
+        *,
+        task: str | None = None,
+        day: date | None = None,
+    ) -> int:
+        """Spend recorded for ``guild_id`` on ``day`` (default today), in micro-USD.
+
+        With ``task``, only that task's spend; otherwise the guild's total.
+        """
+        day = day or _utc_today()
+        with self._lock:
+            if task is not None:
+                return self._spend.get((day, guild_id, task), 0)
+            return sum(
+                cost
+                for (d, g, _task), cost in self._spend.items()
+                if d == day and g == guild_id
+            )
+
+    def _merge_pending(self, row: TokenUsageRow) -> None:
+        existing = self._pending.get(row.key)
+        self._pending[row.key] = existing.merged(row) if existing else row
+
+    def _add_spend(self, day: date, guild_id: int, task: str, cost: int) -> None:
+        today = _utc_today()
+        if day != today:
+            return
+        # Budgets are per UTC day: drop the previous day's totals when the
+        # date rolls over so the map stays bounded by today's active guilds.
+        if self._spend_day != today:
+            self._spend.clear()
+            self._spend_day = today
+        key = (day, guild_id, task)
+        self._spend[key] = self._spend.get(key, 0) + cost
+
     def snapshot(self) -> AIDiagnosticsSnapshot:
         with self._lock:
             return AIDiagnosticsSnapshot(
@@ -71,6 +229,10 @@ class DiagnosticsCollector:
                 last_fallback_reason=self._last_fallback_reason,
                 requests_observed=self._requests,
                 failures_observed=self._failures,
+                input_tokens_observed=self._input_tokens,
+                cached_input_tokens_observed=self._cached_input_tokens,
+                output_tokens_observed=self._output_tokens,
+                cost_usd_observed=self._cost_micros / 1_000_000,
             )
 
 
@@ -10,8 +10,12 @@ Responsibilities (in pipeline order):
 3. Redaction (:mod:`redaction`) — scrub the payload before any
    external call.
 4. Routing (:mod:`routing`) — task → provider, model, timeout.
+   Spend budgets (:mod:`budget`) are checked here: a soft breach
+   reroutes to the provider's economy model, a hard breach degrades
+   with ``budget_exhausted`` before any provider call.
 5. Provider call wrapped in ``asyncio.wait_for`` for the timeout.
-6. Metrics observation (counters + histogram).
+6. Metrics observation (counters + histogram) and the token ledger
+   (:class:`DiagnosticsCollector.record_usage`).
 7. Parse text into :class:`AIResponse` (JSON parse when
    ``AIResponseMode.JSON``).
 8. On any exception or timeout: convert to degraded
@@ -33,7 +37,7 @@ from collections.abc import Mapping
 from dataclasses import replace
 from typing import Any
 
-from core.runtime.ai import redaction
+from core.runtime.ai import budget, redaction
 from core.runtime.ai.contracts import AIRequest, AIResponse, AIResponseMode, AITask
 from core.runtime.ai.diagnostics import DiagnosticsCollector, get_default_collector
 from core.runtime.ai.feature_flags import ai_tools_enabled, task_enabled
@@ -45,14 +49,37 @@ from core.runtime.ai.providers import (
     Provider,
     ProviderUnavailableError,
 )
-from core.runtime.ai.providers.base import ToolDispatch, ToolHandler
-from core.runtime.ai.routing import RoutingTarget, default_model_for, resolve
+from core.runtime.ai.providers.base import (
+    ProviderUsage,
+    ToolDispatch,
+    ToolHandler,
+    collect_usage,
+)
+from core.runtime.ai.routing import (
+    RoutingTarget,
+    default_model_for,
+    economy_model_for,
+    resolve,
+)
 from core.runtime.ai.safety import precheck
 from services import metrics
 from utils.db import ai as ai_db
 
 logger = logging.getLogger("bot.runtime.ai.gateway")
 
+# Ceiling on a single tool handler, applied even when the request's
+# ``AIToolBudget.max_call_seconds`` is unset. Handlers are read-only DB /
+# dataset lookups that finish in milliseconds; a call still running after
+# this long is hung, and must not consume the whole provider timeout while
+# its sibling calls wait on the same turn.
+_TOOL_CALL_TIMEOUT_SECONDS = 10.0
+
+#: Per-conversation tool memo: ``(tool, canonical-arguments)`` → the future
+#: carrying that call's redacted result string. Shared by every hop (and the
+#: fallback attempt) of one ``execute`` so a model that asks the same question
+#: twice — or twice in one turn — pays for one handler run.
+ToolMemo = dict[tuple[str, str], "asyncio.Future[str]"]
+
 
 def _redact_payload(payload: dict[str, Any]) -> dict[str, Any]:
     """Redact secrets from every string value in ``payload``."""
@@ -65,6 +92,37 @@ def _redact_string(value: str) -> str:
     return redaction.redact_text(value).value
 
 
+def _tool_memo_key(name: str, arguments: Mapping[str, Any]) -> tuple[str, str]:
+    """Canonical memo key for one tool call (argument order never matters)."""
+    return name, json.dumps(arguments, sort_keys=True, default=str)
+
+
+def _tool_call_timeout(request: AIRequest) -> float:
+    """Per-call timeout: the budget's cap, never above the gateway ceiling."""
+    budget_cap = request.tool_budget.max_call_seconds
+    if budget_cap is None:
+        return _TOOL_CALL_TIMEOUT_SECONDS
+    return min(budget_cap, _TOOL_CALL_TIMEOUT_SECONDS)
+
+
+def _observe_usage(
+    request: AIRequest, provider_name: str, usage: ProviderUsage
+) -> None:
+    """Export one attempt's token usage, split into cached / uncached input."""
+    task = request.context.task.value
+    for kind, tokens in (
+        ("input_uncached", usage.input_tokens),
+        ("input_cached", usage.cached_input_tokens),
+        ("output", usage.output_tokens),
+    ):
+        if tokens:
+            metrics.ai_tokens_total.labels(
+                task=task,
+                provider=provider_name,
+                kind=kind,
+            ).inc(tokens)
+
+
 def _degraded_response(
     request: AIRequest,
     *,
@@ -237,6 +295,34 @@ class AIGateway:
                 reason=f"feature_flag:disabled:{request.context.task.value}",
             )
 
+        verdict = budget.check(
+            self._collector,
+            request.context.guild_id,
+            request.context.task,
+        )
+        if verdict.level is not budget.BudgetLevel.OK:
+            metrics.ai_budget_total.labels(
+                scope=verdict.scope or "",
+                level=verdict.level.value,
+            ).inc()
+        if verdict.level is budget.BudgetLevel.HARD:
+            logger.info(
+                "ai gateway: guild=%s task=%s over its hard %s budget "
+                "($%.2f of $%.2f); degrading without a provider call",
+                request.context.guild_id,
+                request.context.task.value,
+                verdict.scope,
+                verdict.spent_usd,
+                verdict.limit_usd or 0.0,
+            )
+            return _degraded_response(
+                request,
+                provider_name=provider_name,
+                reason=f"{budget.BUDGET_EXHAUSTED_REASON}:{verdict.scope}",
+            )
+        if verdict.level is budget.BudgetLevel.SOFT and model_override is None:
+            effective_model = economy_model_for(provider_name) or effective_model
+
         safety_reason = precheck(request)
         if safety_reason is not None:
             self._collector.record_failure(
@@ -287,6 +373,7 @@ class AIGateway:
             )
 
         timeout = request.timeout_seconds or target.timeout_seconds
+        tool_memo: ToolMemo = {}
         response = await self._attempt(
             request,
             redacted_request,
@@ -294,6 +381,7 @@ class AIGateway:
             model=effective_model,
             timeout=timeout,
             tool_handlers=tool_handlers,
+            tool_memo=tool_memo,
         )
 
         # Provider-fault fallback. When no explicit ``provider_override``
@@ -317,6 +405,7 @@ class AIGateway:
                     model=fb_model,
                     timeout=timeout,
                     tool_handlers=tool_handlers,
+                    tool_memo=tool_memo,
                 )
                 if not fb_response.degraded:
                     return fb_response
@@ -356,6 +445,7 @@ class AIGateway:
         model: str,
         timeout: float,
         tool_handlers: Mapping[str, ToolHandler] | None,
+        tool_memo: ToolMemo | None = None,
     ) -> AIResponse:
         """Run one provider attempt and convert every fault to a degraded
         :class:`AIResponse`. Never raises — this is where the gateway's
@@ -368,9 +458,11 @@ class AIGateway:
                 redacted_request,
                 tool_handlers,
                 provider.name,
+                memo=tool_memo,
             )
         outcome = "success"
         started = time.perf_counter()
+        usage = ProviderUsage()
         try:
             # Only pass ``dispatch`` when tools are active so the no-tools
             # path stays identical to a provider with the legacy
@@ -386,7 +478,8 @@ class AIGateway:
                     model=model,
                     dispatch=dispatch,
                 )
-            raw_text = await asyncio.wait_for(provider_call, timeout=timeout)
+            with collect_usage() as usage:
+                raw_text = await asyncio.wait_for(provider_call, timeout=timeout)
         except asyncio.TimeoutError:
             latency_ms = (time.perf_counter() - started) * 1000.0
             outcome = "timeout"
@@ -480,6 +573,10 @@ class AIGateway:
                 reason=f"{type(exc).__name__}: {exc}",
                 latency_ms=latency_ms,
             )
+        finally:
+            # Tokens are billed even when the attempt then degrades.
+            _observe_usage(request, provider.name, usage)
+            self._record_usage(request, provider.name, model, usage)
 
         latency_ms = (time.perf_counter() - started) * 1000.0
         metrics.ai_request_total.labels(
@@ -522,6 +619,39 @@ class AIGateway:
             latency_ms=latency_ms,
             degraded=degraded,
             fallback_reason=fallback_reason,
+            input_tokens=usage.input_tokens,
+            cached_input_tokens=usage.cached_input_tokens,
+            output_tokens=usage.output_tokens,
+        )
+
+    def _record_usage(
+        self,
+        request: AIRequest,
+        provider_name: str,
+        model: str,
+        usage: ProviderUsage,
+    ) -> None:
+        """Add one attempt's usage to the collector's token ledger.
+
+        Attempts that reported no tokens (the deterministic provider, a call
+        that failed before the first response) are not ledger rows.
+        """
+        if not (usage.input_tokens or usage.cached_input_tokens or usage.output_tokens):
+            return
+        self._collector.record_usage(
+            guild_id=request.context.guild_id,
+            task=request.context.task.value,
+            provider=provider_name,
+            model=model,
+            input_tokens=usage.input_tokens,
+            cached_input_tokens=usage.cached_input_tokens,
+            output_tokens=usage.output_tokens,
+            cost_micros=budget.cost_micros(
+                model,
+                input_tokens=usage.input_tokens,
+                cached_input_tokens=usage.cached_input_tokens,
+                output_tokens=usage.output_tokens,
+            ),
         )
 
     def _build_dispatch(
@@ -529,24 +659,54 @@ class AIGateway:
         request: AIRequest,
         tool_handlers: Mapping[str, ToolHandler],
         provider_name: str,
+        *,
+        memo: ToolMemo | None = None,
     ) -> ToolDispatch:
         """Wrap ``tool_handlers`` in a redaction- and fault-safe dispatch.
 
         Only tools actually offered on ``request.tools`` are callable (a
         model that names an un-offered tool gets an error back). Each
         result is JSON-encoded and run through redaction before it
-        re-enters the model context. Handler exceptions are converted to
-        a JSON error string so the tool loop never breaks the gateway's
-        never-raise contract.
+        re-enters the model context. Handler exceptions and per-call
+        timeouts are converted to a JSON error string so the tool loop
+        never breaks the gateway's never-raise contract.
+
+        Providers may call the returned dispatch concurrently for the
+        calls of one turn. Identical ``(tool, arguments)`` calls within
+        the conversation resolve from ``memo`` — including a duplicate
+        that arrives while the first is still running, which awaits the
+        same result instead of starting a second handler. Only
+        successful results are memoised, so a failed or timed-out call
+        is retried if the model asks again.
         """
         offered = {spec.name for spec in request.tools}
+        call_timeout = _tool_call_timeout(request)
+        task_label = request.context.task.value
+        memo = {} if memo is None else memo
 
-        async def dispatch(name: str, arguments: dict[str, Any]) -> str:
-            if name not in offered or name not in tool_handlers:
-                return json.dumps({"error": "tool_not_available", "tool": name})
+        async def run_handler(name: str, arguments: dict[str, Any]) -> tuple[str, bool]:
+            started = time.perf_counter()
+            outcome = "success"
             try:
-                result = await tool_handlers[name](arguments)
+                result = await asyncio.wait_for(
+                    tool_handlers[name](arguments),
+                    timeout=call_timeout,
+                )
+            except asyncio.TimeoutError:
+                outcome = "timeout"
+                logger.warning(
+                    "ai gateway: tool %r timed out after %.1fs",
+                    name,
+                    call_timeout,
+                )
+                self._collector.record_failure(
+                    provider_active=provider_name,
+                    error_type="ToolTimeout",
+                    fallback_reason=f"tool:{name}",
+                )
+                return json.dumps({"error": "tool_timeout", "tool": name}), False
             except Exception as exc:  # noqa: BLE001 — tool faults must not break the loop
+                outcome = "error"
                 logger.warning(
                     "ai gateway: tool %r raised: %s",
                     name,
@@ -558,11 +718,39 @@ class AIGateway:
                     error_type="ToolError",
                     fallback_reason=f"tool:{name}",
                 )
-                return json.dumps({"error": "tool_failed", "tool": name})
+                return json.dumps({"error": "tool_failed", "tool": name}), False
+            finally:
+                metrics.ai_tool_call_seconds.labels(
+                    task=task_label,
+                    tool=name,
+                ).observe(time.perf_counter() - started)
+                metrics.ai_tool_call_total.labels(tool=name, outcome=outcome).inc()
             payload = (
                 result if isinstance(result, str) else json.dumps(result, default=str)
             )
-            return _redact_string(payload)
+            return _redact_string(payload), True
+
+        async def dispatch(name: str, arguments: dict[str, Any]) -> str:
+            if name not in offered or name not in tool_handlers:
+                return json.dumps({"error": "tool_not_available", "tool": name})
+            key = _tool_memo_key(name, arguments)
+            pending = memo.get(key)
+            if pending is not None:
+                metrics.ai_tool_call_total.labels(tool=name, outcome="memo").inc()
+                # Shield so a cancelled waiter never cancels the shared result.
+                return await asyncio.shield(pending)
+            future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+            memo[key] = future
+            try:
+                text, cacheable = await run_handler(name, arguments)
+            except BaseException:
+                memo.pop(key, None)
+                future.cancel()
+                raise
+            if not cacheable:
+                memo.pop(key, None)
+            future.set_result(text)
+            return text
 
         return dispatch
 
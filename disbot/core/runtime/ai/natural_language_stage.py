@@ -9,7 +9,9 @@ Flow per message:
 
     1. resolver:  ai_natural_language_policy.resolve()
     2. router:    ai_task_router.classify()
-    3. feature:   for BTD6 → btd6_context_service.build()
+    3. enrich:    feature facts (BTD6 → btd6_context_service.build()),
+                  recent turns and bot knowledge, gathered concurrently
+                  under one budget (per-leg timings land on the audit row)
     4. stack:     ai_instruction_service.assemble()
     5. gateway:   services.ai_gateway.execute()  (never raises; returns
                   a degraded :class:`AIResponse` when the provider path
@@ -22,19 +24,30 @@ Every code path through this stage produces exactly one
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 import time
 import uuid
 from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import discord
 
-from core.runtime.ai.contracts import AIScope, AITask, PolicyDenialReason
+from core.runtime.ai.budget import BUDGET_EXHAUSTED_REASON
+from core.runtime.ai.contracts import (
+    PROMPT_CACHE_BREAKPOINT,
+    AIScope,
+    AITask,
+    PolicyDenialReason,
+)
 from core.runtime.ai.feature_facts import FeatureFactRequest, FeatureFactsResult
-from core.runtime.message_pipeline import MessagePipelineContext, StageResult
+from core.runtime.message_pipeline import (
+    LoadPolicy,
+    MessagePipelineContext,
+    StageResult,
+)
 from services import (
     ai_context_service,
     ai_conversation_service,
@@ -48,7 +61,7 @@ from services import (
 from services.ai_natural_language_policy import MessageContext
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Coroutine, Mapping
 
     from core.runtime.ai.contracts import AIResponse
     from core.runtime.ai.providers.base import ToolHandler
@@ -216,6 +229,44 @@ def _record_user_turn_if_visible(
     return True
 
 
+def _addresses_bot(ctx: MessagePipelineContext) -> bool:
+    return _is_direct_bot_mention(ctx.message, getattr(ctx.bot, "user", None))
+
+
+# A message from someone the bot answered in this channel this recently is a
+# follow-up in an active conversation, even without an @mention.
+CONVERSATION_FOLLOWUP_SECONDS = 120.0
+
+
+def is_conversation_followup(ctx: MessagePipelineContext) -> bool:
+    """True if the bot replied to ``ctx``'s author in this channel within
+    :data:`CONVERSATION_FOLLOWUP_SECONDS` (load-shedding ``keep`` predicate).
+    """
+    message = ctx.message
+    if message.guild is None or message.channel is None:
+        return False
+    return ai_conversation_service.replied_recently(
+        message.guild.id,
+        message.channel.id,
+        message.author.id,
+        within_seconds=CONVERSATION_FOLLOWUP_SECONDS,
+    )
+
+
+def _keep_under_load(ctx: MessagePipelineContext) -> bool:
+    return _addresses_bot(ctx) or is_conversation_followup(ctx)
+
+
+# Passive replies are shed in a flooded channel/guild (see "Load shedding"
+# in core/runtime/message_pipeline.py); a direct @mention or a follow-up in
+# an active conversation is always answered.
+LOAD_POLICY = LoadPolicy(
+    channel_per_minute=30.0,
+    guild_per_minute=300.0,
+    keep=_keep_under_load,
+)
+
+
 @dataclass
 class AINaturalLanguageStage:
     """Single passive natural-language responder.
@@ -228,6 +279,7 @@ class AINaturalLanguageStage:
 
     name: str = STAGE_NAME
     order: int = STAGE_ORDER
+    load_policy: LoadPolicy = LOAD_POLICY
 
     async def process(
         self,
@@ -474,54 +526,8 @@ class AINaturalLanguageStage:
             ctx.metadata["handled_by"] = STAGE_NAME
             return StageResult(short_circuit=True)
 
+        enrichment_timings: dict[str, dict[str, Any]] | None = None
         try:
-            _fact_req = FeatureFactRequest(
-                task=routed.task,
-                text=raw_text,
-                guild_id=guild_id,
-                channel_id=channel_id,
-                author_id=user_id,
-                message_id=message.id,
-                conversation_followup=getattr(routed, "via_conversation_cue", False),
-            )
-            feature = await _gather_feature_facts(_fact_req)
-
-            # Video tasks: short-circuit when no grounding facts are available.
-            # Must not call the AI provider with empty video context.
-            if routed.task in _VIDEO_TASKS and not feature.facts:
-                try:
-                    await message.channel.send(
-                        "I couldn't retrieve video information for that link.",
-                        allowed_mentions=discord.AllowedMentions.none(),
-                    )
-                    await ai_decision_audit_service.record(
-                        guild_id=guild_id,
-                        channel_id=channel_id,
-                        category_id=category_id,
-                        user_id=user_id,
-                        message_id=message.id,
-                        task=routed.task.value,
-                        route=routed.route,
-                        decision="denied",
-                        reason_code=feature.error_reason or "video_grounding_failed",
-                        policy_snapshot_hash=decision.policy_snapshot_hash,
-                    )
-                except discord.HTTPException:
-                    await ai_decision_audit_service.record(
-                        guild_id=guild_id,
-                        channel_id=channel_id,
-                        category_id=category_id,
-                        user_id=user_id,
-                        message_id=message.id,
-                        task=routed.task.value,
-                        route=routed.route,
-                        decision="errored",
-                        reason_code="video_unavailable_reply_send_failed",
-                        policy_snapshot_hash=decision.policy_snapshot_hash,
-                    )
-                ctx.metadata["handled_by"] = STAGE_NAME
-                return StageResult(short_circuit=True)
-
             # BUG-0009 ("grounded facts, wrong assembly"): answer a clear
             # deterministic list question — "which Monkey Knowledge relate to
             # <tower>?", "what does Geraldo unlock per level?" — BEFORE the
@@ -531,6 +537,7 @@ class AINaturalLanguageStage:
             # deterministic layer must OWN the labelled list. The dispatcher
             # returns None for single-entity lookups / strategy / anything
             # outside an exact list shape, which fall through to the model.
+            # Runs before the enrichment gather: a list answer needs none of it.
             if routed.task is AITask.BTD6_ANSWER:
                 list_reply: str | None = None
                 try:
@@ -574,34 +581,74 @@ class AINaturalLanguageStage:
                     ctx.metadata["handled_by"] = STAGE_NAME
                     return StageResult(short_circuit=True)
 
-            # Chat memory: gather recent channel turns (with optional
-            # Discord history fallback). Best-effort — failure returns
-            # an empty list and the stack assembles without recent
-            # turns, preserving the prior behaviour.
-            try:
-                from services import ai_memory_service
+            _fact_req = FeatureFactRequest(
+                task=routed.task,
+                text=raw_text,
+                guild_id=guild_id,
+                channel_id=channel_id,
+                author_id=user_id,
+                message_id=message.id,
+                conversation_followup=getattr(routed, "via_conversation_cue", False),
+            )
+            # Enrichment: feature facts, recent channel turns (chat memory,
+            # with optional Discord history fallback) and bot knowledge are
+            # independent, so they run concurrently under one budget. Every
+            # leg is best-effort except the feature facts, whose failure
+            # still errors the turn below.
+            enrichment, enrichment_timings = await _gather_enrichment(
+                message,
+                fact_req=_fact_req,
+                user_text=user_text,
+                task=routed.task,
+                guild_id=guild_id,
+                channel_id=channel_id,
+                user_id=user_id,
+                bot_user_id=bot_user_id,
+            )
+            feature = enrichment.feature
+            recent_turns = enrichment.recent_turns
+            bot_knowledge_blocks = enrichment.bot_knowledge_blocks
 
-                recent_turns = await ai_memory_service.gather_recent_turns(
-                    guild_id=guild_id,
-                    channel_id=channel_id,
-                    channel=getattr(message, "channel", None),
-                    bot_user_id=bot_user_id,
-                )
-            except Exception:  # noqa: BLE001 — defensive
-                # Warning, not debug: the reply still proceeds without
-                # recent context, but a persistent failure here silently
-                # degrades every reply, so it must be visible in prod logs.
-                logger.warning(
-                    "ai_natural_language_stage: memory unavailable; replying "
-                    "without recent context (guild=%s channel=%s)",
-                    guild_id,
-                    channel_id,
-                    exc_info=True,
-                )
-                recent_turns = []
+            # Video tasks: short-circuit when no grounding facts are available.
+            # Must not call the AI provider with empty video context.
+            if routed.task in _VIDEO_TASKS and not feature.facts:
+                try:
+                    await message.channel.send(
+                        "I couldn't retrieve video information for that link.",
+                        allowed_mentions=discord.AllowedMentions.none(),
+                    )
+                    await ai_decision_audit_service.record(
+                        guild_id=guild_id,
+                        channel_id=channel_id,
+                        category_id=category_id,
+                        user_id=user_id,
+                        message_id=message.id,
+                        task=routed.task.value,
+                        route=routed.route,
+                        decision="denied",
+                        reason_code=feature.error_reason or "video_grounding_failed",
+                        policy_snapshot_hash=decision.policy_snapshot_hash,
+                        enrichment_timings=enrichment_timings,
+                    )
+                except discord.HTTPException:
+                    await ai_decision_audit_service.record(
+                        guild_id=guild_id,
+                        channel_id=channel_id,
+                        category_id=category_id,
+                        user_id=user_id,
+                        message_id=message.id,
+                        task=routed.task.value,
+                        route=routed.route,
+                        decision="errored",
+                        reason_code="video_unavailable_reply_send_failed",
+                        policy_snapshot_hash=decision.policy_snapshot_hash,
+                        enrichment_timings=enrichment_timings,
+                    )
+                ctx.metadata["handled_by"] = STAGE_NAME
+                return StageResult(short_circuit=True)
 
             # Record the triggering mention exactly once, AFTER the
-            # gather above has captured the prior buffer. The mention
+            # enrichment gather has captured the prior buffer. The mention
             # therefore cannot appear in its own recent-turn context.
             _record_user_turn_if_visible(
                 message,
@@ -613,15 +660,6 @@ class AINaturalLanguageStage:
                 record_mentions=True,
             )
 
-            bot_knowledge_blocks = await _gather_bot_knowledge_blocks(
-                message,
-                user_text=user_text,
-                task=routed.task,
-                guild_id=guild_id,
-                channel_id=channel_id,
-                user_id=user_id,
-            )
-
             stack = await ai_instruction_service.assemble(
                 guild_id=guild_id,
                 user_message=user_text,
@@ -630,6 +668,7 @@ class AINaturalLanguageStage:
                 recent_turns=recent_turns,
                 bot_user_id=bot_user_id,
                 bot_knowledge_blocks=bot_knowledge_blocks,
+                policy_version=decision.policy_snapshot_hash,
             )
             correlation_id = uuid.uuid4().hex
             built = ai_context_service.build(
@@ -671,6 +710,7 @@ class AINaturalLanguageStage:
                 instruction_profile_ids=(
                     list(stack.instruction_profile_ids) if "stack" in locals() else None
                 ),
+                enrichment_timings=enrichment_timings,
             )
             await ai_review_log_service.record_unknown(
                 guild_id=guild_id,
@@ -695,7 +735,19 @@ class AINaturalLanguageStage:
             # ``GROUNDING_FAILED`` is reserved for healthy paths — a provider
             # outage stays ``PROVIDER_UNAVAILABLE``.
             sent_refusal = False
-            if response.degraded:
+            budget_refused = (response.fallback_reason or "").startswith(
+                BUDGET_EXHAUSTED_REASON,
+            )
+            if response.degraded and budget_refused:
+                # Over the guild's hard spend budget: no provider was called.
+                # An in-domain BTD6 question still gets the deterministic
+                # floor (roster / meta / refusal) instead of silence.
+                audit_decision = "degraded"
+                audit_reason = PolicyDenialReason.BUDGET_EXHAUSTED
+                if routed.task is AITask.BTD6_ANSWER:
+                    await _serve_btd6_floor(message, raw_text)
+                    sent_refusal = True
+            elif response.degraded:
                 audit_decision = "degraded"
                 audit_reason = PolicyDenialReason.PROVIDER_UNAVAILABLE
             elif routed.task is AITask.BTD6_ANSWER:
@@ -723,6 +775,7 @@ class AINaturalLanguageStage:
                 instruction_profile_ids=list(stack.instruction_profile_ids) or None,
                 provider=response.provider or None,
                 model=response.model or None,
+                enrichment_timings=enrichment_timings,
             )
             await ai_review_log_service.record_unknown(
                 guild_id=guild_id,
@@ -852,6 +905,7 @@ class AINaturalLanguageStage:
                         or None,
                         provider=response.provider or None,
                         model=response.model or None,
+                        enrichment_timings=enrichment_timings,
                     )
                     await ai_review_log_service.record_unknown(
                         guild_id=guild_id,
@@ -946,6 +1000,7 @@ class AINaturalLanguageStage:
                         or None,
                         provider=response.provider or None,
                         model=response.model or None,
+                        enrichment_timings=enrichment_timings,
                     )
                     await ai_review_log_service.record_unknown(
                         guild_id=guild_id,
@@ -1038,6 +1093,7 @@ class AINaturalLanguageStage:
                 instruction_profile_ids=list(stack.instruction_profile_ids) or None,
                 provider=response.provider or None,
                 model=response.model or None,
+                enrichment_timings=enrichment_timings,
             )
             return StageResult()
 
@@ -1076,6 +1132,7 @@ class AINaturalLanguageStage:
             instruction_profile_ids=list(stack.instruction_profile_ids) or None,
             provider=response.provider or None,
             model=response.model or None,
+            enrichment_timings=enrichment_timings,
         )
 
         # Remember this answer so a later 👎 / correction-reply on it can be
@@ -1100,27 +1157,198 @@ class AINaturalLanguageStage:
         return StageResult(short_circuit=True)
 
 
-async def _gather_bot_knowledge_blocks(
+# Wall-clock budget for the concurrent enrichment gather. Legs still running
+# when it expires are cancelled and the reply proceeds with what has arrived —
+# a slow Discord-history fallback or fact store never holds the reply hostage.
+_ENRICHMENT_BUDGET_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class _Enrichment:
+    """What the enrichment legs gathered for one turn (see :func:`_gather_enrichment`)."""
+
+    feature: FeatureFactsResult
+    recent_turns: list[Any]
+    bot_knowledge_blocks: tuple[ai_instruction_service.BotKnowledgeBlock, ...]
+
+
+async def _gather_enrichment(
     message: discord.Message,
     *,
+    fact_req: FeatureFactRequest,
     user_text: str,
     task: AITask,
     guild_id: int,
     channel_id: int,
     user_id: int,
+    bot_user_id: int | None,
+) -> tuple[_Enrichment, dict[str, dict[str, Any]]]:
+    """Run the turn's independent enrichment legs concurrently.
+
+    Feature facts, recent channel turns, bot self-knowledge and (for BTD6)
+    the live-state blocks do not depend on each other, so the reply waits for
+    the slowest leg rather than their sum. A leg that misses the budget
+    contributes its empty default. Returns the gathered :class:`_Enrichment`
+    and the per-leg timings for the audit row.
+    """
+    legs: dict[str, Coroutine[Any, Any, Any]] = {
+        "feature_facts": _gather_feature_facts(fact_req),
+        "recent_turns": _gather_recent_turns(
+            message,
+            guild_id=guild_id,
+            channel_id=channel_id,
+            bot_user_id=bot_user_id,
+        ),
+        "self_knowledge": _gather_self_knowledge_blocks(
+            message,
+            user_text=user_text,
+            guild_id=guild_id,
+            channel_id=channel_id,
+            user_id=user_id,
+        ),
+    }
+    if task is AITask.BTD6_ANSWER:
+        legs["btd6_knowledge"] = _gather_btd6_knowledge_blocks(user_text)
+
+    results, timings = await _run_enrichment_legs(
+        legs,
+        budget_seconds=_ENRICHMENT_BUDGET_SECONDS,
+    )
+    timed_out = sorted(n for n, t in timings.items() if t["outcome"] == "timeout")
+    if timed_out:
+        logger.warning(
+            "ai_natural_language_stage: enrichment legs %s missed the %.1fs "
+            "budget; replying with what arrived (guild=%s channel=%s)",
+            ", ".join(timed_out),
+            _ENRICHMENT_BUDGET_SECONDS,
+            guild_id,
+            channel_id,
+        )
+    feature = results.get("feature_facts") or FeatureFactsResult(
+        facts=(),
+        error_reason="enrichment_timeout",
+    )
+    return (
+        _Enrichment(
+            feature=feature,
+            recent_turns=results.get("recent_turns") or [],
+            bot_knowledge_blocks=(
+                tuple(results.get("self_knowledge") or ())
+                + tuple(results.get("btd6_knowledge") or ())
+            ),
+        ),
+        timings,
+    )
+
+
+async def _run_enrichment_legs(
+    legs: Mapping[str, Coroutine[Any, Any, Any]],
+    *,
+    budget_seconds: float,
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Await ``legs`` concurrently; cancel whatever outlives ``budget_seconds``.
+
+    Returns ``(results, timings)``: ``results`` holds only the legs that
+    finished; ``timings`` maps every leg to ``{"ms", "outcome"}`` with
+    outcome ``ok`` / ``error`` / ``timeout``. A leg that raised re-raises
+    here (first in ``legs`` order) once the others have settled, so the
+    caller's error handling sees it exactly as it did when the legs ran one
+    after another.
+    """
+    timings: dict[str, dict[str, Any]] = {}
+
+    async def _timed(name: str, coro: Coroutine[Any, Any, Any]) -> Any:
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await coro
+            outcome = "ok"
+            return result
+        except asyncio.CancelledError:
+            outcome = "timeout"
+            raise
+        finally:
+            if outcome != "timeout":
+                timings[name] = {
+                    "ms": int((time.perf_counter() - started) * 1000),
+                    "outcome": outcome,
+                }
+
+    tasks = {
+        name: asyncio.create_task(_timed(name, coro)) for name, coro in legs.items()
+    }
+    try:
+        _done, pending = await asyncio.wait(tasks.values(), timeout=budget_seconds)
+    finally:
+        # Cancels the over-budget legs — and every leg if the stage itself
+        # is cancelled mid-gather.
+        for leg in tasks.values():
+            if not leg.done():
+                leg.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    results: dict[str, Any] = {}
+    for name, leg in tasks.items():
+        if leg in pending:
+            timings[name] = {"ms": int(budget_seconds * 1000), "outcome": "timeout"}
+            continue
+        exc = leg.exception()
+        if exc is not None:
+            raise exc
+        results[name] = leg.result()
+    return results, timings
+
+
+async def _gather_recent_turns(
+    message: discord.Message,
+    *,
+    guild_id: int,
+    channel_id: int,
+    bot_user_id: int | None,
+) -> list[Any]:
+    """Recent channel turns for the chat-memory span (best-effort).
+
+    Optional Discord history fallback included. Failure returns an empty
+    list and the stack assembles without recent turns.
+    """
+    try:
+        from services import ai_memory_service
+
+        return await ai_memory_service.gather_recent_turns(
+            guild_id=guild_id,
+            channel_id=channel_id,
+            channel=getattr(message, "channel", None),
+            bot_user_id=bot_user_id,
+        )
+    except Exception:  # noqa: BLE001 — defensive
+        # Warning, not debug: the reply still proceeds without
+        # recent context, but a persistent failure here silently
+        # degrades every reply, so it must be visible in prod logs.
+        logger.warning(
+            "ai_natural_language_stage: memory unavailable; replying "
+            "without recent context (guild=%s channel=%s)",
+            guild_id,
+            channel_id,
+            exc_info=True,
+        )
+        return []
+
+
+async def _gather_self_knowledge_blocks(
+    message: discord.Message,
+    *,
+    user_text: str,
+    guild_id: int,
+    channel_id: int,
+    user_id: int,
 ) -> tuple[ai_instruction_service.BotKnowledgeBlock, ...]:
-    """Collect the authoritative bot-knowledge blocks for this turn.
-
-    Two best-effort enrichments, each isolated so a failure in one never
-    suppresses the other or the reply itself:
-
-    * Bot self-knowledge — command catalog + the asker's most recent
-      non-replied audit row, gated by intent heuristics so the prompt
-      only grows when the user actually asks a meta-question. Failure
-      logs at warning (it silently weakens "what can you do" answers).
-    * BTD6 live-state — only for BTD6-classified messages, and only when
-      the message carries a BTD6 anchor term. Absence is routine, so a
-      failure here stays at debug.
+    """Bot self-knowledge blocks for this turn (best-effort).
+
+    Command catalog + the asker's most recent non-replied audit row, gated
+    by intent heuristics so the prompt only grows when the user actually
+    asks a meta-question. Failure logs at warning (it silently weakens
+    "what can you do" answers) and returns no blocks.
     """
     try:
         from services import bot_knowledge_service
@@ -1130,9 +1358,7 @@ async def _gather_bot_knowledge_blocks(
         else:
             accessible = frozenset()
 
-        blocks: tuple[
-            ai_instruction_service.BotKnowledgeBlock, ...
-        ] = await bot_knowledge_service.gather(
+        return await bot_knowledge_service.gather(
             guild_id=guild_id,
             channel_id=channel_id,
             user_id=user_id,
@@ -1148,26 +1374,32 @@ async def _gather_bot_knowledge_blocks(
             channel_id,
             exc_info=True,
         )
-        blocks = ()
+        return ()
 
-    if task is AITask.BTD6_ANSWER:
-        try:
-            from services import btd6_ai_knowledge_block_service
 
-            btd6_blocks = (
-                await btd6_ai_knowledge_block_service.gather_btd6_bot_knowledge_blocks(
-                    user_text=user_text,
-                )
-            )
-            if btd6_blocks:
-                blocks = blocks + btd6_blocks
-        except Exception as exc:  # noqa: BLE001 — absence is routine here
-            logger.debug(
-                "ai_natural_language_stage: btd6 knowledge unavailable: %s",
-                exc,
-            )
+async def _gather_btd6_knowledge_blocks(
+    user_text: str,
+) -> tuple[ai_instruction_service.BotKnowledgeBlock, ...]:
+    """BTD6 live-state blocks for a BTD6-classified message (best-effort).
 
-    return blocks
+    Only produced when the message carries a BTD6 anchor term. Absence is
+    routine, so a failure here stays at debug.
+    """
+    try:
+        from services import btd6_ai_knowledge_block_service
+
+        return tuple(
+            await btd6_ai_knowledge_block_service.gather_btd6_bot_knowledge_blocks(
+                user_text=user_text,
+            )
+            or (),
+        )
+    except Exception as exc:  # noqa: BLE001 — absence is routine here
+        logger.debug(
+            "ai_natural_language_stage: btd6 knowledge unavailable: %s",
+            exc,
+        )
+        return ()
 
 
 async def _gather_feature_facts(req: FeatureFactRequest) -> FeatureFactsResult:
@@ -1393,9 +1625,7 @@ async def _serve_btd6_floor(
     try:
         from services import btd6_context_service
 
-        floor_reply = btd6_context_service.deterministic_roster_reply(raw_text)
-        if not floor_reply:
-            floor_reply = btd6_context_service.deterministic_meta_reply(raw_text)
+        floor_reply = btd6_context_service.deterministic_floor_reply(raw_text)
     except Exception:
         logger.warning("btd6 deterministic floor build failed", exc_info=True)
 
@@ -1622,11 +1852,16 @@ async def _invoke_gateway(
     if not specs:
         handlers = None
 
+    # Per-turn blocks go after a cache breakpoint so the stable stack
+    # prefix stays prompt-cacheable even on turns that carry them.
     system_prompt = stack.render_system_prompt()
-    if workflow_block:
-        system_prompt = f"{system_prompt}\n\n{workflow_block}"
-    if grounding_constraint:
-        system_prompt = f"{system_prompt}\n\n{grounding_constraint}"
+    volatile_blocks = [
+        block for block in (workflow_block, grounding_constraint) if block
+    ]
+    if volatile_blocks:
+        system_prompt = "\n\n".join(
+            [system_prompt, PROMPT_CACHE_BREAKPOINT, *volatile_blocks],
+        )
 
     request = AIRequest(
         context=ctx,
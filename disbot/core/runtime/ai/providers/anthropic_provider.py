@@ -36,12 +36,16 @@ from core.runtime.ai.contracts import (
     AIToolChoice,
     AIToolSpec,
     ToolRequirementMode,
+    split_prompt_cache_segments,
 )
 from core.runtime.ai.providers.base import (
     ProviderUnavailableError,
     ToolDispatch,
     ToolLoopState,
     cap_tool_result,
+    record_usage,
+    run_tool_calls,
+    usage_count,
 )
 
 logger = logging.getLogger("bot.runtime.ai.anthropic_provider")
@@ -54,6 +58,9 @@ _TOOL_HOP_LIMIT = 4
 # the request does not set one.
 _DEFAULT_MAX_TOKENS = 1024
 
+# Anthropic caps ``cache_control`` breakpoints per request.
+_MAX_CACHE_BREAKPOINTS = 4
+
 
 class AnthropicProvider:
     """Async Anthropic Messages-API adapter with tool use + prompt caching.
@@ -138,6 +145,7 @@ class AnthropicProvider:
                 kwargs["tool_choice"] = _anthropic_tool_choice(choice, hop)
 
             response = await client.messages.create(**kwargs)
+            _record_response_usage(response)
             blocks = _blocks_of(response)
             tool_uses = _tool_uses(blocks) if allow_tools else []
 
@@ -148,29 +156,28 @@ class AnthropicProvider:
                 return text
 
             # The model asked for one or more tools. Echo its turn (the full
-            # content blocks), then append each tool result, then loop.
-            # ``dispatch`` never raises — failures come back as a JSON error
-            # string the model can react to.
+            # content blocks), run the calls concurrently, then append each
+            # tool result in call order and loop. ``dispatch`` never raises —
+            # failures come back as a JSON error string the model can react to.
             messages.append(
                 {"role": "assistant", "content": getattr(response, "content", blocks)},
             )
+            results = await run_tool_calls(
+                dispatch,  # type: ignore[arg-type]
+                [
+                    (getattr(tool_use, "name", "") or "", _tool_input(tool_use))
+                    for tool_use in tool_uses
+                ],
+                max_parallel=budget.max_parallel_calls,
+            )
             tool_results: list[dict[str, Any]] = []
-            for tool_use in tool_uses:
-                raw_input = getattr(tool_use, "input", None)
-                arguments = raw_input if isinstance(raw_input, dict) else {}
+            for tool_use, raw_result in zip(tool_uses, results, strict=True):
                 state.record_call()
-                result = cap_tool_result(
-                    await dispatch(  # type: ignore[misc]
-                        getattr(tool_use, "name", "") or "",
-                        arguments,
-                    ),
-                    budget.max_result_chars,
-                )
                 tool_results.append(
                     {
                         "type": "tool_result",
                         "tool_use_id": getattr(tool_use, "id", ""),
-                        "content": result,
+                        "content": cap_tool_result(raw_result, budget.max_result_chars),
                     },
                 )
             messages.append({"role": "user", "content": tool_results})
@@ -181,19 +188,27 @@ class AnthropicProvider:
 
 
 def _system_blocks(system_prompt: str) -> list[dict[str, Any]]:
-    """Wrap the system prompt as a cache-marked text block.
-
-    ``cache_control`` makes the stable system prefix prompt-cacheable; it is
-    a no-op (no error) when the prefix is shorter than the model's minimum
-    cacheable length.
+    """Wrap the system prompt as cache-marked text blocks.
+
+    One block per :data:`PROMPT_CACHE_BREAKPOINT` segment. ``cache_control``
+    goes on every segment that ends a stable prefix (a prompt without markers
+    is one cached block, the historical shape), never on a trailing per-turn
+    segment, so that text cannot invalidate the cached prefix. Anthropic
+    allows at most :data:`_MAX_CACHE_BREAKPOINTS`; the latest ones are kept
+    because each covers everything before it. ``cache_control`` is a no-op
+    (no error) when a prefix is shorter than the model's minimum cacheable
+    length.
     """
-    return [
-        {
-            "type": "text",
-            "text": system_prompt,
-            "cache_control": {"type": "ephemeral"},
-        },
-    ]
+    segments = split_prompt_cache_segments(system_prompt)
+    cached_indexes = [i for i, (_, cacheable) in enumerate(segments) if cacheable]
+    kept = set(cached_indexes[-_MAX_CACHE_BREAKPOINTS:])
+    blocks: list[dict[str, Any]] = []
+    for index, (text, _) in enumerate(segments):
+        block: dict[str, Any] = {"type": "text", "text": text}
+        if index in kept:
+            block["cache_control"] = {"type": "ephemeral"}
+        blocks.append(block)
+    return blocks
 
 
 def _to_anthropic_tools(specs: tuple[AIToolSpec, ...]) -> list[dict[str, Any]]:
@@ -240,6 +255,23 @@ def _output_config(request: AIRequest) -> dict[str, Any] | None:
     return {"format": {"type": "json_schema", "schema": schema}}
 
 
+def _record_response_usage(response: Any) -> None:
+    """Report a Messages response's ``usage`` block (absent on test doubles).
+
+    Tokens written to the cache are billed as input, so they count as
+    uncached; only ``cache_read_input_tokens`` were served from the cache.
+    """
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    record_usage(
+        input_tokens=usage_count(usage, "input_tokens")
+        + usage_count(usage, "cache_creation_input_tokens"),
+        cached_input_tokens=usage_count(usage, "cache_read_input_tokens"),
+        output_tokens=usage_count(usage, "output_tokens"),
+    )
+
+
 def _blocks_of(response: Any) -> list[Any]:
     """Return the response content blocks as a list (never ``None``)."""
     content = getattr(response, "content", None)
@@ -250,6 +282,12 @@ def _tool_uses(blocks: list[Any]) -> list[Any]:
     return [b for b in blocks if getattr(b, "type", None) == "tool_use"]
 
 
+def _tool_input(tool_use: Any) -> dict[str, Any]:
+    """Return a ``tool_use`` block's parsed input (``{}`` when absent or malformed)."""
+    raw_input = getattr(tool_use, "input", None)
+    return raw_input if isinstance(raw_input, dict) else {}
+
+
 def _extract_text(blocks: list[Any]) -> str | None:
     """Concatenate the text blocks of a Messages response."""
     parts = [
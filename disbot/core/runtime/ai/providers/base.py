@@ -20,8 +20,11 @@ Providers may raise:
 
 from __future__ import annotations
 
+import asyncio
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
@@ -52,6 +55,33 @@ def cap_tool_result(result: str, max_chars: int | None) -> str:
     return result[:max_chars] + " …[tool result truncated]"
 
 
+async def run_tool_calls(
+    dispatch: ToolDispatch,
+    calls: Sequence[tuple[str, dict[str, Any]]],
+    *,
+    max_parallel: int,
+) -> list[str]:
+    """Run one assistant turn's tool calls concurrently; results come back in call order.
+
+    The calls of a single turn are independent by construction (the model asked for all
+    of them before seeing any result), so they run under a semaphore of ``max_parallel``
+    instead of one after another. ``dispatch`` never raises, so one slow or failing call
+    cannot take its siblings down. A single call (or ``max_parallel <= 1``) takes the
+    plain sequential path.
+    """
+    if len(calls) <= 1 or max_parallel <= 1:
+        return [await dispatch(name, arguments) for name, arguments in calls]
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def _one(name: str, arguments: dict[str, Any]) -> str:
+        async with semaphore:
+            return await dispatch(name, arguments)
+
+    return list(
+        await asyncio.gather(*(_one(name, arguments) for name, arguments in calls)),
+    )
+
+
 @dataclass
 class ToolLoopState:
     """Per-request accounting that bounds a provider's model<->tool loop by its budget.
@@ -85,6 +115,74 @@ class ToolLoopState:
         self.calls_made += 1
 
 
+@dataclass
+class ProviderUsage:
+    """Token usage a provider reported for one request, summed over every hop.
+
+    ``input_tokens`` is the uncached prompt input (including tokens written to
+    a provider cache); ``cached_input_tokens`` is the prompt input served from
+    a provider's prompt cache. The split is what shows the cache saving.
+    """
+
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
+
+    def add(
+        self,
+        *,
+        input_tokens: int = 0,
+        cached_input_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> None:
+        self.input_tokens += max(0, input_tokens)
+        self.cached_input_tokens += max(0, cached_input_tokens)
+        self.output_tokens += max(0, output_tokens)
+
+
+# The gateway opens a collector around each provider call; adapters report
+# each API response's usage block into it. A context variable keeps the
+# ``execute(request, *, model, dispatch)`` contract unchanged, and the object
+# travels into the ``asyncio.wait_for`` task with the copied context.
+_CURRENT_USAGE: ContextVar[ProviderUsage | None] = ContextVar(
+    "ai_provider_usage",
+    default=None,
+)
+
+
+def usage_count(usage: Any, field_name: str) -> int:
+    """Read one integer counter off an SDK usage object (``0`` when absent)."""
+    value = getattr(usage, field_name, 0)
+    return value if isinstance(value, int) else 0
+
+
+@contextmanager
+def collect_usage() -> Iterator[ProviderUsage]:
+    """Collect the usage reported by provider calls made inside the block."""
+    usage = ProviderUsage()
+    token = _CURRENT_USAGE.set(usage)
+    try:
+        yield usage
+    finally:
+        _CURRENT_USAGE.reset(token)
+
+
+def record_usage(
+    *,
+    input_tokens: int = 0,
+    cached_input_tokens: int = 0,
+    output_tokens: int = 0,
+) -> None:
+    """Add one API response's usage to the active collector (no-op outside one)."""
+    usage = _CURRENT_USAGE.get()
+    if usage is not None:
+        usage.add(
+            input_tokens=input_tokens,
+            cached_input_tokens=cached_input_tokens,
+            output_tokens=output_tokens,
+        )
+
+
 class ProviderUnavailableError(RuntimeError):
     """Raised when a provider cannot execute the request.
 
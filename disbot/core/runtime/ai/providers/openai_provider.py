@@ -9,6 +9,7 @@ directly. All consumers route through
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
@@ -20,12 +21,16 @@ from core.runtime.ai.contracts import (
     AIToolChoice,
     AIToolSpec,
     ToolRequirementMode,
+    split_prompt_cache_segments,
 )
 from core.runtime.ai.providers.base import (
     ProviderUnavailableError,
     ToolDispatch,
     ToolLoopState,
     cap_tool_result,
+    record_usage,
+    run_tool_calls,
+    usage_count,
 )
 
 logger = logging.getLogger("bot.runtime.ai.openai_provider")
@@ -87,8 +92,9 @@ class OpenAIProvider:
         dispatch: ToolDispatch | None = None,
     ) -> str:
         client = self._ensure_client()
+        system_prompt, cache_key = _system_prompt_and_cache_key(request.system_prompt)
         messages: list[dict[str, Any]] = [
-            {"role": "system", "content": request.system_prompt},
+            {"role": "system", "content": system_prompt},
             {"role": "user", "content": json.dumps(request.payload, default=str)},
         ]
         response_format = _response_format(request)
@@ -112,6 +118,8 @@ class OpenAIProvider:
             # default model (gpt-4o-mini) and other chat models accept it.
             if request.max_output_tokens:
                 kwargs["max_tokens"] = request.max_output_tokens
+            if cache_key is not None:
+                kwargs["prompt_cache_key"] = cache_key
             if response_format is not None:
                 kwargs["response_format"] = response_format
             if allow_tools:
@@ -119,6 +127,7 @@ class OpenAIProvider:
                 kwargs["tool_choice"] = _openai_tool_choice(choice, hop)
 
             response = await client.chat.completions.create(**kwargs)
+            _record_response_usage(response)
             message = _message_of(response)
             tool_calls = getattr(message, "tool_calls", None) if message else None
 
@@ -131,24 +140,23 @@ class OpenAIProvider:
                 return text
 
             # The model asked for one or more tools. Echo its tool-call
-            # turn, then append each tool result, then loop for the
-            # follow-up completion. ``dispatch`` never raises — failures
-            # come back as a JSON error string the model can react to.
+            # turn, run the calls concurrently, then append each result in
+            # call order and loop for the follow-up completion. ``dispatch``
+            # never raises — failures come back as a JSON error string the
+            # model can react to.
             messages.append(_assistant_tool_call_turn(message, tool_calls))
-            for call in tool_calls:
+            results = await run_tool_calls(
+                dispatch,  # type: ignore[arg-type]
+                [(_call_name(call), _call_arguments(call)) for call in tool_calls],
+                max_parallel=budget.max_parallel_calls,
+            )
+            for call, raw_result in zip(tool_calls, results, strict=True):
                 state.record_call()
-                result = cap_tool_result(
-                    await dispatch(  # type: ignore[misc]
-                        _call_name(call),
-                        _call_arguments(call),
-                    ),
-                    budget.max_result_chars,
-                )
                 messages.append(
                     {
                         "role": "tool",
                         "tool_call_id": getattr(call, "id", ""),
-                        "content": result,
+                        "content": cap_tool_result(raw_result, budget.max_result_chars),
                     },
                 )
 
@@ -157,6 +165,26 @@ class OpenAIProvider:
         raise RuntimeError("openai: tool loop did not terminate")
 
 
+def _system_prompt_and_cache_key(system_prompt: str) -> tuple[str, str | None]:
+    """Strip cache-breakpoint markers; derive a ``prompt_cache_key`` from them.
+
+    OpenAI caches prompt prefixes automatically, so a breakpoint needs no
+    block structure — only the marker removed. The stable prefix (every
+    segment that ends at a breakpoint) is hashed into ``prompt_cache_key`` so
+    requests sharing it are routed to the same cache. A prompt without
+    markers is sent unchanged with no key (the historical request).
+    """
+    segments = split_prompt_cache_segments(system_prompt)
+    if len(segments) == 1 and segments[0][0] == system_prompt:
+        return system_prompt, None
+    stable = "\n\n".join(text for text, cacheable in segments if cacheable)
+    text = "\n\n".join(text for text, _ in segments)
+    if not stable:
+        return text, None
+    digest = hashlib.sha256(stable.encode("utf-8")).hexdigest()[:32]
+    return text, f"superbot-{digest}"
+
+
 def _response_format(request: AIRequest) -> dict[str, Any] | None:
     """Build the ``response_format`` kwarg for ``request.mode``."""
     if request.mode is not AIResponseMode.JSON:
@@ -237,6 +265,25 @@ def _call_arguments(call: Any) -> dict[str, Any]:
     return parsed if isinstance(parsed, dict) else {}
 
 
+def _record_response_usage(response: Any) -> None:
+    """Report a completion's ``usage`` block (absent on test doubles).
+
+    ``prompt_tokens`` includes the cached prefix; the cached share is
+    ``prompt_tokens_details.cached_tokens``.
+    """
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    prompt_tokens = usage_count(usage, "prompt_tokens")
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = min(usage_count(details, "cached_tokens"), prompt_tokens)
+    record_usage(
+        input_tokens=prompt_tokens - cached,
+        cached_input_tokens=cached,
+        output_tokens=usage_count(usage, "completion_tokens"),
+    )
+
+
 def _message_of(response: Any) -> Any:
     """Return the first choice's message object, or ``None``."""
     choices = getattr(response, "choices", None)
@@ -0,0 +1,45 @@
+"""Local stub image classifier — the offline twin of ``openai_moderation``.
+
+Never makes an external call.  :meth:`StubModerationProvider.classify_image` has
+the same signature and return shape as
+:meth:`~core.runtime.ai.providers.openai_moderation.OpenAIModerationProvider.classify_image`
+(``dict[str, float]`` of raw omni-moderation category scores), so it drops into
+``cogs.image_moderation.listener.process_message(classifier=...)`` and lets the
+concurrency, verdict-cache and metrics paths be exercised without a key, the
+SDK or the network.
+
+Scores are chosen by URL substring (first match wins, else ``default``); an
+optional ``latency`` simulates a slow provider, and every call is recorded so a
+test can assert how many images actually reached the classifier.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+
+
+class StubModerationProvider:
+    """Deterministic, in-process stand-in for the OpenAI moderation adapter."""
+
+    def __init__(
+        self,
+        rules: Mapping[str, Mapping[str, float]] | None = None,
+        *,
+        default: Mapping[str, float] | None = None,
+        latency: float = 0.0,
+    ) -> None:
+        self._rules = dict(rules or {})
+        self._default = dict(default or {})
+        self._latency = latency
+        self.calls: list[str] = []
+
+    async def classify_image(self, image_url: str) -> dict[str, float]:
+        """Return the scripted category scores for ``image_url``."""
+        self.calls.append(image_url)
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        for needle, scores in self._rules.items():
+            if needle in image_url:
+                return dict(scores)
+        return dict(self._default)
@@ -117,6 +117,25 @@ def default_model_for(provider: str, task: AITask) -> str:
     return _DEFAULT_MODELS.get(task, _OPENAI_FALLBACK_MODEL)
 
 
+# Cheapest model per provider — where the gateway reroutes a guild that has
+# crossed its soft spend budget (see :mod:`core.runtime.ai.budget`). Grounding
+# comes from the tools + data, so the small model keeps answers usable while
+# cutting the per-request cost.
+_ECONOMY_MODELS: dict[str, str] = {
+    "anthropic": "claude-haiku-4-5",
+    "openai": "gpt-4o-mini",
+}
+
+
+def economy_model_for(provider: str) -> str | None:
+    """Return ``provider``'s cheapest model, or ``None`` when it has no tiers.
+
+    ``deterministic`` (and any unknown provider) has no cheaper model to
+    fall back to, so the caller keeps the routed one.
+    """
+    return _ECONOMY_MODELS.get(provider)
+
+
 def fallback_provider() -> str:
     """Optional secondary provider name for the gateway's fault cascade.
 
@@ -0,0 +1,99 @@
+"""Dependency-ordered load waves for the startup extension list.
+
+``bot1._load_cogs`` used to load ``config.INITIAL_EXTENSIONS`` one after
+another, so cold start cost the sum of every extension's import + ``setup`` +
+``cog_load`` (DB reads, anchor restoration, view registration).  This module
+turns the list into **waves**: every extension in a wave has all of its
+dependencies in earlier waves, so the loader can run a wave's loads
+concurrently and only wait between waves.
+
+Dependencies come from two places:
+
+* **Declared** — ``config.EXTENSION_DEPENDENCIES`` (extension → extensions it
+  needs loaded first), for couplings the registry cannot see (a sibling cog
+  that shares its parent's state).
+* **Inferred** — the subsystem registry's ``dependencies`` /
+  ``soft_dependencies``, mapped to extensions by name
+  (``cogs.<subsystem>_cog``).
+
+``first`` extensions (``config.EXTENSIONS_LOAD_FIRST`` — the command-access
+guard) each get a wave of their own, ahead of everything else.  A dependency
+on an extension that is not in the list is ignored; a cycle raises
+``ValueError`` (the loader then falls back to the sequential order).  Within
+a wave, extensions keep their config order.
+
+Public surface:
+    extension_for_subsystem(key)                      → str
+    inferred_dependencies(extensions)                 → dict[str, set[str]]
+    plan_waves(extensions, *, first=, dependencies=)  → list[list[str]]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+
+
+def extension_for_subsystem(key: str) -> str:
+    """The extension a subsystem key is conventionally loaded from."""
+    return f"cogs.{key}_cog"
+
+
+def inferred_dependencies(extensions: Iterable[str]) -> dict[str, set[str]]:
+    """Extension → extensions it depends on, from the subsystem registry."""
+    from utils.subsystem_registry import SUBSYSTEMS
+
+    present = set(extensions)
+    out: dict[str, set[str]] = {}
+    for key, meta in SUBSYSTEMS.items():
+        ext = extension_for_subsystem(key)
+        if ext not in present:
+            continue
+        needs = {
+            extension_for_subsystem(dep)
+            for dep in (
+                *meta.get("dependencies", ()),
+                *meta.get("soft_dependencies", ()),
+            )
+        } & present
+        if needs:
+            out[ext] = needs
+    return out
+
+
+def plan_waves(
+    extensions: Sequence[str],
+    *,
+    first: Sequence[str] = (),
+    dependencies: Mapping[str, Iterable[str]] | None = None,
+) -> list[list[str]]:
+    """Group ``extensions`` into dependency-ordered waves (see module doc)."""
+    waves = [[ext] for ext in first if ext in extensions]
+    leading = {wave[0] for wave in waves}
+    rest = [ext for ext in extensions if ext not in leading]
+    members = set(rest)
+
+    needs: dict[str, set[str]] = {ext: set() for ext in rest}
+    for ext, deps in inferred_dependencies(rest).items():
+        needs[ext] |= deps
+    for ext, extra_deps in (dependencies or {}).items():
+        if ext in needs:
+            needs[ext] |= set(extra_deps)
+    for ext in rest:
+        needs[ext] = (needs[ext] & members) - {ext}
+
+    done: set[str] = set()
+    while rest:
+        wave = [ext for ext in rest if needs[ext] <= done]
+        if not wave:
+            raise ValueError(f"extension dependency cycle among: {', '.join(rest)}")
+        waves.append(wave)
+        done.update(wave)
+        rest = [ext for ext in rest if ext not in done]
+    return waves
+
+
+__all__ = [
+    "extension_for_subsystem",
+    "inferred_dependencies",
+    "plan_waves",
+]
@@ -0,0 +1,200 @@
+"""Boot import profiler — ``-X importtime`` numbers, captured in-process.
+
+State class: **process-local runtime** — see ``docs/architecture.md``
+§"State classification".
+
+Most of cold start is spent importing: every extension in
+``config.INITIAL_EXTENSIONS`` drags in its services, views and their
+module-level dependencies.  ``python -X importtime`` shows where that time
+goes, but only on stderr and only when the interpreter was started with the
+flag.  :func:`capture` gives the same self / cumulative split from inside the
+running bot: while it is active a meta-path finder times each module's
+``exec_module`` (nested imports are subtracted from the parent's self time,
+exactly like ``-X importtime``), and on exit it writes a summary into the
+dict it was handed — ``bot1`` passes the metadata of the
+``"module_imports"`` startup phase, so the profile lands in the startup
+outcome next to the other phases.
+
+Only freshly imported, source/extension-backed modules are timed; built-in
+and frozen modules, and anything already in ``sys.modules``, cost nothing
+here.  Finder time is not included.
+
+``BOOT_DEFERRED_MODULES`` is the import budget: large or optional modules
+that must *not* be imported at boot (they load on first use through
+:func:`utils.lazy_import.lazy_module` or a function-local import).  The
+summary lists any that were, ``bot1`` logs a warning, and
+``tests/unit/runtime/test_import_profile.py`` fails the build on it.
+
+Public surface:
+    BOOT_DEFERRED_MODULES                 — tuple[str, ...]
+    ImportTiming                          — frozen dataclass per module
+    capture(summary=None, *, limit=10)    — context manager
+    timings()                             → tuple[ImportTiming, ...]
+    slowest(limit, *, by="self")          → tuple[ImportTiming, ...]
+    deferred_loaded(modules=None)         → tuple[str, ...]
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.abc
+import sys
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+# Heavy optional SDKs and the multi-thousand-line BTD6 answer stack.  Keep
+# this list to modules that genuinely have a lazy path — adding one that a
+# cog imports at module level fails the boot-import test.
+BOOT_DEFERRED_MODULES: tuple[str, ...] = (
+    "openai",
+    "anthropic",
+    "PIL",
+    "services.ai_gateway",
+    "services.btd6_ai_service",
+    "services.btd6_context_service",
+    "services.btd6_resolver_service",
+)
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """One module's import cost, in milliseconds (``-X importtime`` terms)."""
+
+    name: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+_timings: list[ImportTiming] = []
+_local = threading.local()
+
+
+def _stack() -> list[list[float]]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _timed(name: str, exec_module: Any) -> Any:
+    def exec_module_timed(module: Any) -> None:
+        stack = _stack()
+        frame = [0.0]  # time spent in nested imports
+        stack.append(frame)
+        started = time.perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            stack.pop()
+            if stack:
+                stack[-1][0] += elapsed
+            _timings.append(
+                ImportTiming(
+                    name=name,
+                    self_ms=round(elapsed - frame[0], 3),
+                    cumulative_ms=round(elapsed, 3),
+                    depth=len(stack),
+                ),
+            )
+
+    return exec_module_timed
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """Delegates to the rest of ``sys.meta_path`` and times the loader."""
+
+    def find_spec(self, fullname, path, target=None):  # noqa: ANN001, ANN201
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find = getattr(finder, "find_spec", None)
+            if find is None:
+                continue
+            spec = find(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        # Built-in / frozen importers are classes shared by every module;
+        # per-module loader instances (source, bytecode, extension) are safe
+        # to wrap.
+        exec_module = getattr(loader, "exec_module", None)
+        if exec_module is not None and not isinstance(loader, type):
+            loader.exec_module = _timed(fullname, exec_module)
+        return spec
+
+
+def timings() -> tuple[ImportTiming, ...]:
+    """Every module timed so far, in import-completion order."""
+    return tuple(_timings)
+
+
+def slowest(limit: int = 10, *, by: str = "self") -> tuple[ImportTiming, ...]:
+    """The ``limit`` costliest imports by ``self`` or ``cumulative`` time."""
+    if by not in ("self", "cumulative"):
+        raise ValueError(f"unknown sort key {by!r}")
+    ranked = sorted(
+        _timings,
+        key=lambda t: t.self_ms if by == "self" else t.cumulative_ms,
+        reverse=True,
+    )
+    return tuple(ranked[: max(0, limit)])
+
+
+def deferred_loaded(modules: Iterable[str] | None = None) -> tuple[str, ...]:
+    """Which of ``modules`` (default :data:`BOOT_DEFERRED_MODULES`) are imported."""
+    names = BOOT_DEFERRED_MODULES if modules is None else tuple(modules)
+    return tuple(name for name in names if name in sys.modules)
+
+
+@contextlib.contextmanager
+def capture(
+    summary: dict[str, Any] | None = None,
+    *,
+    limit: int = 10,
+) -> Iterator[dict[str, Any]]:
+    """Time every import in the block; fill ``summary`` on exit.
+
+    ``summary`` gets ``modules`` (count), ``total_ms`` (sum of top-level
+    cumulative times), ``slowest`` (``limit`` entries of
+    ``"<module> <self>/<cumulative> ms"``) and ``deferred_loaded``.  It is
+    filled even if the block raises.
+    """
+    out = summary if summary is not None else {}
+    finder = _TimingFinder()
+    before = len(_timings)
+    sys.meta_path.insert(0, finder)
+    try:
+        yield out
+    finally:
+        with contextlib.suppress(ValueError):
+            sys.meta_path.remove(finder)
+        captured = _timings[before:]
+        out["modules"] = len(captured)
+        out["total_ms"] = round(sum(t.cumulative_ms for t in captured if not t.depth))
+        out["slowest"] = [
+            f"{t.name} {t.self_ms:.0f}/{t.cumulative_ms:.0f} ms"
+            for t in sorted(captured, key=lambda t: t.self_ms, reverse=True)[:limit]
+        ]
+        out["deferred_loaded"] = list(deferred_loaded())
+
+
+def _reset_for_tests() -> None:
+    _timings.clear()
+    _local.stack = []
+
+
+__all__ = [
+    "BOOT_DEFERRED_MODULES",
+    "ImportTiming",
+    "capture",
+    "deferred_loaded",
+    "slowest",
+    "timings",
+]
@@ -53,6 +53,7 @@ order       tier   stage (constant)                           short-circuits?
 40          rewards    rps        (``RPS_STAGE_ORDER``)        no
 50          passive    four_twenty(``FOUR_TWENTY_STAGE_ORDER``) no
 55          passive    ai_correction(``AI_CORRECTION_STAGE_ORDER``) no
+60          passive    ticket_transcript(``TICKET_TRANSCRIPT_STAGE_ORDER``) no
 70          conv.      ai_nl      (``ai…STAGE_ORDER``)         on bot mention
 80          conv.      btd6       (``btd6…STAGE_ORDER``)       on handle
 ==========  =====  =========================================  ============
@@ -110,14 +111,55 @@ directly inside ``process``), that also works — see CleanupStage for
 an example.  Both paths land in the same ``mod_logs`` row + emit the
 same ``EVT_MOD_ACTION``.
 
+Channel routing
+---------------
+
+Stages that only ever act in a known set of channels (chain channels,
+counting channels) can publish that set to a per-guild routing table
+(``guild_id → channel_id → {stage names}``).  Once a stage is *routed*
+— its owner called :func:`load_routes` / :func:`set_guild_routes` —
+:func:`dispatch` skips it in every other channel with no await and no
+latency observation.  An unrouted stage runs everywhere, so a stage
+whose owner has not loaded its bindings yet (or never will) fails open.
+
+Owners keep the table current from the code that mutates the binding:
+:func:`bind_channel` / :func:`unbind_channel` on create/delete.  Binding
+alone never routes a stage — only a full load does — so an early bind
+cannot hide the channels that have not been loaded yet.
+
+Load shedding
+-------------
+
+:func:`dispatch` keeps an exponentially weighted message rate per channel
+and per guild (time constant :data:`RATE_WINDOW_SECONDS`, so the value reads
+as "messages in the last minute"), updated once per message after the
+pre-filter and exposed on the context as ``ctx.channel_rate`` /
+``ctx.guild_rate``.  An optional, expensive stage (AI correction, AI
+replies, the BTD6 assistant) can declare a :class:`LoadPolicy` as its
+``load_policy`` attribute; while either rate is over the policy's threshold
+the stage is skipped for the message — bar a sampled fraction and any
+message the policy's ``keep`` predicate exempts — with no await and no
+latency observation.  Skips are counted in
+``message_pipeline_shed_total{stage=...}``, and a stage that defines a
+synchronous ``on_shed(ctx)`` hook is told about each one (the BTD6 assistant
+records it for ``!btd6 why-no-response``).  Stages without a policy
+(auto-mod, rewards) always run.
+
 Public surface
 --------------
 
 ::
 
     register(stage)         — add a stage (deduplicates by name)
-    unregister(name)        — remove a stage by name
-    clear()                 — test-only: drop all stages
+    unregister(name)        — remove a stage (and its routes) by name
+    clear()                 — test-only: drop all stages, routes and rates
+    load_routes(name, bindings)        — route a stage; union (guild, channel) pairs
+    set_guild_routes(name, guild, ids) — route a stage; replace one guild's set
+    bind_channel / unbind_channel      — keep a routed stage's table current
+    drop_routes(name)       — unroute a stage (it runs everywhere again)
+    channel_stages(guild, channel)     — stage names bound to a channel
+    LoadPolicy              — a stage's load-shedding thresholds
+    channel_rate(id) / guild_rate(id)  — current EWMA message rate (per minute)
     stages_snapshot()       — defensive copy of current stages
     setup(bot)              — install the platform listener (idempotent)
     dispatch(bot, message)  — orchestrator (exposed for unit tests)
@@ -126,7 +168,11 @@ Public surface
 from __future__ import annotations
 
 import logging
+import math
+import random
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
@@ -169,12 +215,52 @@ class MessagePipelineContext:
 
     ``metadata`` is mutable scratch — stages can stash derived state
     (parsed command context, expensive lookups) under stable keys
-    so downstream stages avoid re-computation.
+    so downstream stages avoid re-computation.  ``channel_rate`` /
+    ``guild_rate`` are the dispatcher's EWMA message rates (per minute,
+    this message included) — see "Load shedding" in the module docstring.
     """
 
     bot: commands.Bot
     message: discord.Message
     metadata: dict[str, Any] = field(default_factory=dict)
+    channel_rate: float = 0.0
+    guild_rate: float = 0.0
+    _command_prefixed: bool | None = field(default=None, init=False, repr=False)
+    _command_context: Any = field(default=None, init=False, repr=False)
+
+    @property
+    def command_prefixed(self) -> bool:
+        """True if the content starts with one of the bot's command prefixes.
+
+        Cheap string check, computed once per message and shared by every
+        stage.  ``command_prefix`` may be a string, a sequence of strings,
+        or a callable (which needs a message round-trip); the callable form
+        falls back to ``"!"`` (SuperBot's default).
+        """
+        if self._command_prefixed is None:
+            self._command_prefixed = _starts_with_prefix(
+                self.message.content or "",
+                getattr(self.bot, "command_prefix", "!"),
+            )
+        return self._command_prefixed
+
+    async def command_context(self) -> commands.Context:
+        """Return ``bot.get_context(message)``, parsed at most once per message."""
+        if self._command_context is None:
+            self._command_context = await self.bot.get_context(self.message)
+        return self._command_context
+
+
+def _starts_with_prefix(content: str, prefix_attr: Any) -> bool:
+    candidates: list[str] = []
+    if isinstance(prefix_attr, str):
+        candidates.append(prefix_attr)
+    elif isinstance(prefix_attr, (list, tuple)):
+        candidates.extend(str(p) for p in prefix_attr if isinstance(p, str))
+    if not candidates:
+        candidates.append("!")
+    stripped = content.lstrip()
+    return any(stripped.startswith(p) for p in candidates)
 
 
 @dataclass
@@ -199,12 +285,50 @@ class StageResult:
     moderation_action: ModerationActionDescriptor | None = None
 
 
+@dataclass(frozen=True)
+class LoadPolicy:
+    """When an optional stage sheds work under load.
+
+    Fields:
+        channel_per_minute: skip above this channel rate (``None`` = no limit).
+        guild_per_minute: skip above this guild rate (``None`` = no limit).
+        sample: fraction of over-threshold messages still processed.
+        keep: messages it returns True for are never shed (e.g. a direct
+              mention of the bot).
+    """
+
+    channel_per_minute: float | None = None
+    guild_per_minute: float | None = None
+    sample: float = 0.0
+    keep: Callable[[MessagePipelineContext], bool] | None = None
+
+    def overloaded(self, ctx: MessagePipelineContext) -> bool:
+        """True if either of ``ctx``'s rates is over its threshold."""
+        return (
+            self.channel_per_minute is not None
+            and ctx.channel_rate > self.channel_per_minute
+        ) or (
+            self.guild_per_minute is not None and ctx.guild_rate > self.guild_per_minute
+        )
+
+    def sheds(self, ctx: MessagePipelineContext) -> bool:
+        """True if the stage should skip ``ctx``'s message."""
+        if not self.overloaded(ctx):
+            return False
+        if self.keep is not None and self.keep(ctx):
+            return False
+        return not (self.sample > 0 and random.random() < self.sample)
+
+
 @runtime_checkable
 class MessageStage(Protocol):
     """Protocol every stage must satisfy.
 
     A stage's ``name`` is its stable identifier — used as the
     Prometheus label and as the dedup key for :func:`register`.
+    A stage may also expose a ``load_policy`` (:class:`LoadPolicy`) and
+    an ``on_shed(ctx)`` hook called when that policy skips a message;
+    both are optional and read with ``getattr``.
     """
 
     name: str
@@ -237,15 +361,20 @@ def register(stage: MessageStage) -> None:
 
 
 def unregister(name: str) -> None:
-    """Remove a stage by name.  No-op if not registered."""
+    """Remove a stage (and its channel routes) by name.  No-op if not registered."""
     global _STAGES
     _STAGES = [s for s in _STAGES if s.name != name]
+    drop_routes(name)
 
 
 def clear() -> None:
-    """Test-only: drop all registered stages."""
+    """Test-only: drop all registered stages, the routing table and the rates."""
     global _STAGES
     _STAGES = []
+    _ROUTES.clear()
+    _ROUTED_STAGES.clear()
+    _CHANNEL_RATES.clear()
+    _GUILD_RATES.clear()
 
 
 def stages_snapshot() -> list[MessageStage]:
@@ -253,6 +382,124 @@ def stages_snapshot() -> list[MessageStage]:
     return list(_STAGES)
 
 
+# ---------------------------------------------------------------------------
+# Channel routing table
+# ---------------------------------------------------------------------------
+
+# guild_id -> channel_id -> names of routed stages bound to that channel.
+_ROUTES: dict[int, dict[int, set[str]]] = {}
+# Stages whose bindings have been loaded; dispatch skips them outside _ROUTES.
+_ROUTED_STAGES: set[str] = set()
+
+
+def load_routes(name: str, bindings: Iterable[tuple[int, int]]) -> None:
+    """Route stage ``name`` and bind every ``(guild_id, channel_id)`` pair.
+
+    Unions with bindings already recorded — a bind that raced the bulk
+    load is kept.  A stale extra binding only costs one no-op
+    ``process`` call, whereas a missing one would silence the stage.
+    """
+    for guild_id, channel_id in bindings:
+        bind_channel(name, guild_id, channel_id)
+    _ROUTED_STAGES.add(name)
+
+
+def set_guild_routes(name: str, guild_id: int, channel_ids: Iterable[int]) -> None:
+    """Route stage ``name`` and replace its bindings in one guild."""
+    guild_routes = _ROUTES.get(guild_id, {})
+    for channel_id in [c for c, names in guild_routes.items() if name in names]:
+        unbind_channel(name, guild_id, channel_id)
+    for channel_id in channel_ids:
+        bind_channel(name, guild_id, channel_id)
+    _ROUTED_STAGES.add(name)
+
+
+def bind_channel(name: str, guild_id: int, channel_id: int) -> None:
+    """Bind stage ``name`` to one channel."""
+    _ROUTES.setdefault(guild_id, {}).setdefault(channel_id, set()).add(name)
+
+
+def unbind_channel(name: str, guild_id: int | None, channel_id: int) -> None:
+    """Unbind stage ``name`` from one channel.  No-op if not bound.
+
+    ``guild_id=None`` searches every guild (callers that only know the
+    channel, e.g. a legacy delete path).
+    """
+    guild_ids = list(_ROUTES) if guild_id is None else [guild_id]
+    for gid in guild_ids:
+        guild_routes = _ROUTES.get(gid)
+        if not guild_routes or channel_id not in guild_routes:
+            continue
+        names = guild_routes[channel_id]
+        names.discard(name)
+        if not names:
+            del guild_routes[channel_id]
+        if not guild_routes:
+            del _ROUTES[gid]
+
+
+def drop_routes(name: str) -> None:
+    """Unroute stage ``name`` — it runs in every channel again."""
+    _ROUTED_STAGES.discard(name)
+    for gid in list(_ROUTES):
+        for channel_id in list(_ROUTES[gid]):
+            unbind_channel(name, gid, channel_id)
+
+
+def channel_stages(guild_id: int, channel_id: int) -> frozenset[str]:
+    """Names of the routed stages bound to one channel."""
+    return frozenset(_ROUTES.get(guild_id, {}).get(channel_id, ()))
+
+
+# ---------------------------------------------------------------------------
+# Message-rate model
+# ---------------------------------------------------------------------------
+
+#: EWMA time constant.  Each message adds 1 and the total decays by
+#: ``exp(-dt / RATE_WINDOW_SECONDS)``, so a steady rate of r msg/s settles at
+#: ``r * 60`` — the value reads as messages per minute.
+RATE_WINDOW_SECONDS = 60.0
+# LRU caps: quiet channels/guilds fall out; their rate was ~0 anyway.
+_MAX_TRACKED_CHANNELS = 10_000
+_MAX_TRACKED_GUILDS = 2_000
+
+# id -> (rate at ``at``, ``at`` as time.monotonic()).
+_CHANNEL_RATES: OrderedDict[int, tuple[float, float]] = OrderedDict()
+_GUILD_RATES: OrderedDict[int, tuple[float, float]] = OrderedDict()
+
+
+def _decayed(entry: tuple[float, float] | None, now: float) -> float:
+    if entry is None:
+        return 0.0
+    rate, at = entry
+    return rate * math.exp(-(now - at) / RATE_WINDOW_SECONDS)
+
+
+def _bump(
+    table: OrderedDict[int, tuple[float, float]],
+    key: int,
+    now: float,
+    cap: int,
+) -> float:
+    """Count one message for ``key``; return its updated rate."""
+    rate = _decayed(table.get(key), now) + 1.0
+    table[key] = (rate, now)
+    table.move_to_end(key)
+    if len(table) > cap:
+        table.popitem(last=False)
+    return rate
+
+
+def channel_rate(channel_id: int) -> float:
+    """A channel's current message rate (per minute, exponentially weighted)."""
+    return _decayed(_CHANNEL_RATES.get(channel_id), time.monotonic())
+
+
+def guild_rate(guild_id: int) -> float:
+    """A guild's current message rate (per minute, exponentially weighted)."""
+    return _decayed(_GUILD_RATES.get(guild_id), time.monotonic())
+
+
 # ---------------------------------------------------------------------------
 # Orchestrator
 # ---------------------------------------------------------------------------
@@ -281,8 +528,35 @@ async def dispatch(bot: commands.Bot, message: discord.Message) -> None:
     if message.guild is None:
         return
 
-    ctx = MessagePipelineContext(bot=bot, message=message)
+    now = time.monotonic()
+    ctx = MessagePipelineContext(
+        bot=bot,
+        message=message,
+        channel_rate=_bump(
+            _CHANNEL_RATES, message.channel.id, now, _MAX_TRACKED_CHANNELS
+        ),
+        guild_rate=_bump(_GUILD_RATES, message.guild.id, now, _MAX_TRACKED_GUILDS),
+    )
+    bound: set[str] | tuple[()] = ()
+    if _ROUTED_STAGES:
+        bound = _ROUTES.get(message.guild.id, {}).get(message.channel.id, ())
     for stage in _STAGES:
+        if stage.name in _ROUTED_STAGES and stage.name not in bound:
+            continue
+        policy: LoadPolicy | None = getattr(stage, "load_policy", None)
+        if policy is not None and policy.sheds(ctx):
+            metrics.message_pipeline_shed_total.labels(stage=stage.name).inc()
+            on_shed = getattr(stage, "on_shed", None)
+            if on_shed is not None:
+                try:
+                    on_shed(ctx)
+                except Exception:
+                    logger.exception(
+                        "message pipeline stage %r on_shed raised on message %s",
+                        stage.name,
+                        message.id,
+                    )
+            continue
         t0 = time.perf_counter()
         result: StageResult | None = None
         try:
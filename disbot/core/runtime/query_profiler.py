@@ -0,0 +1,290 @@
+"""Statement-level query profiler — per-fingerprint stats + sampled plans.
+
+State class: **process-local runtime** — see ``docs/architecture.md``
+§"State classification".
+
+``utils.db.pool``'s primitives label every query ``<op>:<table>`` for the
+``db_query_seconds`` histogram, and :mod:`core.runtime.slow_path_log` keeps
+the slowest calls.  Neither says *which statement shape* is slow, or why.
+This module normalises each statement to a **fingerprint** (comments and
+literals stripped, ``$n`` placeholders and ``IN`` lists folded, whitespace
+collapsed) and keeps, per fingerprint, the call count, total / max time, a
+p95 over the most recent calls and the rows returned.
+
+Plan capture: the first call of a fingerprint that takes at least
+:func:`explain_threshold_ms` schedules ONE plan capture for it — ``EXPLAIN
+(ANALYZE, BUFFERS)`` for plain reads, plain ``EXPLAIN`` for everything
+ANALYZE must not execute: writes, locking reads (``FOR UPDATE`` / ``FOR
+SHARE``), advisory-lock calls and sequence advances — as a managed background task on a dedicated connection opened
+outside the pool (:func:`utils.db.pool.dedicated_connection`), inside a
+transaction that is always rolled back.  The slow caller never waits on it,
+it never takes a pool slot, and at most one capture runs at a time.
+
+Recording costs a cached regex pass + a dict update, so :func:`install`
+(called once at startup) registers :func:`observe` as a ``utils.db.pool``
+query observer and it runs on every query.  The table is bounded
+(least-recently-seen fingerprints fall out).
+
+Surfaced via ``!platform queries`` (with the captured plan for one
+fingerprint) and the health server's ``GET /queries`` JSON (stats only —
+a plan can show parameter values, so it stays behind the admin command).
+
+Public surface:
+    install()                                   → None
+    fingerprint(query)                          → str
+    observe(query, params, duration_ms, rows)   → None
+    top(limit, *, sort=)                        → list[QueryStats]
+    get(query_id)                               → QueryStats | None
+    configure(*, enabled=, explain_threshold_ms=) → None
+    explain_threshold_ms()                      → float
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import re
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger("bot.runtime.query_profiler")
+
+_MAX_FINGERPRINTS = 500
+# Calls per fingerprint kept for the p95.
+_RECENT_SAMPLES = 128
+_DEFAULT_EXPLAIN_THRESHOLD_MS = 250.0
+# A capture that runs longer than this is abandoned (SET LOCAL statement_timeout).
+_EXPLAIN_TIMEOUT_MS = 10_000
+
+SORT_KEYS = ("total", "p95", "calls", "rows")
+
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_PARAM_RE = re.compile(r"\$\d+")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE_RE = re.compile(r"\s+")
+_READ_RE = re.compile(r"^\s*(?:select|with)\b", re.IGNORECASE)
+_WRITE_RE = re.compile(r"\b(?:insert|update|delete|merge)\b", re.IGNORECASE)
+# Reads that ANALYZE would still act on: row locks (held until the rollback,
+# up to the capture timeout), advisory locks, and non-transactional sequences.
+_SIDE_EFFECT_RE = re.compile(
+    r"\bfor\s+(?:no\s+key\s+)?(?:update|share|key\s+share)\b"
+    r"|\bpg_(?:try_)?advisory_|\b(?:nextval|setval)\s*\(",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(query: str) -> str:
+    """Normalise ``query`` to its statement shape (cached per query string)."""
+    text = _COMMENT_RE.sub(" ", query)
+    text = _STRING_RE.sub("?", text)
+    text = _PARAM_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = _IN_LIST_RE.sub("(...)", text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+@lru_cache(maxsize=4096)
+def _query_id(shape: str) -> str:
+    return hashlib.blake2b(shape.encode(), digest_size=6).hexdigest()
+
+
+@dataclass
+class QueryStats:
+    """Running stats for one fingerprint."""
+
+    query_id: str
+    fingerprint: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0
+    recent_ms: deque[float] = field(
+        default_factory=lambda: deque(maxlen=_RECENT_SAMPLES),
+        repr=False,
+    )
+    #: ``None`` → not attempted; "pending" / "captured" / "failed".
+    plan_state: str | None = None
+    plan: str | None = field(default=None, repr=False)
+    plan_captured_at: float | None = None
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    @property
+    def p95_ms(self) -> float:
+        """95th percentile over the most recent calls (nearest rank)."""
+        if not self.recent_ms:
+            return 0.0
+        ordered = sorted(self.recent_ms)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-safe stats (no plan text)."""
+        return {
+            "id": self.query_id,
+            "fingerprint": self.fingerprint,
+            "calls": self.calls,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.mean_ms, 3),
+            "p95_ms": round(self.p95_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "rows": self.rows,
+            "plan": self.plan_state,
+        }
+
+
+_STATS: OrderedDict[str, QueryStats] = OrderedDict()
+_enabled = True
+_explain_threshold_ms = _DEFAULT_EXPLAIN_THRESHOLD_MS
+_explain_inflight = False
+
+
+def observe(
+    query: str,
+    params: tuple,
+    duration_ms: float,
+    rows: int,
+) -> None:
+    """Record one call; schedule a plan capture the first time it is slow."""
+    if not _enabled:
+        return
+    shape = fingerprint(query)
+    stats = _STATS.get(shape)
+    if stats is None:
+        stats = _STATS[shape] = QueryStats(_query_id(shape), shape)
+        if len(_STATS) > _MAX_FINGERPRINTS:
+            _STATS.popitem(last=False)
+    else:
+        _STATS.move_to_end(shape)
+    stats.calls += 1
+    stats.total_ms += duration_ms
+    stats.max_ms = max(stats.max_ms, duration_ms)
+    stats.rows += rows
+    stats.recent_ms.append(duration_ms)
+    if (
+        duration_ms >= _explain_threshold_ms
+        and stats.plan_state is None
+        and not _explain_inflight
+    ):
+        _schedule_capture(stats, query, params)
+
+
+def install() -> None:
+    """Feed every ``utils.db.pool`` query to :func:`observe` (idempotent)."""
+    from utils.db import pool
+
+    pool.add_query_observer(observe)
+
+
+def _schedule_capture(stats: QueryStats, query: str, params: tuple) -> None:
+    global _explain_inflight
+    from core.runtime import tasks
+
+    coro = _capture(stats, query, params)
+    try:
+        tasks.spawn("db:explain_capture", coro)
+    except RuntimeError:  # no running loop (sync caller) — try next time
+        coro.close()
+        return
+    stats.plan_state = "pending"
+    _explain_inflight = True
+
+
+async def _capture(stats: QueryStats, query: str, params: tuple) -> None:
+    """Run EXPLAIN for one slow call on a dedicated, rolled-back connection."""
+    global _explain_inflight
+    from utils.db import pool
+
+    analyze = bool(_READ_RE.match(query)) and not (
+        _WRITE_RE.search(query) or _SIDE_EFFECT_RE.search(query)
+    )
+    options = "ANALYZE, BUFFERS" if analyze else "COSTS"
+    try:
+        async with pool.dedicated_connection() as conn:
+            tr = conn.transaction()
+            await tr.start()
+            try:
+                await conn.execute(
+                    f"SET LOCAL statement_timeout = {_EXPLAIN_TIMEOUT_MS}",
+                )
+                rows = await conn.fetch(f"EXPLAIN ({options}) {query}", *params)
+            finally:
+                await tr.rollback()
+        stats.plan = "\n".join(r[0] for r in rows)
+        stats.plan_state = "captured"
+        stats.plan_captured_at = time.time()
+    except Exception:
+        stats.plan_state = "failed"
+        logger.warning(
+            "query profiler: plan capture failed for %s",
+            stats.query_id,
+            exc_info=True,
+        )
+    finally:
+        _explain_inflight = False
+
+
+def top(limit: int = 10, *, sort: str = "total") -> list[QueryStats]:
+    """The ``limit`` heaviest fingerprints by ``sort`` (one of SORT_KEYS)."""
+    key = {
+        "total": lambda s: s.total_ms,
+        "p95": lambda s: s.p95_ms,
+        "calls": lambda s: s.calls,
+        "rows": lambda s: s.rows,
+    }.get(sort)
+    if key is None:
+        raise ValueError(f"sort must be one of {SORT_KEYS}, got {sort!r}")
+    return sorted(_STATS.values(), key=key, reverse=True)[: max(0, limit)]
+
+
+def get(query_id: str) -> QueryStats | None:
+    """The fingerprint with this id (or id prefix), or ``None``."""
+    for stats in _STATS.values():
+        if stats.query_id.startswith(query_id):
+            return stats
+    return None
+
+
+def tracked() -> int:
+    """Number of fingerprints currently tracked."""
+    return len(_STATS)
+
+
+def configure(
+    *,
+    enabled: bool | None = None,
+    explain_threshold_ms: float | None = None,
+) -> None:
+    """Turn recording on/off or move the plan-capture threshold."""
+    global _enabled, _explain_threshold_ms
+    if enabled is not None:
+        _enabled = enabled
+    if explain_threshold_ms is not None:
+        _explain_threshold_ms = explain_threshold_ms
+
+
+def explain_threshold_ms() -> float:
+    """Return the plan-capture threshold in milliseconds."""
+    return _explain_threshold_ms
+
+
+# ---------------------------------------------------------------------------
+# Test surface
+# ---------------------------------------------------------------------------
+
+
+def _reset_for_tests() -> None:
+    """Drop every fingerprint and restore defaults."""
+    global _enabled, _explain_threshold_ms, _explain_inflight
+    _STATS.clear()
+    _enabled = True
+    _explain_threshold_ms = _DEFAULT_EXPLAIN_THRESHOLD_MS
+    _explain_inflight = False
@@ -48,6 +48,8 @@ from typing import Any
 # (unknown)" — the latter would be a regression that the
 # orchestrator never reached the recorder.
 KNOWN_PHASES: tuple[str, ...] = (
+    "db_schema",
+    "module_imports",
     "command_surface_ledger",
     "panel_manifest",
     "command_manifest",
@@ -252,28 +254,48 @@ class ExtensionLoadOutcome:
 
     ``error`` is ``None`` on success and a short ``type:message`` string on
     failure (no traceback, mirroring :class:`StartupOutcome`).
+    ``duration_ms`` is the load's wall time (import + ``setup`` +
+    ``cog_load``; loads in one wave overlap, so it includes time spent
+    waiting on a sibling's await) and ``wave`` the load wave it ran in
+    (``core.runtime.extension_waves``).  Both ``None`` for loads outside
+    startup (``!load`` / ``!reload``).
     """
 
     name: str
     success: bool
     error: str | None
     recorded_at: datetime.datetime
+    duration_ms: float | None = None
+    wave: int | None = None
 
 
 _EXTENSIONS: dict[str, ExtensionLoadOutcome] = {}
 
 
-def record_extension_success(name: str) -> None:
+def record_extension_success(
+    name: str,
+    *,
+    duration_ms: float | None = None,
+    wave: int | None = None,
+) -> None:
     """Record a successful extension load. Overwrites prior state; never raises."""
     _EXTENSIONS[name] = ExtensionLoadOutcome(
         name=name,
         success=True,
         error=None,
         recorded_at=_now(),
+        duration_ms=duration_ms,
+        wave=wave,
     )
 
 
-def record_extension_failure(name: str, exc: BaseException) -> None:
+def record_extension_failure(
+    name: str,
+    exc: BaseException,
+    *,
+    duration_ms: float | None = None,
+    wave: int | None = None,
+) -> None:
     """Record a failed extension load (short ``type:message``; no traceback)."""
     summary = f"{type(exc).__name__}: {exc}"
     if len(summary) > 200:
@@ -283,6 +305,8 @@ def record_extension_failure(name: str, exc: BaseException) -> None:
         success=False,
         error=summary,
         recorded_at=_now(),
+        duration_ms=duration_ms,
+        wave=wave,
     )
 
 
@@ -291,6 +315,13 @@ def all_extension_outcomes() -> tuple[ExtensionLoadOutcome, ...]:
     return tuple(sorted(_EXTENSIONS.values(), key=lambda o: o.name))
 
 
+def slowest_extensions(limit: int = 5) -> tuple[ExtensionLoadOutcome, ...]:
+    """The ``limit`` timed extension loads that took longest, slowest first."""
+    timed = [o for o in _EXTENSIONS.values() if o.duration_ms is not None]
+    timed.sort(key=lambda o: o.duration_ms or 0.0, reverse=True)
+    return tuple(timed[: max(0, limit)])
+
+
 def reset_for_tests() -> None:
     """Clear every recorded outcome (catalogue phases + extensions).
 
@@ -315,5 +346,6 @@ __all__ = [
     "record_phase",
     "record_success",
     "reset_for_tests",
+    "slowest_extensions",
     "summary_status",
 ]
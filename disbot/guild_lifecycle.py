@@ -498,8 +498,10 @@ def _teardown_guild_config(guild_id: int) -> None:
     """
     try:
         from core.runtime.guild_config import forget_guild as _gc_forget
+        from services import settings_resolution
 
         _gc_forget(guild_id)
+        settings_resolution.forget_guild(guild_id)
     except Exception as exc:
         logger.warning("guild_lifecycle: guild_config teardown failed: %s", exc)
 
@@ -15,6 +15,9 @@ networking can reach it (host/port via HEALTH_HOST / HEALTH_PORT):
                     the snapshot JSON.  Operators ``curl`` this during an
                     incident when the bot is unresponsive in Discord but the
                     HTTP server is still serving.
+  GET /queries    — top-N statement fingerprints from the query profiler
+                    (``?limit=20&sort=total|p95|calls|rows``) as JSON.  Stats
+                    only; captured plans stay behind ``!platform queries``.
 
 The server runs as a background asyncio task alongside the bot, sharing the
 same event loop. It adds no threads and has negligible overhead.
@@ -45,7 +48,7 @@ import os
 from aiohttp import web
 from discord.ext import commands
 
-from core.runtime import lifecycle
+from core.runtime import lifecycle, query_profiler
 
 try:
     from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
@@ -159,6 +162,28 @@ async def _lifecycle_handler(request: web.Request) -> web.Response:
     )
 
 
+async def _queries_handler(request: web.Request) -> web.Response:
+    """Top-N query fingerprints (``core.runtime.query_profiler``) as JSON.
+
+    ``limit`` (default 20, max 100) and ``sort`` (``total`` / ``p95`` /
+    ``calls`` / ``rows``) come from the query string; a bad value is a 400.
+    """
+    sort = request.query.get("sort", "total")
+    try:
+        limit = max(1, min(int(request.query.get("limit", "20")), 100))
+        rows = query_profiler.top(limit, sort=sort)
+    except ValueError as exc:
+        return web.json_response({"error": str(exc)}, status=400)
+    return web.json_response(
+        {
+            "tracked": query_profiler.tracked(),
+            "sort": sort,
+            "explain_threshold_ms": query_profiler.explain_threshold_ms(),
+            "queries": [s.as_dict() for s in rows],
+        },
+    )
+
+
 async def _metrics_handler(request: web.Request) -> web.Response:
     """Prometheus metrics exposition endpoint."""
     return web.Response(body=generate_latest(), content_type=CONTENT_TYPE_LATEST)
@@ -189,6 +214,7 @@ async def start_health_server(
     app.router.add_get("/health", _health_handler)
     app.router.add_get("/ready", _ready_handler)
     app.router.add_get("/lifecycle", _lifecycle_handler)
+    app.router.add_get("/queries", _queries_handler)
     app.router.add_get("/metrics", _metrics_handler)
 
     # Private control API (Q-0156/Q-0159) — dormant unless CONTROL_API_TOKEN is
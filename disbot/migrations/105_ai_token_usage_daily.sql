@@ -0,0 +1,38 @@
+-- Migration 105: AI token/cost rollup (the `ai_token_usage_daily` table).
+--
+-- The gateway's in-process token ledger (core/runtime/ai/diagnostics.py
+-- DiagnosticsCollector) sums every provider call's reported usage per
+-- (UTC day, guild, task, provider, model). services/ai_usage_service.py
+-- drains it into this table every few minutes with an additive UPSERT, so
+-- rows are running daily totals, never per-request records.
+--
+-- Readers: the `!ai usage` breakdown (cogs/ai_cog.py) and the boot-time
+-- budget seed (today's rows, so a restart does not reset per-guild spend
+-- budgets — core/runtime/ai/budget.py). Calls made outside a guild (DMs,
+-- system jobs) use guild_id = 0. Cost is an estimate from the list-price
+-- table in budget.py, in micro-USD.
+--
+-- CRUD primitives live in utils/db/ai.py; per-guild teardown is wired in
+-- utils/db/ai.py::delete_for_guild. Rollback by dropping the table (the
+-- ledger keeps working in memory; budgets then reset on restart).
+
+CREATE TABLE IF NOT EXISTS ai_token_usage_daily (
+    day                 DATE        NOT NULL,
+    guild_id            BIGINT      NOT NULL,
+    task                TEXT        NOT NULL,
+    provider            TEXT        NOT NULL,
+    model               TEXT        NOT NULL,
+    requests            BIGINT      NOT NULL DEFAULT 0,
+    -- uncached prompt input (includes tokens written to a provider cache)
+    input_tokens        BIGINT      NOT NULL DEFAULT 0,
+    -- prompt input served from a provider's prompt cache
+    cached_input_tokens BIGINT      NOT NULL DEFAULT 0,
+    output_tokens       BIGINT      NOT NULL DEFAULT 0,
+    cost_micros         BIGINT      NOT NULL DEFAULT 0,
+    updated_at          TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (day, guild_id, task, provider, model)
+);
+
+-- `!ai usage` reads one guild's recent days.
+CREATE INDEX IF NOT EXISTS idx_ai_token_usage_daily_guild_day
+    ON ai_token_usage_daily (guild_id, day DESC);
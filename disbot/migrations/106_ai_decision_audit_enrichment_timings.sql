@@ -0,0 +1,18 @@
+-- Migration 106: per-leg enrichment timings on `ai_decision_audit`.
+--
+-- Before calling the gateway, the natural-language stage gathers its
+-- enrichment legs (feature facts, recent channel turns, bot self-knowledge,
+-- BTD6 live-state blocks) concurrently under one wall-clock budget
+-- (core/runtime/ai/natural_language_stage.py::_run_enrichment_legs). Each
+-- reply-path audit row now records how long every leg took and how it ended,
+-- so a slow leg is visible per message:
+--
+--     {"feature_facts": {"ms": 412, "outcome": "ok"},
+--      "recent_turns":  {"ms": 5000, "outcome": "timeout"}, ...}
+--
+-- Additive + nullable → rows written before the gather (policy denials,
+-- presets, deterministic floors) stay NULL; no backfill. The JSONB codec on
+-- the connection encodes the dict (utils/db/ai.py::record_decision).
+
+ALTER TABLE ai_decision_audit
+    ADD COLUMN IF NOT EXISTS enrichment_timings JSONB NULL;
@@ -0,0 +1,35 @@
+-- 107_mining_discovered_chunks.sql — fog of war as one bitset row per chunk.
+--
+-- 085 stored one mining_discovered row per visited (z, x, y), so drawing the
+-- map window meant fetching up to 81 rows.  The grid is now generated in 8×8
+-- chunks (utils/mining/grid.py CHUNK_SIZE), and the fog of war follows the
+-- same grid: one row per (z, cx, cy) chunk whose BIGINT ``bits`` has bit
+-- ``(y & 7) * 8 + (x & 7)`` set for every visited cell (bit 63 is the sign
+-- bit — the value is a bitset, never arithmetic).  A map window touches at
+-- most four chunks, fetched in one query.
+--
+-- cx = x >> 3, cy = y >> 3 (arithmetic shift: negative coordinates floor to
+-- the chunk south-west of them, matching Python's >>).
+--
+-- Additive: the backfill folds every existing mining_discovered row into its
+-- chunk, so no player loses explored map.  mining_discovered itself is left in
+-- place (no longer written or read) so a rollback to the previous build still
+-- finds its table.
+
+CREATE TABLE IF NOT EXISTS mining_discovered_chunks (
+    user_id  TEXT    NOT NULL,
+    guild_id BIGINT  NOT NULL,
+    z        INTEGER NOT NULL,
+    cx       INTEGER NOT NULL,
+    cy       INTEGER NOT NULL,
+    bits     BIGINT  NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, guild_id, z, cx, cy)
+);
+
+INSERT INTO mining_discovered_chunks (user_id, guild_id, z, cx, cy, bits)
+SELECT user_id, guild_id, z, x >> 3, y >> 3,
+       bit_or(1::bigint << (((y & 7) << 3) | (x & 7)))
+FROM mining_discovered
+GROUP BY user_id, guild_id, z, x >> 3, y >> 3
+ON CONFLICT (user_id, guild_id, z, cx, cy)
+DO UPDATE SET bits = mining_discovered_chunks.bits | EXCLUDED.bits;
@@ -0,0 +1,21 @@
+-- 108_ticket_transcript_lines.sql — ticket transcripts recorded as they happen.
+--
+-- Closing a ticket used to page up to 500 messages out of channel history and
+-- build the whole transcript in memory, so long tickets were silently cut and
+-- a burst of closes queued REST pagination on the event loop.  Each message in
+-- an open ticket channel is now appended here as one rendered line, keyed by
+-- its Discord message id (snowflakes sort by creation time), so close-time work
+-- is a single ordered read.  A history backfill covers only the messages after
+-- the newest recorded id (bot downtime, a restart before the channel set was
+-- loaded); ON CONFLICT DO NOTHING makes that overlap harmless.
+--
+-- Additive: tickets closed before this migration simply have no lines, and an
+-- open ticket's first close backfills its full history.  Lines are kept after
+-- close (the archive) and go with their ticket row.
+
+CREATE TABLE IF NOT EXISTS ticket_transcript_lines (
+    ticket_id  BIGINT NOT NULL REFERENCES tickets (id) ON DELETE CASCADE,
+    message_id BIGINT NOT NULL,
+    line       TEXT   NOT NULL,
+    PRIMARY KEY (ticket_id, message_id)
+);
@@ -0,0 +1,17 @@
+-- 109_schema_fingerprints.sql — skip the DDL phase when the schema is current.
+--
+-- Every boot used to run the bootstrap DDL and walk every migration file under
+-- the advisory lock, even when nothing was pending — seconds added to each
+-- deploy handoff while the incoming replica is not serving yet.  The runner
+-- now hashes the bootstrap DDL + every migration file (name and content) and
+-- records the hash here once a full pass has applied them.  A boot whose hash
+-- is already recorded skips the DDL phase entirely.
+--
+-- One row per schema revision ever fully applied, so an older build booting
+-- against a newer database (a blue/green rollback) also takes the fast path:
+-- migrations are forward-only and additive, so a later schema is a superset.
+
+CREATE TABLE IF NOT EXISTS schema_fingerprints (
+    fingerprint TEXT   PRIMARY KEY,
+    applied_at  BIGINT NOT NULL
+);
@@ -0,0 +1,22 @@
+-- 110_ticket_transcript_attachments.sql — ticket attachments archived as posted.
+--
+-- Attachment URLs on Discord's CDN are signed and expire, so a transcript that
+-- only names the URL loses the file, and downloading every attachment at close
+-- puts a burst of REST reads in front of the close.  When a ticket message is
+-- recorded (migration 108), the bytes of its attachments are downloaded while
+-- the URL is still valid and stored here; the close streams them into the
+-- attachments zip one row at a time.  ``entry`` is the file's path inside that
+-- zip, which the transcript line names.
+--
+-- A row with NULL ``data`` records an attachment that was not kept (``note``
+-- says why: over the ticket's upload-size budget, or the download failed), so
+-- the archive can list it in SKIPPED.txt.  Rows go with their ticket row.
+
+CREATE TABLE IF NOT EXISTS ticket_transcript_attachments (
+    ticket_id     BIGINT NOT NULL REFERENCES tickets (id) ON DELETE CASCADE,
+    attachment_id BIGINT NOT NULL,
+    entry         TEXT   NOT NULL,
+    data          BYTEA,
+    note          TEXT,
+    PRIMARY KEY (ticket_id, attachment_id)
+);
@@ -159,6 +159,30 @@ def recent_turns(
     return windowed[-limit:]
 
 
+def replied_recently(
+    guild_id: int,
+    channel_id: int,
+    user_id: int,
+    *,
+    within_seconds: float,
+) -> bool:
+    """True if the bot answered ``user_id`` in the channel in the last
+    ``within_seconds`` — i.e. the user's next message is a follow-up in an
+    active conversation.  Scans only the turns inside the window (newest
+    first) and does not touch the channel LRU.
+    """
+    buf = _BUFFERS.get((guild_id, channel_id))
+    if not buf:
+        return False
+    cutoff = time.time() - within_seconds
+    for turn in reversed(buf):
+        if turn.ts < cutoff:
+            return False
+        if turn.role == "assistant" and turn.user_id == user_id:
+            return True
+    return False
+
+
 def forget_guild(guild_id: int) -> int:
     """Drop every buffer scoped to ``guild_id``; returns the count."""
     drop = [key for key in _BUFFERS if key[0] == guild_id]
@@ -221,5 +245,6 @@ __all__ = [
     "forget_channel",
     "forget_guild",
     "recent_turns",
+    "replied_recently",
     "stats",
 ]
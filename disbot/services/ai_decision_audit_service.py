@@ -41,9 +41,13 @@ async def record(
     instruction_profile_ids: list[int] | None = None,
     provider: str | None = None,
     model: str | None = None,
+    enrichment_timings: dict[str, Any] | None = None,
 ) -> int:
     """Write one row; returns the new ``id``.
 
+    ``enrichment_timings`` is the stage's per-leg ``{"ms", "outcome"}`` map
+    for rows written after the enrichment gather (``None`` otherwise).
+
     Raises ``ValueError`` for unknown ``decision`` values so a typo
     surfaces at the call site rather than silently corrupting the
     audit table.
@@ -75,6 +79,7 @@ async def record(
         instruction_profile_ids=instruction_profile_ids,
         provider=provider,
         model=model,
+        enrichment_timings=enrichment_timings,
     )
 
 
@@ -44,6 +44,10 @@ def snapshot_for_cog() -> dict[str, object]:
         "requests_observed": snap.requests_observed,
         "failures_observed": snap.failures_observed,
         "redaction_enabled": snap.redaction_enabled,
+        "input_tokens_observed": snap.input_tokens_observed,
+        "cached_input_tokens_observed": snap.cached_input_tokens_observed,
+        "output_tokens_observed": snap.output_tokens_observed,
+        "estimated_cost_usd": round(snap.cost_usd_observed, 4),
     }
 
 
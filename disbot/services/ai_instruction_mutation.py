@@ -15,7 +15,7 @@ import uuid
 from dataclasses import dataclass
 from typing import Any
 
-from services import ai_natural_language_policy
+from services import ai_instruction_service, ai_natural_language_policy
 from utils.db import ai as ai_db
 
 logger = logging.getLogger("bot.services.ai_instruction_mutation")
@@ -120,6 +120,8 @@ async def upsert_profile(
     if guild_id is not None:
         await ai_db.bump_generation(guild_id)
         ai_natural_language_policy.invalidate(guild_id)
+    # A system/preset profile is shared by every guild (guild_id None).
+    ai_instruction_service.invalidate(guild_id)
     event_emitted = await _emit(
         "ai.instruction.profile_changed",
         guild_id,
@@ -142,9 +144,13 @@ async def delete_profile(profile_id: int, *, actor: Any) -> int:
     if profile is None:
         return 0
     deleted = await ai_db.delete_instruction_profile(profile_id)
-    if profile.get("guild_id") is not None:
-        await ai_db.bump_generation(int(profile["guild_id"]))
-        ai_natural_language_policy.invalidate(int(profile["guild_id"]))
+    owner_guild_id = profile.get("guild_id")
+    if owner_guild_id is not None:
+        await ai_db.bump_generation(int(owner_guild_id))
+        ai_natural_language_policy.invalidate(int(owner_guild_id))
+    ai_instruction_service.invalidate(
+        int(owner_guild_id) if owner_guild_id is not None else None,
+    )
     return deleted
 
 
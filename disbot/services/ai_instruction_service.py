@@ -11,15 +11,26 @@ Every untrusted layer goes through
 :func:`core.runtime.ai.safety.wrap_untrusted_text` so that a hostile
 instruction body like "Ignore previous instructions" becomes data
 the model can describe, not an instruction it follows.
+
+The system layers are the stable prefix of every request: the shared
+constants are identical for every guild, and a guild's profile layers
+only change when its policy ``generation`` is bumped. They are memoised
+per ``(guild, profiles, policy version)`` and rendered with
+:data:`~core.runtime.ai.contracts.PROMPT_CACHE_BREAKPOINT` markers so the
+providers can prompt-cache them; per-turn content (recent turns, facts,
+the user's message, workflow evidence) always follows them.
 """
 
 from __future__ import annotations
 
 import logging
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
 
+from core.runtime.ai.contracts import PROMPT_CACHE_BREAKPOINT
 from core.runtime.ai.safety import wrap_untrusted_text
+from services import metrics
 from utils.db import ai as ai_db
 
 logger = logging.getLogger("bot.services.ai_instruction_service")
@@ -365,15 +376,27 @@ class BotKnowledgeBlock:
 
 @dataclass(frozen=True)
 class InstructionStack:
-    """Ordered system / data blocks ready to compose into a prompt."""
+    """Ordered system / data blocks ready to compose into a prompt.
+
+    ``cache_breakpoints`` are indexes into ``system``: a prompt-cache
+    breakpoint is rendered *after* each listed layer, so the shared
+    constants and the guild's profile layers become separately cacheable
+    prefixes.
+    """
 
     system: tuple[str, ...]
     data: tuple[str, ...]
     user_message: str
     instruction_profile_ids: tuple[int, ...]
+    cache_breakpoints: tuple[int, ...] = ()
 
     def render_system_prompt(self) -> str:
-        return "\n\n".join(self.system)
+        parts: list[str] = []
+        for index, layer in enumerate(self.system):
+            parts.append(layer)
+            if index in self.cache_breakpoints:
+                parts.append(PROMPT_CACHE_BREAKPOINT)
+        return "\n\n".join(parts)
 
     def render_payload_text(self) -> str:
         body = "\n".join(self.data)
@@ -382,6 +405,93 @@ class InstructionStack:
         return self.user_message
 
 
+# The guild-independent head of every system prompt.
+_SHARED_SYSTEM_LAYERS: tuple[str, ...] = (
+    _SYSTEM_SAFETY,
+    _BOT_AI_POLICY,
+    _CAPABILITIES_OVERVIEW,
+    _TASK_CONTRACT,
+)
+
+# Wrapped profile layers keyed by (guild_id, ordered profile ids, policy
+# version). The policy version is the NL policy snapshot hash, which folds in
+# ``ai_guild_policy.generation`` — every profile write bumps it — so a stale
+# entry is simply never looked up again; ``invalidate`` drops it eagerly.
+_LAYER_CACHE_MAX_ENTRIES = 512
+_LAYER_CACHE: OrderedDict[tuple[int, tuple[int, ...], str], tuple[str, ...]] = (
+    OrderedDict()
+)
+
+
+def invalidate(guild_id: int | None = None) -> None:
+    """Drop memoised profile layers for ``guild_id`` (every guild when ``None``).
+
+    ``ai_instruction_mutation`` calls this after every profile write; a
+    system/preset profile is shared by all guilds, so its writes pass ``None``.
+    """
+    if guild_id is None:
+        _LAYER_CACHE.clear()
+        return
+    for key in [key for key in _LAYER_CACHE if key[0] == guild_id]:
+        del _LAYER_CACHE[key]
+
+
+def _reset_for_tests() -> None:
+    _LAYER_CACHE.clear()
+
+
+async def _load_profile_layers(guild_id: int, ordered: list[int]) -> tuple[str, ...]:
+    """Read and wrap each referenced profile body, in order, skipping duplicates."""
+    layers: list[str] = []
+    seen: set[int] = set()
+    for pid in ordered:
+        if pid in seen:
+            continue
+        seen.add(pid)
+        profile = await ai_db.get_instruction_profile(int(pid))
+        if profile is None:
+            # A bound profile id that no longer resolves means policy still
+            # references a deleted instruction profile. The reply continues
+            # without that layer, but warn so the dangling binding gets
+            # noticed instead of silently degrading every reply for the guild.
+            logger.warning(
+                "ai_instruction_service.assemble: instruction profile id=%s "
+                "(guild=%s) not found; skipping. Policy may reference a "
+                "deleted profile.",
+                pid,
+                guild_id,
+            )
+            continue
+        body = str(profile.get("body") or "").strip()
+        if not body:
+            continue
+        kind = f"profile_{profile.get('scope', 'guild')}_{pid}"
+        layers.append(wrap_untrusted_text(body, kind=kind))
+    return tuple(layers)
+
+
+async def _profile_layers(
+    guild_id: int,
+    ordered: list[int],
+    policy_version: str | None,
+) -> tuple[str, ...]:
+    """Profile layers for ``ordered``, memoised when a ``policy_version`` is known."""
+    if not policy_version:
+        return await _load_profile_layers(guild_id, ordered)
+    key = (guild_id, tuple(ordered), policy_version)
+    cached = _LAYER_CACHE.get(key)
+    if cached is not None:
+        _LAYER_CACHE.move_to_end(key)
+        metrics.ai_instruction_layer_cache_total.labels(outcome="hit").inc()
+        return cached
+    metrics.ai_instruction_layer_cache_total.labels(outcome="miss").inc()
+    layers = await _load_profile_layers(guild_id, ordered)
+    _LAYER_CACHE[key] = layers
+    while len(_LAYER_CACHE) > _LAYER_CACHE_MAX_ENTRIES:
+        _LAYER_CACHE.popitem(last=False)
+    return layers
+
+
 def _speaker_label(non_bot_index: int) -> str:
     """Map ``0..25 → 'user_A'..'user_Z'``, ``26 → 'user_AA'``, etc.
 
@@ -518,9 +628,14 @@ async def assemble(
     recent_turns: list[object] | None = None,
     bot_user_id: int | None = None,
     bot_knowledge_blocks: tuple[BotKnowledgeBlock, ...] = (),
+    policy_version: str | None = None,
 ) -> InstructionStack:
     """Build the layered :class:`InstructionStack`.
 
+    ``policy_version`` (the NL policy decision's snapshot hash) enables
+    the in-process memo of the profile layers; without it every call
+    reads the profiles afresh, as before.
+
     ``recent_turns`` is an optional rolling slice of prior channel
     messages (see :mod:`services.ai_conversation_service`). Each turn
     is wrapped as untrusted data so adversarial text in a prior
@@ -531,41 +646,17 @@ async def assemble(
     ``user_B`` / ... — opaque pseudonyms that keep raw Discord
     snowflakes out of the model-visible prompt.
     """
-    system: list[str] = [
-        _SYSTEM_SAFETY,
-        _BOT_AI_POLICY,
-        _CAPABILITIES_OVERVIEW,
-        _TASK_CONTRACT,
-    ]
-
     # Load each referenced profile body and wrap as data.
-    seen: set[int] = set()
     ordered = list(profile_ids)
-    if feature_profile_id is not None and feature_profile_id not in seen:
+    if feature_profile_id is not None:
         ordered.append(feature_profile_id)
-    for pid in ordered:
-        if pid in seen:
-            continue
-        seen.add(pid)
-        profile = await ai_db.get_instruction_profile(int(pid))
-        if profile is None:
-            # A bound profile id that no longer resolves means policy still
-            # references a deleted instruction profile. The reply continues
-            # without that layer, but warn so the dangling binding gets
-            # noticed instead of silently degrading every reply for the guild.
-            logger.warning(
-                "ai_instruction_service.assemble: instruction profile id=%s "
-                "(guild=%s) not found; skipping. Policy may reference a "
-                "deleted profile.",
-                pid,
-                guild_id,
-            )
-            continue
-        body = str(profile.get("body") or "").strip()
-        if not body:
-            continue
-        kind = f"profile_{profile.get('scope', 'guild')}_{pid}"
-        system.append(wrap_untrusted_text(body, kind=kind))
+    profile_layers = await _profile_layers(guild_id, ordered, policy_version)
+    system = (*_SHARED_SYSTEM_LAYERS, *profile_layers)
+    # One breakpoint after the guild-independent constants (cached across
+    # every guild) and one after the guild's own layers.
+    cache_breakpoints = tuple(
+        sorted({len(_SHARED_SYSTEM_LAYERS) - 1, len(system) - 1}),
+    )
 
     data: list[str] = []
     for block in bot_knowledge_blocks:
@@ -626,10 +717,11 @@ async def assemble(
     wrapped_user = wrap_untrusted_text(user_message, kind="current_user_message")
 
     return InstructionStack(
-        system=tuple(system),
+        system=system,
         data=tuple(data),
         user_message=wrapped_user,
         instruction_profile_ids=tuple(int(p) for p in ordered),
+        cache_breakpoints=cache_breakpoints,
     )
 
 
@@ -638,4 +730,5 @@ __all__ = [
     "BotKnowledgeBlock",
     "InstructionStack",
     "assemble",
+    "invalidate",
 ]
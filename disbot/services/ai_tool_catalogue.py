@@ -159,13 +159,25 @@ CATALOGUE: dict[str, AIToolMetadata] = {
     ),
     "btd6_answerability": _btd6(TOOLSET_SELF_AWARENESS, TOOLSET_BTD6_REFERENCE),
     # --- Support tickets (the one write-capable / action tool) ---
+    # Not ``parallel_safe``: its eligibility check and ``ticket.open_requested``
+    # emit must not interleave with a second call from the same turn.
     "open_support_ticket": AIToolMetadata(
         toolsets=frozenset({TOOLSET_TICKET}),
         freshness="live",
+        parallel_safe=False,
     ),
 }
 
 
+def serial_tool_names() -> frozenset[str]:
+    """Tools that must not run concurrently with another call of the same request.
+
+    The gateway runs one assistant turn's tool calls concurrently; ``build_registry``
+    serialises the handlers named here behind a per-request lock.
+    """
+    return frozenset(name for name, meta in CATALOGUE.items() if not meta.parallel_safe)
+
+
 def known_toolsets() -> frozenset[str]:
     """Every toolset name any catalogue entry declares membership in."""
     return frozenset(ts for meta in CATALOGUE.values() for ts in meta.toolsets)
@@ -25,6 +25,7 @@ cannot even attempt to call it.
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Collection, Mapping
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -2400,6 +2401,16 @@ class ToolRegistry:
     handlers: Mapping[str, ToolHandler]
 
 
+def _serialised(handler: ToolHandler, lock: asyncio.Lock) -> ToolHandler:
+    """Run ``handler`` under ``lock`` — for tools the catalogue marks not parallel-safe."""
+
+    async def wrapped(arguments: dict[str, Any]) -> Any:
+        async with lock:
+            return await handler(arguments)
+
+    return wrapped
+
+
 # Tools whose results are BTD6 *facts* and may therefore ground a BTD6 answer.
 # The natural-language stage captures ONLY these tools' outputs into the
 # faithfulness ledger — server/user/config tools (member counts, timestamps,
@@ -2709,10 +2720,18 @@ def build_registry(
     }
     specs: list[AIToolSpec] = []
     handlers: dict[str, ToolHandler] = {}
+    # The gateway runs one turn's calls concurrently; tools the catalogue marks
+    # not parallel-safe share one per-request lock so they still run one at a time.
+    serial_names = ai_tool_catalogue.serial_tool_names()
+    serial_lock = asyncio.Lock()
     for spec, handler in catalog:
         if decisions[spec.name].included:
             specs.append(spec)
-            handlers[spec.name] = handler
+            handlers[spec.name] = (
+                _serialised(handler, serial_lock)
+                if spec.name in serial_names
+                else handler
+            )
     return ToolRegistry(specs=tuple(specs), handlers=handlers)
 
 
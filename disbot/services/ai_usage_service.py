@@ -0,0 +1,142 @@
+"""AI token / cost usage — the persistence side of the gateway's token ledger.
+
+The gateway records every provider call's usage into the in-process
+:class:`~core.runtime.ai.diagnostics.DiagnosticsCollector` ledger. This
+service owns the ledger's lifecycle around the ``ai_token_usage_daily`` rollup
+table (migration 105):
+
+* :func:`flush` drains pending ledger rows into the rollup (additive UPSERT).
+  ``cogs/ai_cog.py`` runs it on a slow loop and once more on unload; a failed
+  flush puts the rows back so nothing is lost to a DB blip.
+* :func:`hydrate` seeds today's per-guild spend from the rollup at boot, so the
+  spend budgets (:mod:`core.runtime.ai.budget`) survive a restart.
+* :func:`usage_breakdown` / :func:`budget_status` feed ``!ai usage``.
+
+Nothing here runs on the AI reply path; :func:`flush` and :func:`hydrate` raise
+on a DB failure and their caller (the cog's loop) logs and carries on.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+
+from core.runtime.ai import budget
+from core.runtime.ai.contracts import AITask
+from core.runtime.ai.diagnostics import TokenUsageRow, get_default_collector
+from utils.db import ai as ai_db
+
+logger = logging.getLogger("bot.services.ai_usage")
+
+__all__ = [
+    "UsageLine",
+    "budget_status",
+    "flush",
+    "hydrate",
+    "usage_breakdown",
+]
+
+
+@dataclass(frozen=True)
+class UsageLine:
+    """One ``!ai usage`` row: a guild's summed usage for one (task, model)."""
+
+    task: str
+    provider: str
+    model: str
+    requests: int
+    input_tokens: int
+    cached_input_tokens: int
+    output_tokens: int
+    cost_usd: float
+
+
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+async def flush() -> int:
+    """Persist pending ledger rows; return how many rollup buckets were written."""
+    collector = get_default_collector()
+    rows = collector.drain_usage()
+    if not rows:
+        return 0
+    try:
+        return await ai_db.add_token_usage(
+            (
+                row.day,
+                row.guild_id,
+                row.task,
+                row.provider,
+                row.model,
+                row.requests,
+                row.input_tokens,
+                row.cached_input_tokens,
+                row.output_tokens,
+                row.cost_micros,
+            )
+            for row in rows
+        )
+    except Exception:
+        collector.restore_usage(rows)
+        raise
+
+
+async def hydrate() -> int:
+    """Seed today's spend totals from the rollup; return the rows loaded."""
+    today = _today()
+    spend = await ai_db.get_token_spend(today)
+    get_default_collector().seed_spend(
+        TokenUsageRow(
+            day=today,
+            guild_id=int(row["guild_id"]),
+            task=str(row["task"]),
+            provider="",
+            model="",
+            cost_micros=int(row["cost_micros"] or 0),
+        )
+        for row in spend
+    )
+    return len(spend)
+
+
+async def usage_breakdown(guild_id: int, *, days: int = 7) -> list[UsageLine]:
+    """A guild's usage over the last ``days`` UTC days, costliest first.
+
+    Reads the rollup, so calls since the last flush are not included.
+    """
+    since = _today() - timedelta(days=max(1, days) - 1)
+    rows = await ai_db.get_token_usage(guild_id, since=since)
+    return [
+        UsageLine(
+            task=str(row["task"]),
+            provider=str(row["provider"]),
+            model=str(row["model"]),
+            requests=int(row["requests"] or 0),
+            input_tokens=int(row["input_tokens"] or 0),
+            cached_input_tokens=int(row["cached_input_tokens"] or 0),
+            output_tokens=int(row["output_tokens"] or 0),
+            cost_usd=int(row["cost_micros"] or 0) / 1_000_000,
+        )
+        for row in rows
+    ]
+
+
+def budget_status(guild_id: int) -> list[tuple[str, float, budget.BudgetLimits]]:
+    """Today's spend against every configured budget, as ``(label, spent, limits)``.
+
+    Includes the guild-wide budget and each task budget that is set.
+    """
+    collector = get_default_collector()
+    status: list[tuple[str, float, budget.BudgetLimits]] = []
+    limits = budget.guild_daily_limits()
+    if limits.soft_usd is not None or limits.hard_usd is not None:
+        status.append(("guild", collector.spend_micros(guild_id) / 1_000_000, limits))
+    for task in AITask:
+        limits = budget.task_daily_limits(task)
+        if limits.soft_usd is None and limits.hard_usd is None:
+            continue
+        spent = collector.spend_micros(guild_id, task=task.value) / 1_000_000
+        status.append((task.value, spent, limits))
+    return status
@@ -18,14 +18,17 @@ table); there is **no migration** — the keys live in
 existing ``!settings`` widget dispatcher.
 
 Cycle discipline (mirrors :mod:`services.moderation_config`): the only
-cross-package import (``settings_resolution``) is function-local; top-level
-imports are stdlib only.
+cross-package import is ``settings_resolution``. Its :func:`memoised_policy`
+decorator is imported at top level (that module is stdlib-only at import time);
+the resolvers stay function-local.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 
+from services.settings_resolution import memoised_policy
+
 SUBSYSTEM = "automod"
 
 # ---------------------------------------------------------------------------
@@ -146,6 +149,7 @@ def parse_id_csv(raw: str) -> frozenset[int]:
     return frozenset(ids)
 
 
+@memoised_policy(SUBSYSTEM)
 async def load_policy(guild_id: int) -> AutomodPolicy:
     """Load the effective :class:`AutomodPolicy` for ``guild_id``.
 
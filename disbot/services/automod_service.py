@@ -12,8 +12,9 @@ Public surface:
     SpamTracker             — per (guild,user,channel) sliding-window counter,
                               also used (keyed guild+user only) for the
                               cross-channel spam rule
-    DuplicateTracker        — per (guild,user) sliding window of normalized
-                              content, for the repeated/duplicate-message rule
+    DuplicateTracker        — per (guild,user) sliding window of content
+                              fingerprints (exact digest + MinHash sketch), for
+                              the repeated/duplicate-message rule
     find_invite(content)    — discord invite-link detector
     caps_ratio(content)     — uppercase-letter fraction (0..1)
     exceeds_caps(...)       — caps rule predicate
@@ -29,15 +30,26 @@ repeated/duplicate message from a burst of different ones, nor see a burst
 spread across multiple channels) and run right after the per-channel spam
 check: cross-channel spam burst → repeated/duplicate content → invite links →
 excessive caps → mass mentions.
+
+Both trackers are bounded (2026-10): an LRU cap on tracked keys, a per-key
+entry cap, and an amortised sweep that drops keys idle for longer than any
+window could span — previously every author who ever spoke stayed resident
+for the life of the process.  Sizes are exported as the
+``automod_tracker_keys`` gauge.
 """
 
 from __future__ import annotations
 
+import hashlib
+import heapq
 import re
 import time
-from collections import defaultdict, deque
+import zlib
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Generic, TypeVar
+
+from services import metrics as _metrics
 
 # discord.gg/CODE, discord.com/invite/CODE, discordapp.com/invite/CODE.
 _INVITE_RE = re.compile(
@@ -59,6 +71,83 @@ class AutomodVerdict:
     reason: str
 
 
+# ---------------------------------------------------------------------------
+# Bounded window storage shared by both trackers
+# ---------------------------------------------------------------------------
+
+# Hard cap on tracked keys per tracker; the least-recently-active key is
+# evicted first.  Losing an idle author's window only resets their burst count,
+# which is the same conservative outcome as a restart.
+DEFAULT_MAX_KEYS = 50_000
+# Keys untouched for this long are swept.  Comfortably above the largest
+# configurable spam window (automod_config.MAX_SPAM_WINDOW_SECONDS = 120), so a
+# sweep can never drop an entry a window still needs.
+DEFAULT_IDLE_SECONDS = 300.0
+# How often (in tracker time) the amortised idle sweep runs.
+_SWEEP_INTERVAL_SECONDS = 60.0
+# Per-key entry cap.  Every rule threshold is <= 50, so a count saturating at
+# 64 still trips exactly the same rules.
+_MAX_ENTRIES_PER_KEY = 64
+
+_K = TypeVar("_K")
+_E = TypeVar("_E")
+
+
+class _BoundedWindows(Generic[_K, _E]):
+    """LRU-ordered map of key → bounded deque, with an amortised idle sweep.
+
+    The ``OrderedDict`` is kept in last-touched order (``move_to_end`` on every
+    record), so both the LRU eviction and the idle sweep pop from the front and
+    cost O(evicted), never a full scan.
+    """
+
+    def __init__(self, label: str, *, max_keys: int, idle_seconds: float) -> None:
+        self._label = label
+        self._max_keys = max_keys
+        self._idle_seconds = idle_seconds
+        self._windows: OrderedDict[_K, tuple[float, deque[_E]]] = OrderedDict()
+        self._next_sweep: float | None = None
+
+    def touch(self, key: _K, ts: float) -> deque[_E]:
+        """Return ``key``'s deque, marking it most recently active at ``ts``."""
+        slot = self._windows.pop(key, None)
+        bucket = slot[1] if slot is not None else deque(maxlen=_MAX_ENTRIES_PER_KEY)
+        self._windows[key] = (ts, bucket)
+        if slot is None and len(self._windows) > self._max_keys:
+            self._windows.popitem(last=False)
+            self._publish()
+        if self._next_sweep is None or ts >= self._next_sweep:
+            self.sweep_idle(ts)
+        return bucket
+
+    def sweep_idle(self, now: float) -> int:
+        """Drop keys idle since before ``now - idle_seconds``; return how many."""
+        cutoff = now - self._idle_seconds
+        dropped = 0
+        while self._windows:
+            key, (last_seen, _) = next(iter(self._windows.items()))
+            if last_seen >= cutoff:
+                break
+            del self._windows[key]
+            dropped += 1
+        self._next_sweep = now + _SWEEP_INTERVAL_SECONDS
+        self._publish()
+        return dropped
+
+    def _publish(self) -> None:
+        _metrics.automod_tracker_keys.labels(tracker=self._label).set(
+            len(self._windows),
+        )
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def clear(self) -> None:
+        self._windows.clear()
+        self._next_sweep = None
+        self._publish()
+
+
 # ---------------------------------------------------------------------------
 # Spam burst — sliding-window message counter
 # ---------------------------------------------------------------------------
@@ -69,7 +158,8 @@ class SpamTracker:
 
     State is process-local and intentionally not persisted (ADR-002: game/runtime
     state is not restart-safe by design; a restart simply resets burst windows,
-    which is harmless — a fresh window is the conservative choice).
+    which is harmless — a fresh window is the conservative choice).  Memory is
+    bounded by ``max_keys`` (LRU) and an idle sweep; see :class:`_BoundedWindows`.
     """
 
     # Sentinel channel-component for the cross-channel bucket. Discord channel
@@ -78,8 +168,17 @@ class SpamTracker:
     # exact same sliding-window mechanics/storage as the per-channel one.
     _CROSS_CHANNEL_KEY = -1
 
-    def __init__(self) -> None:
-        self._hits: dict[tuple[int, int, int], deque[float]] = defaultdict(deque)
+    def __init__(
+        self,
+        *,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+    ) -> None:
+        self._hits: _BoundedWindows[tuple[int, int, int], float] = _BoundedWindows(
+            "spam",
+            max_keys=max_keys,
+            idle_seconds=idle_seconds,
+        )
 
     def record_and_count(
         self,
@@ -92,15 +191,11 @@ class SpamTracker:
     ) -> int:
         """Record a message at ``now`` and return the count within the window."""
         ts = time.monotonic() if now is None else now
-        key = (guild_id, user_id, channel_id)
-        bucket = self._hits[key]
+        bucket = self._hits.touch((guild_id, user_id, channel_id), ts)
         bucket.append(ts)
         cutoff = ts - window_seconds
         while bucket and bucket[0] < cutoff:
             bucket.popleft()
-        if not bucket:  # pragma: no cover - bucket always holds the just-added ts
-            del self._hits[key]
-            return 0
         return len(bucket)
 
     def record_and_count_any_channel(
@@ -123,6 +218,10 @@ class SpamTracker:
             now=now,
         )
 
+    def tracked_keys(self) -> int:
+        """Number of (guild, user, channel) windows currently held."""
+        return len(self._hits)
+
     def reset(self) -> None:
         """Drop all tracked windows (used by tests and on a guild leave)."""
         self._hits.clear()
@@ -140,30 +239,127 @@ def default_tracker() -> SpamTracker:
 def _normalize_for_duplicate(content: str) -> str:
     """Normalize content for duplicate comparison: casefold + collapse whitespace.
 
-    Trivial variation (extra spaces, casing) shouldn't defeat the check, but
-    this stops short of fuzzy matching — that's a deliberate v1 boundary
-    (higher false-positive risk, tracked separately).
+    Trivial variation (extra spaces, casing) shouldn't defeat the check; the
+    near-duplicate sketch below handles the rest.
     """
     return " ".join((content or "").split()).casefold()
 
 
+# Near-duplicate matching (bottom-k MinHash over character 3-gram shingles).
+# A raider varying one character per message changes at most three shingles,
+# so the sketch similarity of long variants stays high while unrelated
+# messages sit near zero.  Short messages are matched exactly only: "message
+# number 1" and "message number 2" are a one-character variant too, and on
+# short text that is far more often an honest burst than a raid (the owner's
+# Q-0108 concern).
+#
+# The sketch runs on the event loop for every message, so it is one CRC32 per
+# shingle plus a k-smallest selection — linear in the (capped) text — rather
+# than k hash permutations per shingle.
+_SHINGLE = 3
+_SKETCH_SIZE = 32
+_NEAR_DUPLICATE_MIN_LENGTH = 24
+_NEAR_DUPLICATE_SIMILARITY = 0.7
+# Only the head of a very long message is sketched — bounds the per-message
+# cost without weakening the check (a raid template varies near the start).
+_SKETCH_MAX_CHARS = 512
+
+
+def _hash64(text: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(text.encode(), digest_size=8).digest(),
+        "big",
+    )
+
+
+def _minhash(normalized: str) -> frozenset[int]:
+    """Bottom-k sketch: the ``_SKETCH_SIZE`` smallest shingle hashes.
+
+    Deterministic (CRC32, not the per-process ``hash``), so matching is
+    reproducible in tests.  Text with fewer shingles keeps all of them.
+    """
+    data = normalized[:_SKETCH_MAX_CHARS].encode()
+    shingles = {
+        zlib.crc32(data[i : i + _SHINGLE])
+        for i in range(max(1, len(data) - _SHINGLE + 1))
+    }
+    return frozenset(heapq.nsmallest(_SKETCH_SIZE, shingles))
+
+
+def _sketch_similarity(left: frozenset[int], right: frozenset[int]) -> float:
+    """Estimated Jaccard similarity of two bottom-k sketches.
+
+    The k smallest hashes of the union are a uniform sample of it; the
+    fraction present in both sketches estimates the Jaccard index.
+    """
+    sample = heapq.nsmallest(_SKETCH_SIZE, left | right)
+    if not sample:
+        return 0.0
+    both = left & right
+    return sum(1 for h in sample if h in both) / len(sample)
+
+
+@dataclass(frozen=True, slots=True)
+class _Fingerprint:
+    """Constant-size stand-in for a message body — the body itself is never kept.
+
+    ``digest`` is a 64-bit hash of the full normalized text (exact matching);
+    ``sketch`` is its bottom-k MinHash (at most ``_SKETCH_SIZE`` ints), or
+    None for text too short to fuzzy-match.
+    """
+
+    digest: int
+    sketch: frozenset[int] | None
+
+    @classmethod
+    def of(cls, normalized: str, digest: int | None = None) -> _Fingerprint:
+        sketch = (
+            _minhash(normalized)
+            if len(normalized) >= _NEAR_DUPLICATE_MIN_LENGTH
+            else None
+        )
+        if digest is None:
+            digest = _hash64(normalized)
+        return cls(digest=digest, sketch=sketch)
+
+    def matches(self, other: _Fingerprint) -> bool:
+        if self.digest == other.digest:
+            return True
+        if self.sketch is None or other.sketch is None:
+            return False
+        return (
+            _sketch_similarity(self.sketch, other.sketch) >= _NEAR_DUPLICATE_SIMILARITY
+        )
+
+
 class DuplicateTracker:
-    """In-memory per (guild, user) sliding window of normalized message content.
+    """In-memory per (guild, user) sliding window of message fingerprints.
 
     Distinct from :class:`SpamTracker`: this counts how many of the messages
-    currently in the window share the *same* normalized content, independent
-    of overall message rate — a burst of five different messages and the same
-    message repeated five times look identical to a pure rate counter, but not
-    to this one. Keyed guild+user only (not per-channel) so it also catches
-    the same message copy-pasted across different channels.
-
-    State is process-local, same restart-reset rationale as ``SpamTracker``
-    (ADR-002).
+    currently in the window share the *same* (or near-same) content,
+    independent of overall message rate — a burst of five different messages
+    and the same message repeated five times look identical to a pure rate
+    counter, but not to this one. Keyed guild+user only (not per-channel) so it
+    also catches the same message copy-pasted across different channels.
+
+    Only a constant-size :class:`_Fingerprint` is stored per message, never the
+    body.  State is process-local, same restart-reset rationale and the same
+    memory bounds as ``SpamTracker`` (ADR-002).
     """
 
-    def __init__(self) -> None:
-        self._hits: dict[tuple[int, int], deque[tuple[float, str]]] = defaultdict(
-            deque,
+    def __init__(
+        self,
+        *,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+    ) -> None:
+        self._hits: _BoundedWindows[
+            tuple[int, int],
+            tuple[float, _Fingerprint | None],
+        ] = _BoundedWindows(
+            "duplicate",
+            max_keys=max_keys,
+            idle_seconds=idle_seconds,
         )
 
     def record_and_count(
@@ -175,26 +371,35 @@ class DuplicateTracker:
         window_seconds: float,
         now: float | None = None,
     ) -> int:
-        """Record a message's normalized content and return how many messages
-        currently in the window share that same normalized content (including
-        this one). Empty/whitespace-only content never counts — a run of
-        blank messages (e.g. attachment-only posts) shouldn't trip this rule;
-        that's a different, not-yet-built rule class.
+        """Record a message's fingerprint and return how many messages
+        currently in the window match it (including this one). Empty/
+        whitespace-only content never counts — a run of blank messages (e.g.
+        attachment-only posts) shouldn't trip this rule; that's a different,
+        not-yet-built rule class.
         """
         normalized = _normalize_for_duplicate(content)
         ts = time.monotonic() if now is None else now
-        key = (guild_id, user_id)
-        bucket = self._hits[key]
-        bucket.append((ts, normalized))
+        bucket = self._hits.touch((guild_id, user_id), ts)
+        fingerprint = None
+        if normalized:
+            # An exact repeat (the common raid shape) reuses the fingerprint
+            # already in the window instead of sketching the text again.
+            digest = _hash64(normalized)
+            fingerprint = next(
+                (f for _, f in bucket if f is not None and f.digest == digest),
+                None,
+            ) or _Fingerprint.of(normalized, digest)
+        bucket.append((ts, fingerprint))
         cutoff = ts - window_seconds
         while bucket and bucket[0][0] < cutoff:
             bucket.popleft()
-        if not bucket:  # pragma: no cover - bucket always holds the just-added entry
-            del self._hits[key]
+        if fingerprint is None:
             return 0
-        if not normalized:
-            return 0
-        return sum(1 for _, c in bucket if c == normalized)
+        return sum(1 for _, f in bucket if f is not None and fingerprint.matches(f))
+
+    def tracked_keys(self) -> int:
+        """Number of (guild, user) windows currently held."""
+        return len(self._hits)
 
     def reset(self) -> None:
         """Drop all tracked windows (used by tests and on a guild leave)."""
@@ -344,7 +549,7 @@ def evaluate(
             )
 
     # Repeated/duplicate content — distinct from spam rate: trips when the
-    # same normalized content repeats, regardless of how fast it's arriving.
+    # same (or near-same) content repeats, regardless of how fast it arrives.
     if policy.duplicate_enabled:
         dup_trk = (
             duplicate_tracker
@@ -20,7 +20,7 @@ from __future__ import annotations
 import logging
 import re
 import unicodedata
-from collections import Counter
+from collections import Counter, OrderedDict
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from functools import lru_cache
@@ -4442,7 +4442,14 @@ def deterministic_btd6_list_reply(message_text: str) -> str | None:
     The AI §7.5 comparison builders ride the same seam: a "which costs more" /
     "which earns more" question (across towers, difficulties, or round ranges) is
     the comparison member of the same wrong-assembly class.
+
+    Memoised per normalised question (:func:`_memoised_reply`): this runs on
+    every BTD6-routed message, and a repeat question skips all the builders.
     """
+    return _memoised_reply("list", message_text, _build_btd6_list_reply)
+
+
+def _build_btd6_list_reply(message_text: str) -> str | None:
     for builder in _BTD6_LIST_BUILDERS:
         reply = builder(message_text)
         if reply:
@@ -4450,6 +4457,138 @@ def deterministic_btd6_list_reply(message_text: str) -> str | None:
     return None
 
 
+# --- deterministic reply memo ----------------------------------------------
+#
+# The deterministic floors are pure functions of the question text and the
+# loaded dataset (plus, for the meta answer, the live-ingestion coverage), so a
+# repeated question — and the list floor runs on every BTD6-routed message —
+# can be answered from memory. Entries store the reply *or* the miss (``None``):
+# most messages match no builder, and remembering that is the bigger saving.
+#
+# Entries are keyed on ``(chain, normalised text)`` and live for one version
+# generation: the dataset's ``(data_version, game_version, id())`` — so a
+# ``btd6_data_service.reset_cache()`` (new object) drops them all, the same
+# discipline as ``btd6_grounding_service._name_index`` — plus an ingestion
+# counter that :func:`invalidate_reply_memo` bumps after an ingestion run
+# stores new facts or patch notes.
+
+_REPLY_MEMO_MAX = 1024
+_REPLY_MEMO: OrderedDict[tuple[str, str], str | None] = OrderedDict()
+_REPLY_MEMO_KEY: tuple[str, str, int, int] | None = None
+# The dataset whose ``id()`` is in the key, held so that id cannot be reused by
+# a reloaded dataset allocated at the same address.
+_reply_memo_dataset: object | None = None
+_reply_memo_generation = 0
+_reply_memo_hits = 0
+_reply_memo_misses = 0
+
+_MEMO_SPACE_RE = re.compile(r"\s+")
+# Only sentence punctuation at the ends is folded — inner punctuation carries
+# meaning for the builders ("0-2-4", "r40-60", "x2.5").
+_MEMO_EDGE_PUNCT = " ?!.,;:…"
+
+
+@dataclass(frozen=True)
+class ReplyMemoStats:
+    """Deterministic-reply memo counters for ``!btd6 ops readiness``."""
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _normalise_question(message_text: str) -> str:
+    """Memo key text: NFKC, casefolded, whitespace collapsed, edge punctuation off.
+
+    Deliberately conservative — the builders match case-insensitively over
+    the raw text, so these folds cannot change which builder answers. Plural
+    and number folding are not applied: builders tell "tower" from "towers"
+    and read digits literally.
+    """
+    text = unicodedata.normalize("NFKC", message_text or "").casefold()
+    text = text.replace("’", "'").replace("‘", "'")
+    return _MEMO_SPACE_RE.sub(" ", text).strip(_MEMO_EDGE_PUNCT)
+
+
+def _reply_memo_version() -> tuple[str, str, int, int] | None:
+    global _reply_memo_dataset
+    from services import btd6_data_service
+
+    try:
+        dataset = btd6_data_service.get_dataset()
+    except Exception:  # noqa: BLE001 — no dataset, no memo; builders decide
+        return None
+    if dataset is not _reply_memo_dataset:
+        _reply_memo_dataset = dataset
+        _REPLY_MEMO.clear()
+    return (
+        dataset.data_version,
+        dataset.game_version,
+        id(dataset),
+        _reply_memo_generation,
+    )
+
+
+def _memoised_reply(
+    chain: str,
+    message_text: str,
+    build: Callable[[str], str | None],
+) -> str | None:
+    """Serve ``build(message_text)`` from the reply memo when possible."""
+    global _REPLY_MEMO_KEY, _reply_memo_hits, _reply_memo_misses
+    version = _reply_memo_version()
+    if version is None:
+        return build(message_text)
+    if version != _REPLY_MEMO_KEY:
+        _REPLY_MEMO.clear()
+        _REPLY_MEMO_KEY = version
+    key = (chain, _normalise_question(message_text))
+    if key in _REPLY_MEMO:
+        _REPLY_MEMO.move_to_end(key)
+        _reply_memo_hits += 1
+        return _REPLY_MEMO[key]
+    _reply_memo_misses += 1
+    reply = build(message_text)
+    _REPLY_MEMO[key] = reply
+    if len(_REPLY_MEMO) > _REPLY_MEMO_MAX:
+        _REPLY_MEMO.popitem(last=False)
+    return reply
+
+
+def invalidate_reply_memo() -> None:
+    """Drop every memoised deterministic reply (new facts were ingested)."""
+    global _reply_memo_generation
+    _reply_memo_generation += 1
+    _REPLY_MEMO.clear()
+
+
+def reply_memo_stats() -> ReplyMemoStats:
+    """Hit / miss counters and current size of the deterministic-reply memo."""
+    return ReplyMemoStats(
+        hits=_reply_memo_hits,
+        misses=_reply_memo_misses,
+        size=len(_REPLY_MEMO),
+        max_size=_REPLY_MEMO_MAX,
+    )
+
+
+def _reset_for_tests() -> None:
+    global _REPLY_MEMO_KEY, _reply_memo_dataset, _reply_memo_generation
+    global _reply_memo_hits, _reply_memo_misses
+    _REPLY_MEMO.clear()
+    _REPLY_MEMO_KEY = None
+    _reply_memo_dataset = None
+    _reply_memo_generation = 0
+    _reply_memo_hits = 0
+    _reply_memo_misses = 0
+
+
 # A capability/meta ask about the bot's BTD6 knowledge. Anchored on a
 # btd6/bloons token on purpose: the floor only handles BTD6-routed messages,
 # and requiring the anchor keeps entity questions ("do you know how much the
@@ -4554,6 +4693,23 @@ def deterministic_meta_reply(message_text: str) -> str | None:
     return reply if len(reply) <= 1900 else reply[:1899] + "…"
 
 
+def deterministic_floor_reply(message_text: str) -> str | None:
+    """The post-model floor: the roster list, else the meta answer, or ``None``.
+
+    What the natural-language stage serves when a healthy BTD6 answer produced
+    no groundable reply — :func:`deterministic_roster_reply` first, then
+    :func:`deterministic_meta_reply`. Memoised like
+    :func:`deterministic_btd6_list_reply`.
+    """
+    return _memoised_reply("floor", message_text, _build_floor_reply)
+
+
+def _build_floor_reply(message_text: str) -> str | None:
+    return deterministic_roster_reply(message_text) or deterministic_meta_reply(
+        message_text,
+    )
+
+
 _PARAGON_NAME_FILLERS = frozenset({"the", "of"})
 
 # Paragon shorthand distinctive enough to ground WITHOUT the word "paragon"
@@ -25,7 +25,7 @@ import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from services import (
     btd6_fact_store,
@@ -38,9 +38,16 @@ from services import (  # noqa: F401  — triggers registration side-effects
     parsers as _parsers_pkg,
 )
 from utils.db import btd6_sources as btd6_sources_db
+from utils.lazy_import import is_loaded, lazy_module
 
 logger = logging.getLogger("bot.services.btd6_ingestion")
 
+# Only used to drop the reply memo after a run changes facts.
+if TYPE_CHECKING:
+    from services import btd6_context_service
+else:
+    btd6_context_service = lazy_module("services.btd6_context_service")
+
 
 # ---------------------------------------------------------------------------
 # Shared types
@@ -289,6 +296,11 @@ async def _run_ingestion(
             written_keys = tuple(r.entity_key for r in results)
     except Exception as err:
         return await _fail("store_error", "store_exception", str(err))
+    if fact_count and is_loaded(btd6_context_service):
+        # New facts / patch notes can change the live-coverage lines the
+        # deterministic floors render.  No memo exists until the deferred
+        # context stack has loaded, so don't import it just to clear one.
+        btd6_context_service.invalidate_reply_memo()
 
     # 11. Update run to ok.
     duration_ms = _elapsed()
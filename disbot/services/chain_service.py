@@ -24,6 +24,10 @@ Two write lanes live here:
 
 Reads (``get_chain_channel`` / ``get_all_chain_channels``) stay direct via
 ``utils.db`` — panels and embeds compose them freely (read lane).
+
+Create/delete also keep the message pipeline's channel routing table
+current (``CHAIN_STAGE_NAME`` bound to every chain channel), so the chain
+stage is never dispatched in a channel that has no chain row.
 """
 
 from __future__ import annotations
@@ -34,11 +38,15 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Literal
 
+from core.runtime import message_pipeline
 from services.audit_events import emit_audit_action
 from utils.db.games import chain as db
 
 logger = logging.getLogger("bot.services.chain")
 
+# Message-pipeline stage name; the routing-table key for chain channels.
+CHAIN_STAGE_NAME = "chain"
+
 ChainMutationStatus = Literal[
     "applied",
     "already_exists",
@@ -153,6 +161,11 @@ async def create_chain(
         normalized,
         limit=(existing or {}).get("word_limit") or 0,
     )
+    if guild_id is not None:
+        message_pipeline.bind_channel(CHAIN_STAGE_NAME, guild_id, channel_id)
+    else:
+        # Can't place the channel in the per-guild table: fail open.
+        message_pipeline.drop_routes(CHAIN_STAGE_NAME)
     mutation_id, audit_emitted = await _emit(
         mutation_type="create_chain",
         guild_id=guild_id,
@@ -191,6 +204,7 @@ async def delete_chain(
             action="delete_chain",
         )
     await db.delete_chain_channel(channel_id)
+    message_pipeline.unbind_channel(CHAIN_STAGE_NAME, guild_id, channel_id)
     mutation_id, audit_emitted = await _emit(
         mutation_type="delete_chain",
         guild_id=guild_id,
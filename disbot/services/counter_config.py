@@ -22,14 +22,17 @@ table); there is **no migration** — the keys live in
 existing ``!settings`` widget dispatcher.
 
 Cycle discipline (mirrors :mod:`services.welcome_config`): the only
-cross-package import (``settings_resolution``) is function-local; top-level
-imports are stdlib only.
+cross-package import is ``settings_resolution``. Its :func:`memoised_policy`
+decorator is imported at top level (that module is stdlib-only at import time);
+the resolvers stay function-local.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 
+from services.settings_resolution import memoised_policy
+
 SUBSYSTEM = "counters"
 
 # ---------------------------------------------------------------------------
@@ -236,6 +239,7 @@ def render_counter_name(template: str, count: int) -> str:
     return name[:MAX_CHANNEL_NAME_LENGTH]
 
 
+@memoised_policy(SUBSYSTEM)
 async def load_policy(guild_id: int) -> CounterPolicy:
     """Load the effective :class:`CounterPolicy` for ``guild_id``.
 
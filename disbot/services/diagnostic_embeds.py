@@ -1772,6 +1772,91 @@ def build_slow_embed(limit: int = 10) -> discord.Embed:
     return embed
 
 
+def build_queries_embed(
+    limit: int = 10,
+    query_id: str = "",
+    sort: str = "total",
+) -> discord.Embed:
+    """Build the embed for ``!platform queries [limit|id] [sort]``.
+
+    Without ``query_id``: the top fingerprints from
+    :mod:`core.runtime.query_profiler`.  With it: that fingerprint's full
+    statement, stats and captured plan.
+    """
+    from core.runtime import query_profiler
+    from utils.db import pool
+
+    if query_id:
+        stats = query_profiler.get(query_id)
+        if stats is None:
+            return discord.Embed(
+                title="🔎 Query profile",
+                description=f"No tracked fingerprint `{query_id}`.",
+                color=discord.Color.red(),
+            )
+        embed = discord.Embed(
+            title=f"🔎 Query `{stats.query_id}`",
+            description=f"```sql\n{stats.fingerprint[:1500]}\n```",
+            color=discord.Color.blurple(),
+        )
+        embed.add_field(
+            name="Stats",
+            value=(
+                f"calls `{stats.calls}`  ·  total `{stats.total_ms:.0f}ms`  ·  "
+                f"mean `{stats.mean_ms:.1f}ms`  ·  p95 `{stats.p95_ms:.1f}ms`  ·  "
+                f"max `{stats.max_ms:.0f}ms`  ·  rows `{stats.rows}`"
+            ),
+            inline=False,
+        )
+        plan = stats.plan or f"_{stats.plan_state or 'not captured'}_"
+        if stats.plan:
+            plan = f"```\n{stats.plan[:1000]}\n```"
+        embed.add_field(name="Plan", value=plan, inline=False)
+        return embed
+
+    if sort not in query_profiler.SORT_KEYS:
+        sort = "total"
+    limit = max(1, min(limit, 15))
+    rows = query_profiler.top(limit, sort=sort)
+    embed = discord.Embed(
+        title="🔎 Query profile",
+        description=(
+            f"**{query_profiler.tracked()}** fingerprints  ·  sorted by `{sort}`  ·  "
+            f"plan capture ≥ `{query_profiler.explain_threshold_ms():.0f}ms`"
+        ),
+        color=discord.Color.blurple(),
+    )
+    lanes = pool.lane_stats()
+    if lanes:
+        embed.add_field(
+            name="Pool lanes (in use / max)",
+            value="  ·  ".join(
+                f"{lane} `{n['size'] - n['idle']}/{n['max']}`"
+                for lane, n in lanes.items()
+            ),
+            inline=False,
+        )
+    if not rows:
+        embed.add_field(
+            name="No queries recorded",
+            value="Nothing has run through the DB pool yet.",
+            inline=False,
+        )
+        return embed
+    for stats in rows:
+        plan = " · 📋" if stats.plan else ""
+        embed.add_field(
+            name=f"`{stats.query_id}` {stats.fingerprint[:80]}",
+            value=(
+                f"calls `{stats.calls}`  ·  total `{stats.total_ms:.0f}ms`  ·  "
+                f"p95 `{stats.p95_ms:.1f}ms`  ·  rows `{stats.rows}`{plan}"
+            ),
+            inline=False,
+        )
+    embed.set_footer(text="!platform queries <id> — full statement + captured plan")
+    return embed
+
+
 async def build_sessions_embed(
     subsystem: str = "",
 ) -> tuple[discord.Embed | None, str | None]:
@@ -2565,6 +2650,7 @@ __all__ = [
     "build_migrations_embed",
     "build_participation_schemas_embed",
     "build_provisioning_embed",
+    "build_queries_embed",
     "build_resource_requirements_embed",
     "build_resources_embed",
     "build_runtime_embed",
@@ -77,6 +77,8 @@ class FarmStatus:
     elapsed_seconds: int
     #: True when the coop is at capacity (so the blurb can nudge a collect).
     at_capacity: bool
+    #: The player's coin balance, read in the same round-trip (panel footer).
+    balance: int = 0
 
 
 async def get_status(user_id: int, guild_id: int) -> FarmStatus:
@@ -85,16 +87,25 @@ async def get_status(user_id: int, guild_id: int) -> FarmStatus:
     Read-only (the same no-persist contract as :func:`get_state`). The deltas are
     measured against the *stored* state, so a fresh farm (normalized to *now*)
     reports ``eggs_gained=0`` / ``elapsed_seconds=0`` — no spurious return-moment.
+    The farm row and the coin balance come back in ONE query
+    (:func:`utils.db.load_farm_player_state`) — this is every panel redraw.
     """
     now = int(time.time())
-    chickens, eggs, ts, coop = await db.get_chicken_farm(user_id, guild_id)
-    stored = _stored_state(now, chickens, eggs, ts, coop)
+    row = await db.load_farm_player_state(user_id, guild_id)
+    stored = _stored_state(
+        now,
+        row.chickens,
+        row.eggs,
+        row.eggs_updated_at,
+        row.coop_level,
+    )
     settled = farm_mod.settle(stored, now)
     return FarmStatus(
         state=settled,
         eggs_gained=max(0, settled.eggs - stored.eggs),
         elapsed_seconds=max(0, now - stored.updated_at),
         at_capacity=settled.eggs >= farm_mod.coop_capacity(settled.coop_level),
+        balance=row.coins,
     )
 
 
@@ -132,6 +132,7 @@ async def roll_cast(
     rarity_pull: float | None = None,
     venue: str = venue_mod.SHORE,
     double_catch_chance: float | None = None,
+    fishing_xp: int | None = None,
 ) -> Cast:
     """Read the player's level and roll a catch **without writing anything**.
 
@@ -151,13 +152,18 @@ async def roll_cast(
     repeated at commit). When ``None`` (the legacy ``fish()`` seam, which has no
     runtime callers), it defaults to the base ``rewards.BONUS_CATCH_CHANCE`` — i.e.
     the Fishery bonus is applied through ``begin_cast``, the real cast path.
+
+    *fishing_xp*, when given, is the player's fishing XP as ``begin_cast`` already
+    read it (in its one state read), so the level lookup skips the
+    ``db.get_game_xp`` round-trip.
     """
     rod = rod or rods_mod.STARTER
     venue = venue_mod.normalize(venue)
     pull = rod.rarity_pull if rarity_pull is None else rarity_pull
-    xp_map = await db.get_game_xp(user_id, guild_id)
-    fishing_xp_before = xp_map.get(game_xp_service.GAME_FISHING, 0)
-    level_before = fishing_level_from_xp(fishing_xp_before)
+    if fishing_xp is None:
+        xp_map = await db.get_game_xp(user_id, guild_id)
+        fishing_xp = xp_map.get(game_xp_service.GAME_FISHING, 0)
+    level_before = fishing_level_from_xp(fishing_xp)
     catch = roll_catch(level_before, rarity_pull=pull, venue=venue)
     if catch is None:
         logger.error("fishing: no catchable species (venue=%s, catalog empty?)", venue)
@@ -353,13 +359,14 @@ async def get_energy(user_id: int, guild_id: int) -> int:
     faster refill a built Boathouse grants (unbuilt ⇒ REGEN_SECONDS ⇒ byte-identical).
     """
     now = int(time.time())
-    built = await db.get_structures(user_id, guild_id)
+    player = await db.load_fishing_player_state(user_id, guild_id)
     regen_seconds = fish_energy.regen_seconds_for(
-        structures_mod.boathouse_regen_mult(built.get(structures_mod.BOATHOUSE, 0)),
+        structures_mod.boathouse_regen_mult(
+            player.structures.get(structures_mod.BOATHOUSE, 0),
+        ),
     )
-    cur, ts = await db.get_fishing_energy(user_id, guild_id)
     return fish_energy.settle(
-        fish_energy.EnergyState(cur, ts),
+        fish_energy.EnergyState(player.energy, player.energy_updated_at),
         now,
         regen_seconds=regen_seconds,
     ).current
@@ -375,6 +382,10 @@ async def get_active_bait(
     key (catalog entry removed) or non-positive charges both read as no bait.
     """
     key, charges = await db.get_active_bait(user_id, guild_id)
+    return _resolve_bait(key, charges)
+
+
+def _resolve_bait(key: str, charges: int) -> tuple[bait_mod.Bait | None, int]:
     bait = bait_mod.bait_by_key(key)
     if bait is None or charges <= 0:
         return None, 0
@@ -388,19 +399,23 @@ async def begin_cast(user_id: int, guild_id: int) -> CastStart:
     still costs, exactly like a dig). Energy is direct game state (no audit, like
     mining energy). Energy is only spent once a catch is actually rolled, so a
     catalog-load failure never charges the player.
+
+    Everything the cast reads — energy, rod, venue, bait, structures, gear,
+    skills and fishing XP — comes from ONE ``db.load_fishing_player_state``
+    round-trip; only the spend / bait-charge writes follow it.
     """
     now = int(time.time())
-    # One structures read serves every structure knob (Tide Pool / Dock below) *and*
+    player = await db.load_fishing_player_state(user_id, guild_id)
+    # The structures serve every structure knob (Tide Pool / Dock below) *and*
     # the Boathouse's energy-regen speed-up, which must be known before the energy
     # settle so the out-of-energy gate + "ready in" wait already reflect it. A built
     # Boathouse shortens the regen interval; unbuilt (level 0) ⇒ ×1.0 ⇒ exactly
     # REGEN_SECONDS ⇒ byte-identical energy.
-    built = await db.get_structures(user_id, guild_id)
+    built = player.structures
     regen_seconds = fish_energy.regen_seconds_for(
         structures_mod.boathouse_regen_mult(built.get(structures_mod.BOATHOUSE, 0)),
     )
-    cur, ts = await db.get_fishing_energy(user_id, guild_id)
-    state = fish_energy.EnergyState(cur, ts)
+    state = fish_energy.EnergyState(player.energy, player.energy_updated_at)
     settled = fish_energy.settle(state, now, regen_seconds=regen_seconds)
     if settled.current < fish_energy.CAST_COST:
         wait = fish_energy.seconds_until(
@@ -418,26 +433,22 @@ async def begin_cast(user_id: int, guild_id: int) -> CastStart:
             energy_current=settled.current,
         )
 
-    rod = rods_mod.rod_for_tier(await db.get_rod_tier(user_id, guild_id))
-    venue = await db.get_fishing_venue(user_id, guild_id)
-    profile = venue_mod.profile_for(venue)
+    rod = rods_mod.rod_for_tier(player.rod_tier)
+    profile = venue_mod.profile_for(player.venue)
     weather = weather_mod.current_weather()
-    bait, bait_charges = await get_active_bait(user_id, guild_id)
+    bait, bait_charges = _resolve_bait(player.bait_key, player.bait_charges)
     # The 4th "how-well" knob: equipped fishing gear (Q-0175 / V-14). Read the
     # character's gear+skill stats and fold fishing_power → rarity pull and
     # bite_luck → bite speed. No fishing gear ⇒ both multipliers are 1.0 ⇒ the
     # cast is byte-identical to the pre-gear behaviour (additive safety property).
-    gear_stats = character.character_stats(
-        await db.get_equipment(str(user_id), guild_id),
-        await db.get_skills(user_id, guild_id),
-    )
+    gear_stats = character.character_stats(player.equipment, player.skills)
     gear_pull = fishing_gear.fishing_pull_mult(gear_stats)
     gear_bite_speed = fishing_gear.fishing_bite_speed_mult(gear_stats)
     # The structure knobs: the built **Tide Pool** (rarity-pull, coral's functional
     # sink) and its sibling the **Dock** (bite-speed). Both default to their neutral
     # multiplier when unbuilt (level 0) ⇒ ×1.0 ⇒ byte-identical, exactly like the
-    # gear knob's additive-safety property. ``built`` was read once above (it also
-    # feeds the Boathouse regen speed-up).
+    # gear knob's additive-safety property. ``built`` came with the state read
+    # above (it also feeds the Boathouse regen speed-up).
     tide_pool_level = built.get(structures_mod.TIDE_POOL, 0)
     tide_pool_pull = structures_mod.tide_pool_pull_mult(tide_pool_level)
     dock_level = built.get(structures_mod.DOCK, 0)
@@ -476,6 +487,7 @@ async def begin_cast(user_id: int, guild_id: int) -> CastStart:
         rarity_pull=effective_pull,
         venue=profile.key,
         double_catch_chance=double_catch_chance,
+        fishing_xp=player.game_xp.get(game_xp_service.GAME_FISHING, 0),
     )
     if cast.catch is None:
         return CastStart(
@@ -521,7 +533,8 @@ async def begin_cast(user_id: int, guild_id: int) -> CastStart:
 def get_forecast() -> weather_mod.Weather:
     """Today's fishing weather (UTC date) — for the menu / ``!forecast`` command.
 
-    Pure read of the date-seeded weather; the same for everyone on a given day.
+    Pure read of the date-seeded weather; the same for everyone on a given day,
+    so :mod:`utils.fishing.weather` memoises it per date.
     """
     return weather_mod.current_weather()
 
@@ -473,13 +473,21 @@ def _extensions_subsystem() -> SubsystemHealth:
         )
         for o in failed[:MAX_SUBSYSTEM_FINDINGS]
     )
+    facts: dict[str, Any] = {
+        "loaded": len(outcomes) - len(failed),
+        "failed": len(failed),
+    }
+    slowest = so.slowest_extensions(1)
+    if slowest:
+        facts["slowest"] = slowest[0].name
+        facts["slowest_ms"] = round(slowest[0].duration_ms or 0.0)
     return SubsystemHealth(
         name="extensions",
         status=status,
         summary=f"{len(outcomes) - len(failed)} of {len(outcomes)} extensions loaded",
         generated_at=_now(),
         findings=findings,
-        facts={"loaded": len(outcomes) - len(failed), "failed": len(failed)},
+        facts=facts,
         source="startup_outcome",
         required=True,
     )
@@ -0,0 +1,211 @@
+"""Verdict-score cache for image moderation — reposts resolve without a re-scan.
+
+Reposted memes, raid images and re-uploads used to be sent to the classifier
+again every time.  This module remembers the **category scores** (not the
+verdict — thresholds are per guild, scores are not) for recently classified
+images, keyed two ways:
+
+* an exact content digest (blake2b of the downloaded bytes) — a byte-identical
+  re-upload gets a fresh Discord URL and attachment id, but the same digest;
+* a perceptual dHash (Pillow) — a re-encoded, resized or lightly recompressed
+  copy lands within :data:`_NEAR_MATCH_BITS` Hamming distance of the original.
+
+Pure and process-local: no Discord I/O, no network.  The caller downloads the
+bytes and runs :func:`fingerprint` off the event loop (Pillow decoding is
+CPU-bound).  Bounded LRU (:data:`_CACHE_MAX`); a restart simply starts cold.
+
+Public surface:
+
+    ImageFingerprint           — (digest, dhash) for one image
+    fingerprint(data)          -> ImageFingerprint
+    lookup(fp)                 -> scores | None   (counts a hit or a miss)
+    store(fp, scores)
+    cache_stats()              -> VerdictCacheStats
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from services import metrics as _metrics
+
+logger = logging.getLogger("bot.services.image_moderation_cache")
+
+_CACHE_MAX = 2048
+# dHash grid: (W+1) x W greyscale thumbnail → W*W = 64 gradient bits.
+_DHASH_WIDTH = 8
+# Two images whose dHashes differ in at most this many bits are treated as the
+# same picture.  4/64 is the conventional "near-identical" tolerance for dHash.
+_NEAR_MATCH_BITS = 4
+# A flat or near-flat image (solid colour, a mostly-black frame) hashes to
+# (almost) all-zero or all-one bits, so unrelated images would collide.  Such
+# hashes carry too little detail to share a verdict and only match exactly.
+_MIN_DHASH_DETAIL = 8
+
+
+@dataclass(frozen=True)
+class ImageFingerprint:
+    """Cache keys for one image: exact ``digest`` + perceptual ``dhash``.
+
+    ``dhash`` is None when Pillow cannot decode the bytes (the digest still
+    catches byte-identical reposts).
+    """
+
+    digest: bytes
+    dhash: int | None
+
+    @property
+    def perceptual(self) -> bool:
+        """Whether ``dhash`` has enough detail to match near-identical images."""
+        if self.dhash is None:
+            return False
+        bits = self.dhash.bit_count()
+        total = _DHASH_WIDTH * _DHASH_WIDTH
+        return _MIN_DHASH_DETAIL <= bits <= total - _MIN_DHASH_DETAIL
+
+
+@dataclass(frozen=True)
+class VerdictCacheStats:
+    """Verdict-cache counters (hit rate is over every lookup since start)."""
+
+    exact_hits: int
+    perceptual_hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.exact_hits + self.perceptual_hits + self.misses
+        if not lookups:
+            return 0.0
+        return (self.exact_hits + self.perceptual_hits) / lookups
+
+
+_CACHE: OrderedDict[bytes, tuple[int | None, dict[str, float]]] = OrderedDict()
+_exact_hits = 0
+_perceptual_hits = 0
+_misses = 0
+
+
+def dhash(data: bytes) -> int | None:
+    """Return the 64-bit difference hash of an encoded image, or None.
+
+    Each bit records whether a pixel of the (9x8 greyscale) thumbnail is
+    brighter than its right-hand neighbour, so the hash survives re-encoding,
+    resizing and mild recompression.  Animated images hash their first frame.
+    """
+    try:
+        from PIL import Image
+    except ImportError:  # pragma: no cover - Pillow is a hard requirement
+        return None
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            thumb = image.convert("L").resize(
+                (_DHASH_WIDTH + 1, _DHASH_WIDTH),
+                Image.Resampling.LANCZOS,
+            )
+            pixels = thumb.tobytes()
+    except Exception:  # noqa: BLE001 — undecodable/corrupt upload: exact-only
+        logger.debug("image_moderation_cache: could not decode image for dHash")
+        return None
+    value = 0
+    row_len = _DHASH_WIDTH + 1
+    for row in range(_DHASH_WIDTH):
+        offset = row * row_len
+        for col in range(_DHASH_WIDTH):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def fingerprint(data: bytes) -> ImageFingerprint:
+    """Compute both cache keys for ``data`` (CPU-bound — run off the loop)."""
+    return ImageFingerprint(
+        digest=hashlib.blake2b(data, digest_size=16).digest(),
+        dhash=dhash(data),
+    )
+
+
+def lookup(fp: ImageFingerprint) -> dict[str, float] | None:
+    """Return cached scores for ``fp`` (exact first, then perceptual), or None.
+
+    Counts the lookup as an exact hit, a perceptual hit or a miss — both in
+    :func:`cache_stats` and in the ``image_moderation_cache_total`` metric.
+    """
+    global _exact_hits, _perceptual_hits, _misses
+    entry = _CACHE.get(fp.digest)
+    if entry is not None:
+        _CACHE.move_to_end(fp.digest)
+        _exact_hits += 1
+        _metrics.image_moderation_cache_total.labels(result="exact_hit").inc()
+        return dict(entry[1])
+    if fp.perceptual:
+        match = _nearest(fp.dhash)
+        if match is not None:
+            _CACHE.move_to_end(match)
+            _perceptual_hits += 1
+            _metrics.image_moderation_cache_total.labels(
+                result="perceptual_hit",
+            ).inc()
+            return dict(_CACHE[match][1])
+    _misses += 1
+    _metrics.image_moderation_cache_total.labels(result="miss").inc()
+    return None
+
+
+def _nearest(target: int | None) -> bytes | None:
+    """Digest of the most recent entry within :data:`_NEAR_MATCH_BITS` of ``target``.
+
+    A linear scan of at most :data:`_CACHE_MAX` XOR + popcounts — well under a
+    millisecond, and only paid on an exact miss.
+    """
+    if target is None:
+        return None
+    for digest in reversed(_CACHE):
+        other = _CACHE[digest][0]
+        if other is not None and (other ^ target).bit_count() <= _NEAR_MATCH_BITS:
+            return digest
+    return None
+
+
+def store(fp: ImageFingerprint, scores: Mapping[str, float]) -> None:
+    """Remember ``scores`` for ``fp``; evicts the least recently used entry."""
+    _CACHE[fp.digest] = (fp.dhash if fp.perceptual else None, dict(scores))
+    _CACHE.move_to_end(fp.digest)
+    if len(_CACHE) > _CACHE_MAX:
+        _CACHE.popitem(last=False)
+
+
+def cache_stats() -> VerdictCacheStats:
+    """Hit / miss counters and current size of the verdict cache."""
+    return VerdictCacheStats(
+        exact_hits=_exact_hits,
+        perceptual_hits=_perceptual_hits,
+        misses=_misses,
+        size=len(_CACHE),
+        max_size=_CACHE_MAX,
+    )
+
+
+def _reset_for_tests() -> None:
+    global _exact_hits, _perceptual_hits, _misses
+    _CACHE.clear()
+    _exact_hits = 0
+    _perceptual_hits = 0
+    _misses = 0
+
+
+__all__ = [
+    "ImageFingerprint",
+    "VerdictCacheStats",
+    "cache_stats",
+    "dhash",
+    "fingerprint",
+    "lookup",
+    "store",
+]
@@ -22,8 +22,10 @@ The exempt-list parsing reuses :func:`services.automod_config.parse_id_csv`
 (the same tolerant CSV-of-ids safety valve both reactive features share).
 
 Cycle discipline (mirrors :mod:`services.automod_config`): the only
-cross-package import (``settings_resolution``) is function-local; top-level
-imports are stdlib + the sibling ``automod_config`` parser only.
+cross-package imports are ``settings_resolution`` and the sibling
+``automod_config`` parser. The :func:`memoised_policy` decorator is imported at
+top level (``settings_resolution`` is stdlib-only at import time); the
+resolvers stay function-local.
 """
 
 from __future__ import annotations
@@ -31,6 +33,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from services.automod_config import parse_id_csv
+from services.settings_resolution import memoised_policy
 
 SUBSYSTEM = "image_moderation"
 
@@ -100,6 +103,7 @@ class ImageModerationPolicy:
         return bool(self.exempt_role_ids & frozenset(role_ids))
 
 
+@memoised_policy(SUBSYSTEM)
 async def load_policy(guild_id: int) -> ImageModerationPolicy:
     """Load the effective :class:`ImageModerationPolicy` for ``guild_id``.
 
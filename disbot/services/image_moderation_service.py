@@ -12,6 +12,7 @@ Public surface:
 
     ImageModerationVerdict          — (category, score, reason) for a flagged image
     CATEGORY_BUCKETS                — owner-named bucket → raw OpenAI category keys
+    image_attachments(message)      — the scannable image attachments
     image_attachment_urls(message)  — the scannable image attachment URLs
     bucket_score(scores, bucket)    — the worst raw score in a bucket
     evaluate_scores(scores, policy) -> ImageModerationVerdict | None
@@ -81,20 +82,25 @@ def _is_image_attachment(attachment: Any) -> bool:
     return any(lowered.endswith(ext) for ext in _IMAGE_EXTENSIONS)
 
 
-def image_attachment_urls(message: Any) -> list[str]:
-    """Return the URLs of every image attachment on ``message`` (order-preserving).
+def image_attachments(message: Any) -> list[Any]:
+    """Return every image attachment on ``message`` that has a URL (in order).
 
     Non-image attachments (text files, archives, …) are skipped, so a guild that
     enables image moderation pays the per-image API cost only on actual images.
     """
-    urls: list[str] = []
+    found: list[Any] = []
     for attachment in getattr(message, "attachments", None) or []:
         if not _is_image_attachment(attachment):
             continue
         url = getattr(attachment, "url", None)
         if isinstance(url, str) and url:
-            urls.append(url)
-    return urls
+            found.append(attachment)
+    return found
+
+
+def image_attachment_urls(message: Any) -> list[str]:
+    """Return the URLs of every image attachment on ``message`` (order-preserving)."""
+    return [attachment.url for attachment in image_attachments(message)]
 
 
 def bucket_score(scores: Mapping[str, float], bucket: str) -> float:
@@ -147,4 +153,5 @@ __all__ = [
     "bucket_score",
     "evaluate_scores",
     "image_attachment_urls",
+    "image_attachments",
 ]
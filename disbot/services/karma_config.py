@@ -16,14 +16,17 @@ table); the keys live in :mod:`utils.settings_keys.karma` and are
 operator-editable through the existing ``!settings`` widget.
 
 Cycle discipline (mirrors :mod:`services.automod_config`): the only
-cross-package import (``settings_resolution``) is function-local; top-level
-imports are stdlib only.
+cross-package import is ``settings_resolution``. Its :func:`memoised_policy`
+decorator is imported at top level (that module is stdlib-only at import time);
+the resolvers stay function-local.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 
+from services.settings_resolution import memoised_policy
+
 SUBSYSTEM = "karma"
 
 # ---------------------------------------------------------------------------
@@ -70,6 +73,7 @@ class KarmaPolicy:
     reaction_emoji: str = DEFAULT_REACTION_EMOJI
 
 
+@memoised_policy(SUBSYSTEM)
 async def load_policy(guild_id: int) -> KarmaPolicy:
     """Load the effective :class:`KarmaPolicy` for ``guild_id``.
 
@@ -412,6 +412,35 @@ scope_locks_idle_swept_total = Counter(
     "cogs are missing explicit forget() calls on edge teardown paths.",
 )
 
+# ---------------------------------------------------------------------------
+# Automod window trackers (services/automod_service.py)
+# ---------------------------------------------------------------------------
+
+automod_tracker_keys = Gauge(
+    "automod_tracker_keys",
+    "Keys currently held by an automod sliding-window tracker (spam | "
+    "duplicate), after LRU eviction and the idle sweep.",
+    ["tracker"],
+)
+
+# ---------------------------------------------------------------------------
+# Image moderation (cogs/image_moderation/listener.py +
+# services/image_moderation_cache.py)
+# ---------------------------------------------------------------------------
+
+image_moderation_cache_total = Counter(
+    "image_moderation_cache_total",
+    "Verdict-cache lookups for image moderation, by result "
+    "(exact_hit | perceptual_hit | miss).",
+    ["result"],
+)
+
+image_moderation_classify_seconds = Histogram(
+    "image_moderation_classify_seconds",
+    "Latency of one image classification call (cache misses only).",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
 # ---------------------------------------------------------------------------
 # Latency histograms — Phase S3.1 / O-2
 # Three slot-bucketed histograms for the three hot-path timing surfaces:
@@ -434,6 +463,22 @@ db_query_seconds = Histogram(
     buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
 )
 
+db_pool_acquire_seconds = Histogram(
+    "db_pool_acquire_seconds",
+    "Time a query waited for a connection from its pool lane "
+    "(primary / hot / replica — see utils.db.pool).",
+    ["lane"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+
+db_pool_saturation = Histogram(
+    "db_pool_saturation",
+    "Share of a lane's max_size in use, sampled as each query acquires "
+    "(1.0 = every connection busy; sustained values near 1 mean waits).",
+    ["lane"],
+    buckets=(0.1, 0.25, 0.5, 0.75, 0.9, 1.0),
+)
+
 interaction_handler_seconds = Histogram(
     "interaction_handler_seconds",
     "Interaction callback total time, labelled by the custom_id prefix "
@@ -451,6 +496,13 @@ message_pipeline_stage_seconds = Histogram(
     buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
 )
 
+message_pipeline_shed_total = Counter(
+    "message_pipeline_shed_total",
+    "Messages an optional message-pipeline stage skipped because its "
+    "channel/guild message rate was over the stage's LoadPolicy threshold.",
+    ["stage"],
+)
+
 # ---------------------------------------------------------------------------
 # Process memory RSS — Phase S3.3 / O-4
 # Sampled every PROCESS_MEMORY_SAMPLE_INTERVAL seconds by a supervised
@@ -488,6 +540,51 @@ ai_request_total = Counter(
     ["task", "outcome"],
 )
 
+# Provider-reported token usage per gateway attempt.  ``kind`` values:
+# input_uncached | input_cached | output.  ``input_cached`` is prompt input
+# served from the provider's prompt cache (the stable instruction-stack
+# prefix); its share of all input tokens per task is the caching saving.
+ai_tokens_total = Counter(
+    "ai_tokens_total",
+    "AI provider tokens by task, provider and kind (cached vs uncached input, output).",
+    ["task", "provider", "kind"],
+)
+
+# Spend-budget breaches seen by the gateway (core/runtime/ai/budget.py).
+# ``scope`` values: guild | task.  ``level`` values: soft (rerouted to the
+# provider's economy model) | hard (degraded with no provider call).
+ai_budget_total = Counter(
+    "ai_budget_total",
+    "AI requests that hit a spend budget, by scope and level.",
+    ["scope", "level"],
+)
+
+# Memo of the instruction stack's stable profile layers
+# (services/ai_instruction_service.py).  ``outcome`` values: hit | miss.
+ai_instruction_layer_cache_total = Counter(
+    "ai_instruction_layer_cache_total",
+    "Instruction-stack profile-layer memo lookups by outcome.",
+    ["outcome"],
+)
+
+# Per-tool handler latency inside the gateway's tool dispatch. One
+# observation per handler run (memo hits never run a handler and are only
+# counted).  ``outcome`` values: success | error | timeout | memo.  A tool
+# whose p95 climbs toward the gateway's per-call ceiling is the one holding
+# up multi-tool turns.
+ai_tool_call_seconds = Histogram(
+    "ai_tool_call_seconds",
+    "Duration of one AI tool handler call dispatched by the gateway.",
+    ["task", "tool"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 10.0),
+)
+
+ai_tool_call_total = Counter(
+    "ai_tool_call_total",
+    "AI tool calls by tool and outcome (memo = served from the per-conversation memo).",
+    ["tool", "outcome"],
+)
+
 # ---------------------------------------------------------------------------
 # Media / YouTube provider requests — services/youtube_fetch_service.py
 # Every metadata fetch lands one observation, categorised into the bounded
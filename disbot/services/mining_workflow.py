@@ -803,20 +803,18 @@ def _pack_warning_after(inventory: dict[str, int], granted: str | None) -> str |
 async def mine(user_id: int, guild_id: int) -> MineResult:
     """One mining swing: roll loot, grant it, and tick wear — atomically."""
     suid = str(user_id)
-    inventory = await db.get_mining_inventory(suid, guild_id)
-    equipped = await db.get_equipment(suid, guild_id)
-    depth = await db.get_depth(suid, guild_id)
+    state = await db.load_mining_player_state(user_id, guild_id)
+    inventory, equipped, depth = state.inventory, state.equipment, state.depth
     found, amount = rewards.roll_mine_loot(
         has_pickaxe=inventory.get("pickaxe", 0) > 0,
         depth=depth,
         multiplier=rewards.mine_multiplier(equipped, inventory),
     )
     candidates = _wear_candidates(workshop.ACTION_MINE, depth, equipped)
-    wear = await db.get_gear_wear(suid, guild_id) if candidates else {}
     async with db.transaction() as conn:
         await db.update_mining_item(suid, guild_id, found, amount, conn=conn)
         report = (
-            await _apply_wear_writes(conn, suid, guild_id, candidates, wear)
+            await _apply_wear_writes(conn, suid, guild_id, candidates, state.wear)
             if candidates
             else WearReport()
         )
@@ -866,21 +864,19 @@ async def harvest(user_id: int, guild_id: int) -> HarvestResult:
 async def explore(user_id: int, guild_id: int) -> ExploreActionResult:
     """One exploration roll: outcome + loot grant + wear — atomically."""
     suid = str(user_id)
-    inventory = await db.get_mining_inventory(suid, guild_id)
-    equipped = await db.get_equipment(suid, guild_id)
-    depth = await db.get_depth(suid, guild_id)
+    state = await db.load_mining_player_state(user_id, guild_id)
+    inventory, equipped, depth = state.inventory, state.equipment, state.depth
     text, item, amount = explore_from_state(
         equipped,
         inventory,
         biome=world.biome_for_depth(depth),
     )
     candidates = _wear_candidates(workshop.ACTION_EXPLORE, depth, equipped)
-    wear = await db.get_gear_wear(suid, guild_id) if candidates else {}
     async with db.transaction() as conn:
         if item:
             await db.update_mining_item(suid, guild_id, item, amount, conn=conn)
         report = (
-            await _apply_wear_writes(conn, suid, guild_id, candidates, wear)
+            await _apply_wear_writes(conn, suid, guild_id, candidates, state.wear)
             if candidates
             else WearReport()
         )
@@ -1154,12 +1150,11 @@ async def delete_loadout(user_id: int, guild_id: int, name: str) -> TradeResult:
 async def descend(user_id: int, guild_id: int) -> DescentResult:
     """Move one band deeper if the equipped light allows it."""
     suid = str(user_id)
-    depth = await db.get_depth(suid, guild_id)
+    state = await db.load_mining_player_state(user_id, guild_id)
+    depth = state.depth
     # Gear + allocated skill points (§7.4).  An unspent player reads {} ⇒
     # byte-identical to the old gear-only stats (the additive safety property).
-    equipped = await db.get_equipment(suid, guild_id)
-    alloc = await db.get_skills(user_id, guild_id)
-    stats = character.character_stats(equipped, alloc)
+    stats = character.character_stats(state.equipment, state.skills)
     new_depth = world.descend(depth, stats)
     if new_depth == depth:
         return DescentResult(moved=False, depth=depth, hint=world.descend_hint(stats))
@@ -1266,62 +1261,72 @@ async def dig(user_id: int, guild_id: int, direction: str) -> DigResult:
     fog-of-war mark, and the wear tick all commit in ONE transaction; a down-dig
     that reaches a new deepest band also awards the depth-record XP (the
     :func:`descend` precedent).  A blocked vertical dig returns ``moved=False`` with
-    a hint and no loot.
+    a hint and no loot.  Everything the dig decides from is read in one locked
+    query (:func:`utils.db.load_mining_player_state`) at the top of that
+    transaction; the load first creates a missing state row, so the lock holds
+    even on a player's first dig.
     """
     suid = str(user_id)
     direction = direction.strip().lower()
-    x, y = await db.get_position(suid, guild_id)
-    depth = await db.get_depth(suid, guild_id)
-
-    # Energy is the frequency brake (owner's choice over a cooldown, 2026-06-22):
-    # no energy → can't dig (no move, no loot, no energy spent) until it refills
-    # over time or you eat a ration / energy drink.
-    now = int(time.time())
-    e_state = energy.EnergyState(*await db.get_energy(suid, guild_id))
-    if not energy.can_dig(e_state, now):
-        wait = energy.seconds_until(e_state, now, energy.DIG_COST)
-        return DigResult(
-            moved=False,
-            x=x,
-            y=y,
-            depth=depth,
-            found=None,
-            amount=0,
-            wear=WearReport(),
-            hint=(
-                "⚡ You're out of energy — rest a moment "
-                f"(~{wait}s until your next dig) or eat a **ration** / "
-                "**energy drink** (`!use ration`)."
-            ),
+    awards: list[game_xp_service.GameXpAward] = []
+    async with db.transaction() as conn:
+        # ONE read for everything below, locking the player's state row (created
+        # first if this is their first dig) so the energy check and the
+        # spend/move written from it cannot interleave with a second dig from a
+        # double-clicked button.  Blocked digs return from inside the
+        # transaction having written no game state.
+        state = await db.load_mining_player_state(
+            user_id,
+            guild_id,
+            for_update=True,
+            conn=conn,
         )
+        x, y, depth = state.x, state.y, state.depth
 
-    equipped = await db.get_equipment(suid, guild_id)
-    # Gear + allocated skill points gate Down (byte-identical to gear-only when
-    # nothing is allocated — the additive safety property, as in descend()).
-    alloc = await db.get_skills(user_id, guild_id)
-    stats = character.character_stats(equipped, alloc)
+        # Energy is the frequency brake (owner's choice over a cooldown,
+        # 2026-06-22): no energy → can't dig (no move, no loot, no energy spent)
+        # until it refills over time or you eat a ration / energy drink.
+        now = int(time.time())
+        e_state = energy.EnergyState(state.energy, state.energy_updated_at)
+        if not energy.can_dig(e_state, now):
+            wait = energy.seconds_until(e_state, now, energy.DIG_COST)
+            return DigResult(
+                moved=False,
+                x=x,
+                y=y,
+                depth=depth,
+                found=None,
+                amount=0,
+                wear=WearReport(),
+                hint=(
+                    "⚡ You're out of energy — rest a moment "
+                    f"(~{wait}s until your next dig) or eat a **ration** / "
+                    "**energy drink** (`!use ration`)."
+                ),
+            )
 
-    target = _resolve_dig_target(direction, x, y, depth, stats)
-    if isinstance(target, DigResult):
-        return target  # blocked / unknown — no move, no loot
-    nx, ny, nz = target
+        equipped, inventory = state.equipment, state.inventory
+        # Gear + allocated skill points gate Down (byte-identical to gear-only
+        # when nothing is allocated — the additive safety property, as in
+        # descend()).
+        stats = character.character_stats(equipped, state.skills)
 
-    inventory = await db.get_mining_inventory(suid, guild_id)
-    seed = await db.get_world_seed(guild_id)
-    cell = grid.cell_at(seed, nx, ny, nz)
-    found, amount = rewards.roll_mine_loot(
-        has_pickaxe=inventory.get("pickaxe", 0) > 0,
-        depth=nz,
-        multiplier=rewards.mine_multiplier(equipped, inventory),
-    )
-    found, amount, cell_note = grid.apply_cell_to_loot(cell, found, amount)
-    candidates = _wear_candidates(workshop.ACTION_MINE, nz, equipped)
-    wear = await db.get_gear_wear(suid, guild_id) if candidates else {}
+        target = _resolve_dig_target(direction, x, y, depth, stats)
+        if isinstance(target, DigResult):
+            return target  # blocked / unknown — no move, no loot
+        nx, ny, nz = target
 
-    awards: list[game_xp_service.GameXpAward] = []
-    descended = direction == grid.DOWN
-    spent = energy.spend(e_state, now)
-    async with db.transaction() as conn:
+        cell = grid.cell_at(state.seed, nx, ny, nz)
+        found, amount = rewards.roll_mine_loot(
+            has_pickaxe=inventory.get("pickaxe", 0) > 0,
+            depth=nz,
+            multiplier=rewards.mine_multiplier(equipped, inventory),
+        )
+        found, amount, cell_note = grid.apply_cell_to_loot(cell, found, amount)
+        candidates = _wear_candidates(workshop.ACTION_MINE, nz, equipped)
+
+        descended = direction == grid.DOWN
+        spent = energy.spend(e_state, now)
         await db.set_energy(suid, guild_id, spent.current, spent.updated_at, conn=conn)
         if direction in grid.LATERAL:
             await db.set_position(suid, guild_id, nx, ny, conn=conn)
@@ -1330,7 +1335,7 @@ async def dig(user_id: int, guild_id: int, direction: str) -> DigResult:
         await db.update_mining_item(suid, guild_id, found, amount, conn=conn)
         await db.mark_discovered(suid, guild_id, nz, nx, ny, conn=conn)
         report = (
-            await _apply_wear_writes(conn, suid, guild_id, candidates, wear)
+            await _apply_wear_writes(conn, suid, guild_id, candidates, state.wear)
             if candidates
             else WearReport()
         )
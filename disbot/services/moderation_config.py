@@ -23,14 +23,17 @@ legacy KV table); there is **no new migration** — the keys live in
 existing ``!settings`` widget dispatcher.
 
 Cycle discipline (mirrors :mod:`services.settings_resolution`): the only
-cross-package import (``settings_resolution``) is function-local; top-level
-imports are stdlib only.
+cross-package import is ``settings_resolution``. Its :func:`memoised_policy`
+decorator is imported at top level (that module is stdlib-only at import time);
+the resolvers stay function-local.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 
+from services.settings_resolution import memoised_policy
+
 SUBSYSTEM = "moderation"
 
 # ---------------------------------------------------------------------------
@@ -277,6 +280,7 @@ def public_log_includes(action: str, policy: ModerationPolicy) -> bool:
     return action in _PUBLIC_LOG_ACTION_SETS.get(policy.public_log_actions, frozenset())
 
 
+@memoised_policy(SUBSYSTEM)
 async def load_policy(guild_id: int) -> ModerationPolicy:
     """Load the effective :class:`ModerationPolicy` for ``guild_id``.
 
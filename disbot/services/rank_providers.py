@@ -116,6 +116,7 @@ class XpProvider(RankProvider):
             "SELECT user_id, xp, level FROM xp WHERE guild_id=$1 "
             "ORDER BY xp DESC LIMIT 10",
             (guild.id,),
+            read_only=True,
         )
         entries: list[RankEntry] = []
         for row in rows:
@@ -138,6 +139,7 @@ class XpProvider(RankProvider):
         all_xp = await db.fetchall(
             "SELECT user_id, xp, level FROM xp WHERE guild_id=$1 ORDER BY xp DESC",
             (guild.id,),
+            read_only=True,
         )
         for i, row in enumerate(all_xp):
             if row["user_id"] == user_id:
@@ -159,6 +161,7 @@ class CoinsProvider(RankProvider):
             "SELECT user_id, coins FROM xp WHERE guild_id=$1 "
             "ORDER BY coins DESC LIMIT 10",
             (guild.id,),
+            read_only=True,
         )
         entries: list[RankEntry] = []
         for row in rows:
@@ -181,6 +184,7 @@ class CoinsProvider(RankProvider):
         all_coins = await db.fetchall(
             "SELECT user_id, coins FROM xp WHERE guild_id=$1 ORDER BY coins DESC",
             (guild.id,),
+            read_only=True,
         )
         for i, row in enumerate(all_coins):
             if row["user_id"] == user_id:
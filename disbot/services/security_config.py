@@ -18,14 +18,18 @@ This module owns:
 
 Settings are scalar guild settings (the legacy KV table) — **no migration** —
 declared in :mod:`utils.settings_keys.security`. Cycle discipline (mirrors
-:mod:`services.welcome_config`): the only cross-package import
-(``settings_resolution``) is function-local; top-level imports are stdlib only.
+:mod:`services.welcome_config`): the only cross-package import is
+``settings_resolution``. Its :func:`memoised_policy` decorator is imported at
+top level (that module is stdlib-only at import time); the resolvers stay
+function-local.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 
+from services.settings_resolution import memoised_policy
+
 SUBSYSTEM = "security"
 
 # ---------------------------------------------------------------------------
@@ -155,6 +159,7 @@ def _coerce_int(raw: object, default: int) -> int:
         return default
 
 
+@memoised_policy(SUBSYSTEM)
 async def load_policy(guild_id: int) -> SecurityPolicy:
     """Load the effective :class:`SecurityPolicy` for ``guild_id``.
 
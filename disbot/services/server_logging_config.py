@@ -26,14 +26,17 @@ existing ``logging.enabled`` flag (the same one
 runs moderation-action logging keeps one master switch for everything.
 
 Cycle discipline (mirrors :mod:`services.automod_config`): the only
-cross-package import (``settings_resolution``) is function-local; top-level
-imports are stdlib only.
+cross-package import is ``settings_resolution``. Its :func:`memoised_policy`
+decorator is imported at top level (that module is stdlib-only at import time);
+the resolvers stay function-local.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from services.settings_resolution import memoised_policy
+
 SUBSYSTEM = "logging"
 
 # ---------------------------------------------------------------------------
@@ -182,6 +185,7 @@ class EventLoggingPolicy:
         return user_id is not None and user_id in self.ignored_user_ids
 
 
+@memoised_policy(SUBSYSTEM)
 async def load_policy(guild_id: int) -> EventLoggingPolicy:
     """Load the effective :class:`EventLoggingPolicy` for ``guild_id``.
 
@@ -9,8 +9,9 @@ Sources composed (all read-only):
 * :func:`core.runtime.subsystem_schema.get_schema` — the authoritative
   :class:`SettingSpec` (carries ``value_type``, ``default``,
   ``validator``).
-* :func:`core.runtime.guild_config.get` — per-key TTL cache.
-* :func:`utils.db.settings.get_setting` — the legacy KV table.
+* :func:`utils.guild_config_accessors.get_settings_snapshot` — one
+  TTL-cached snapshot of a guild's legacy KV rows plus the global rows.
+* :func:`utils.db.settings.get_settings_for_guilds` — the legacy KV table.
 
 Scope (per the v1 amendment):
 
@@ -29,6 +30,8 @@ Public surface:
 * :class:`SettingResolution` — frozen result type.
 * :func:`resolve_setting` — single-key resolution.
 * :func:`resolve_batch` — every scalar in a subsystem's schema.
+* :func:`memoised_policy` — decorator memoising a typed policy loader on
+  the guild's settings-snapshot version.
 * :func:`counters_snapshot` — provenance / validity counters used by
   the diagnostics provider (mirrors
   :func:`core.runtime.config_arbitration.counters_snapshot`).
@@ -42,12 +45,16 @@ are function-local. Top-level imports are stdlib only.
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from typing import Any, Literal
+from typing import Any, Literal, TypeVar
 
 logger = logging.getLogger("bot.services.settings_resolution")
 
+T = TypeVar("T")
+
 
 # ---------------------------------------------------------------------------
 # Public types
@@ -218,19 +225,18 @@ def _all_specs(subsystem: str) -> tuple[Any, ...]:
 # ---------------------------------------------------------------------------
 
 
-async def _read_legacy(guild_id: int, settings_key: str) -> str:
-    """Read a legacy KV row via the typed-accessor lane.
+async def _read_snapshot(guild_id: int) -> Any:
+    """Return the guild's :class:`GuildSettingsSnapshot` (typed-accessor lane).
 
-    Routes through :func:`utils.guild_config_accessors.get_setting_value`
+    Routes through :func:`utils.guild_config_accessors.get_settings_snapshot`
     so the F-1 invariant test (``test_guild_config_typed_accessors``)
-    sees a single typed-accessor owner for the ``"setting:"`` cache
-    namespace. A ``guild_id`` of :data:`GLOBAL_GUILD_ID` reads the global
-    row through the same cached accessor (its own ``"setting:"`` cache
-    key, distinct from any guild's).
+    sees a single typed-accessor owner.  One snapshot carries both the
+    per-guild and the global rows, so a resolve — including an unset key
+    that falls through to the global tier — never issues a point query.
     """
-    from utils.guild_config_accessors import get_setting_value
+    from utils.guild_config_accessors import get_settings_snapshot
 
-    return await get_setting_value(guild_id, settings_key)
+    return await get_settings_snapshot(guild_id)
 
 
 # ---------------------------------------------------------------------------
@@ -360,7 +366,8 @@ async def resolve_setting(
         _bump_counters(resolution)
         return resolution
 
-    raw = await _read_legacy(guild_id, spec.settings_key)
+    snapshot = await _read_snapshot(guild_id)
+    raw = snapshot.value(spec.settings_key)
     if raw != "":
         resolution = _resolution_from_raw(subsystem, name, spec, raw, "legacy_kv")
         _bump_counters(resolution)
@@ -370,7 +377,7 @@ async def resolve_setting(
     # Skipped for ``include_global=False`` and for a resolve that is itself
     # already scoped at the global sentinel (no self-inheritance).
     if include_global and guild_id != GLOBAL_GUILD_ID:
-        global_raw = await _read_legacy(GLOBAL_GUILD_ID, spec.settings_key)
+        global_raw = snapshot.global_value(spec.settings_key)
         if global_raw != "":
             resolution = _resolution_from_raw(
                 subsystem,
@@ -444,6 +451,60 @@ async def resolve_value(
     return resolution.value
 
 
+# ---------------------------------------------------------------------------
+# Policy memo
+# ---------------------------------------------------------------------------
+
+# (guild_id, subsystem) -> (snapshot version, policy).  A policy is a pure
+# function of the guild's settings rows (plus the frozen schema), so it is
+# reused until the snapshot it was built from is reloaded — by TTL or by
+# ``invalidate_setting_value`` on any write.
+_POLICY_MEMO: dict[tuple[int, str], tuple[int, Any]] = {}
+
+
+def memoised_policy(
+    subsystem: str,
+) -> Callable[[Callable[[int], Awaitable[T]]], Callable[[int], Awaitable[T]]]:
+    """Memoise a subsystem's ``load_policy(guild_id)`` on the settings snapshot.
+
+    Decorate the builder with ``@memoised_policy(SUBSYSTEM)``; it then runs
+    only when the guild's snapshot has been reloaded (a settings write or
+    the TTL) since the memoised policy was built.  The builder must derive
+    the policy from :func:`resolve_value` / :func:`resolve_setting` reads
+    only; anything else it reads would not invalidate the memo.  The
+    version is read before building, so a snapshot reloaded mid-build only
+    costs one extra rebuild.
+    """
+
+    def decorate(
+        build: Callable[[int], Awaitable[T]],
+    ) -> Callable[[int], Awaitable[T]]:
+        @functools.wraps(build)
+        async def load(guild_id: int) -> T:
+            version = (await _read_snapshot(guild_id)).version
+            memo = _POLICY_MEMO.get((guild_id, subsystem))
+            if memo is not None and memo[0] == version:
+                return memo[1]  # type: ignore[no-any-return]
+            policy = await build(guild_id)
+            _POLICY_MEMO[(guild_id, subsystem)] = (version, policy)
+            return policy
+
+        return load
+
+    return decorate
+
+
+def forget_guild(guild_id: int) -> None:
+    """Drop every memoised policy for ``guild_id`` (guild teardown)."""
+    for key in [k for k in _POLICY_MEMO if k[0] == guild_id]:
+        del _POLICY_MEMO[key]
+
+
+def _reset_for_tests() -> None:
+    """Test helper — drop every memoised policy."""
+    _POLICY_MEMO.clear()
+
+
 # ---------------------------------------------------------------------------
 # Diagnostics provider — registers at import time
 # ---------------------------------------------------------------------------
@@ -469,6 +530,7 @@ __all__ = [
     "Provenance",
     "SettingResolution",
     "counters_snapshot",
+    "memoised_policy",
     "resolve_batch",
     "resolve_setting",
     "resolve_value",
@@ -38,7 +38,7 @@ import discord
 
 from core.events import bus
 from core.runtime import guild_resources
-from services import ticket_service
+from services import ticket_service, ticket_transcript
 from services.audit_events import emit_audit_action
 from services.channel_lifecycle_service import ChannelLifecycleService
 from services.lifecycle import contracts as lc
@@ -188,7 +188,11 @@ async def open_ticket(
             reason="db_failed",
         )
 
-    # 4. Audit + advisory event (after commit).
+    # 4. Record the conversation from here on (the close-time transcript).
+    if channel_id:
+        ticket_transcript.track(channel_id, ticket_id)
+
+    # 5. Audit + advisory event (after commit).
     await _emit_audit(
         guild_id=guild.id,
         mutation_type="open",
@@ -310,7 +314,13 @@ async def close_ticket(
     guild = channel.guild
     cfg = await ticket_service.get_config(guild.id)
 
-    transcript = await ticket_service.build_transcript(channel)
+    # Best-effort: a failed backfill, read or temp-file write must not block
+    # the close — the log post and DM then carry the "unavailable" note.
+    try:
+        transcript = await ticket_transcript.export(channel, ticket_id)
+    except Exception:
+        logger.exception("ticket close: transcript export failed for %s", ticket_id)
+        transcript = ticket_transcript.TranscriptExport.unavailable()
 
     async with db.transaction() as conn:
         await db.ticket_close(
@@ -337,7 +347,11 @@ async def close_ticket(
         closed_by=closer.id,
     )
 
-    await _deliver_transcript(guild, cfg, ticket, transcript, closer, reason)
+    try:
+        await _deliver_transcript(guild, cfg, ticket, transcript, closer, reason)
+    finally:
+        transcript.discard()
+    ticket_transcript.untrack(channel.id)
 
     if delete_after:
         try:
@@ -352,7 +366,7 @@ async def _deliver_transcript(
     guild: discord.Guild,
     cfg: ticket_service.TicketConfig | None,
     ticket: dict[str, Any],
-    transcript: str,
+    transcript: ticket_transcript.TranscriptExport,
     closer: discord.Member,
     reason: str | None,
 ) -> None:
@@ -362,10 +376,16 @@ async def _deliver_transcript(
     subject = ticket.get("subject", "")
 
     def _file() -> discord.File:
-        import io
-
-        data = io.BytesIO(transcript.encode("utf-8"))
-        return discord.File(data, filename=f"ticket-{ticket_id}-transcript.txt")
+        return transcript.file(f"ticket-{ticket_id}-transcript.txt")
+
+    async def _send_archive(target: discord.abc.Messageable) -> None:
+        # Its own message: each upload stays within the per-file limit.
+        archive = transcript.archive_file(f"ticket-{ticket_id}-attachments.zip")
+        if archive is not None:
+            await target.send(
+                content=f"Attachments from ticket **#{ticket_id}**.",
+                file=archive,
+            )
 
     embed = discord.Embed(
         title=f"🎫 Ticket #{ticket_id} closed",
@@ -376,12 +396,17 @@ async def _deliver_transcript(
     embed.add_field(name="Closed by", value=closer.mention, inline=True)
     if reason:
         embed.add_field(name="Reason", value=reason[:1024], inline=False)
+    if transcript.truncated:
+        embed.set_footer(
+            text="Transcript cut at the upload size limit — the full record is kept.",
+        )
 
     if cfg is not None and cfg.log_channel_id is not None:
         log_channel = guild.get_channel(cfg.log_channel_id)
         if isinstance(log_channel, discord.TextChannel):
             try:
                 await log_channel.send(embed=embed, file=_file())
+                await _send_archive(log_channel)
             except Exception:  # pragma: no cover — best-effort
                 logger.exception("ticket close: log post failed")
 
@@ -395,6 +420,7 @@ async def _deliver_transcript(
                 ),
                 file=_file(),
             )
+            await _send_archive(opener)
         except Exception:  # pragma: no cover — DMs may be closed
             logger.debug("ticket close: opener DM failed (DMs closed?)")
 
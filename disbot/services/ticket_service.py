@@ -148,34 +148,3 @@ async def list_open(guild_id: int, *, limit: int = 25) -> list[dict[str, Any]]:
 async def get_ticket_for_channel(channel_id: int) -> dict[str, Any] | None:
     """The ticket bound to ``channel_id`` (for in-channel control buttons)."""
     return await db.ticket_get_by_channel(channel_id)
-
-
-async def build_transcript(channel: Any, *, max_messages: int = 500) -> str:
-    """Render a plain-text transcript of a ticket channel, oldest first.
-
-    Best-effort: reads up to ``max_messages`` from history. Returns a header +
-    one ``[time] author: content`` line per message (attachments noted). Used
-    on close to preserve the conversation for the log channel + the opener DM.
-    """
-    lines: list[str] = []
-    try:
-        async for msg in channel.history(limit=max_messages, oldest_first=True):
-            stamp = msg.created_at.strftime("%Y-%m-%d %H:%M")
-            author = getattr(msg.author, "display_name", str(msg.author))
-            content = msg.content or ""
-            if msg.attachments:
-                names = ", ".join(a.filename for a in msg.attachments)
-                content = f"{content} [attachments: {names}]".strip()
-            if not content and msg.embeds:
-                content = "[embed]"
-            lines.append(f"[{stamp}] {author}: {content}")
-    except Exception:  # pragma: no cover — defensive; transcript is best-effort
-        logger.exception(
-            "ticket transcript: history read failed for channel %s",
-            getattr(channel, "id", "?"),
-        )
-        if not lines:
-            return "Transcript unavailable (could not read channel history)."
-    header = f"Transcript — #{getattr(channel, 'name', 'ticket')} "
-    header += f"({len(lines)} message(s))"
-    return header + "\n" + ("\n".join(lines) if lines else "(no messages)")
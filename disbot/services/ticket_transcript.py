@@ -0,0 +1,480 @@
+"""Support tickets — transcripts recorded as the conversation happens.
+
+Closing a ticket used to page the channel's history (capped at 500 messages)
+and build one large string on the event loop.  Instead, every message in an
+open ticket channel is rendered to one line and appended to
+``ticket_transcript_lines`` (migration 108) as it arrives, so close-time work is
+a history backfill that only covers the gap since the newest recorded message
+(bot downtime, or a ticket opened before recording existed) plus one ordered
+read, paged on ``message_id`` and written to the file a page at a time.
+
+The set of open ticket channels is held in memory (:func:`track` /
+:func:`untrack` from :mod:`services.ticket_mutation`, :func:`load` at startup)
+so ``cogs.ticket_cog``'s message-pipeline stage does no DB work outside ticket
+channels.  The pipeline drops bot-authored messages, so the bot's own posts in
+a ticket (the welcome panel, command replies, public button replies) are
+recorded where they are sent, through :func:`record_if_tracked` and
+:func:`record_interaction_reply`.  Posts by other bots and webhooks are not
+recorded.
+
+Attachment URLs on Discord's CDN expire, so when a message is recorded the
+bytes of its attachments are downloaded in the background, while the URL is
+still valid, into ``ticket_transcript_attachments`` (migration 110); the
+transcript line names each by its path in the archive
+(``attachments/<id>-<filename>``).  :func:`export` writes the transcript to a
+temporary file and the stored attachments to a zip, each bounded by the
+guild's upload limit, for :mod:`services.ticket_mutation` to attach to the log
+post and the opener DM.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import os
+import tempfile
+import zipfile
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import discord
+
+from utils import db
+
+logger = logging.getLogger("bot.services.ticket_transcript")
+
+# Discord's default per-file upload limit (guilds without a boost tier).
+_DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+# Backfilled lines are written in batches of this many (one INSERT each).
+_BACKFILL_BATCH = 100
+# The export reads the transcript in pages of this many lines.
+_EXPORT_PAGE = 500
+# Attachments archive: bytes held back for the zip's central directory and
+# SKIPPED.txt, and the per-entry header cost charged against the limit.
+_ARCHIVE_RESERVE = 16 * 1024
+_ARCHIVE_ENTRY_OVERHEAD = 512
+
+# channel_id -> ticket_id for every open ticket (the listener's filter).
+_CHANNELS: dict[int, int] = {}
+
+
+def track(channel_id: int, ticket_id: int) -> None:
+    """Start recording messages posted in ``channel_id`` for ``ticket_id``."""
+    _CHANNELS[channel_id] = ticket_id
+
+
+def untrack(channel_id: int) -> None:
+    """Stop recording ``channel_id``.  No-op if it was not tracked."""
+    _CHANNELS.pop(channel_id, None)
+
+
+def load(pairs: Iterable[tuple[int, int]]) -> None:
+    """Track every ``(channel_id, ticket_id)`` pair (the startup load)."""
+    _CHANNELS.update(pairs)
+
+
+def ticket_for_channel(channel_id: int) -> int | None:
+    """The open ticket recorded in ``channel_id``, or ``None``."""
+    return _CHANNELS.get(channel_id)
+
+
+def attachment_entry(attachment: Any) -> str:
+    """The archive path of ``attachment`` (unique: keyed by its snowflake)."""
+    name = str(attachment.filename).replace("/", "_").replace("\\", "_")
+    return f"attachments/{attachment.id}-{name}"
+
+
+def format_line(message: Any) -> str:
+    """Render one message as ``[time] author: content`` (attachments noted)."""
+    stamp = message.created_at.strftime("%Y-%m-%d %H:%M")
+    author = getattr(message.author, "display_name", str(message.author))
+    content = message.content or ""
+    if message.attachments:
+        files = ", ".join(
+            f"{a.filename} <{attachment_entry(a)}>" for a in message.attachments
+        )
+        content = f"{content} [attachments: {files}]".strip()
+    if not content and message.embeds:
+        content = "[embed]"
+    return f"[{stamp}] {author}: {content}"
+
+
+async def record(ticket_id: int, message: Any) -> None:
+    """Append one live message to the ticket's transcript.
+
+    Its attachments are archived by a background task, so a large download
+    never holds up the message pipeline.
+    """
+    await db.ticket_transcript_append(ticket_id, [(message.id, format_line(message))])
+    if message.attachments:
+        from core.runtime import tasks
+
+        tasks.spawn(
+            f"ticket:archive_attachments:{message.id}",
+            archive_attachments(
+                ticket_id,
+                list(message.attachments),
+                _upload_limit(getattr(message, "guild", None)),
+            ),
+        )
+
+
+async def record_if_tracked(message: Any) -> None:
+    """Record ``message`` if it was posted in an open ticket channel.
+
+    A dict lookup everywhere else.  Best-effort: a failed write is logged
+    and the line is missing from the transcript.
+    """
+    ticket_id = ticket_for_channel(message.channel.id)
+    if ticket_id is None:
+        return
+    try:
+        await record(ticket_id, message)
+    except Exception:
+        logger.exception("ticket transcript: record failed for message %s", message.id)
+
+
+async def record_interaction_reply(interaction: Any) -> None:
+    """Record the public reply just sent to ``interaction`` in a ticket channel.
+
+    Interaction replies are bot-authored, so the pipeline never delivers
+    them.  Fetching the reply costs a REST call, made only in open ticket
+    channels; best-effort like :func:`record_if_tracked`.
+    """
+    if ticket_for_channel(interaction.channel_id) is None:
+        return
+    try:
+        message = await interaction.original_response()
+    except Exception:
+        logger.exception(
+            "ticket transcript: reply lookup failed for interaction %s",
+            getattr(interaction, "id", "?"),
+        )
+        return
+    await record_if_tracked(message)
+
+
+async def archive_attachments(
+    ticket_id: int,
+    attachments: list[Any],
+    max_bytes: int,
+) -> None:
+    """Store the bytes of a recorded message's ``attachments`` for the archive.
+
+    A ticket keeps at most what one archive upload of ``max_bytes`` can carry;
+    an attachment past that budget, or one whose download fails, is stored as
+    a note instead, for the archive's ``SKIPPED.txt``.  Best-effort: a failure
+    is logged and the attachment is left out.
+    """
+    budget = max_bytes - _ARCHIVE_RESERVE
+    try:
+        used = await db.ticket_transcript_attachment_bytes(ticket_id)
+        for attachment in attachments:
+            data: bytes | None = None
+            note: str | None = None
+            cost = int(getattr(attachment, "size", 0)) + _ARCHIVE_ENTRY_OVERHEAD
+            if used + cost > budget:
+                note = "upload size limit"
+            else:
+                try:
+                    data = await attachment.read()
+                except Exception:
+                    logger.warning(
+                        "ticket transcript: attachment %s could not be downloaded",
+                        attachment.id,
+                    )
+                    note = "download failed"
+            await db.ticket_transcript_store_attachment(
+                ticket_id,
+                attachment.id,
+                attachment_entry(attachment),
+                data,
+                note=note,
+            )
+            if data is not None:
+                used += len(data) + _ARCHIVE_ENTRY_OVERHEAD
+    except Exception:
+        logger.exception(
+            "ticket transcript: attachment archive failed for ticket %s",
+            ticket_id,
+        )
+
+
+async def backfill(channel: Any, ticket_id: int) -> int:
+    """Record the messages posted after the newest recorded one; return the count.
+
+    A ticket with nothing recorded yet is backfilled from the start of its
+    history.  Attachments of the backfilled messages are archived as they are
+    read.  Best-effort: a history read failure is logged and whatever was
+    recorded so far is kept.
+    """
+    last = await db.ticket_transcript_last_message_id(ticket_id)
+    after = discord.Object(id=last) if last is not None else None
+    max_bytes = _upload_limit(getattr(channel, "guild", None))
+    batch: list[tuple[int, str]] = []
+    count = 0
+    try:
+        async for msg in channel.history(limit=None, after=after, oldest_first=True):
+            batch.append((msg.id, format_line(msg)))
+            if msg.attachments:
+                await archive_attachments(ticket_id, list(msg.attachments), max_bytes)
+            if len(batch) >= _BACKFILL_BATCH:
+                await db.ticket_transcript_append(ticket_id, batch)
+                count += len(batch)
+                batch = []
+    except Exception:
+        logger.exception(
+            "ticket transcript: history backfill failed for channel %s",
+            getattr(channel, "id", "?"),
+        )
+    if batch:
+        await db.ticket_transcript_append(ticket_id, batch)
+        count += len(batch)
+    return count
+
+
+async def load_open_tickets() -> list[tuple[int, int]]:
+    """Track every open ticket channel; return the ``(channel_id, ticket_id)`` pairs."""
+    pairs = await db.ticket_list_open_channels()
+    load(pairs)
+    return pairs
+
+
+# Attached in place of the transcript when :func:`export` fails, so a close
+# never depends on the transcript being readable.
+UNAVAILABLE_TEXT = "Transcript unavailable (could not read the recorded transcript)."
+
+
+@dataclass(frozen=True)
+class TranscriptExport:
+    """A rendered transcript on disk, ready to attach (see :func:`export`).
+
+    ``path`` is ``None`` for the :meth:`unavailable` placeholder, which
+    attaches :data:`UNAVAILABLE_TEXT` from memory.  ``archive_path`` is the
+    attachments zip, ``None`` when no attachment was archived.
+    """
+
+    path: Path | None
+    message_count: int
+    #: True when the upload limit cut the file short (the DB keeps every line).
+    truncated: bool
+    archive_path: Path | None = None
+    #: attachments left out of the archive (size limit, or download failed)
+    attachments_skipped: int = 0
+
+    @classmethod
+    def unavailable(cls) -> TranscriptExport:
+        """The placeholder a close falls back to when :func:`export` failed."""
+        return cls(path=None, message_count=0, truncated=False)
+
+    def file(self, filename: str) -> discord.File:
+        """A fresh upload of the transcript (each send needs its own handle)."""
+        if self.path is None:
+            return discord.File(
+                io.BytesIO(UNAVAILABLE_TEXT.encode("utf-8")),
+                filename=filename,
+            )
+        return discord.File(str(self.path), filename=filename)
+
+    def archive_file(self, filename: str) -> discord.File | None:
+        """A fresh upload of the attachments zip, or ``None`` without one."""
+        if self.archive_path is None:
+            return None
+        return discord.File(str(self.archive_path), filename=filename)
+
+    def discard(self) -> None:
+        """Delete the temporary files (a no-op for the placeholder)."""
+        for path in (self.path, self.archive_path):
+            if path is None:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+async def export(
+    channel: Any,
+    ticket_id: int,
+    *,
+    max_bytes: int | None = None,
+) -> TranscriptExport:
+    """Backfill the gap, then write the transcript + attachments archive.
+
+    Neither file exceeds ``max_bytes`` (default: the guild's upload limit).
+    The lines are read a page at a time and each page is written as it
+    arrives, so the whole transcript is never held in memory.  A transcript
+    that is longer ends with a note of how many lines were left out;
+    attachments that were not kept or do not fit are listed in the archive's
+    ``SKIPPED.txt`` and counted in the transcript header.  The caller must
+    :meth:`TranscriptExport.discard` the result.
+    """
+    await backfill(channel, ticket_id)
+    # Lines recorded after this count (the close in progress) are left out,
+    # so the header matches the file.
+    total = await db.ticket_transcript_count(ticket_id)
+    if max_bytes is None:
+        max_bytes = _upload_limit(getattr(channel, "guild", None))
+    archive, archived, skipped = await _archive(ticket_id, max_bytes)
+    header = f"Transcript — #{getattr(channel, 'name', 'ticket')} "
+    header += f"({total} message(s))"
+    if archived or skipped:
+        header += f"\nAttachments: {archived} archived"
+        if skipped:
+            header += f", {skipped} not archived (upload size limit or gone)"
+    out: _TranscriptFile | None = None
+    try:
+        out = await asyncio.to_thread(_TranscriptFile, header, max_bytes)
+        after = 0
+        remaining = total
+        while remaining > 0:
+            page = await db.ticket_transcript_page(
+                ticket_id,
+                after=after,
+                limit=min(_EXPORT_PAGE, remaining),
+            )
+            if not page:
+                break
+            remaining -= len(page)
+            after = page[-1][0]
+            if not await asyncio.to_thread(out.write, [line for _, line in page]):
+                break
+        await asyncio.to_thread(out.finish, total)
+    except BaseException:
+        if out is not None:
+            out.discard()
+        if archive is not None:
+            archive.unlink(missing_ok=True)
+        raise
+    return TranscriptExport(
+        path=out.path,
+        message_count=total,
+        truncated=out.truncated,
+        archive_path=archive,
+        attachments_skipped=skipped,
+    )
+
+
+def _upload_limit(guild: Any) -> int:
+    """The guild's per-file upload limit (Discord's default without a guild)."""
+    return getattr(guild, "filesize_limit", None) or _DEFAULT_MAX_BYTES
+
+
+async def _archive(ticket_id: int, max_bytes: int) -> tuple[Path | None, int, int]:
+    """Write the ticket's archived attachments into a zip of at most ``max_bytes``.
+
+    The bytes are read from the DB one attachment at a time and the zip
+    writes run off the event loop.  Returns ``(path or None, archived,
+    skipped)`` — no file is left behind when nothing was archived.
+    """
+    index = await db.ticket_transcript_attachment_index(ticket_id)
+    if not index:
+        return None, 0, 0
+    fd, name = tempfile.mkstemp(prefix="ticket-attachments-", suffix=".zip")
+    os.close(fd)
+    path = Path(name)
+    # Room kept for the central directory and SKIPPED.txt.
+    budget = max_bytes - _ARCHIVE_RESERVE
+    used = 0
+    archived = 0
+    skipped: list[str] = []
+    try:
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zf:
+            for row in index:
+                entry = row["entry"]
+                if row["size"] is None:
+                    skipped.append(f"{entry} ({row['note'] or 'not archived'})")
+                    continue
+                cost = int(row["size"]) + _ARCHIVE_ENTRY_OVERHEAD
+                if used + cost > budget:
+                    skipped.append(f"{entry} (upload size limit)")
+                    continue
+                data = await db.ticket_transcript_attachment_data(
+                    ticket_id,
+                    row["attachment_id"],
+                )
+                if data is None:
+                    skipped.append(f"{entry} (not archived)")
+                    continue
+                await asyncio.to_thread(zf.writestr, entry, data)
+                used += cost
+                archived += 1
+            if skipped and archived:
+                zf.writestr("SKIPPED.txt", "\n".join(skipped)[: _ARCHIVE_RESERVE // 2])
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    if not archived:
+        path.unlink(missing_ok=True)
+        return None, 0, len(skipped)
+    return path, archived, len(skipped)
+
+
+class _TranscriptFile:
+    """A temp file of at most ``max_bytes``, written a page at a time.
+
+    Every method does blocking file I/O; :func:`export` runs them off the
+    event loop.
+    """
+
+    def __init__(self, header: str, max_bytes: int) -> None:
+        fd, name = tempfile.mkstemp(prefix="ticket-transcript-", suffix=".txt")
+        self.path = Path(name)
+        self._out = os.fdopen(fd, "wb")
+        # Room kept for the truncation note, so adding it never breaks the limit.
+        self._budget = max_bytes - 128
+        self._written = self._out.write(header.encode("utf-8") + b"\n")
+        self.lines = 0
+        self.truncated = False
+
+    def write(self, lines: list[str]) -> bool:
+        """Append ``lines``; False once the size limit cut the file short."""
+        for line in lines:
+            data = line.encode("utf-8") + b"\n"
+            if self._written + len(data) > self._budget:
+                self.truncated = True
+                return False
+            self._written += self._out.write(data)
+            self.lines += 1
+        return True
+
+    def finish(self, total: int) -> None:
+        """Close the file, noting the ``total - lines`` lines left out."""
+        with self._out:
+            if not total:
+                self._out.write(b"(no messages)")
+            elif self.truncated:
+                left = total - self.lines
+                self._out.write(
+                    f"… {left} more message(s) not included (upload size limit).".encode(),
+                )
+
+    def discard(self) -> None:
+        self._out.close()
+        self.path.unlink(missing_ok=True)
+
+
+def _reset_for_tests() -> None:
+    _CHANNELS.clear()
+
+
+__all__ = [
+    "UNAVAILABLE_TEXT",
+    "TranscriptExport",
+    "archive_attachments",
+    "attachment_entry",
+    "backfill",
+    "export",
+    "format_line",
+    "load",
+    "load_open_tickets",
+    "record",
+    "record_if_tracked",
+    "record_interaction_reply",
+    "ticket_for_channel",
+    "track",
+    "untrack",
+]
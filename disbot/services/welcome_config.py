@@ -20,8 +20,9 @@ table); there is **no migration** — the keys live in
 existing ``!settings`` widget dispatcher.
 
 Cycle discipline (mirrors :mod:`services.automod_config`): the only
-cross-package import (``settings_resolution``) is function-local; top-level
-imports are stdlib only.
+cross-package import is ``settings_resolution``. Its :func:`memoised_policy`
+decorator is imported at top level (that module is stdlib-only at import time);
+the resolvers stay function-local.
 """
 
 from __future__ import annotations
@@ -31,6 +32,8 @@ import random
 import re
 from dataclasses import dataclass
 
+from services.settings_resolution import memoised_policy
+
 SUBSYSTEM = "welcome"
 
 # ---------------------------------------------------------------------------
@@ -272,6 +275,7 @@ def render_template(
     )
 
 
+@memoised_policy(SUBSYSTEM)
 async def load_policy(guild_id: int) -> WelcomePolicy:
     """Load the effective :class:`WelcomePolicy` for ``guild_id``.
 
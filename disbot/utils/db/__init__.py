@@ -71,6 +71,7 @@ from utils.db.economy import (
 from utils.db.games.chain import (
     delete_chain_channel,
     get_all_chain_channels,
+    get_chain_bindings,
     get_chain_channel,
     increment_chain_count,
     set_chain_channel,
@@ -93,7 +94,9 @@ from utils.db.games.deathmatch import (
     update_deathmatch,
 )
 from utils.db.games.farm import (
+    FarmPlayerState,
     get_chicken_farm,
+    load_farm_player_state,
     set_chicken_farm,
     top_farmers,
 )
@@ -113,6 +116,10 @@ from utils.db.games.fishing_energy import (
     get_fishing_energy,
     set_fishing_energy,
 )
+from utils.db.games.fishing_player_state import (
+    FishingPlayerState,
+    load_fishing_player_state,
+)
 from utils.db.games.fishing_rod import (
     get_rod_tier,
     set_rod_tier,
@@ -161,6 +168,7 @@ from utils.db.games.mining_loadout import (
     save_loadout,
 )
 from utils.db.games.mining_player_state import (
+    MiningPlayerState,
     get_depth,
     get_energy,
     get_equipped_title,
@@ -168,6 +176,7 @@ from utils.db.games.mining_player_state import (
     get_max_depth,
     get_vault_level,
     list_guild_miner_ids,
+    load_mining_player_state,
     record_depth,
     set_depth,
     set_energy,
@@ -257,7 +266,7 @@ from utils.db.sessions import (
     set_session_state_many,
     touch_session,
 )
-from utils.db.settings import get_setting, set_setting
+from utils.db.settings import get_setting, get_settings_for_guilds, set_setting
 from utils.db.tickets import (
     ticket_add_blacklist,
     ticket_close,
@@ -269,8 +278,17 @@ from utils.db.tickets import (
     ticket_is_blacklisted,
     ticket_list_for_user,
     ticket_list_open,
+    ticket_list_open_channels,
     ticket_remove_blacklist,
     ticket_set_claim,
+    ticket_transcript_append,
+    ticket_transcript_attachment_bytes,
+    ticket_transcript_attachment_data,
+    ticket_transcript_attachment_index,
+    ticket_transcript_count,
+    ticket_transcript_last_message_id,
+    ticket_transcript_page,
+    ticket_transcript_store_attachment,
     ticket_upsert_config,
 )
 from utils.db.treasury import (
@@ -309,6 +327,7 @@ __all__ = [
     "xp_for_level",
     # settings
     "get_setting",
+    "get_settings_for_guilds",
     "set_setting",
     # roles
     "add_reaction_role",
@@ -370,8 +389,17 @@ __all__ = [
     "ticket_is_blacklisted",
     "ticket_list_for_user",
     "ticket_list_open",
+    "ticket_list_open_channels",
     "ticket_remove_blacklist",
     "ticket_set_claim",
+    "ticket_transcript_append",
+    "ticket_transcript_attachment_bytes",
+    "ticket_transcript_attachment_data",
+    "ticket_transcript_attachment_index",
+    "ticket_transcript_count",
+    "ticket_transcript_last_message_id",
+    "ticket_transcript_page",
+    "ticket_transcript_store_attachment",
     "ticket_upsert_config",
     # inventory
     "add_item",
@@ -437,6 +465,7 @@ __all__ = [
     "list_guild_miner_ids",
     "record_depth",
     "get_all_mining_totals",
+    "get_chain_bindings",
     "get_chain_channel",
     "get_counting_state",
     "get_deathmatch_leaderboard",
@@ -460,6 +489,8 @@ __all__ = [
     "list_loadouts",
     "delete_loadout",
     "get_depth",
+    "MiningPlayerState",
+    "load_mining_player_state",
     "set_depth",
     "get_energy",
     "set_energy",
@@ -488,6 +519,10 @@ __all__ = [
     "set_fishing_venue",
     "get_chicken_farm",
     "set_chicken_farm",
+    "FarmPlayerState",
+    "load_farm_player_state",
+    "FishingPlayerState",
+    "load_fishing_player_state",
     "top_farmers",
     "get_active_bait",
     "set_active_bait",
@@ -2,7 +2,8 @@
 
 The only module that touches the ``ai_guild_policy``,
 ``ai_channel_policy``, ``ai_category_policy``, ``ai_role_policy``,
-``ai_instruction_profile``, and ``ai_decision_audit`` tables.
+``ai_instruction_profile``, ``ai_decision_audit``, and
+``ai_token_usage_daily`` tables.
 
 Reads land here; writes flow through the M2 service-layer mutation
 pipelines (``services.ai_policy_mutation`` /
@@ -18,6 +19,8 @@ under the M1 BindingSpec and is the single source of truth.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
+from datetime import date
 from typing import Any
 
 from utils.db import pool
@@ -564,15 +567,18 @@ async def record_decision(
     provider: str | None,
     model: str | None,
     expires_at: Any | None = None,
+    enrichment_timings: dict[str, Any] | None = None,
 ) -> int:
     row = await pool.get().fetchrow(
         """
         INSERT INTO ai_decision_audit (
             guild_id, channel_id, category_id, user_id, message_id,
             task, route, decision, reason_code, policy_snapshot_hash,
-            instruction_profile_ids, provider, model, created_at, expires_at
+            instruction_profile_ids, provider, model, created_at, expires_at,
+            enrichment_timings
         ) VALUES (
-            $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, NOW(), $14
+            $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, NOW(), $14,
+            $15::jsonb
         )
         RETURNING id
         """,
@@ -590,6 +596,7 @@ async def record_decision(
         provider,
         model,
         expires_at,
+        enrichment_timings,
     )
     return int(row["id"])
 
@@ -605,7 +612,8 @@ async def query_decisions(
     sql = (
         "SELECT id, guild_id, channel_id, category_id, user_id, message_id,"
         " task, route, decision, reason_code, policy_snapshot_hash,"
-        " instruction_profile_ids, provider, model, created_at "
+        " instruction_profile_ids, provider, model, enrichment_timings,"
+        " created_at "
         "FROM ai_decision_audit WHERE guild_id = $1"
     )
     args: list[Any] = [guild_id]
@@ -624,6 +632,84 @@ async def query_decisions(
     return [dict(r) for r in rows]
 
 
+# ---------------------------------------------------------------------------
+# ai_token_usage_daily
+# ---------------------------------------------------------------------------
+
+
+async def add_token_usage(
+    rows: Iterable[tuple[date, int, str, str, str, int, int, int, int, int]],
+) -> int:
+    """Add ledger rows onto the daily rollup. Returns the number of rows written.
+
+    Each tuple is ``(day, guild_id, task, provider, model, requests,
+    input_tokens, cached_input_tokens, output_tokens, cost_micros)``; an
+    existing bucket is incremented, never overwritten.
+    """
+    materialised = list(rows)
+    if not materialised:
+        return 0
+    async with pool.get().acquire() as conn, conn.transaction():
+        await conn.executemany(
+            """
+            INSERT INTO ai_token_usage_daily (
+                day, guild_id, task, provider, model, requests,
+                input_tokens, cached_input_tokens, output_tokens, cost_micros,
+                updated_at
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, NOW())
+            ON CONFLICT (day, guild_id, task, provider, model)
+            DO UPDATE SET
+                requests = ai_token_usage_daily.requests + EXCLUDED.requests,
+                input_tokens = ai_token_usage_daily.input_tokens
+                    + EXCLUDED.input_tokens,
+                cached_input_tokens = ai_token_usage_daily.cached_input_tokens
+                    + EXCLUDED.cached_input_tokens,
+                output_tokens = ai_token_usage_daily.output_tokens
+                    + EXCLUDED.output_tokens,
+                cost_micros = ai_token_usage_daily.cost_micros
+                    + EXCLUDED.cost_micros,
+                updated_at = NOW()
+            """,
+            materialised,
+        )
+    return len(materialised)
+
+
+async def get_token_usage(guild_id: int, *, since: date) -> list[dict[str, Any]]:
+    """One guild's rollup from ``since`` onward, summed per (task, model)."""
+    rows = await pool.get().fetch(
+        """
+        SELECT task, provider, model,
+               SUM(requests)::BIGINT AS requests,
+               SUM(input_tokens)::BIGINT AS input_tokens,
+               SUM(cached_input_tokens)::BIGINT AS cached_input_tokens,
+               SUM(output_tokens)::BIGINT AS output_tokens,
+               SUM(cost_micros)::BIGINT AS cost_micros
+        FROM ai_token_usage_daily
+        WHERE guild_id = $1 AND day >= $2
+        GROUP BY task, provider, model
+        ORDER BY cost_micros DESC
+        """,
+        guild_id,
+        since,
+    )
+    return [dict(r) for r in rows]
+
+
+async def get_token_spend(day: date) -> list[dict[str, Any]]:
+    """Every guild's spend on ``day``, per task — seeds the budget totals."""
+    rows = await pool.get().fetch(
+        """
+        SELECT guild_id, task, SUM(cost_micros)::BIGINT AS cost_micros
+        FROM ai_token_usage_daily
+        WHERE day = $1
+        GROUP BY guild_id, task
+        """,
+        day,
+    )
+    return [dict(r) for r in rows]
+
+
 # ---------------------------------------------------------------------------
 # Guild teardown — wired in disbot/guild_lifecycle.py
 # ---------------------------------------------------------------------------
@@ -640,6 +726,7 @@ async def delete_for_guild(guild_id: int) -> int:
     total = 0
     for sql in (
         "DELETE FROM ai_decision_audit WHERE guild_id = $1",
+        "DELETE FROM ai_token_usage_daily WHERE guild_id = $1",
         "DELETE FROM ai_review_log WHERE guild_id = $1",
         "DELETE FROM ai_answer_presets WHERE guild_id = $1",
         "DELETE FROM ai_role_policy WHERE guild_id = $1",
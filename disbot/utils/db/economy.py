@@ -131,6 +131,7 @@ async def economy_flow_by_reason(
                ORDER BY net DESC""",
             (guild_id,),
             conn=conn,
+            read_only=True,
         )
     else:
         rows = await pool.fetchall(
@@ -143,6 +144,7 @@ async def economy_flow_by_reason(
                ORDER BY net DESC""",
             (guild_id, since),
             conn=conn,
+            read_only=True,
         )
     return [(r["reason"], int(r["net"]), int(r["n"])) for r in rows]
 
@@ -176,6 +178,7 @@ async def economy_flow_daily(
                ORDER BY day ASC""",
             (guild_id,),
             conn=conn,
+            read_only=True,
         )
     else:
         rows = await pool.fetchall(
@@ -190,6 +193,7 @@ async def economy_flow_daily(
                ORDER BY day ASC""",
             (guild_id, since),
             conn=conn,
+            read_only=True,
         )
     return [
         (r["day"], int(r["minted"]), int(r["drained"]), int(r["net"]), int(r["n"]))
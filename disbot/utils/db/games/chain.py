@@ -57,3 +57,9 @@ async def get_all_chain_channels(guild_id: int) -> list[dict]:
         "FROM chain_channels WHERE guild_id=$1",
         (guild_id,),
     )
+
+
+async def get_chain_bindings() -> list[tuple[int, int]]:
+    """Every ``(guild_id, channel_id)`` with a chain row — the pipeline route set."""
+    rows = await pool.fetchall("SELECT guild_id, channel_id FROM chain_channels")
+    return [(row["guild_id"], row["channel_id"]) for row in rows]
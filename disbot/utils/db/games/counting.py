@@ -18,4 +18,5 @@ async def set_counting_state(guild_id: int, state: dict) -> None:
         """INSERT INTO counting_state (guild_id, state) VALUES ($1, $2::jsonb)
            ON CONFLICT (guild_id) DO UPDATE SET state=EXCLUDED.state""",
         (guild_id, state),
+        lane=pool.LANE_HOT,
     )
@@ -8,10 +8,14 @@ Transaction-aware (the Q-0071 precedent): the write primitive takes an optional
 ``conn`` so the farm workflow can compose the row update with the coin leg on one
 connection. With ``conn`` given a primitive must never open its own transaction —
 the caller owns commit/rollback.
+
+:func:`load_farm_player_state` is the farm panel's one-round-trip read: the farm
+row and the coin balance its footer shows, in a single statement.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from utils.db import pool
@@ -72,6 +76,56 @@ async def get_chicken_farm(
     )
 
 
+@dataclass(frozen=True)
+class FarmPlayerState:
+    """The stored farm row plus the coin balance — one :func:`load_farm_player_state`."""
+
+    chickens: int
+    eggs: int
+    eggs_updated_at: int
+    coop_level: int
+    coins: int
+
+
+# LEFT JOIN from a one-row VALUES so a player with no farm row (starter
+# defaults) and/or no xp row (0 coins) still reads back one row.
+_PANEL_SQL = """
+    SELECT f.chickens, f.eggs, f.eggs_updated_at, f.coop_level,
+           (SELECT coins FROM xp WHERE user_id = k.user_id AND guild_id = k.guild_id)
+               AS coins
+    FROM (VALUES ($1::bigint, $2::bigint)) AS k (user_id, guild_id)
+    LEFT JOIN chicken_farm f ON f.user_id = k.user_id AND f.guild_id = k.guild_id
+"""
+
+
+async def load_farm_player_state(
+    user_id: int,
+    guild_id: int,
+    *,
+    conn: asyncpg.Connection | None = None,
+) -> FarmPlayerState:
+    """The farm row (starter defaults if none) and coin balance in ONE round-trip.
+
+    Field-for-field what :func:`get_chicken_farm` + ``get_coins`` return.
+    """
+    row = await pool.fetchone(_PANEL_SQL, (user_id, guild_id), conn=conn)
+    if row is None or row["chickens"] is None:
+        return FarmPlayerState(
+            _DEFAULT_CHICKENS,
+            _DEFAULT_EGGS,
+            _DEFAULT_EGGS_UPDATED_AT,
+            _DEFAULT_COOP_LEVEL,
+            (row or {}).get("coins") or 0,
+        )
+    return FarmPlayerState(
+        row["chickens"],
+        row["eggs"],
+        row["eggs_updated_at"],
+        row["coop_level"],
+        row["coins"] or 0,
+    )
+
+
 async def top_farmers(
     guild_id: int,
     *,
@@ -0,0 +1,106 @@
+"""Fishing player-state loader — everything a cast reads, in one round-trip.
+
+A cast (:func:`services.fishing_workflow.begin_cast`) is gated and tuned by eight
+per-player rows spread over eight tables: the fishing energy bar, the owned rod
+tier, the current venue, the loaded bait, the built structures (Boathouse / Tide
+Pool / Dock / Fishery), the equipped gear + allocated skill points (the gear
+knob), and the fishing XP (the unlocked size band).  Read one getter at a time
+that was eight sequential awaits on the most-clicked panel;
+:func:`load_fishing_player_state` reads them with ONE statement of scalar
+subqueries and returns a :class:`FishingPlayerState`.
+
+Read-only, no cache: the state is per-player and changes on every cast.  Each
+field carries the same missing-row default as its single-purpose getter, so a
+caller can swap a getter for the aggregate without a behaviour change.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from utils.db import pool
+from utils.db.games.fishing_energy import _DEFAULT_ENERGY
+from utils.db.games.fishing_venue import _DEFAULT_VENUE
+
+if TYPE_CHECKING:
+    import asyncpg
+
+
+@dataclass(frozen=True)
+class FishingPlayerState:
+    """One player's fishing state, as read by :func:`load_fishing_player_state`."""
+
+    #: Stored (unsettled) fishing energy + its settle timestamp.
+    energy: int = _DEFAULT_ENERGY
+    energy_updated_at: int = 0
+    rod_tier: int = 0
+    venue: str = _DEFAULT_VENUE
+    #: Raw stored bait key + charges (``""``/0 = none loaded).
+    bait_key: str = ""
+    bait_charges: int = 0
+    #: Built structures only (level > 0), like ``get_structures``.
+    structures: dict[str, int] = field(default_factory=dict)
+    equipment: dict[str, str] = field(default_factory=dict)
+    #: Spent skill branches only (points > 0), like ``get_skills``.
+    skills: dict[str, int] = field(default_factory=dict)
+    #: ``{game: xp}`` across every game, like ``get_game_xp``.
+    game_xp: dict[str, int] = field(default_factory=dict)
+
+
+# $1 BIGINT user id (the fishing tables, structures, skills, game_xp), $2 guild
+# id, $3 TEXT user id (mining_equipment keeps the legacy TEXT column).
+_STATE_SQL = """
+WITH fe AS (
+    SELECT energy, energy_updated_at FROM fishing_energy
+    WHERE user_id = $1 AND guild_id = $2
+), fb AS (
+    SELECT bait_key, charges FROM fishing_bait
+    WHERE user_id = $1 AND guild_id = $2
+)
+SELECT (SELECT energy FROM fe) AS energy,
+       (SELECT energy_updated_at FROM fe) AS energy_updated_at,
+       (SELECT tier FROM fishing_rod
+         WHERE user_id = $1 AND guild_id = $2) AS rod_tier,
+       (SELECT venue FROM fishing_venue
+         WHERE user_id = $1 AND guild_id = $2) AS venue,
+       (SELECT bait_key FROM fb) AS bait_key,
+       (SELECT charges FROM fb) AS bait_charges,
+       (SELECT jsonb_object_agg(structure, level) FROM mining_structures
+         WHERE user_id = $1 AND guild_id = $2 AND level > 0) AS structures,
+       (SELECT jsonb_object_agg(slot, item_name) FROM mining_equipment
+         WHERE user_id = $3 AND guild_id = $2) AS equipment,
+       (SELECT jsonb_object_agg(branch, points) FROM player_skills
+         WHERE user_id = $1 AND guild_id = $2 AND points > 0) AS skills,
+       (SELECT jsonb_object_agg(game, xp) FROM game_xp
+         WHERE user_id = $1 AND guild_id = $2) AS game_xp
+"""
+
+
+async def load_fishing_player_state(
+    user_id: int,
+    guild_id: int,
+    *,
+    conn: asyncpg.Connection | None = None,
+) -> FishingPlayerState:
+    """Read a player's whole fishing state in ONE round-trip."""
+    row = await pool.fetchone(
+        _STATE_SQL,
+        (user_id, guild_id, str(user_id)),
+        conn=conn,
+    )
+    if row is None:  # pragma: no cover - a FROM-less SELECT always yields a row
+        return FishingPlayerState()
+    has_energy = row["energy"] is not None
+    return FishingPlayerState(
+        energy=row["energy"] if has_energy else _DEFAULT_ENERGY,
+        energy_updated_at=row["energy_updated_at"] if has_energy else 0,
+        rod_tier=row["rod_tier"] or 0,
+        venue=row["venue"] or _DEFAULT_VENUE,
+        bait_key=row["bait_key"] or "",
+        bait_charges=row["bait_charges"] or 0,
+        structures=row["structures"] or {},
+        equipment=row["equipment"] or {},
+        skills=row["skills"] or {},
+        game_xp=row["game_xp"] or {},
+    )
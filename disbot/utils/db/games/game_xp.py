@@ -109,6 +109,7 @@ async def top_total_xp(guild_id: int, limit: int = 10) -> list[tuple[int, int]]:
         "SELECT user_id, SUM(xp) AS total FROM game_xp "
         "WHERE guild_id=$1 GROUP BY user_id ORDER BY total DESC LIMIT $2",
         (guild_id, limit),
+        read_only=True,
     )
     return [(r["user_id"], int(r["total"])) for r in rows]
 
@@ -123,5 +124,6 @@ async def top_game_xp(
         "SELECT user_id, xp FROM game_xp "
         "WHERE guild_id=$1 AND game=$2 ORDER BY xp DESC LIMIT $3",
         (guild_id, game, limit),
+        read_only=True,
     )
     return [(r["user_id"], r["xp"]) for r in rows]
@@ -8,8 +8,10 @@ Direct-lane game state (``docs/ownership.md`` routes mining writes direct via
 * **world seed** — one row per guild in ``mining_world``; a guild with no row
   defaults to ``seed = guild_id``, so every guild has a stable shared world with
   no setup (Q-0173: "ONE shared grid per seed").
-* **fog of war** — one row per visited ``(z, x, y)`` in ``mining_discovered``;
-  reads only ever fetch a small window around the player.
+* **fog of war** — one row per ``(z, cx, cy)`` chunk in
+  ``mining_discovered_chunks`` (migration 107): a 64-bit bitset over the chunk's
+  8×8 cells, on the same chunk grid as :mod:`utils.mining.grid`.  A map window
+  spans at most four chunks, read in one query.
 
 RS02 (Q-0071): the write primitives take an optional ``conn`` so
 ``services/mining_workflow`` can compose them inside one transaction (callers own
@@ -21,9 +23,11 @@ service may call them, never a cog or view.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from utils.db import pool
+from utils.mining.grid import chunk_cells, chunk_of
 
 if TYPE_CHECKING:
     import asyncpg
@@ -98,6 +102,11 @@ async def set_world_seed(
     )
 
 
+def _to_bigint(bits: int) -> int:
+    """A 64-bit bitset as the signed value a Postgres BIGINT column holds."""
+    return bits - (1 << 64) if bits >= 1 << 63 else bits
+
+
 async def mark_discovered(
     user_id: str,
     guild_id: int,
@@ -107,12 +116,18 @@ async def mark_discovered(
     *,
     conn: asyncpg.Connection | None = None,
 ) -> None:
-    """Record that the player has visited cell ``(z, x, y)`` (idempotent)."""
+    """Record that the player has visited cell ``(z, x, y)`` (idempotent).
+
+    ORs the cell's bit into its chunk's bitset, creating the chunk row on the
+    first visit.
+    """
+    cx, cy, bit = chunk_of(x, y)
     await pool.execute(
-        """INSERT INTO mining_discovered (user_id, guild_id, z, x, y)
-           VALUES ($1, $2, $3, $4, $5)
-           ON CONFLICT (user_id, guild_id, z, x, y) DO NOTHING""",
-        (user_id, guild_id, z, x, y),
+        """INSERT INTO mining_discovered_chunks (user_id, guild_id, z, cx, cy, bits)
+           VALUES ($1, $2, $3, $4, $5, $6)
+           ON CONFLICT (user_id, guild_id, z, cx, cy)
+           DO UPDATE SET bits = mining_discovered_chunks.bits | EXCLUDED.bits""",
+        (user_id, guild_id, z, cx, cy, _to_bigint(1 << bit)),
         conn=conn,
     )
 
@@ -130,13 +145,42 @@ async def get_discovered_window(
 ) -> set[tuple[int, int]]:
     """The visited ``(x, y)`` cells at depth *z* inside the inclusive box.
 
-    Windowed so the map render is O(window) however far the player has roamed.
+    Windowed so the map render is O(window) however far the player has roamed:
+    one query for the chunk bitsets overlapping the box, decoded and clipped.
     """
+    cx_min, cy_min, _ = chunk_of(x_min, y_min)
+    cx_max, cy_max, _ = chunk_of(x_max, y_max)
     rows = await pool.fetchall(
-        """SELECT x, y FROM mining_discovered
+        """SELECT cx, cy, bits FROM mining_discovered_chunks
            WHERE user_id=$1 AND guild_id=$2 AND z=$3
-             AND x BETWEEN $4 AND $5 AND y BETWEEN $6 AND $7""",
-        (user_id, guild_id, z, x_min, x_max, y_min, y_max),
+             AND cx BETWEEN $4 AND $5 AND cy BETWEEN $6 AND $7""",
+        (user_id, guild_id, z, cx_min, cx_max, cy_min, cy_max),
         conn=conn,
     )
-    return {(r["x"], r["y"]) for r in rows}
+    return cells_in_box(
+        ((r["cx"], r["cy"], r["bits"]) for r in rows),
+        x_min,
+        x_max,
+        y_min,
+        y_max,
+    )
+
+
+def cells_in_box(
+    chunks: Iterable[tuple[int, int, int]],
+    x_min: int,
+    x_max: int,
+    y_min: int,
+    y_max: int,
+) -> set[tuple[int, int]]:
+    """Decode ``(cx, cy, bits)`` chunk rows into the visited cells inside the box.
+
+    ``bits`` is the stored (signed BIGINT) bitset; shared with the one-query
+    player-state loader, which reads the same rows in its own statement.
+    """
+    return {
+        (x, y)
+        for cx, cy, bits in chunks
+        for x, y in chunk_cells(cx, cy, bits & ((1 << 64) - 1))
+        if x_min <= x <= x_max and y_min <= y <= y_max
+    }
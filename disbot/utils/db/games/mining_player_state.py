@@ -9,13 +9,20 @@ stored, so depth is the single source of truth for position.
 
 RS02 (Q-0071): write primitives take an optional ``conn`` so the workflow
 service can compose them inside one transaction (callers own commit).
+
+:func:`load_mining_player_state` is the one-round-trip read for a mining action:
+everything a dig / mine / explore / descent (or the grid render) needs, from the
+player's tables, in a single multi-CTE statement.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from utils.db import pool
+from utils.db.games.mining_grid import cells_in_box
+from utils.mining.grid import CHUNK_SIZE
 
 if TYPE_CHECKING:
     import asyncpg
@@ -274,3 +281,134 @@ async def record_depth(
         conn=conn,
     )
     return row is not None
+
+
+@dataclass(frozen=True)
+class MiningPlayerState:
+    """One player's mining state, as read by :func:`load_mining_player_state`.
+
+    Field-for-field what the single-purpose getters return for the same player
+    (``get_position``, ``get_depth``, ``get_energy``, ``get_mining_inventory``,
+    ``get_equipment``, ``get_gear_wear``, ``get_skills``, ``get_world_seed``),
+    missing rows included.  ``discovered`` is only filled when a window was
+    requested.
+    """
+
+    x: int
+    y: int
+    depth: int
+    energy: int
+    energy_updated_at: int
+    seed: int
+    inventory: dict[str, int] = field(default_factory=dict)
+    equipment: dict[str, str] = field(default_factory=dict)
+    wear: dict[str, int] = field(default_factory=dict)
+    skills: dict[str, int] = field(default_factory=dict)
+    discovered: frozenset[tuple[int, int]] = frozenset()
+
+
+_CHUNK_SHIFT = CHUNK_SIZE.bit_length() - 1
+
+# $1 TEXT user id (mining tables), $2 guild id, $3 BIGINT user id (player_skills,
+# shared with game_xp), $4 fog-of-war half-width.  Every per-table read is a
+# scalar subquery over the same (user, guild) key, so one statement and one
+# round-trip replace the eight getters; the discovered chunks are addressed
+# from the *stored* position, which the caller does not know yet.
+_STATE_SQL = """
+WITH st AS (
+    SELECT depth, pos_x, pos_y, energy, energy_updated_at
+    FROM mining_player_state
+    WHERE user_id = $1 AND guild_id = $2{lock}
+), pos AS (
+    SELECT COALESCE((SELECT depth FROM st), 0) AS depth,
+           COALESCE((SELECT pos_x FROM st), 0) AS x,
+           COALESCE((SELECT pos_y FROM st), 0) AS y
+)
+SELECT pos.depth, pos.x, pos.y,
+       COALESCE((SELECT energy FROM st), 0) AS energy,
+       COALESCE((SELECT energy_updated_at FROM st), 0) AS energy_updated_at,
+       COALESCE((SELECT seed FROM mining_world WHERE guild_id = $2), $2) AS seed,
+       (SELECT jsonb_object_agg(item_name, quantity) FROM mining_inventory
+         WHERE user_id = $1 AND guild_id = $2) AS inventory,
+       (SELECT jsonb_object_agg(slot, item_name) FROM mining_equipment
+         WHERE user_id = $1 AND guild_id = $2) AS equipment,
+       (SELECT jsonb_object_agg(item_name, durability) FROM mining_gear_wear
+         WHERE user_id = $1 AND guild_id = $2) AS wear,
+       (SELECT jsonb_object_agg(branch, points) FROM player_skills
+         WHERE user_id = $3 AND guild_id = $2 AND points > 0) AS skills,
+       CASE WHEN $4::int IS NULL THEN NULL ELSE (
+         SELECT jsonb_agg(jsonb_build_array(cx, cy, bits))
+         FROM mining_discovered_chunks
+         WHERE user_id = $1 AND guild_id = $2 AND z = pos.depth
+           AND cx BETWEEN (pos.x - $4) >> {shift} AND (pos.x + $4) >> {shift}
+           AND cy BETWEEN (pos.y - $4) >> {shift} AND (pos.y + $4) >> {shift}
+       ) END AS discovered
+FROM pos
+"""
+
+
+async def load_mining_player_state(
+    user_id: int,
+    guild_id: int,
+    *,
+    window: int | None = None,
+    for_update: bool = False,
+    conn: asyncpg.Connection | None = None,
+) -> MiningPlayerState:
+    """Read a player's whole mining state in ONE round-trip.
+
+    *window* also loads the fog of war: the visited cells within that
+    half-width of the stored position, at the stored depth.  *for_update*
+    locks the ``mining_player_state`` row (``FOR UPDATE``) — pass it with the
+    workflow's transaction *conn* when the action then writes energy or
+    position from what it read, so a double-clicked button serialises instead
+    of spending the same energy twice.  A locked load first inserts the
+    player's default row (``ON CONFLICT DO NOTHING``) so even a first-ever
+    action has a row to lock: a racing first action waits on that insert and
+    then reads the committed state.  The defaults settle to the same state
+    the read reports for a player with no row.
+    """
+    if for_update:
+        await pool.execute(
+            """INSERT INTO mining_player_state (user_id, guild_id)
+               VALUES ($1, $2)
+               ON CONFLICT (user_id, guild_id) DO NOTHING""",
+            (str(user_id), guild_id),
+            conn=conn,
+        )
+    query = _STATE_SQL.format(
+        lock=" FOR UPDATE" if for_update else "",
+        shift=_CHUNK_SHIFT,
+    )
+    row = await pool.fetchone(
+        query,
+        (str(user_id), guild_id, user_id, window),
+        conn=conn,
+    )
+    if row is None:  # pragma: no cover - `FROM pos` always yields one row
+        raise RuntimeError("mining player-state query returned no row")
+    x, y = row["x"], row["y"]
+    discovered: frozenset[tuple[int, int]] = frozenset()
+    if window is not None and row["discovered"]:
+        discovered = frozenset(
+            cells_in_box(
+                (tuple(chunk) for chunk in row["discovered"]),
+                x - window,
+                x + window,
+                y - window,
+                y + window,
+            ),
+        )
+    return MiningPlayerState(
+        x=x,
+        y=y,
+        depth=row["depth"],
+        energy=row["energy"],
+        energy_updated_at=row["energy_updated_at"],
+        seed=row["seed"],
+        inventory=row["inventory"] or {},
+        equipment=row["equipment"] or {},
+        wear=row["wear"] or {},
+        skills=row["skills"] or {},
+        discovered=discovered,
+    )
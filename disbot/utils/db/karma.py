@@ -73,6 +73,7 @@ async def top_karma(
         "LIMIT $2",
         (guild_id, limit),
         conn=conn,
+        read_only=True,
     )
     return [dict(r) for r in rows]
 
@@ -1,6 +1,7 @@
 """Schema bootstrap and migration runner.
 
-Runs at startup from :func:`utils.db.pool.init`.  Three steps:
+Runs at startup from :func:`utils.db.pool.init` via :func:`bootstrap`.
+Three steps:
 
   1. ``ensure_migrations_table``  — creates ``schema_migrations`` if absent
   2. ``create_tables``            — idempotent CREATE TABLE IF NOT EXISTS
@@ -8,6 +9,13 @@ Runs at startup from :func:`utils.db.pool.init`.  Three steps:
      ``disbot/migrations/`` that has not been recorded yet, under a
      Postgres advisory lock so concurrent bot instances cannot race.
 
+Fast path: :func:`schema_fingerprint` hashes the bootstrap DDL plus every
+migration file (name + content).  Once a full pass has applied them the hash
+is recorded in ``schema_fingerprints`` (migration 109), and a later boot whose
+hash is already there skips all three steps — one indexed read instead of
+the DDL walk.  The check is repeated after taking the advisory lock, so of
+two replicas booting together only one runs the DDL phase.
+
 Responsibility split — this module owns two DIFFERENT things; do not
 let them blur:
 
@@ -30,11 +38,15 @@ migrations are never edited; new schema changes ship as new files.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import re
 import time
 from collections.abc import Iterable
+from typing import Any
+
+import asyncpg
 
 from utils.db import pool
 
@@ -133,8 +145,8 @@ async def list_public_tables() -> set[str]:
     return {r["tablename"] for r in rows}
 
 
-async def ensure_migrations_table() -> None:
-    await pool.get().execute(
+async def ensure_migrations_table(conn: asyncpg.Connection | None = None) -> None:
+    await (conn or pool.get()).execute(
         """CREATE TABLE IF NOT EXISTS schema_migrations (
             version     INTEGER PRIMARY KEY,
             applied_at  BIGINT  NOT NULL,
@@ -158,43 +170,7 @@ async def run_migrations() -> None:
     async with pool.get().acquire() as conn:
         await conn.execute("SELECT pg_advisory_lock($1)", _MIGRATION_ADVISORY_LOCK)
         try:
-            applied = {
-                r["version"]
-                for r in await conn.fetch(
-                    "SELECT version FROM schema_migrations ORDER BY version",
-                )
-            }
-            for version, filename in _ordered_migration_versions(
-                os.listdir(_MIGRATIONS_DIR),
-            ):
-                if version in applied:
-                    continue
-                path = os.path.join(_MIGRATIONS_DIR, filename)
-                with open(path, encoding="utf-8") as f:
-                    sql = f.read()
-                # Strip the validated "NNN_" prefix + ".sql" suffix for a human
-                # description (the old slice mishandled the zero-padded version
-                # and emitted e.g. "1 initial schema").
-                description = filename[4:].removesuffix(".sql").replace("_", " ")
-                try:
-                    async with conn.transaction():
-                        await conn.execute(sql)
-                        await conn.execute(
-                            "INSERT INTO schema_migrations "
-                            "(version, applied_at, description) VALUES ($1, $2, $3)",
-                            version,
-                            int(time.time()),
-                            description,
-                        )
-                    logger.info("Applied migration %03d: %s", version, description)
-                except Exception as exc:
-                    logger.error(
-                        "Migration %03d failed: %s",
-                        version,
-                        exc,
-                        exc_info=True,
-                    )
-                    raise
+            await _apply_pending(conn)
         finally:
             await conn.execute(
                 "SELECT pg_advisory_unlock($1)",
@@ -202,7 +178,259 @@ async def run_migrations() -> None:
             )
 
 
-async def create_tables() -> None:
+async def _apply_pending(conn: asyncpg.Connection) -> int:
+    """Apply every unrecorded migration on ``conn`` (lock already held).
+
+    Returns the number applied.
+    """
+    if not os.path.isdir(_MIGRATIONS_DIR):
+        return 0
+    applied = {
+        r["version"]
+        for r in await conn.fetch(
+            "SELECT version FROM schema_migrations ORDER BY version",
+        )
+    }
+    count = 0
+    for version, filename in _ordered_migration_versions(
+        os.listdir(_MIGRATIONS_DIR),
+    ):
+        if version in applied:
+            continue
+        path = os.path.join(_MIGRATIONS_DIR, filename)
+        with open(path, encoding="utf-8") as f:
+            sql = f.read()
+        # Strip the validated "NNN_" prefix + ".sql" suffix for a human
+        # description (the old slice mishandled the zero-padded version
+        # and emitted e.g. "1 initial schema").
+        description = filename[4:].removesuffix(".sql").replace("_", " ")
+        try:
+            async with conn.transaction():
+                await conn.execute(sql)
+                await conn.execute(
+                    "INSERT INTO schema_migrations "
+                    "(version, applied_at, description) VALUES ($1, $2, $3)",
+                    version,
+                    int(time.time()),
+                    description,
+                )
+            logger.info("Applied migration %03d: %s", version, description)
+            count += 1
+        except Exception as exc:
+            logger.error(
+                "Migration %03d failed: %s",
+                version,
+                exc,
+                exc_info=True,
+            )
+            raise
+    return count
+
+
+def schema_fingerprint() -> str:
+    """Hash of the bootstrap DDL + every migration file (name and content).
+
+    Any edit, addition or rename in ``disbot/migrations/`` — or to the frozen
+    bootstrap DDL — changes it.  Validates the directory on the way
+    (:class:`MigrationError`), exactly as :func:`run_migrations` would.
+    """
+    digest = hashlib.sha256()
+    for stmt in _BOOTSTRAP_DDL:
+        digest.update(stmt.encode() + b"\0")
+    if os.path.isdir(_MIGRATIONS_DIR):
+        for _, filename in _ordered_migration_versions(os.listdir(_MIGRATIONS_DIR)):
+            digest.update(filename.encode() + b"\0")
+            with open(os.path.join(_MIGRATIONS_DIR, filename), "rb") as f:
+                digest.update(f.read() + b"\0")
+    return digest.hexdigest()
+
+
+async def _fingerprint_recorded(conn: asyncpg.Connection, fingerprint: str) -> bool:
+    try:
+        return bool(
+            await conn.fetchval(
+                "SELECT EXISTS "
+                "(SELECT 1 FROM schema_fingerprints WHERE fingerprint=$1)",
+                fingerprint,
+            ),
+        )
+    except asyncpg.UndefinedTableError:  # before migration 109
+        return False
+
+
+def _ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+async def bootstrap(timings: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Bring the schema up to date, skipping the DDL phase when it already is.
+
+    Returns the startup-phase breakdown — ``fast_path``, ``applied`` and the
+    per-step ``*_ms`` durations — filling ``timings`` in place as it goes, so
+    a caller still sees the partial breakdown if a step raises.
+    """
+    out = timings if timings is not None else {}
+    started = time.perf_counter()
+    fingerprint = schema_fingerprint()
+    out["fingerprint"] = fingerprint[:12]
+    out["fingerprint_ms"] = _ms(started)
+    out["applied"] = 0
+    async with pool.get().acquire() as conn:
+        step = time.perf_counter()
+        out["fast_path"] = await _fingerprint_recorded(conn, fingerprint)
+        out["check_ms"] = _ms(step)
+        if not out["fast_path"]:
+            step = time.perf_counter()
+            await conn.execute("SELECT pg_advisory_lock($1)", _MIGRATION_ADVISORY_LOCK)
+            out["lock_wait_ms"] = _ms(step)
+            try:
+                # Another replica may have finished the pass while we waited.
+                out["fast_path"] = await _fingerprint_recorded(conn, fingerprint)
+                if not out["fast_path"]:
+                    step = time.perf_counter()
+                    await ensure_migrations_table(conn)
+                    await create_tables(conn)
+                    out["bootstrap_ddl_ms"] = _ms(step)
+                    step = time.perf_counter()
+                    out["applied"] = await _apply_pending(conn)
+                    out["migrations_ms"] = _ms(step)
+                    await conn.execute(
+                        "INSERT INTO schema_fingerprints (fingerprint, applied_at) "
+                        "VALUES ($1, $2) ON CONFLICT (fingerprint) DO NOTHING",
+                        fingerprint,
+                        int(time.time()),
+                    )
+            finally:
+                await conn.execute(
+                    "SELECT pg_advisory_unlock($1)",
+                    _MIGRATION_ADVISORY_LOCK,
+                )
+    out["total_ms"] = _ms(started)
+    logger.info(
+        "Schema bootstrap: %s",
+        ", ".join(f"{k}={v}" for k, v in out.items()),
+    )
+    return out
+
+
+# The frozen pre-migration-001 schema (see the module docstring); also an
+# input to :func:`schema_fingerprint`.
+_BOOTSTRAP_DDL: tuple[str, ...] = (
+    """CREATE TABLE IF NOT EXISTS economy (
+        user_id      BIGINT  NOT NULL,
+        guild_id     BIGINT  NOT NULL,
+        last_daily   BIGINT  NOT NULL DEFAULT 0,
+        daily_streak INTEGER NOT NULL DEFAULT 0,
+        daily_count  INTEGER NOT NULL DEFAULT 0,
+        last_worked  BIGINT  NOT NULL DEFAULT 0,
+        PRIMARY KEY (user_id, guild_id)
+    )""",
+    """CREATE TABLE IF NOT EXISTS job_progress (
+        user_id      BIGINT  NOT NULL,
+        guild_id     BIGINT  NOT NULL,
+        job_name     TEXT    NOT NULL,
+        times_worked INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (user_id, guild_id, job_name)
+    )""",
+    """CREATE TABLE IF NOT EXISTS inventory (
+        user_id   BIGINT  NOT NULL,
+        guild_id  BIGINT  NOT NULL,
+        item_name TEXT    NOT NULL,
+        quantity  INTEGER NOT NULL DEFAULT 1,
+        PRIMARY KEY (user_id, guild_id, item_name)
+    )""",
+    """CREATE TABLE IF NOT EXISTS xp (
+        user_id  BIGINT  NOT NULL,
+        guild_id BIGINT  NOT NULL,
+        xp       BIGINT  NOT NULL DEFAULT 0,
+        level    INTEGER NOT NULL DEFAULT 0,
+        messages BIGINT  NOT NULL DEFAULT 0,
+        last_xp  BIGINT  NOT NULL DEFAULT 0,
+        coins    BIGINT  NOT NULL DEFAULT 0,
+        PRIMARY KEY (user_id, guild_id)
+    )""",
+    """CREATE TABLE IF NOT EXISTS warnings (
+        user_id  BIGINT  NOT NULL,
+        guild_id BIGINT  NOT NULL,
+        count    INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (user_id, guild_id)
+    )""",
+    """CREATE TABLE IF NOT EXISTS mod_logs (
+        id           BIGINT  GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+        timestamp    TEXT    NOT NULL,
+        guild_id     BIGINT  NOT NULL,
+        action       TEXT    NOT NULL,
+        target_id    BIGINT  NOT NULL,
+        moderator_id BIGINT  NOT NULL,
+        reason       TEXT    NOT NULL DEFAULT 'No reason provided'
+    )""",
+    """CREATE TABLE IF NOT EXISTS role_thresholds (
+        guild_id      BIGINT  NOT NULL,
+        role_name     TEXT    NOT NULL,
+        days_required INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (guild_id, role_name)
+    )""",
+    """CREATE TABLE IF NOT EXISTS guild_settings (
+        guild_id BIGINT NOT NULL,
+        key      TEXT   NOT NULL,
+        value    TEXT   NOT NULL,
+        PRIMARY KEY (guild_id, key)
+    )""",
+    """CREATE TABLE IF NOT EXISTS logs (
+        id        BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+        timestamp TEXT   NOT NULL,
+        level     TEXT   NOT NULL,
+        message   TEXT   NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS reaction_roles (
+        guild_id   BIGINT NOT NULL,
+        message_id BIGINT NOT NULL,
+        emoji      TEXT   NOT NULL,
+        role_id    BIGINT NOT NULL,
+        PRIMARY KEY (guild_id, message_id, emoji)
+    )""",
+    """CREATE TABLE IF NOT EXISTS rps_players (
+        user_id BIGINT PRIMARY KEY,
+        name    TEXT    NOT NULL,
+        wins    INTEGER NOT NULL DEFAULT 0,
+        losses  INTEGER NOT NULL DEFAULT 0,
+        ties    INTEGER NOT NULL DEFAULT 0
+    )""",
+    # PR C1 — ``rps_matches`` removed.  It was created here for an
+    # unshipped match-history feature and had zero CRUD callers.
+    # Migration 019 drops the table on existing deploys; fresh
+    # installs never create it.
+    """CREATE TABLE IF NOT EXISTS mining_inventory (
+        user_id   TEXT    NOT NULL,
+        item_name TEXT    NOT NULL,
+        quantity  INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (user_id, item_name)
+    )""",
+    """CREATE TABLE IF NOT EXISTS prohibited_words (
+        guild_id BIGINT NOT NULL,
+        word     TEXT   NOT NULL,
+        PRIMARY KEY (guild_id, word)
+    )""",
+    """CREATE TABLE IF NOT EXISTS deathmatch_stats (
+        user_id BIGINT  PRIMARY KEY,
+        wins    INTEGER NOT NULL DEFAULT 0,
+        losses  INTEGER NOT NULL DEFAULT 0
+    )""",
+    """CREATE TABLE IF NOT EXISTS chain_channels (
+        channel_id BIGINT PRIMARY KEY,
+        guild_id   BIGINT NOT NULL,
+        word       TEXT   NOT NULL DEFAULT '',
+        word_limit INTEGER NOT NULL DEFAULT 0,
+        chain_count INTEGER NOT NULL DEFAULT 0
+    )""",
+    """CREATE TABLE IF NOT EXISTS counting_state (
+        guild_id BIGINT PRIMARY KEY,
+        state    JSONB  NOT NULL DEFAULT '{}'
+    )""",
+)
+
+
+async def create_tables(conn: asyncpg.Connection | None = None) -> None:
     """Idempotent CREATE TABLE IF NOT EXISTS pass for the pre-migration schema.
 
     The original schema (everything before migration 001) is reproduced
@@ -213,120 +441,10 @@ async def create_tables() -> None:
     add new DDL here; every schema change (including to these tables)
     ships as a new ``disbot/migrations/NNN_*.sql`` file.
     """
-    p = pool.get()
-    statements = [
-        """CREATE TABLE IF NOT EXISTS economy (
-            user_id      BIGINT  NOT NULL,
-            guild_id     BIGINT  NOT NULL,
-            last_daily   BIGINT  NOT NULL DEFAULT 0,
-            daily_streak INTEGER NOT NULL DEFAULT 0,
-            daily_count  INTEGER NOT NULL DEFAULT 0,
-            last_worked  BIGINT  NOT NULL DEFAULT 0,
-            PRIMARY KEY (user_id, guild_id)
-        )""",
-        """CREATE TABLE IF NOT EXISTS job_progress (
-            user_id      BIGINT  NOT NULL,
-            guild_id     BIGINT  NOT NULL,
-            job_name     TEXT    NOT NULL,
-            times_worked INTEGER NOT NULL DEFAULT 0,
-            PRIMARY KEY (user_id, guild_id, job_name)
-        )""",
-        """CREATE TABLE IF NOT EXISTS inventory (
-            user_id   BIGINT  NOT NULL,
-            guild_id  BIGINT  NOT NULL,
-            item_name TEXT    NOT NULL,
-            quantity  INTEGER NOT NULL DEFAULT 1,
-            PRIMARY KEY (user_id, guild_id, item_name)
-        )""",
-        """CREATE TABLE IF NOT EXISTS xp (
-            user_id  BIGINT  NOT NULL,
-            guild_id BIGINT  NOT NULL,
-            xp       BIGINT  NOT NULL DEFAULT 0,
-            level    INTEGER NOT NULL DEFAULT 0,
-            messages BIGINT  NOT NULL DEFAULT 0,
-            last_xp  BIGINT  NOT NULL DEFAULT 0,
-            coins    BIGINT  NOT NULL DEFAULT 0,
-            PRIMARY KEY (user_id, guild_id)
-        )""",
-        """CREATE TABLE IF NOT EXISTS warnings (
-            user_id  BIGINT  NOT NULL,
-            guild_id BIGINT  NOT NULL,
-            count    INTEGER NOT NULL DEFAULT 0,
-            PRIMARY KEY (user_id, guild_id)
-        )""",
-        """CREATE TABLE IF NOT EXISTS mod_logs (
-            id           BIGINT  GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
-            timestamp    TEXT    NOT NULL,
-            guild_id     BIGINT  NOT NULL,
-            action       TEXT    NOT NULL,
-            target_id    BIGINT  NOT NULL,
-            moderator_id BIGINT  NOT NULL,
-            reason       TEXT    NOT NULL DEFAULT 'No reason provided'
-        )""",
-        """CREATE TABLE IF NOT EXISTS role_thresholds (
-            guild_id      BIGINT  NOT NULL,
-            role_name     TEXT    NOT NULL,
-            days_required INTEGER NOT NULL DEFAULT 0,
-            PRIMARY KEY (guild_id, role_name)
-        )""",
-        """CREATE TABLE IF NOT EXISTS guild_settings (
-            guild_id BIGINT NOT NULL,
-            key      TEXT   NOT NULL,
-            value    TEXT   NOT NULL,
-            PRIMARY KEY (guild_id, key)
-        )""",
-        """CREATE TABLE IF NOT EXISTS logs (
-            id        BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
-            timestamp TEXT   NOT NULL,
-            level     TEXT   NOT NULL,
-            message   TEXT   NOT NULL
-        )""",
-        """CREATE TABLE IF NOT EXISTS reaction_roles (
-            guild_id   BIGINT NOT NULL,
-            message_id BIGINT NOT NULL,
-            emoji      TEXT   NOT NULL,
-            role_id    BIGINT NOT NULL,
-            PRIMARY KEY (guild_id, message_id, emoji)
-        )""",
-        """CREATE TABLE IF NOT EXISTS rps_players (
-            user_id BIGINT PRIMARY KEY,
-            name    TEXT    NOT NULL,
-            wins    INTEGER NOT NULL DEFAULT 0,
-            losses  INTEGER NOT NULL DEFAULT 0,
-            ties    INTEGER NOT NULL DEFAULT 0
-        )""",
-        # PR C1 — ``rps_matches`` removed.  It was created here for an
-        # unshipped match-history feature and had zero CRUD callers.
-        # Migration 019 drops the table on existing deploys; fresh
-        # installs never create it.
-        """CREATE TABLE IF NOT EXISTS mining_inventory (
-            user_id   TEXT    NOT NULL,
-            item_name TEXT    NOT NULL,
-            quantity  INTEGER NOT NULL DEFAULT 0,
-            PRIMARY KEY (user_id, item_name)
-        )""",
-        """CREATE TABLE IF NOT EXISTS prohibited_words (
-            guild_id BIGINT NOT NULL,
-            word     TEXT   NOT NULL,
-            PRIMARY KEY (guild_id, word)
-        )""",
-        """CREATE TABLE IF NOT EXISTS deathmatch_stats (
-            user_id BIGINT  PRIMARY KEY,
-            wins    INTEGER NOT NULL DEFAULT 0,
-            losses  INTEGER NOT NULL DEFAULT 0
-        )""",
-        """CREATE TABLE IF NOT EXISTS chain_channels (
-            channel_id BIGINT PRIMARY KEY,
-            guild_id   BIGINT NOT NULL,
-            word       TEXT   NOT NULL DEFAULT '',
-            word_limit INTEGER NOT NULL DEFAULT 0,
-            chain_count INTEGER NOT NULL DEFAULT 0
-        )""",
-        """CREATE TABLE IF NOT EXISTS counting_state (
-            guild_id BIGINT PRIMARY KEY,
-            state    JSONB  NOT NULL DEFAULT '{}'
-        )""",
-    ]
-    async with p.acquire() as conn:
-        for stmt in statements:
+    if conn is not None:
+        for stmt in _BOOTSTRAP_DDL:
             await conn.execute(stmt)
+        return
+    async with pool.get().acquire() as acquired:
+        for stmt in _BOOTSTRAP_DDL:
+            await acquired.execute(stmt)
@@ -8,12 +8,32 @@ into the global pool directly — that indirection lets tests monkeypatch
 
 Lifecycle:
     - :func:`init` is called once from ``bot1.main()`` before any cog
-      loads.  It creates the pool, runs ``_ensure_migrations_table``,
-      ``_create_tables``, and ``_run_migrations`` from
-      :mod:`utils.db.migrations`.
+      loads.  It creates the pools and runs
+      :func:`utils.db.migrations.bootstrap` (bootstrap DDL + migrations,
+      skipped when the schema fingerprint is already recorded), recording
+      its timing breakdown as the ``db_schema`` startup phase.
     - :func:`close` is called on graceful shutdown.
     - :func:`get` raises if init has not run yet — production code
       should never see that error; tests must call init or monkeypatch.
+
+Lanes — named pools so a slow report cannot starve message handling:
+    - ``primary`` — the main pool (:func:`get`); every call by default.
+    - ``hot`` — a small pool on the same database whose connections are
+      all held open and reserved for latency-sensitive per-message writes
+      (XP, counting).  ``lane="hot"``.
+    - ``replica`` — an optional pool on ``DATABASE_REPLICA_URL`` for
+      analytical reads (leaderboards, economy flow).  ``read_only=True``
+      (or ``lane="replica"``) routes there, falling back to the primary
+      when no replica is configured.
+
+    Read-your-writes: a task that wrote through this module in the last
+    :data:`READ_YOUR_WRITES_SECONDS` has its ``read_only`` reads served by
+    the primary instead of a possibly-lagging replica.  The marker is a
+    context variable, so it follows one command / interaction / message
+    task (and tasks it spawns), not unrelated work.  Raw ``get()`` /
+    ``lane_pool()`` callers that write can call :func:`mark_write`.
+
+    Each lane reports ``db_pool_acquire_seconds`` and ``db_pool_saturation``.
 """
 
 from __future__ import annotations
@@ -22,8 +42,10 @@ import logging
 import os
 import re
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any
 
 import asyncpg
 
@@ -36,6 +58,25 @@ logger = logging.getLogger("bot.db.pool")
 # Module-level singleton.  Tests may swap this via monkeypatch.
 _pool: asyncpg.Pool | None = None
 
+LANE_PRIMARY = "primary"
+LANE_HOT = "hot"
+LANE_REPLICA = "replica"
+LANES = (LANE_PRIMARY, LANE_HOT, LANE_REPLICA)
+
+_PRIMARY_MIN_SIZE, _PRIMARY_MAX_SIZE = 2, 10
+# Hot lane: min == max, so every reserved connection stays open.
+_HOT_SIZE = 3
+_REPLICA_MIN_SIZE, _REPLICA_MAX_SIZE = 1, 5
+
+# The non-primary lane pools (absent → the lane falls back to the primary).
+_lanes: dict[str, asyncpg.Pool] = {}
+
+# How long after a write the same context keeps reading from the primary.
+READ_YOUR_WRITES_SECONDS = 5.0
+_last_write: ContextVar[float | None] = ContextVar("db_last_write", default=None)
+# Statements that write (INSERT … RETURNING through fetchone, etc.).
+_WRITE_RE = re.compile(r"\b(?:insert|update|delete|merge)\b", re.IGNORECASE)
+
 
 def _get_dsn() -> str:
     if dsn := os.environ.get("DATABASE_URL"):
@@ -46,32 +87,60 @@ def _get_dsn() -> str:
     )
 
 
+def _get_replica_dsn() -> str:
+    return os.environ.get("DATABASE_REPLICA_URL", "")
+
+
 async def init() -> None:
-    """Create the pool and run migrations.
+    """Create the lane pools and bring the schema up to date (on the primary).
 
     Imports the migration runner lazily to keep this module free of
     cross-module dependencies at module-load time (migrations.py imports
-    from this module to use ``get``).
+    from this module to use ``get``).  A replica that cannot be reached
+    is logged and skipped — its reads fall back to the primary.
     """
     global _pool
     dsn = _get_dsn()
     _pool = await asyncpg.create_pool(
         dsn,
-        min_size=2,
-        max_size=10,
+        min_size=_PRIMARY_MIN_SIZE,
+        max_size=_PRIMARY_MAX_SIZE,
+        init=init_connection,
+    )
+    _lanes[LANE_HOT] = await asyncpg.create_pool(
+        dsn,
+        min_size=_HOT_SIZE,
+        max_size=_HOT_SIZE,
         init=init_connection,
     )
+    if replica_dsn := _get_replica_dsn():
+        try:
+            _lanes[LANE_REPLICA] = await asyncpg.create_pool(
+                replica_dsn,
+                min_size=_REPLICA_MIN_SIZE,
+                max_size=_REPLICA_MAX_SIZE,
+                init=init_connection,
+            )
+            logger.info("Read replica pool ready (%s)", replica_dsn.split("@")[-1])
+        except (OSError, asyncpg.PostgresError):
+            logger.warning(
+                "Read replica unreachable — replica reads use the primary",
+                exc_info=True,
+            )
     # Lazy import — avoids circular dependency at module load.
+    from core.runtime import startup_outcome
     from utils.db import migrations
 
-    await migrations.ensure_migrations_table()
-    await migrations.create_tables()
-    await migrations.run_migrations()
+    breakdown: dict[str, Any] = {}
+    with startup_outcome.record_phase("db_schema", metadata=breakdown):
+        await migrations.bootstrap(breakdown)
     logger.info("PostgreSQL pool initialised (%s)", dsn.split("@")[-1])
 
 
 async def close() -> None:
     global _pool
+    for lane in list(_lanes):
+        await _lanes.pop(lane).close()
     if _pool:
         await _pool.close()
         _pool = None
@@ -84,6 +153,58 @@ def get() -> asyncpg.Pool:
     return _pool
 
 
+def mark_write() -> None:
+    """Note that the current context just wrote (see read-your-writes)."""
+    _last_write.set(time.monotonic())
+
+
+def _wrote_recently() -> bool:
+    last = _last_write.get()
+    return last is not None and time.monotonic() - last < READ_YOUR_WRITES_SECONDS
+
+
+def _route(lane: str | None, read_only: bool) -> tuple[str, Any]:
+    """Resolve ``(lane, pool)`` for one call.
+
+    ``lane`` wins over ``read_only``; a replica read right after a write in
+    the same context, or a lane with no pool, goes to the primary.
+    """
+    if lane is None:
+        lane = LANE_REPLICA if read_only else LANE_PRIMARY
+    elif lane not in LANES:
+        raise ValueError(f"unknown pool lane {lane!r}; expected one of {LANES}")
+    if lane == LANE_REPLICA and _wrote_recently():
+        lane = LANE_PRIMARY
+    target = _lanes.get(lane)
+    if target is None:
+        return LANE_PRIMARY, get()
+    return lane, target
+
+
+def lane_pool(lane: str) -> asyncpg.Pool:
+    """The pool serving ``lane`` (the primary when that lane has none).
+
+    For callers that need a raw pool method (``fetchval``, ``fetchrow``
+    with positional args) on a lane.  Replica reads still honour
+    read-your-writes.
+    """
+    return _route(lane, lane == LANE_REPLICA)[1]
+
+
+def lane_stats() -> dict[str, dict[str, int]]:
+    """``{lane: {"size", "idle", "max"}}`` for every open lane pool."""
+    pools = {LANE_PRIMARY: _pool, **_lanes}
+    return {
+        lane: {
+            "size": p.get_size(),
+            "idle": p.get_idle_size(),
+            "max": p.get_max_size(),
+        }
+        for lane, p in pools.items()
+        if p is not None
+    }
+
+
 # ---------------------------------------------------------------------------
 # Generic CRUD primitives — preserved verbatim from the pre-split db.py.
 # Submodules call these via `from utils.db import pool` + ``pool.fetchone(...)``
@@ -93,8 +214,29 @@ def get() -> asyncpg.Pool:
 # !platform metrics surface + Prometheus can highlight slow queries by
 # (op, table) without retrofitting timing into every CRUD module.
 # Phase S3.2: also records slow paths via core.runtime.slow_path_log.
+# Each call is also handed to the registered query observers — the seam
+# core.runtime.query_profiler attaches to at startup (per-statement
+# fingerprint stats + a sampled EXPLAIN for slow shapes), so this module
+# never imports the profiler.
 # ---------------------------------------------------------------------------
 
+#: ``observer(query, params, elapsed_ms, rows)`` — called after every primitive.
+QueryObserver = Callable[[str, tuple, float, int], None]
+_query_observers: list[QueryObserver] = []
+
+
+def add_query_observer(observer: QueryObserver) -> None:
+    """Call ``observer`` after every primitive.  Idempotent."""
+    if observer not in _query_observers:
+        _query_observers.append(observer)
+
+
+def remove_query_observer(observer: QueryObserver) -> None:
+    """Stop calling ``observer``.  No-op if it was not registered."""
+    if observer in _query_observers:
+        _query_observers.remove(observer)
+
+
 # Low-cardinality query label.  Matches the first table name after the
 # operation keyword in SELECT/INSERT/UPDATE/DELETE statements; falls back
 # to "unknown" so a malformed query produces a single label, not a unique
@@ -114,22 +256,79 @@ def _query_label(query: str) -> str:
     return f"{op}:{table}"
 
 
+def _status_rows(status: str) -> int:
+    """Row count from an asyncpg command status (``"UPDATE 3"`` → 3)."""
+    if not isinstance(status, str):
+        return 0
+    tail = status.rsplit(" ", 1)[-1]
+    return int(tail) if tail.isdigit() else 0
+
+
+async def _run(
+    target: Any,
+    lane: str,
+    method: str,
+    query: str,
+    params: tuple,
+) -> Any:
+    """Run ``method`` on ``target``, timing the acquire for a real pool.
+
+    Connections and test doubles are called directly (as the pool's own
+    ``fetchrow`` etc. would after acquiring).
+    """
+    if not isinstance(target, asyncpg.Pool):
+        return await getattr(target, method)(query, *params)
+    start = time.monotonic()
+    async with target.acquire() as conn:
+        _metrics.db_pool_acquire_seconds.labels(lane=lane).observe(
+            time.monotonic() - start,
+        )
+        in_use = target.get_size() - target.get_idle_size()
+        _metrics.db_pool_saturation.labels(lane=lane).observe(
+            in_use / max(target.get_max_size(), 1),
+        )
+        return await getattr(conn, method)(query, *params)
+
+
+def _observe(query: str, params: tuple, elapsed: float, rows: int) -> None:
+    label = _query_label(query)
+    _metrics.db_query_seconds.labels(query_name=label).observe(elapsed)
+    _slow.maybe_record("db_query", label, elapsed * 1000)
+    for observer in _query_observers:
+        try:
+            observer(query, params, elapsed * 1000, rows)
+        except Exception:
+            logger.exception("db query observer %r failed", observer)
+
+
+def _target(
+    conn: asyncpg.Connection | None,
+    lane: str | None,
+    read_only: bool,
+) -> tuple[str, Any]:
+    if conn is not None:
+        return LANE_PRIMARY, conn
+    return _route(lane, read_only)
+
+
 async def fetchone(
     query: str,
     params: tuple = (),
     *,
     conn: asyncpg.Connection | None = None,
+    lane: str | None = None,
+    read_only: bool = False,
 ) -> dict | None:
     start = time.monotonic()
+    row = None
     try:
-        target = conn if conn is not None else get()
-        row = await target.fetchrow(query, *params)
+        name, target = _target(conn, lane, read_only)
+        row = await _run(target, name, "fetchrow", query, params)
         return dict(row) if row else None
     finally:
-        elapsed = time.monotonic() - start
-        label = _query_label(query)
-        _metrics.db_query_seconds.labels(query_name=label).observe(elapsed)
-        _slow.maybe_record("db_query", label, elapsed * 1000)
+        if not read_only and _WRITE_RE.search(query):
+            mark_write()
+        _observe(query, params, time.monotonic() - start, 1 if row else 0)
 
 
 async def fetchall(
@@ -137,17 +336,19 @@ async def fetchall(
     params: tuple = (),
     *,
     conn: asyncpg.Connection | None = None,
+    lane: str | None = None,
+    read_only: bool = False,
 ) -> list[dict]:
     start = time.monotonic()
+    rows: list = []
     try:
-        target = conn if conn is not None else get()
-        rows = await target.fetch(query, *params)
+        name, target = _target(conn, lane, read_only)
+        rows = await _run(target, name, "fetch", query, params)
         return [dict(r) for r in rows]
     finally:
-        elapsed = time.monotonic() - start
-        label = _query_label(query)
-        _metrics.db_query_seconds.labels(query_name=label).observe(elapsed)
-        _slow.maybe_record("db_query", label, elapsed * 1000)
+        if not read_only and _WRITE_RE.search(query):
+            mark_write()
+        _observe(query, params, time.monotonic() - start, len(rows))
 
 
 async def execute(
@@ -155,16 +356,34 @@ async def execute(
     params: tuple = (),
     *,
     conn: asyncpg.Connection | None = None,
+    lane: str | None = None,
 ) -> None:
+    """Run a statement; ``lane`` may be ``"primary"`` or ``"hot"``."""
+    if lane == LANE_REPLICA:
+        raise ValueError("execute() cannot run on the read-only replica lane")
     start = time.monotonic()
+    status = ""
+    try:
+        name, target = _target(conn, lane, False)
+        status = await _run(target, name, "execute", query, params)
+    finally:
+        mark_write()
+        _observe(query, params, time.monotonic() - start, _status_rows(status))
+
+
+@asynccontextmanager
+async def dedicated_connection() -> AsyncIterator[asyncpg.Connection]:
+    """A short-lived connection opened outside the pool (same DSN + codecs).
+
+    For diagnostics that must not take a pool slot from live traffic (the
+    query profiler's plan capture).  Closed on exit.
+    """
+    conn = await asyncpg.connect(_get_dsn())
     try:
-        target = conn if conn is not None else get()
-        await target.execute(query, *params)
+        await init_connection(conn)
+        yield conn
     finally:
-        elapsed = time.monotonic() - start
-        label = _query_label(query)
-        _metrics.db_query_seconds.labels(query_name=label).observe(elapsed)
-        _slow.maybe_record("db_query", label, elapsed * 1000)
+        await conn.close()
 
 
 @asynccontextmanager
@@ -178,5 +397,15 @@ async def transaction() -> AsyncIterator[asyncpg.Connection]:
     inside it (the ``economy_service.transfer`` precedent).
     """
     p = get()
-    async with p.acquire() as conn, conn.transaction():
-        yield conn
+    try:
+        async with p.acquire() as conn, conn.transaction():
+            yield conn
+    finally:
+        mark_write()
+
+
+def _reset_for_tests() -> None:
+    """Forget lanes, query observers and the write marker (pools not closed)."""
+    _lanes.clear()
+    _query_observers.clear()
+    _last_write.set(None)
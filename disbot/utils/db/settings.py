@@ -7,6 +7,8 @@ drift.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from utils.db import pool
 
 # Canonical global-scope sentinel. A row at ``guild_id = 0`` is the
@@ -26,6 +28,25 @@ async def get_setting(guild_id: int, key: str, default: str = "") -> str:
     return row["value"] if row else default
 
 
+async def get_settings_for_guilds(
+    guild_ids: Sequence[int],
+) -> dict[int, dict[str, str]]:
+    """Every KV row for ``guild_ids`` in one query, as ``{guild_id: {key: value}}``.
+
+    Guilds without rows map to ``{}`` so callers can treat absence as a
+    cached "unset" rather than a reason to re-query.
+    """
+    out: dict[int, dict[str, str]] = {gid: {} for gid in guild_ids}
+    rows = await pool.fetchall(
+        "SELECT guild_id, key, value FROM guild_settings "
+        "WHERE guild_id = ANY($1::bigint[])",
+        (list(guild_ids),),
+    )
+    for row in rows:
+        out.setdefault(row["guild_id"], {})[row["key"]] = row["value"]
+    return out
+
+
 async def set_setting(guild_id: int, key: str, value: str) -> None:
     await pool.execute(
         """INSERT INTO guild_settings (guild_id, key, value) VALUES ($1, $2, $3)
@@ -1,6 +1,8 @@
 """Support-ticket CRUD — the ``ticket`` subsystem's data primitives.
 
-Migration 098 (``ticket_config`` / ``tickets`` / ``ticket_blacklist``).
+Migration 098 (``ticket_config`` / ``tickets`` / ``ticket_blacklist``), 108
+(``ticket_transcript_lines`` — the incrementally recorded transcript) and 110
+(``ticket_transcript_attachments`` — attachment bytes archived as posted).
 
 Conn-aware (Q-0071 precedent): every write primitive takes an optional
 ``conn`` so :mod:`services.ticket_mutation` can compose reads + writes in one
@@ -13,6 +15,7 @@ submodule symbol flat, so names must be unique across the package.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 from utils.db import pool
@@ -194,6 +197,18 @@ async def ticket_list_open(
     )
 
 
+async def ticket_list_open_channels(
+    *,
+    conn: asyncpg.Connection | None = None,
+) -> list[tuple[int, int]]:
+    """``[(channel_id, ticket_id)]`` for every open ticket, across all guilds."""
+    rows = await pool.fetchall(
+        "SELECT channel_id, id FROM tickets WHERE status = 'open' AND channel_id <> 0",
+        conn=conn,
+    )
+    return [(int(r["channel_id"]), int(r["id"])) for r in rows]
+
+
 async def ticket_set_claim(
     ticket_id: int,
     claimed_by: int | None,
@@ -225,6 +240,161 @@ async def ticket_close(
     )
 
 
+# --------------------------------------------------------------------------- #
+# Transcript lines (migration 108)
+# --------------------------------------------------------------------------- #
+
+
+async def ticket_transcript_append(
+    ticket_id: int,
+    lines: Sequence[tuple[int, str]],
+    *,
+    conn: asyncpg.Connection | None = None,
+) -> None:
+    """Record ``[(message_id, line)]`` for a ticket in one statement.
+
+    Already-recorded message ids are skipped, so a backfill that overlaps the
+    live recording is harmless.
+    """
+    if not lines:
+        return
+    await pool.execute(
+        "INSERT INTO ticket_transcript_lines (ticket_id, message_id, line) "
+        "SELECT $1, m, l FROM unnest($2::bigint[], $3::text[]) AS u (m, l) "
+        "ON CONFLICT (ticket_id, message_id) DO NOTHING",
+        (ticket_id, [m for m, _ in lines], [line for _, line in lines]),
+        conn=conn,
+    )
+
+
+async def ticket_transcript_last_message_id(
+    ticket_id: int,
+    *,
+    conn: asyncpg.Connection | None = None,
+) -> int | None:
+    """The newest recorded message id for a ticket, or ``None`` if none yet."""
+    row = await pool.fetchone(
+        "SELECT MAX(message_id) AS last FROM ticket_transcript_lines "
+        "WHERE ticket_id = $1",
+        (ticket_id,),
+        conn=conn,
+    )
+    return int(row["last"]) if row and row["last"] is not None else None
+
+
+async def ticket_transcript_count(
+    ticket_id: int,
+    *,
+    conn: asyncpg.Connection | None = None,
+) -> int:
+    """How many transcript lines are recorded for a ticket."""
+    row = await pool.fetchone(
+        "SELECT COUNT(*) AS n FROM ticket_transcript_lines WHERE ticket_id = $1",
+        (ticket_id,),
+        conn=conn,
+    )
+    return int(row["n"]) if row else 0
+
+
+async def ticket_transcript_page(
+    ticket_id: int,
+    *,
+    after: int = 0,
+    limit: int,
+    conn: asyncpg.Connection | None = None,
+) -> list[tuple[int, str]]:
+    """Up to ``limit`` ``(message_id, line)`` rows recorded after message ``after``.
+
+    Oldest first.  Keyset-paged on the primary key, so reading a long
+    transcript page by page never holds more than one page.
+    """
+    rows = await pool.fetchall(
+        "SELECT message_id, line FROM ticket_transcript_lines "
+        "WHERE ticket_id = $1 AND message_id > $2 "
+        "ORDER BY message_id LIMIT $3",
+        (ticket_id, after, limit),
+        conn=conn,
+    )
+    return [(int(r["message_id"]), r["line"]) for r in rows]
+
+
+# --------------------------------------------------------------------------- #
+# Transcript attachments (migration 110)
+# --------------------------------------------------------------------------- #
+
+
+async def ticket_transcript_store_attachment(
+    ticket_id: int,
+    attachment_id: int,
+    entry: str,
+    data: bytes | None,
+    *,
+    note: str | None = None,
+    conn: asyncpg.Connection | None = None,
+) -> None:
+    """Archive one attachment's bytes (``None`` + ``note``: not kept, and why).
+
+    An attachment already archived is left as it is.
+    """
+    await pool.execute(
+        "INSERT INTO ticket_transcript_attachments "
+        "(ticket_id, attachment_id, entry, data, note) VALUES ($1, $2, $3, $4, $5) "
+        "ON CONFLICT (ticket_id, attachment_id) DO NOTHING",
+        (ticket_id, attachment_id, entry, data, note),
+        conn=conn,
+    )
+
+
+async def ticket_transcript_attachment_bytes(
+    ticket_id: int,
+    *,
+    conn: asyncpg.Connection | None = None,
+) -> int:
+    """Total bytes archived for a ticket's attachments so far."""
+    row = await pool.fetchone(
+        "SELECT COALESCE(SUM(octet_length(data)), 0) AS total "
+        "FROM ticket_transcript_attachments WHERE ticket_id = $1",
+        (ticket_id,),
+        conn=conn,
+    )
+    return int(row["total"]) if row else 0
+
+
+async def ticket_transcript_attachment_index(
+    ticket_id: int,
+    *,
+    conn: asyncpg.Connection | None = None,
+) -> list[dict[str, Any]]:
+    """Every archived attachment's ``attachment_id``/``entry``/``size``/``note``.
+
+    Oldest first, without the bytes (``size`` is ``None`` when none were kept);
+    read those one at a time with :func:`ticket_transcript_attachment_data`.
+    """
+    return await pool.fetchall(
+        "SELECT attachment_id, entry, octet_length(data) AS size, note "
+        "FROM ticket_transcript_attachments WHERE ticket_id = $1 "
+        "ORDER BY attachment_id",
+        (ticket_id,),
+        conn=conn,
+    )
+
+
+async def ticket_transcript_attachment_data(
+    ticket_id: int,
+    attachment_id: int,
+    *,
+    conn: asyncpg.Connection | None = None,
+) -> bytes | None:
+    """The archived bytes of one attachment, or ``None`` if none were kept."""
+    row = await pool.fetchone(
+        "SELECT data FROM ticket_transcript_attachments "
+        "WHERE ticket_id = $1 AND attachment_id = $2",
+        (ticket_id, attachment_id),
+        conn=conn,
+    )
+    return bytes(row["data"]) if row and row["data"] is not None else None
+
+
 # --------------------------------------------------------------------------- #
 # Blacklist
 # --------------------------------------------------------------------------- #
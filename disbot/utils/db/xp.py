@@ -70,9 +70,12 @@ async def add_xp(
     concurrent on_message handlers would otherwise hit.  Level is
     re-derived from the returned total and monotonically advanced (the
     second UPDATE only fires when the new level is higher, preventing
-    regression under any race).
+    regression under any race).  Runs on the reserved ``hot`` pool lane,
+    so a slow report on the primary never delays the per-message write;
+    both statements go through the pool helpers, so the lane's wait and
+    saturation metrics and the read-your-writes marker see them.
     """
-    row = await pool.get().fetchrow(
+    row = await pool.fetchone(
         """INSERT INTO xp (user_id, guild_id, xp, level, messages, last_xp)
            VALUES ($1, $2, $3, 0, 1, $4)
            ON CONFLICT (user_id, guild_id) DO UPDATE SET
@@ -80,19 +83,18 @@ async def add_xp(
                messages = xp.messages + 1,
                last_xp  = $4
            RETURNING xp, level""",
-        user_id,
-        guild_id,
-        amount,
-        now,
+        (user_id, guild_id, amount, now),
+        lane=pool.LANE_HOT,
     )
-    new_xp = row["xp"]
-    old_level = row["level"]
+    new_xp = row["xp"] if row else amount
+    old_level = row["level"] if row else 0
     new_level, _, _ = level_progress(new_xp)
     leveled_up = new_level > old_level
     if leveled_up:
         await pool.execute(
             "UPDATE xp SET level=$3 WHERE user_id=$1 AND guild_id=$2 AND level < $3",
             (user_id, guild_id, new_level),
+            lane=pool.LANE_HOT,
         )
     return new_xp, new_level, leveled_up
 
@@ -27,6 +27,7 @@ from __future__ import annotations
 import hashlib
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
+from functools import lru_cache
 
 
 @dataclass(frozen=True)
@@ -116,8 +117,13 @@ def _date_fraction(d: date) -> float:
     return value / float(1 << 64)
 
 
+@lru_cache(maxsize=8)
 def weather_for_date(d: date) -> Weather:
-    """The weather for calendar date *d* — deterministic, weighted by frequency."""
+    """The weather for calendar date *d* — deterministic, weighted by frequency.
+
+    Memoised: the answer is a pure function of the date, and every cast and
+    menu render on a given day asks for the same one.
+    """
     if _TOTAL_WEIGHT <= 0:
         return _NEUTRAL
     target = _date_fraction(d) * _TOTAL_WEIGHT
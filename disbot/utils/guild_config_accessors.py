@@ -32,8 +32,10 @@ accessors; later cogs add theirs here as they migrate off
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import itertools
+from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Generic, TypeVar
 
 from core.runtime import guild_config
@@ -212,45 +214,118 @@ def invalidate_role_exemptions(guild_id: int) -> None:
 # The SettingSpec lane stores typed scalars (int / str / bool / float)
 # in the legacy KV table.  Each SettingSpec declares a canonical
 # ``settings_key`` (from ``utils.settings_keys``); the resolver hands
-# that string in here.  Sharing one ``"setting:"`` cache namespace
-# keeps the per-key TypedAccessor proliferation manageable while the
-# F-1 invariant test still sees a single accessor owner.
+# that string in here.
 #
-# Only the read accessor lands here today; the SettingsMutationPipeline
-# (S4, not in this PR) will own the matching invalidation entry point.
+# Reads go through one whole-guild snapshot rather than a cache entry
+# per key: a policy load resolves ~20 keys, and per-key entries meant
+# one point query per key (plus a second for the global row on every
+# unset key) each time the TTL lapsed.  The snapshot holds every row for
+# the guild *and* every global row, loaded in a single query, so an
+# absent key is a cached "unset" too.
+#
+# Global rows are shared by every guild's snapshot.  A global write bumps
+# ``_GLOBAL_GENERATION``; a snapshot stamped with an older generation is
+# reloaded on its next read instead of fanning out an invalidation to
+# every cached guild.
+
+
+@dataclass(frozen=True)
+class GuildSettingsSnapshot:
+    """Every legacy-KV row for one guild plus the global rows.
+
+    ``version`` is unique per load (monotonic across the process), so a
+    derived object memoised against it is stale exactly when the
+    snapshot has been reloaded.
+    """
+
+    guild_id: int
+    version: int
+    values: Mapping[str, str]
+    global_values: Mapping[str, str]
+    global_generation: int
+
+    def value(self, settings_key: str) -> str:
+        """This guild's raw value, or ``""`` when no row exists."""
+        return self.values.get(settings_key, "")
 
-_SETTING_CACHE_PREFIX = "setting:"
+    def global_value(self, settings_key: str) -> str:
+        """The global row's raw value, or ``""`` when no row exists."""
+        return self.global_values.get(settings_key, "")
+
+
+_SNAPSHOT_VERSIONS = itertools.count(1)
+_GLOBAL_GENERATION = 0
+
+
+def _settings_snapshot_loader(
+    guild_id: int,
+) -> Callable[[], Awaitable[GuildSettingsSnapshot]]:
+    async def _load() -> GuildSettingsSnapshot:
+        from utils.db.settings import GLOBAL_GUILD_ID
+
+        generation = _GLOBAL_GENERATION
+        rows = await db.get_settings_for_guilds(
+            sorted({guild_id, GLOBAL_GUILD_ID}),
+        )
+        global_values = rows.get(GLOBAL_GUILD_ID, {})
+        return GuildSettingsSnapshot(
+            guild_id=guild_id,
+            version=next(_SNAPSHOT_VERSIONS),
+            values=MappingProxyType(rows.get(guild_id, {})),
+            global_values=MappingProxyType(
+                {} if guild_id == GLOBAL_GUILD_ID else global_values,
+            ),
+            global_generation=generation,
+        )
+
+    return _load
+
+
+_settings_snapshot_accessor: TypedAccessor[GuildSettingsSnapshot] = TypedAccessor(
+    cache_key="settings_snapshot",
+    loader_factory=_settings_snapshot_loader,
+)
+
+
+async def get_settings_snapshot(guild_id: int) -> GuildSettingsSnapshot:
+    """Return the cached KV snapshot for ``guild_id``; load on miss.
+
+    A snapshot taken before the latest global write is reloaded.
+    """
+    snapshot = await _settings_snapshot_accessor.get(guild_id)
+    if snapshot.global_generation != _GLOBAL_GENERATION:
+        _settings_snapshot_accessor.invalidate(guild_id)
+        snapshot = await _settings_snapshot_accessor.get(guild_id)
+    return snapshot
 
 
 async def get_setting_value(guild_id: int, settings_key: str) -> str:
     """Return the legacy KV value for ``settings_key``, cached per guild.
 
     Returns the raw string (or ``""`` when no row exists — matches the
-    semantics of :func:`utils.db.settings.get_setting`).  The cache key
-    is namespaced with ``"setting:"`` so it cannot collide with other
-    typed accessors' keys.
+    semantics of :func:`utils.db.settings.get_setting`).  Served from the
+    guild's :class:`GuildSettingsSnapshot`.
     """
-
-    async def _loader() -> str:
-        return await db.get_setting(guild_id, settings_key)
-
-    return await guild_config.get(
-        guild_id,
-        _SETTING_CACHE_PREFIX + settings_key,
-        loader=_loader,
-    )
+    snapshot = await get_settings_snapshot(guild_id)
+    return snapshot.value(settings_key)
 
 
 def invalidate_setting_value(guild_id: int, settings_key: str) -> None:
     """Drop the cached value for a single ``settings_key`` on ``guild_id``.
 
-    Called from the SettingsMutationPipeline (S4, not in this PR) and
-    from any admin write path that bypasses the pipeline.  Bulk
-    invalidation (``settings_key=None``) is intentionally NOT supported
-    so a single misconfigured caller cannot blow other typed accessors'
-    caches.
+    Called from the SettingsMutationPipeline (S4) and from any admin
+    write path that bypasses the pipeline.  Drops the guild's snapshot;
+    a write to the global row (``GLOBAL_GUILD_ID``) also marks every
+    other guild's snapshot stale.  Bulk invalidation
+    (``settings_key=None``) is intentionally NOT supported so a single
+    misconfigured caller cannot blow other typed accessors' caches.
     """
-    guild_config.invalidate(guild_id, _SETTING_CACHE_PREFIX + settings_key)
+    global _GLOBAL_GENERATION
+    from utils.db.settings import GLOBAL_GUILD_ID
+
+    _settings_snapshot_accessor.invalidate(guild_id)
+    if guild_id == GLOBAL_GUILD_ID:
+        _GLOBAL_GENERATION += 1
 
 
 # ---------------------------------------------------------------------------
@@ -324,10 +399,12 @@ def invalidate_command_access_policy(guild_id: int) -> None:
 
 __all__ = [
     "CommandAccessPolicySnapshot",
+    "GuildSettingsSnapshot",
     "TypedAccessor",
     "XpConfig",
     "get_command_access_policy",
     "get_setting_value",
+    "get_settings_snapshot",
     "get_xp_config",
     "get_xp_threshold_roles",
     "invalidate_command_access_policy",
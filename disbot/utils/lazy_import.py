@@ -0,0 +1,85 @@
+"""Deferred module imports — bind a module name now, import it on first use.
+
+Cog modules are imported at boot, so anything they import at module level is
+paid by every process before the first command runs, whether or not the
+guild ever touches that feature.  :func:`lazy_module` keeps the familiar
+``module.attr`` call style while moving the import to the first attribute
+access::
+
+    from typing import TYPE_CHECKING
+
+    from utils.lazy_import import lazy_module
+
+    if TYPE_CHECKING:
+        from services import btd6_context_service
+    else:
+        btd6_context_service = lazy_module("services.btd6_context_service")
+
+    def memo_line() -> str:
+        stats = btd6_context_service.reply_memo_stats()  # imports here
+        ...
+
+The proxy is *not* placed in ``sys.modules``; the real module is imported
+through the normal machinery on first access and every later access (get,
+set, delete) is forwarded to it, so ``monkeypatch.setattr`` on either the
+proxy or the real module behaves the same.  The proxy is typed as a bare
+``ModuleType``, so bind the real import under ``TYPE_CHECKING`` (as above)
+to keep mypy checking every ``module.attr`` call site.  Names used only in
+annotations stay free under ``from __future__ import annotations``.
+
+Use it for the large, optional modules listed in
+``core.runtime.import_profile.BOOT_DEFERRED_MODULES`` — the boot-import test
+fails if one of those is imported at startup.  ``scripts/check_architecture``
+reads ``lazy_module("…")`` calls as imports, so the layer graph still sees
+the edge.
+
+Public surface:
+    lazy_module(name)  → ModuleType proxy
+    is_loaded(module)  → bool
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from typing import Any
+
+
+class _LazyModule(types.ModuleType):
+    """Module proxy that imports ``__name__`` on the first attribute access."""
+
+    def _lazy_target(self) -> types.ModuleType:
+        name = object.__getattribute__(self, "__name__")
+        module = sys.modules.get(name)
+        return module if module is not None else importlib.import_module(name)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._lazy_target(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._lazy_target(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self._lazy_target(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._lazy_target())
+
+    def __repr__(self) -> str:
+        name = object.__getattribute__(self, "__name__")
+        state = "loaded" if name in sys.modules else "not loaded"
+        return f"<lazy module {name!r} ({state})>"
+
+
+def lazy_module(name: str) -> types.ModuleType:
+    """A proxy for the absolute module ``name``; imports on first use."""
+    return _LazyModule(name)
+
+
+def is_loaded(module: types.ModuleType) -> bool:
+    """True once ``module`` (a proxy or a real module) has been imported."""
+    return module.__name__ in sys.modules
+
+
+__all__ = ["is_loaded", "lazy_module"]
@@ -21,13 +21,24 @@ Owner design (Q-0173, 2026-06-17/19 — ``docs/planning/mining-hub-redesign-2026
 
 Pure: stdlib only, no Discord, no DB, no global RNG — every cell is reproducible
 from ``(seed, x, y, z)``, so it is trivially unit-testable.
+
+Cells are generated a **chunk** (:data:`CHUNK_SIZE` × :data:`CHUNK_SIZE`) at a
+time and the chunks are LRU-cached, so rendering a map window or digging next
+to where you last dug costs a cache lookup, not a fresh RNG per cell.  Chunking
+is invisible in the output: every cell is still drawn from its own
+``(seed, x, y, z)``-seeded stream, bit-for-bit what the per-cell generator
+produced.  The same chunk grid keys the fog-of-war bitsets in
+``utils/db/games/mining_grid`` (:func:`chunk_of`).
 """
 
 from __future__ import annotations
 
 import random
+from bisect import bisect
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from itertools import accumulate
 
 from utils.mining.rewards import ore_weights_for_depth
 
@@ -140,21 +151,92 @@ class Cell:
     richness: float
 
 
+# Chunk edge length.  8×8 = 64 cells, so a chunk's fog-of-war fits one BIGINT.
+CHUNK_SIZE = 8
+_CHUNK_SHIFT = 3  # log2(CHUNK_SIZE): floor-divides negative coordinates too
+_CHUNK_MASK = CHUNK_SIZE - 1
+# Generated chunks kept per process (~64 cells each).  A player's map window
+# touches at most four chunks, so this covers hundreds of active players.
+_CHUNK_CACHE_SIZE = 1024
+
+
+def chunk_of(x: int, y: int) -> tuple[int, int, int]:
+    """``(cx, cy, bit)`` — the chunk holding ``(x, y)`` and the cell's index in it.
+
+    ``bit`` is row-major (``local_y * CHUNK_SIZE + local_x``, 0..63); negative
+    coordinates floor into the chunk to their south-west, so chunk boundaries
+    are uniform across the origin.
+    """
+    return (
+        x >> _CHUNK_SHIFT,
+        y >> _CHUNK_SHIFT,
+        ((y & _CHUNK_MASK) << _CHUNK_SHIFT) | (x & _CHUNK_MASK),
+    )
+
+
+def chunk_cells(cx: int, cy: int, bits: int) -> set[tuple[int, int]]:
+    """The ``(x, y)`` cells whose bit is set in chunk ``(cx, cy)``'s bitset."""
+    base_x, base_y = cx << _CHUNK_SHIFT, cy << _CHUNK_SHIFT
+    return {
+        (base_x + (bit & _CHUNK_MASK), base_y + (bit >> _CHUNK_SHIFT))
+        for bit in range(CHUNK_SIZE * CHUNK_SIZE)
+        if bits >> bit & 1
+    }
+
+
+_FEATURES: tuple[CellFeature, ...] = tuple(f for f, _ in _FEATURE_WEIGHTS)
+_FEATURE_CUM: tuple[float, ...] = tuple(accumulate(w for _, w in _FEATURE_WEIGHTS))
+
+
+@lru_cache(maxsize=32)
+def _ore_table(z: int) -> tuple[tuple[str, ...], tuple[float, ...]]:
+    weights = ore_weights_for_depth(z)
+    return tuple(weights), tuple(accumulate(weights.values()))
+
+
+def _pick(rng: random.Random, population: tuple, cum_weights: tuple[float, ...]):
+    """``rng.choices(population, weights=...)[0]`` without rebuilding the sums.
+
+    Same arithmetic as :meth:`random.Random.choices` (one ``random()`` draw
+    scaled by the total, bisected into the cumulative weights), so a stream
+    picks exactly what ``choices`` would.
+    """
+    total = cum_weights[-1] + 0.0
+    return population[
+        bisect(cum_weights, rng.random() * total, 0, len(cum_weights) - 1)
+    ]
+
+
+@lru_cache(maxsize=_CHUNK_CACHE_SIZE)
+def chunk_at(seed: int, cx: int, cy: int, z: int) -> tuple[Cell, ...]:
+    """Every cell of chunk ``(cx, cy)`` at depth *z*, row-major (see :func:`chunk_of`).
+
+    One pass, one reusable RNG re-seeded per cell — each cell's stream is the
+    one :func:`cell_at` has always used, so chunking never changes a world.
+    """
+    ores, ore_cum = _ore_table(z)
+    rng = random.Random()
+    cells: list[Cell] = []
+    base_x, base_y = cx << _CHUNK_SHIFT, cy << _CHUNK_SHIFT
+    for y in range(base_y, base_y + CHUNK_SIZE):
+        for x in range(base_x, base_x + CHUNK_SIZE):
+            rng.seed(_cell_seed(seed, x, y, z))
+            feature = _pick(rng, _FEATURES, _FEATURE_CUM)
+            featured = _pick(rng, ores, ore_cum)
+            cells.append(Cell(x, y, z, feature, featured, _RICHNESS[feature]))
+    return tuple(cells)
+
+
 def cell_at(seed: int, x: int, y: int, z: int) -> Cell:
     """The cell at ``(x, y, z)`` in world *seed* — a pure function of its inputs.
 
     The featured ore is drawn from the depth-weighted ore table
     (:func:`utils.mining.rewards.ore_weights_for_depth`), so a rich vein deep
     down is far likelier to be gold/diamond than one near the surface — "deeper =
-    richer" with no separate balance table.
+    richer" with no separate balance table.  Served from the chunk cache.
     """
-    rng = random.Random(_cell_seed(seed, x, y, z))
-    features = [f for f, _ in _FEATURE_WEIGHTS]
-    feature = rng.choices(features, weights=[w for _, w in _FEATURE_WEIGHTS], k=1)[0]
-    weights = ore_weights_for_depth(z)
-    ores = list(weights)
-    featured = rng.choices(ores, weights=[weights[o] for o in ores], k=1)[0]
-    return Cell(x, y, z, feature, featured, _RICHNESS[feature])
+    cx, cy, bit = chunk_of(x, y)
+    return chunk_at(seed, cx, cy, z)[bit]
 
 
 def apply_cell_to_loot(
@@ -204,7 +286,7 @@ _FEATURE_LABEL: dict[CellFeature, str] = {
 # gear ``light_radius`` was wired in; a brighter light widens it so you literally
 # see more of the map at once (capped so the rendered grid stays embed-sized).
 _BASE_REVEAL_RADIUS = 2
-_MAX_REVEAL_RADIUS = 4
+MAX_REVEAL_RADIUS = 4
 
 
 def reveal_radius(light_radius: int) -> int:
@@ -214,10 +296,10 @@ def reveal_radius(light_radius: int) -> int:
     **Non-regressive:** ``light_radius`` 0 or 1 → the base 2, so a player with no
     light or a single torch sees exactly what they did before this stat was wired.
     A lantern (2) → 3, a diamond lantern (3) → 4. Capped at
-    :data:`_MAX_REVEAL_RADIUS` so a future brighter light can't blow up the embed.
+    :data:`MAX_REVEAL_RADIUS` so a future brighter light can't blow up the embed.
     """
     radius = _BASE_REVEAL_RADIUS + max(0, light_radius - 1)
-    return min(radius, _MAX_REVEAL_RADIUS)
+    return min(radius, MAX_REVEAL_RADIUS)
 
 
 def render_local_map(
@@ -271,7 +353,12 @@ __all__ = [
     "move_phrase",
     "CellFeature",
     "Cell",
+    "CHUNK_SIZE",
+    "MAX_REVEAL_RADIUS",
     "cell_at",
+    "chunk_at",
+    "chunk_cells",
+    "chunk_of",
     "apply_cell_to_loot",
     "render_local_map",
     "describe_cell",
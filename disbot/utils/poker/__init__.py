@@ -14,7 +14,9 @@ from utils.poker.engine import (
     PotResult,
     Stage,
 )
+from utils.poker.equity import equity
 from utils.poker.evaluate import HandCategory, HandRank, best_hand, score_five
+from utils.poker.lookup import evaluate
 
 __all__ = [
     "Action",
@@ -26,5 +28,7 @@ __all__ = [
     "PotResult",
     "Stage",
     "best_hand",
+    "equity",
+    "evaluate",
     "score_five",
 ]
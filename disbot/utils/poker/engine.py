@@ -33,6 +33,7 @@ from enum import Enum
 
 from utils.cards import Card, make_deck
 from utils.poker.evaluate import HandRank, best_hand
+from utils.poker.lookup import category_of, evaluate
 
 __all__ = [
     "Action",
@@ -123,8 +124,8 @@ class PokerGame:
         self.log: list[str] = []
         self.results: list[PotResult] = []
         self.hand_number: int = 0
-        # Players forced all-in by deck (used to suppress reveal of folded hands).
-        self._showdown_ranks: dict[int, HandRank] = {}
+        # Showdown strength per contender index (utils.poker.lookup values).
+        self._showdown_values: dict[int, int] = {}
 
     # ------------------------------------------------------------------ helpers
 
@@ -203,7 +204,7 @@ class PokerGame:
         self.min_raise = self.big_blind
         self.log = []
         self.results = []
-        self._showdown_ranks = {}
+        self._showdown_values = {}
 
         heads_up = len(contenders) == 2
         if heads_up:
@@ -464,10 +465,12 @@ class PokerGame:
         self.stage = Stage.SHOWDOWN
         self.current = -1
         contenders = [i for i, p in enumerate(self.players) if p.in_hand]
-        ranks: dict[int, HandRank] = {
-            i: best_hand(self.players[i].hole + self.board) for i in contenders
+        # The table evaluator orders hands exactly like best_hand; the full
+        # HandRank (with the five cards played) is built only on request.
+        values: dict[int, int] = {
+            i: evaluate(self.players[i].hole + self.board) for i in contenders
         }
-        self._showdown_ranks = ranks
+        self._showdown_values = values
 
         contributions = {
             i: p.committed_hand
@@ -483,14 +486,14 @@ class PokerGame:
             layer = sum(level - prev for c in contributions.values() if c >= level)
             eligible = [i for i in contenders if contributions.get(i, 0) >= level]
             if eligible and layer > 0:
-                best_key = max(ranks[i].key for i in eligible)
-                winners = [i for i in eligible if ranks[i].key == best_key]
+                best = max(values[i] for i in eligible)
+                winners = [i for i in eligible if values[i] == best]
                 share, remainder = divmod(layer, len(winners))
                 # Odd chips go to the earliest winner(s) left of the button.
                 ordered_winners = self._winners_in_order(winners)
                 for w in ordered_winners:
                     winnings[w] += share
-                    labels[w] = ranks[w].label
+                    labels[w] = category_of(values[w]).label
                 for w in ordered_winners[:remainder]:
                     winnings[w] += 1
             prev = level
@@ -521,5 +524,7 @@ class PokerGame:
         """The evaluated hand for *user_id* at showdown (None if not shown)."""
         for i, p in enumerate(self.players):
             if p.user_id == user_id:
-                return self._showdown_ranks.get(i)
+                if i not in self._showdown_values:
+                    return None
+                return best_hand(p.hole + self.board)
         return None
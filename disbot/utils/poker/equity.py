@@ -0,0 +1,82 @@
+"""Hold'em equity — each hand's share of the pot over the unseen board cards.
+
+Built on the table evaluator (:mod:`utils.poker.lookup`), so it is cheap enough
+for a live win-probability display and for casino balance simulations.
+
+:func:`equity` enumerates every remaining board exactly when that is no more
+work than the requested ``iterations`` (always the case on the turn and river,
+and for small flop spots), and otherwise samples ``iterations`` random run-outs
+(Monte Carlo).  A split pot credits each tied hand an equal fraction, so the
+returned equities always sum to 1.
+
+Public API
+----------
+- :func:`equity` — per-hand pot share (0..1) for 2+ hole-card hands.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator, Sequence
+from itertools import combinations
+from math import comb
+
+from utils.cards import Card, make_deck
+from utils.poker.lookup import evaluate
+
+__all__ = ["equity"]
+
+_BOARD_SIZE = 5
+
+
+def _run_outs(
+    deck: list[Card],
+    needed: int,
+    iterations: int,
+    rng: random.Random,
+) -> Iterator[tuple[Card, ...]]:
+    """Every completion of the board, or ``iterations`` sampled ones."""
+    if comb(len(deck), needed) <= iterations:
+        yield from combinations(deck, needed)
+        return
+    for _ in range(iterations):
+        yield tuple(rng.sample(deck, needed))
+
+
+def equity(
+    hands: Sequence[Sequence[Card]],
+    board: Sequence[Card] = (),
+    iterations: int = 10_000,
+    *,
+    rng: random.Random | None = None,
+) -> list[float]:
+    """Return each hand's expected share of the pot, in ``hands`` order.
+
+    ``hands`` are the players' hole cards (two each for Hold'em); ``board`` is
+    the 0-5 community cards already dealt.  Pass a seeded ``rng`` for
+    reproducible Monte Carlo results.
+    """
+    if len(hands) < 2:
+        raise ValueError("equity needs at least two hands")
+    if len(board) > _BOARD_SIZE:
+        raise ValueError(f"board has at most {_BOARD_SIZE} cards, got {len(board)}")
+    if iterations < 1:
+        raise ValueError(f"iterations must be positive, got {iterations}")
+    known = [c for hand in hands for c in hand] + list(board)
+    if len(set(known)) != len(known):
+        raise ValueError("a card appears more than once across hands and board")
+
+    dead = set(known)
+    deck = [c for c in make_deck(shuffle=False) if c not in dead]
+    needed = _BOARD_SIZE - len(board)
+    shares = [0.0] * len(hands)
+    runs = 0
+    for run_out in _run_outs(deck, needed, iterations, rng or random.Random()):
+        full_board = [*board, *run_out]
+        values = [evaluate([*hand, *full_board]) for hand in hands]
+        best = max(values)
+        winners = [i for i, value in enumerate(values) if value == best]
+        for i in winners:
+            shares[i] += 1 / len(winners)
+        runs += 1
+    return [share / runs for share in shares]
@@ -0,0 +1,198 @@
+"""Table-driven poker hand evaluator — the fast path for bulk evaluation.
+
+:func:`utils.poker.evaluate.best_hand` scores every ``C(n, 5)`` combination with
+Python-level comparisons; that stays the reference implementation (and is what
+the table game uses, since it also reports *which* five cards played).  This
+module answers only "how strong is this hand?" — as a single ``int`` — from two
+precomputed tables, so simulations and equity estimates can evaluate millions
+of hands:
+
+* **flush table** — keyed by the 13-bit rank mask of one suit (5..7 bits set).
+  In 7 cards a flush rules out quads and a full house, so when any suit holds
+  five or more cards its mask alone decides the hand.
+* **rank table** — keyed by the *product of per-rank primes* of all the cards.
+  Multiplication is order-independent and, by unique factorisation, the product
+  identifies the rank multiset exactly — a perfect hash for every 5-, 6- and
+  7-card rank pattern (~74k entries).
+
+Values preserve :attr:`HandRank.key` ordering exactly: :func:`evaluate` packs
+``key`` into an int (4 bits per field, category first, zero-padded), so
+``evaluate(a) > evaluate(b)`` iff ``best_hand(a) > best_hand(b)`` and equal
+values are genuine ties.  :func:`unpack` inverts the packing.
+
+The tables are built on first use (under a second), not at import.
+
+Public API
+----------
+- :func:`evaluate` — 5, 6 or 7 cards → comparable ``int``.
+- :func:`category_of` — the :class:`HandCategory` of an evaluated value.
+- :func:`unpack` — an evaluated value → the ``HandRank.key`` tuple.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from utils.cards import RANKS, SUITS, Card
+from utils.poker.evaluate import HandCategory
+
+__all__ = ["category_of", "evaluate", "unpack"]
+
+# One prime per rank, 2 → 2 … A → 41.
+_PRIMES: dict[int, int] = dict(
+    zip(RANKS, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41), strict=True),
+)
+_SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+
+# Packed layout: category, then up to five 4-bit tiebreak ranks (2..14).
+_FIELDS = 5
+_FIELD_BITS = 4
+_CATEGORY_SHIFT = _FIELDS * _FIELD_BITS
+
+_tables: tuple[dict[int, int], dict[int, int]] | None = None
+
+
+def _pack(category: HandCategory, ranks: Sequence[int]) -> int:
+    value = int(category)
+    for i in range(_FIELDS):
+        value = (value << _FIELD_BITS) | (ranks[i] if i < len(ranks) else 0)
+    return value
+
+
+def unpack(value: int) -> tuple[int, ...]:
+    """Return the ``HandRank.key`` tuple an evaluated ``value`` encodes."""
+    fields = [
+        (value >> (_FIELD_BITS * (_FIELDS - 1 - i))) & 0xF for i in range(_FIELDS)
+    ]
+    while fields and fields[-1] == 0:
+        fields.pop()
+    return (value >> _CATEGORY_SHIFT, *fields)
+
+
+def category_of(value: int) -> HandCategory:
+    """The :class:`HandCategory` of an evaluated ``value``."""
+    return HandCategory(value >> _CATEGORY_SHIFT)
+
+
+# (high card, rank-bit mask) for every straight, best first; bit i is rank i+2
+# and the wheel's ace-low reuses the ace bit.
+_STRAIGHTS: tuple[tuple[int, int], ...] = (
+    *((high, 0b11111 << (high - 6)) for high in range(14, 5, -1)),
+    (5, 0b1111 | 1 << 12),
+)
+
+
+def _rank_mask(ranks: Iterable[int]) -> int:
+    mask = 0
+    for r in ranks:
+        mask |= 1 << (r - 2)
+    return mask
+
+
+def _straight_high(present: Iterable[int]) -> int | None:
+    """High card of the best straight among distinct ranks ``present``."""
+    mask = _rank_mask(present)
+    for high, straight in _STRAIGHTS:
+        if mask & straight == straight:
+            return high
+    return None
+
+
+def _flush_value(ranks: list[int]) -> int:
+    """Best flush / straight flush from one suit's distinct ranks (desc)."""
+    high = _straight_high(ranks)
+    if high is not None:
+        return _pack(HandCategory.STRAIGHT_FLUSH, (high,))
+    return _pack(HandCategory.FLUSH, ranks[:5])
+
+
+def _rank_value(counts: dict[int, int]) -> int:
+    """Best non-flush 5-card hand from a rank multiset of 5..7 cards."""
+    desc = sorted(counts, reverse=True)
+
+    def kickers(*used: int, n: int) -> list[int]:
+        return [r for r in desc if r not in used][:n]
+
+    quads = [r for r in desc if counts[r] == 4]
+    trips = [r for r in desc if counts[r] == 3]
+    pairs = [r for r in desc if counts[r] == 2]
+    if quads:
+        return _pack(HandCategory.FOUR_OF_A_KIND, (quads[0], *kickers(quads[0], n=1)))
+    if trips and (len(trips) > 1 or pairs):
+        pair = max([*trips[1:], *pairs])
+        return _pack(HandCategory.FULL_HOUSE, (trips[0], pair))
+    high = _straight_high(desc)
+    if high is not None:
+        return _pack(HandCategory.STRAIGHT, (high,))
+    if trips:
+        return _pack(
+            HandCategory.THREE_OF_A_KIND,
+            (trips[0], *kickers(trips[0], n=2)),
+        )
+    if len(pairs) >= 2:
+        top, second = pairs[0], pairs[1]
+        return _pack(HandCategory.TWO_PAIR, (top, second, *kickers(top, second, n=1)))
+    if pairs:
+        return _pack(HandCategory.PAIR, (pairs[0], *kickers(pairs[0], n=3)))
+    return _pack(HandCategory.HIGH_CARD, desc[:5])
+
+
+def _rank_multisets(
+    index: int,
+    remaining: int,
+    counts: dict[int, int],
+) -> Iterable[dict[int, int]]:
+    """Yield every multiset of up to ``remaining`` more cards over RANKS[index:]."""
+    if index == len(RANKS):
+        yield counts
+        return
+    rank = RANKS[index]
+    for n in range(min(4, remaining) + 1):
+        if n:
+            counts[rank] = n
+        yield from _rank_multisets(index + 1, remaining - n, counts)
+    counts.pop(rank, None)
+
+
+def _build_tables() -> tuple[dict[int, int], dict[int, int]]:
+    flush: dict[int, int] = {}
+    for mask in range(1 << len(RANKS)):
+        if 5 <= mask.bit_count() <= 7:
+            ranks = [r for i, r in enumerate(RANKS) if mask >> i & 1][::-1]
+            flush[mask] = _flush_value(ranks)
+    by_product: dict[int, int] = {}
+    for counts in _rank_multisets(0, 7, {}):
+        if sum(counts.values()) < 5:
+            continue
+        product = 1
+        for rank, n in counts.items():
+            product *= _PRIMES[rank] ** n
+        by_product[product] = _rank_value(counts)
+    return flush, by_product
+
+
+def _get_tables() -> tuple[dict[int, int], dict[int, int]]:
+    global _tables
+    if _tables is None:
+        _tables = _build_tables()
+    return _tables
+
+
+def evaluate(cards: Sequence[Card]) -> int:
+    """Score the best 5-card hand in 5, 6 or 7 ``cards`` as a comparable int.
+
+    Orders exactly like :func:`utils.poker.evaluate.best_hand`'s ``HandRank``
+    (same winners, same ties); see the module docstring for the encoding.
+    """
+    if not 5 <= len(cards) <= 7:
+        raise ValueError(f"evaluate needs 5 to 7 cards, got {len(cards)}")
+    flush, by_product = _get_tables()
+    product = 1
+    suit_masks = [0, 0, 0, 0]
+    for c in cards:
+        product *= _PRIMES[c.rank]
+        suit_masks[_SUIT_INDEX[c.suit]] |= 1 << (c.rank - 2)
+    for mask in suit_masks:
+        if mask.bit_count() >= 5:
+            return flush[mask]
+    return by_product[product]
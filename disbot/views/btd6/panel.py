@@ -19,14 +19,19 @@ invokes a provider.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import discord
 
 from core.runtime.interaction_helpers import safe_defer, safe_followup
 from core.runtime.persistent_views import PersistentView, register
-from services import btd6_ai_service
 from utils.discord_permissions import is_staff_member
+from utils.lazy_import import lazy_module
+
+if TYPE_CHECKING:
+    from services import btd6_ai_service
+else:
+    btd6_ai_service = lazy_module("services.btd6_ai_service")
 
 _PANEL_COLOR = discord.Color.green()
 
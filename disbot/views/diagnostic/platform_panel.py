@@ -54,6 +54,7 @@ from services.diagnostic_embeds import (
     build_migrations_embed,
     build_participation_schemas_embed,
     build_provisioning_embed,
+    build_queries_embed,
     build_resource_requirements_embed,
     build_resources_embed,
     build_runtime_embed,
@@ -83,6 +84,7 @@ _RUNTIME_OPTIONS = (
     ("views", "🖼", "Registered PersistentView classes by subsystem"),
     ("sessions", "🎫", "Active session counts by subsystem"),
     ("slow", "🐢", "Slow-path log entries (latest 10)"),
+    ("queries", "🔎", "Top query fingerprints by total DB time"),
     ("automation", "🤖", "Scheduler status + per-guild rule management panel"),
 )
 
@@ -241,6 +243,8 @@ async def _dispatch(name: str, interaction: discord.Interaction) -> discord.Embe
         return build_views_embed()
     if name == "slow":
         return build_slow_embed()
+    if name == "queries":
+        return build_queries_embed()
     if name == "automation":
         from views.diagnostic.automation_panel import build_automation_embed
 
@@ -19,8 +19,8 @@ import time
 import discord
 
 from services import farm_workflow
-from utils import db, idle_summary
 from utils import farm as farm_mod
+from utils import idle_summary
 from utils.ui_constants import GAME_COLOR
 from views.base import HubView
 from views.navigation import carry_back
@@ -126,7 +126,6 @@ async def _panel_data(
 ) -> tuple[farm_mod.FarmState, int, int, str | None]:
     """Read the settled state, balance, seconds-to-full, and the away blurb."""
     status = await farm_workflow.get_status(user_id, guild_id)
-    balance = await db.get_coins(user_id, guild_id)
     to_full = farm_mod.seconds_until_full(status.state, int(time.time()))
     away = idle_summary.summarize_idle_gain(
         status.eggs_gained,
@@ -136,7 +135,7 @@ async def _panel_data(
         capped=status.at_capacity,
         capped_note=_COOP_FULL_NOTE,
     )
-    return status.state, balance, to_full, away
+    return status.state, status.balance, to_full, away
 
 
 async def open_farm_panel(
@@ -37,29 +37,25 @@ async def build_grid_embed(
     color: int = MINING_COLOR,
 ) -> discord.Embed:
     """Render the navigator embed: position · current cell · fog-of-war map."""
-    suid = str(user_id)
-    depth = await db.get_depth(suid, guild_id)
-    x, y = await db.get_position(suid, guild_id)
-    seed = await db.get_world_seed(guild_id)
+    # One round-trip for the whole render.  The fog of war is loaded for the
+    # widest window a light can give and clipped to this player's radius below.
+    state = await db.load_mining_player_state(
+        user_id,
+        guild_id,
+        window=grid.MAX_REVEAL_RADIUS,
+    )
+    x, y, depth, seed = state.x, state.y, state.depth, state.seed
     # A brighter equipped light widens the fog-of-war window (BUG-0026 wiring):
-    # the same radius feeds the discovered-cell query and the render so they
+    # the same radius clips the discovered cells and sizes the render so they
     # stay in lock-step. light_radius 0-1 keeps the prior default of 2.
-    equipped = await db.get_equipment(suid, guild_id)
-    # get_skills is keyed on a BIGINT user_id (player_skills, shared with game_xp),
-    # unlike the TEXT-keyed mining tables above — so it takes the int user_id, not
-    # suid. Passing the string raised asyncpg DataError on every !mine (the grid
-    # navigator crash the mocked unit tests could not see; pinned below).
-    alloc = await db.get_skills(user_id, guild_id)
-    radius = grid.reveal_radius(character_stats(equipped, alloc).light_radius)
-    discovered = await db.get_discovered_window(
-        suid,
-        guild_id,
-        depth,
-        x - radius,
-        x + radius,
-        y - radius,
-        y + radius,
+    radius = grid.reveal_radius(
+        character_stats(state.equipment, state.skills).light_radius,
     )
+    discovered = {
+        (cx, cy)
+        for cx, cy in state.discovered
+        if abs(cx - x) <= radius and abs(cy - y) <= radius
+    }
     cell = grid.cell_at(seed, x, y, depth)
     body = grid.render_local_map(seed, x, y, depth, discovered, radius=radius)
 
@@ -68,8 +64,8 @@ async def build_grid_embed(
         description = f"{note}\n\n{description}"
 
     embed = discord.Embed(title="⛏️ Mine", description=description, color=color)
-    e_cur, e_ts = await db.get_energy(suid, guild_id)
-    e_now = energy.settle(energy.EnergyState(e_cur, e_ts), int(time.time())).current
+    e_state = energy.EnergyState(state.energy, state.energy_updated_at)
+    e_now = energy.settle(e_state, int(time.time())).current
     embed.add_field(name="📍 Depth", value=world.describe_position(depth), inline=True)
     embed.add_field(name="🧭 Position", value=f"({x}, {y})", inline=True)
     embed.add_field(name="⚡ Energy", value=energy.bar(e_now), inline=True)
@@ -15,7 +15,7 @@ import logging
 import discord
 
 from core.runtime.persistent_views import PersistentView, register
-from services import ticket_mutation, ticket_service
+from services import ticket_mutation, ticket_service, ticket_transcript
 from views.tickets._shared import is_ticket_staff
 
 logger = logging.getLogger("bot.views.tickets")
@@ -115,6 +115,10 @@ class TicketControlView(PersistentView):
             result.message,
             ephemeral=not result.success,
         )
+        if result.success:
+            # Public, so it belongs in the transcript (the pipeline never
+            # delivers bot-authored replies).
+            await ticket_transcript.record_interaction_reply(interaction)
 
     @discord.ui.button(
         label="Close",
@@ -64,13 +64,21 @@ class Harness:
         self.http: FakeHTTP | None = None
         self.events: list[dict[str, Any]] = []
         self.extension_failures: dict[str, str] = {}
+        #: how capture_case snapshots the DB (dbsnap.SNAPSHOT_MODES)
+        self.snapshot_mode = "full"
         self._spawned: set[asyncio.Task[Any]] = set()
 
     # ------------------------------------------------------------------ boot
 
     @classmethod
-    async def start(cls, *, require_db: bool = True) -> Harness:
+    async def start(
+        cls,
+        *,
+        require_db: bool = True,
+        snapshot_mode: str = "full",
+    ) -> Harness:
         self = cls()
+        self.snapshot_mode = snapshot_mode
 
         import discord
         from discord.ext import tasks as ext_tasks
@@ -178,6 +186,11 @@ class Harness:
                 await db.init()
             except Exception as exc:  # noqa: BLE001 - env failure, not behavior
                 raise HarnessBootError(f"Postgres unavailable: {exc}") from exc
+            if snapshot_mode != "full":
+                from parity.harness.dbsnap import install_change_tracking
+                from utils.db import pool as db_pool
+
+                await install_change_tracking(db_pool)
 
         from core import runtime
         from core.runtime import message_pipeline
@@ -5,18 +5,56 @@ Each case starts from the same deterministic database: every public table
 case's fixture rows are applied. The observable "DB out" of a case is the
 delta between the post-reset baseline and the post-run dump, with volatile
 values (timestamps) normalized.
+
+Parallel replay (``parity.run check --workers N``) gives every worker its own
+database: one migrated, truncated *template* is built once and each worker
+database is a ``CREATE DATABASE … TEMPLATE`` copy of it — a file-level clone,
+far cheaper than migrating N databases.
+
+Change-tracked snapshots (``--snapshots tracked``) skip the full dumps: row
+triggers on every table append each write's before/after image to
+``parity_changelog``, and :func:`tracked_snapshot` rebuilds the touched
+tables' contents from that log alone. Every table is empty after the reset,
+so a table the log never mentions is empty in both snapshots and the delta
+is identical to the full-dump one; ``--snapshots verify`` computes both and
+reports any disagreement.
 """
 
 from __future__ import annotations
 
 import datetime as _dt
 import json
+from collections import Counter
 from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+__all__ = [
+    "reset_database",
+    "snapshot",
+    "diff_snapshots",
+    "normalize_value",
+    "database_dsn",
+    "create_database",
+    "drop_databases",
+    "CHANGELOG_TABLE",
+    "install_change_tracking",
+    "tracked_snapshot",
+    "SNAPSHOT_MODES",
+    "SnapshotMismatchError",
+    "snapshot_tables",
+    "rebuild_rows",
+]
 
-__all__ = ["reset_database", "snapshot", "diff_snapshots", "normalize_value"]
+#: ``full`` dumps every table (the reference); ``tracked`` rebuilds from the
+#: change log; ``verify`` does both and raises on any disagreement.
+SNAPSHOT_MODES = ("full", "tracked", "verify")
 
 _KEEP_TABLES = {"schema_migrations"}
 
+#: the change log itself — truncated by the reset like a bot table, but
+#: never tracked or snapshotted.
+CHANGELOG_TABLE = "parity_changelog"
+
 #: columns whose values are per-run randomness (random hex ids, boot ids) —
 #: scrubbed by NAME because shape alone cannot separate them from
 #: deterministic content hashes (e.g. policy_snapshot_hash, which stays).
@@ -38,11 +76,199 @@ async def _tables(pool: Any) -> list[str]:
 
 async def reset_database(pool: Any) -> None:
     """Truncate every bot table; identities restart so serials are stable."""
-    names = [t for t in await _tables(pool) if t not in _KEEP_TABLES]
-    if not names:
-        return
-    joined = ", ".join(f'"{t}"' for t in names)
-    await pool.execute(f"TRUNCATE {joined} RESTART IDENTITY CASCADE")
+    tables = await _tables(pool)
+    names = [t for t in tables if t not in _KEEP_TABLES and t != CHANGELOG_TABLE]
+    if names:
+        joined = ", ".join(f'"{t}"' for t in names)
+        await pool.execute(f"TRUNCATE {joined} RESTART IDENTITY CASCADE")
+    if CHANGELOG_TABLE in tables:
+        # After the reset, so its own TRUNCATE-trigger entries go too.
+        await pool.execute(f'TRUNCATE "{CHANGELOG_TABLE}" RESTART IDENTITY')
+
+
+def database_dsn(dsn: str, name: str) -> str:
+    """``dsn`` re-pointed at database ``name`` (credentials/host/query kept)."""
+    parts = urlsplit(dsn)
+    return urlunsplit(parts._replace(path=f"/{name}"))
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+async def create_database(admin_dsn: str, name: str, *, template: str) -> None:
+    """(Re)create database ``name`` as a copy of ``template``.
+
+    Any leftover from a crashed run is dropped first. ``template`` must have
+    no open connections — Postgres refuses to copy a database in use.
+    """
+    import asyncpg
+
+    conn = await asyncpg.connect(admin_dsn)
+    try:
+        await conn.execute(f"DROP DATABASE IF EXISTS {_quote_ident(name)}")
+        await conn.execute(
+            f"CREATE DATABASE {_quote_ident(name)} TEMPLATE {_quote_ident(template)}",
+        )
+    finally:
+        await conn.close()
+
+
+async def drop_databases(admin_dsn: str, names: list[str]) -> None:
+    """Drop the harness-owned databases ``names`` (missing ones are fine)."""
+    import asyncpg
+
+    conn = await asyncpg.connect(admin_dsn)
+    try:
+        for name in names:
+            await conn.execute(f"DROP DATABASE IF EXISTS {_quote_ident(name)}")
+    finally:
+        await conn.close()
+
+
+_CHANGELOG_DDL = f"""
+CREATE TABLE IF NOT EXISTS "{CHANGELOG_TABLE}" (
+    seq        bigserial PRIMARY KEY,
+    table_name text NOT NULL,
+    op         char(1) NOT NULL,
+    old_row    jsonb,
+    new_row    jsonb
+);
+CREATE OR REPLACE FUNCTION parity_log_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO "{CHANGELOG_TABLE}" (table_name, op, old_row, new_row)
+    VALUES (
+        TG_TABLE_NAME,
+        left(TG_OP, 1),
+        CASE WHEN TG_OP IN ('UPDATE', 'DELETE') THEN to_jsonb(OLD) END,
+        CASE WHEN TG_OP IN ('INSERT', 'UPDATE') THEN to_jsonb(NEW) END
+    );
+    RETURN NULL;
+END $$;
+"""
+
+
+async def install_change_tracking(pool: Any) -> None:
+    """Create the change log + a row/TRUNCATE trigger on every bot table.
+
+    Idempotent (re-run per boot, so tables added by a migration since the
+    last run get their trigger).
+    """
+    await pool.execute(_CHANGELOG_DDL)
+    for table in await _tables(pool):
+        if table in _KEEP_TABLES or table == CHANGELOG_TABLE:
+            continue
+        quoted = _quote_ident(table)
+        await pool.execute(f"DROP TRIGGER IF EXISTS parity_track ON {quoted}")
+        await pool.execute(
+            f"CREATE TRIGGER parity_track AFTER INSERT OR UPDATE OR DELETE "
+            f"ON {quoted} FOR EACH ROW EXECUTE FUNCTION parity_log_change()",
+        )
+        await pool.execute(f"DROP TRIGGER IF EXISTS parity_track_truncate ON {quoted}")
+        await pool.execute(
+            f"CREATE TRIGGER parity_track_truncate AFTER TRUNCATE "
+            f"ON {quoted} FOR EACH STATEMENT EXECUTE FUNCTION parity_log_change()",
+        )
+
+
+async def _images(
+    pool: Any,
+    table: str,
+    column: str,
+) -> list[tuple[int, dict[str, Any]]]:
+    """``(seq, row)`` for the logged ``column`` images of ``table``.
+
+    ``jsonb_populate_record`` turns each image back into the table's row
+    type, so asyncpg decodes it with exactly the codecs ``SELECT *`` uses.
+    """
+    rows = await pool.fetchall(
+        f'SELECT c.seq AS "__parity_seq", r.* FROM "{CHANGELOG_TABLE}" c, '
+        f"LATERAL jsonb_populate_record(NULL::{_quote_ident(table)}, c.{column}) r "
+        f"WHERE c.table_name = $1 AND c.{column} IS NOT NULL",
+        (table,),
+    )
+    out = []
+    for r in rows:
+        row = dict(r)
+        seq = row.pop("__parity_seq")
+        out.append((seq, row))
+    return out
+
+
+async def tracked_snapshot(pool: Any) -> dict[str, list[dict[str, Any]]]:
+    """:func:`snapshot`'s result, rebuilt from the change log alone.
+
+    Valid only when every table was empty at the start of the log (i.e.
+    right after :func:`reset_database`): a table's contents are then the
+    multiset of images written since its last TRUNCATE, minus the images
+    later updated away or deleted.
+    """
+    logged = await pool.fetchall(
+        f"SELECT table_name, max(seq) FILTER (WHERE op = 'T') AS truncated "
+        f'FROM "{CHANGELOG_TABLE}" GROUP BY table_name',
+    )
+    out: dict[str, list[dict[str, Any]]] = {}
+    for entry in sorted(logged, key=lambda e: e["table_name"]):
+        table = entry["table_name"]
+        rows = rebuild_rows(
+            await _images(pool, table, "new_row"),
+            await _images(pool, table, "old_row"),
+            since=entry["truncated"] or 0,
+        )
+        if rows:
+            out[table] = rows
+    return out
+
+
+def rebuild_rows(
+    written: list[tuple[int, dict[str, Any]]],
+    removed: list[tuple[int, dict[str, Any]]],
+    *,
+    since: int = 0,
+) -> list[dict[str, Any]]:
+    """A table's normalized rows from its logged images.
+
+    ``written`` are the INSERT/UPDATE after-images, ``removed`` the
+    UPDATE/DELETE before-images, each ``(seq, row)``; images at or before
+    ``since`` (the table's last TRUNCATE) are void. Ordered like
+    :func:`snapshot`.
+    """
+    counts: Counter[str] = Counter()
+    by_key: dict[str, dict[str, Any]] = {}
+    for images, sign in ((written, 1), (removed, -1)):
+        for seq, row in images:
+            if seq <= since:
+                continue
+            normalized = _normalize_row(row)
+            key = json.dumps(normalized, sort_keys=True, default=str)
+            counts[key] += sign
+            by_key.setdefault(key, normalized)
+    return [by_key[key] for key in sorted(counts) for _ in range(counts[key])]
+
+
+class SnapshotMismatchError(RuntimeError):
+    """``verify`` mode: the tracked snapshot differs from the full dump."""
+
+
+async def snapshot_tables(
+    pool: Any,
+    mode: str,
+) -> dict[str, list[dict[str, Any]]]:
+    """The database's current contents, taken the way ``mode`` says."""
+    if mode == "full":
+        return await snapshot(pool)
+    tracked = await tracked_snapshot(pool)
+    if mode == "verify":
+        full = await snapshot(pool)
+        if tracked != full:
+            tables = sorted(
+                t for t in set(full) | set(tracked) if full.get(t) != tracked.get(t)
+            )
+            raise SnapshotMismatchError(
+                f"tracked snapshot disagrees with the full dump on {tables}",
+            )
+    return tracked
 
 
 def normalize_value(value: Any) -> Any:
@@ -77,20 +303,21 @@ def normalize_value(value: Any) -> Any:
     return value
 
 
+def _normalize_row(row: dict[str, Any]) -> dict[str, Any]:
+    return {
+        k: ("<hexid>" if k in _VOLATILE_COLUMNS else normalize_value(v))
+        for k, v in row.items()
+    }
+
+
 async def snapshot(pool: Any) -> dict[str, list[dict[str, Any]]]:
     """Dump every public table as normalized, deterministically ordered rows."""
     out: dict[str, list[dict[str, Any]]] = {}
     for table in await _tables(pool):
-        if table in _KEEP_TABLES:
+        if table in _KEEP_TABLES or table == CHANGELOG_TABLE:
             continue
         rows = await pool.fetchall(f'SELECT * FROM "{table}"')
-        normalized = [
-            {
-                k: ("<hexid>" if k in _VOLATILE_COLUMNS else normalize_value(v))
-                for k, v in dict(r).items()
-            }
-            for r in rows
-        ]
+        normalized = [_normalize_row(dict(r)) for r in rows]
         normalized.sort(key=lambda r: json.dumps(r, sort_keys=True, default=str))
         if normalized:
             out[table] = normalized
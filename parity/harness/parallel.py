@@ -0,0 +1,190 @@
+"""Sharded golden replay — N worker processes, one cloned database each.
+
+A single-process ``check`` replays every case back to back against one
+database; the per-case TRUNCATE + boot-once bot keeps it correct but serial.
+``run_parallel_check`` instead:
+
+1. builds a migrated, truncated **template** database once
+   (``<db>_parity_tpl``, migrations run through the real ``db.init``);
+2. clones one database per worker from it (``CREATE DATABASE … TEMPLATE``);
+3. spawns ``python -m parity.run check-shard`` per worker — each boots its
+   own harness against its own database and replays its shard;
+4. merges the per-worker result files into one ``{case_id: result}`` map
+   for the normal golden diff report, then drops the clones + template.
+
+Cases are independent by construction (per-case seed, clock base, isolation
+resets, DB reset — README "Determinism model"), so which process replays a
+case cannot change its document. Sharding is round-robin over the sorted
+case ids: every worker builds the same corpus, so every worker derives the
+same partition without coordination — and the merge verifies it did.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from parity.harness.cases import GoldenCase
+from parity.harness.dbsnap import (
+    create_database,
+    database_dsn,
+    drop_databases,
+    reset_database,
+)
+
+__all__ = [
+    "ShardError",
+    "shard_cases",
+    "worker_database_names",
+    "merge_shard_results",
+    "run_parallel_check",
+]
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+class ShardError(RuntimeError):
+    """A worker failed, or the workers disagreed about the corpus."""
+
+
+def shard_cases(
+    cases: Sequence[GoldenCase],
+    index: int,
+    count: int,
+) -> list[GoldenCase]:
+    """Worker ``index`` of ``count``'s cases — round-robin over sorted ids."""
+    if not 0 <= index < count:
+        raise ValueError(f"shard index {index} out of range for {count} shard(s)")
+    ordered = sorted(cases, key=lambda c: c.id)
+    return ordered[index::count]
+
+
+def worker_database_names(dsn: str, workers: int) -> tuple[str, list[str]]:
+    """The template name and per-worker database names derived from ``dsn``."""
+    base = urlsplit(dsn).path.lstrip("/") or "postgres"
+    return f"{base}_parity_tpl", [f"{base}_parity_w{i}" for i in range(workers)]
+
+
+def merge_shard_results(shards: Sequence[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Combine worker result documents into one ``{case_id: result}`` map.
+
+    Each document is ``{"case_ids": [...every id the worker built...],
+    "results": {case_id: {"match", "problems", "ms"}}}``. Raises
+    :class:`ShardError` when the workers built different corpora or a case
+    was replayed zero or several times — a silent gap would read as green.
+    """
+    if not shards:
+        return {}
+    corpus = shards[0]["case_ids"]
+    for doc in shards[1:]:
+        if doc["case_ids"] != corpus:
+            raise ShardError("workers built different case corpora")
+    merged: dict[str, dict[str, Any]] = {}
+    for doc in shards:
+        for case_id, result in doc["results"].items():
+            if case_id in merged:
+                raise ShardError(f"case {case_id} replayed by more than one worker")
+            merged[case_id] = result
+    missing = sorted(set(corpus) - set(merged))
+    if missing:
+        raise ShardError(f"{len(missing)} case(s) never replayed: {missing[:5]}")
+    return {case_id: merged[case_id] for case_id in corpus}
+
+
+async def _build_template(dsn: str, template: str) -> None:
+    """Create ``template`` from ``template0``, migrate it, leave it empty."""
+    import parity.harness.boot  # noqa: F401 - disbot on sys.path + token env
+    from utils import db
+    from utils.db import pool
+
+    await create_database(dsn, template, template="template0")
+    previous = os.environ.get("DATABASE_URL")
+    os.environ["DATABASE_URL"] = database_dsn(dsn, template)
+    try:
+        await db.init()
+        await reset_database(pool)
+    finally:
+        await db.close()
+        if previous is not None:
+            os.environ["DATABASE_URL"] = previous
+
+
+async def _run_worker(
+    index: int,
+    count: int,
+    dsn: str,
+    result_path: Path,
+    extra_args: list[str],
+) -> dict[str, Any]:
+    env = {**os.environ, "DATABASE_URL": dsn}
+    # A clone has no replica — never let worker reads go elsewhere.
+    env.pop("DATABASE_REPLICA_URL", None)
+    log_path = result_path.with_suffix(".log")
+    with log_path.open("wb") as log:
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "parity.run",
+            "check-shard",
+            "--shard",
+            f"{index}/{count}",
+            "--result",
+            str(result_path),
+            *extra_args,
+            cwd=str(_REPO_ROOT),
+            env=env,
+            stdout=log,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        code = await proc.wait()
+    if code != 0 or not result_path.exists():
+        tail = log_path.read_text(errors="replace")[-2000:]
+        raise ShardError(f"worker {index} exited {code}:\n{tail}")
+    return json.loads(result_path.read_text())
+
+
+async def run_parallel_check(
+    workers: int,
+    *,
+    curated: bool = False,
+    only: str = "",
+    snapshots: str = "full",
+) -> dict[str, dict[str, Any]]:
+    """Replay the corpus across ``workers`` processes; merged per-case results."""
+    dsn = os.environ.get("DATABASE_URL", "")
+    if not dsn:
+        from parity.harness.boot import HarnessBootError
+
+        raise HarnessBootError("DATABASE_URL unset — parallel replay needs Postgres.")
+    template, names = worker_database_names(dsn, workers)
+    extra_args = ["--snapshots", snapshots]
+    extra_args += (["--curated"] if curated else []) + (
+        ["--only", only] if only else []
+    )
+    try:
+        await _build_template(dsn, template)
+        for name in names:
+            await create_database(dsn, name, template=template)
+        with tempfile.TemporaryDirectory(prefix="parity-shards-") as tmp:
+            shards = await asyncio.gather(
+                *(
+                    _run_worker(
+                        i,
+                        workers,
+                        database_dsn(dsn, name),
+                        Path(tmp) / f"shard{i}.json",
+                        extra_args,
+                    )
+                    for i, name in enumerate(names)
+                ),
+            )
+    finally:
+        await drop_databases(dsn, [*names, template])
+    return merge_shard_results(shards)
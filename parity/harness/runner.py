@@ -17,7 +17,12 @@ from typing import Any
 from parity.harness.boot import Harness
 from parity.harness.capture import Normalizer
 from parity.harness.cases import GoldenCase, Step
-from parity.harness.dbsnap import diff_snapshots, reset_database, snapshot
+from parity.harness.dbsnap import (
+    SnapshotMismatchError,
+    diff_snapshots,
+    reset_database,
+    snapshot_tables,
+)
 from parity.harness.world import DEFAULT_PERSONAS
 
 __all__ = ["capture_case", "replay_case", "golden_path", "apply_isolation_resets"]
@@ -123,7 +128,7 @@ async def capture_case(harness: Harness, case: GoldenCase) -> dict[str, Any]:
     await reset_database(pool)
     for statement in case.fixture_sql:
         await pool.execute(statement)
-    before = await snapshot(pool)
+    before = await snapshot_tables(pool, harness.snapshot_mode)
 
     normalizer = Normalizer(harness.world)
     minted: list[int] = []
@@ -168,7 +173,7 @@ async def capture_case(harness: Harness, case: GoldenCase) -> dict[str, Any]:
             step_doc["events"] = normalizer.events(events)
         steps_out.append(step_doc)
 
-    after = await snapshot(pool)
+    after = await snapshot_tables(pool, harness.snapshot_mode)
     delta = normalizer.db_delta(diff_snapshots(before, after))
 
     return {
@@ -236,6 +241,9 @@ async def replay_case(
     if not path.exists():
         return False, [f"golden missing: {path}"]
     expected = json.loads(path.read_text())
-    actual = await capture_case(harness, case)
+    try:
+        actual = await capture_case(harness, case)
+    except SnapshotMismatchError as exc:
+        return False, [f"$.db_delta: {exc}"]
     problems = _diff_docs(expected, actual)
     return (not problems), problems
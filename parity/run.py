@@ -5,6 +5,8 @@ Usage (from the repo root, python3.10, DATABASE_URL pointing at Postgres):
     python3.10 -m parity.run capture            # curated + sweep → goldens/
     python3.10 -m parity.run capture --curated  # curated only (fast)
     python3.10 -m parity.run check              # replay against goldens (red on drift)
+    python3.10 -m parity.run check --workers 4  # sharded over 4 cloned databases
+    python3.10 -m parity.run check --snapshots verify  # change-log == full dumps?
     python3.10 -m parity.run coverage           # (re)compute COVERAGE.md
 
 ``check`` is the current-bot regression net today and the red-until-parity
@@ -17,7 +19,9 @@ import argparse
 import asyncio
 import json
 import sys
+import time
 from pathlib import Path
+from typing import Any
 
 _REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(_REPO_ROOT) not in sys.path:
@@ -25,6 +29,8 @@ if str(_REPO_ROOT) not in sys.path:
 
 GOLDENS_ROOT = _REPO_ROOT / "parity" / "goldens"
 SWEEP_SKIPS_PATH = GOLDENS_ROOT / "_sweep_skips.json"
+#: how many of the slowest replayed cases ``check`` lists after the report
+SLOWEST_SHOWN = 10
 
 
 async def _all_cases(harness, include_sweep: bool):  # type: ignore[no-untyped-def]
@@ -44,7 +50,7 @@ async def _capture(args: argparse.Namespace) -> int:
     from parity.harness.boot import Harness
     from parity.harness.runner import capture_case, golden_path
 
-    harness = await Harness.start()
+    harness = await Harness.start(snapshot_mode=args.snapshots)
     if harness.extension_failures:
         print("EXTENSION FAILURES:", harness.extension_failures)
         return 2
@@ -80,36 +86,76 @@ async def _capture(args: argparse.Namespace) -> int:
     return 0 if not failures else 1
 
 
-async def _check(args: argparse.Namespace) -> int:
+async def _replay(
+    curated: bool,
+    only: str,
+    shard: tuple[int, int] = (0, 1),
+    snapshots: str = "full",
+) -> tuple[list[str], dict[str, dict[str, Any]]]:
+    """Replay (a shard of) the corpus in this process.
+
+    Returns every case id built, in corpus order, and ``{case_id: {"match",
+    "problems", "ms"}}`` for the cases this shard replayed.
+    """
     from parity.harness.boot import Harness
+    from parity.harness.parallel import shard_cases
     from parity.harness.runner import replay_case
 
-    harness = await Harness.start()
-    cases, _ = await _all_cases(harness, include_sweep=not args.curated)
-    if args.only:
-        cases = [c for c in cases if args.only in c.id]
+    harness = await Harness.start(snapshot_mode=snapshots)
+    cases, _ = await _all_cases(harness, include_sweep=not curated)
+    if only:
+        cases = [c for c in cases if only in c.id]
+    mine = shard_cases(cases, *shard) if shard[1] > 1 else cases
+    results: dict[str, dict[str, Any]] = {}
+    for case in mine:
+        started = time.perf_counter()
+        match, problems = await replay_case(harness, case, GOLDENS_ROOT)
+        results[case.id] = {
+            "match": match,
+            "problems": problems,
+            "ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+    await harness.close()
+    return [c.id for c in cases], results
+
+
+async def _check(args: argparse.Namespace) -> int:
     from parity.cases.sweep import FLAKY_ADVISORY
 
+    started = time.perf_counter()
+    if args.workers > 1:
+        from parity.harness.parallel import run_parallel_check
+
+        results = await run_parallel_check(
+            args.workers,
+            curated=args.curated,
+            only=args.only,
+            snapshots=args.snapshots,
+        )
+    else:
+        _, results = await _replay(args.curated, args.only, snapshots=args.snapshots)
+    elapsed = time.perf_counter() - started
+
     ok = 0
     advisory: dict[str, int] = {}
     failed: dict[str, list[str]] = {}
     gating_total = 0
-    for case in cases:
-        match, problems = await replay_case(harness, case, GOLDENS_ROOT)
-        if case.id in FLAKY_ADVISORY:
+    for case_id, result in results.items():
+        match, problems = result["match"], result["problems"]
+        if case_id in FLAKY_ADVISORY:
             if not match:
-                advisory[case.id] = len(problems)
+                advisory[case_id] = len(problems)
             continue
         gating_total += 1
         if match:
             ok += 1
         else:
-            failed[case.id] = problems
-    await harness.close()
+            failed[case_id] = problems
     print(
         f"parity: {ok}/{gating_total} gating green"
         f" (+{len(advisory)} advisory diffs"
-        f" of {len(FLAKY_ADVISORY)} advisory cases)",
+        f" of {len(FLAKY_ADVISORY)} advisory cases)"
+        f" in {elapsed:.1f}s across {args.workers} worker(s)",
     )
     for cid, n in sorted(advisory.items()):
         print(f"ADVISORY {cid}: {n} diff(s) — {FLAKY_ADVISORY[cid]}")
@@ -119,9 +165,33 @@ async def _check(args: argparse.Namespace) -> int:
             print(f"    {problem}")
         if len(problems) > 8:
             print(f"    … {len(problems) - 8} more")
+    slowest = sorted(results.items(), key=lambda kv: kv[1]["ms"], reverse=True)
+    if slowest:
+        print("slowest cases:")
+        for cid, result in slowest[:SLOWEST_SHOWN]:
+            print(f"  {result['ms']:>9.1f} ms  {cid}")
+    if args.timings:
+        Path(args.timings).write_text(
+            json.dumps({cid: r["ms"] for cid, r in slowest}, indent=1) + "\n",
+        )
     return 0 if not failed else 1
 
 
+async def _check_shard(args: argparse.Namespace) -> int:
+    """One parallel-replay worker (spawned by ``check --workers N``)."""
+    index, count = (int(part) for part in args.shard.split("/"))
+    case_ids, results = await _replay(
+        args.curated,
+        args.only,
+        (index, count),
+        args.snapshots,
+    )
+    Path(args.result).write_text(
+        json.dumps({"case_ids": case_ids, "results": results}) + "\n",
+    )
+    return 0
+
+
 async def _coverage(args: argparse.Namespace) -> int:  # noqa: ARG001
     from parity.coverage import build_coverage_report
 
@@ -133,6 +203,8 @@ async def _coverage(args: argparse.Namespace) -> int:  # noqa: ARG001
 
 
 def main() -> int:
+    from parity.harness.dbsnap import SNAPSHOT_MODES
+
     parser = argparse.ArgumentParser(prog="parity")
     sub = parser.add_subparsers(dest="command", required=True)
     for name, needs_flags in (("capture", True), ("check", True), ("coverage", False)):
@@ -140,10 +212,33 @@ def main() -> int:
         if needs_flags:
             p.add_argument("--curated", action="store_true", help="curated cases only")
             p.add_argument("--only", default="", help="substring filter on case id")
+            p.add_argument(
+                "--snapshots",
+                choices=SNAPSHOT_MODES,
+                default="full",
+                help="DB delta source: full dumps, the change log, or both compared",
+            )
+        if name == "check":
+            p.add_argument(
+                "--workers",
+                type=int,
+                default=1,
+                help="replay in N processes, each on its own cloned database",
+            )
+            p.add_argument("--timings", default="", help="write per-case ms as JSON")
+    shard = sub.add_parser("check-shard", help="internal: one --workers process")
+    shard.add_argument("--shard", required=True, help="INDEX/COUNT")
+    shard.add_argument("--result", required=True, help="result JSON path")
+    shard.add_argument("--curated", action="store_true")
+    shard.add_argument("--only", default="")
+    shard.add_argument("--snapshots", choices=SNAPSHOT_MODES, default="full")
     args = parser.parse_args()
-    handler = {"capture": _capture, "check": _check, "coverage": _coverage}[
-        args.command
-    ]
+    handler = {
+        "capture": _capture,
+        "check": _check,
+        "check-shard": _check_shard,
+        "coverage": _coverage,
+    }[args.command]
     return asyncio.run(handler(args))
 
 
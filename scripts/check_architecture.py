@@ -133,6 +133,21 @@ class _ImportVisitor(ast.NodeVisitor):
         bucket = self.lazy_imports if self._fn_depth > 0 else self.imports
         bucket.append((node.lineno, node.module, self._in_tc))
 
+    def visit_Call(self, node: ast.Call) -> None:
+        # ``utils.lazy_import.lazy_module("pkg.mod")`` binds a module that is
+        # imported on first use — the same dependency edge as an import.
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", "")
+        if (
+            name == "lazy_module"
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ):
+            bucket = self.lazy_imports if self._fn_depth > 0 else self.imports
+            bucket.append((node.lineno, node.args[0].value, self._in_tc))
+        self.generic_visit(node)
+
 
 def _crosses_layer(
     module: str,
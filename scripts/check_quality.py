@@ -128,6 +128,11 @@ def run_pytest() -> int:
     return _run("pytest", _tool("pytest", "tests/", "-q", "-n", "auto", "--tb=short"))
 
 
+def run_perf() -> int:
+    # CI's "Perf budgets" step, run serially after pytest like there.
+    return _run("perf budgets", [_PY, str(REPO_ROOT / "scripts" / "run_perf.py")])
+
+
 def run_check_docs() -> int:
     # CI runs `python3 scripts/check_docs.py --strict` on every PR (incl. docs-only).
     return _run(
@@ -199,7 +204,7 @@ def main() -> int:
     parser.add_argument(
         "--full",
         action="store_true",
-        help="Also run mypy and pytest (implies --check-only for formatters)",
+        help="Also run mypy, pytest and the perf budgets (implies --check-only for formatters)",
     )
     parser.add_argument(
         "--fix-only",
@@ -235,6 +240,8 @@ def main() -> int:
                 failed.append("mypy")
             if run_pytest() != 0:
                 failed.append("pytest")
+            if run_perf() != 0:
+                failed.append("perf")
 
     print("\n" + "=" * 64)
     if failed:
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3.10
+"""Local load test for the developer dashboard — requests/second per page.
+
+Measures the dashboard's GET pages in three modes so the data-cache and
+conditional-GET work can be compared on one machine:
+
+* **uncached** — the old behaviour: ``load_data`` swapped for a per-request
+  read + JSON decode of ``dashboard.json``, identity (uncompressed) responses;
+* **cached** — the shipped app: parsed document held in memory, responses
+  gzip-compressed;
+* **revalidate** — the shipped app with the previous response's ``ETag`` sent
+  as ``If-None-Match``, i.e. a browser revisiting an unchanged page (304s).
+
+By default the app runs in-process through Starlette's ``TestClient`` (no
+network, no server), so the numbers are relative — compare modes, not
+absolute throughput. ``--url`` instead drives a running server over HTTP (only
+the ``cached`` and ``revalidate`` modes apply then; point it at an old and a
+new deploy for the before/after).
+
+Needs the dashboard's web deps (``pip install -r dashboard/requirements.txt``).
+Run::
+
+    python3.10 scripts/dashboard_loadtest.py
+    python3.10 scripts/dashboard_loadtest.py --requests 500 --pages / /commands
+    python3.10 scripts/dashboard_loadtest.py --url http://127.0.0.1:8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = REPO_ROOT / "dashboard" / "app.py"
+DEFAULT_PAGES = ("/", "/functions", "/commands", "/aliases", "/settings", "/env")
+MODES = ("uncached", "cached", "revalidate")
+
+
+def _load_app() -> Any:
+    sys.path.insert(0, str(APP_PATH.parent))
+    spec = importlib.util.spec_from_file_location("dashboard_loadtest_app", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run(client: Any, page: str, requests: int, mode: str) -> dict[str, Any]:
+    headers = {"Accept-Encoding": "identity" if mode == "uncached" else "gzip"}
+    first = client.get(page, headers=headers)
+    if mode == "revalidate" and "etag" in first.headers:
+        headers["If-None-Match"] = first.headers["etag"]
+    latencies: list[float] = []
+    sizes: list[int] = []
+    statuses: set[int] = set()
+    started = time.perf_counter()
+    for _ in range(requests):
+        t0 = time.perf_counter()
+        resp = client.get(page, headers=headers)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        statuses.add(resp.status_code)
+        sizes.append(int(resp.headers.get("content-length", len(resp.content))))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "rps": requests / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "bytes": int(statistics.mean(sizes)),
+        "status": ",".join(str(s) for s in sorted(statuses)),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="per page and mode")
+    parser.add_argument("--pages", nargs="+", default=list(DEFAULT_PAGES))
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--url", help="drive a running server instead of in-process")
+    args = parser.parse_args(argv)
+
+    if args.url:
+        import httpx
+
+        client: Any = httpx.Client(base_url=args.url, timeout=30.0)
+        modes = [m for m in args.modes if m != "uncached"]
+        app_module = None
+    else:
+        from fastapi.testclient import TestClient
+
+        app_module = _load_app()
+        client = TestClient(app_module.app)
+        modes = args.modes
+
+    print(
+        f"{'page':<12} {'mode':<11} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'bytes':>8}  status"
+    )
+    for page in args.pages:
+        for mode in modes:
+            original = None
+            if mode == "uncached" and app_module is not None:
+                original = app_module.load_data
+                app_module.load_data = app_module._read_data
+            try:
+                row = _run(client, page, args.requests, mode)
+            finally:
+                if original is not None:
+                    app_module.load_data = original
+            print(
+                f"{page:<12} {mode:<11} {row['rps']:>8.1f} {row['p50_ms']:>8.2f} "
+                f"{row['p95_ms']:>8.2f} {row['bytes']:>8}  {row['status']}",
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
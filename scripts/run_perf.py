@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+r"""Run the ``tests/perf`` benchmarks and check them against their budgets.
+
+Offline and deterministic — no DB, no network, no API keys. Examples::
+
+    python3.10 scripts/run_perf.py                      # table + budget check
+    python3.10 scripts/run_perf.py --only poker         # substring filter
+    python3.10 scripts/run_perf.py --update             # re-record baselines
+    python3.10 scripts/run_perf.py --update --only btd6 # re-record a subset
+
+Exits 1 when any benchmark exceeds its budget (or has no baseline). The same
+check runs under pytest as ``tests/perf/test_perf_budgets.py`` when
+``RUN_PERF=1``. Re-record a baseline only for a deliberate, explained cost
+change — never to silence a regression.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+# Mirror tests/conftest.py: a token must exist before disbot imports validate
+# config, and both the repo root (for ``tests.perf``) and ``disbot/`` must be
+# importable.
+os.environ.setdefault("DISCORD_BOT_TOKEN_PRODUCTION", "PERF_TOKEN_PLACEHOLDER")
+for _path in (str(_ROOT), str(_ROOT / "disbot")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", default="", help="substring filter on name")
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="store these timings as the new baselines",
+    )
+    args = parser.parse_args(argv)
+
+    from tests.perf.benchmarks import BENCHMARKS
+    from tests.perf.harness import (
+        budget_violation,
+        load_baselines,
+        measure,
+        save_baselines,
+    )
+
+    benches = [b for b in BENCHMARKS if args.only in b.name]
+    baselines = load_baselines()
+    results = []
+    failures: list[str] = []
+    print(
+        f"{'benchmark':<26} {'kind':<6} {'ms/call':>9} {'units':>8} {'base':>8}  budget"
+    )
+    for bench in benches:
+        if bench.requires and importlib.util.find_spec(bench.requires) is None:
+            print(
+                f"{bench.name:<26} {bench.kind:<6} skipped — {bench.requires} missing"
+            )
+            continue
+        result = measure(bench)
+        results.append(result)
+        base = baselines.get(bench.name)
+        problem = None if args.update else budget_violation(bench, result, baselines)
+        if problem:
+            failures.append(problem)
+        verdict = "REGRESSED" if problem else "ok"
+        print(
+            f"{bench.name:<26} {bench.kind:<6} {result.seconds * 1000:>9.3f} "
+            f"{result.units:>8.3f} {base if base is not None else float('nan'):>8.3f}"
+            f"  {bench.tolerance:.1f}x {verdict}",
+        )
+    if args.update:
+        save_baselines(results)
+        print(f"\nrecorded {len(results)} baseline(s)")
+        return 0
+    if failures:
+        print(f"\nFAIL — {len(failures)} benchmark(s) over budget:")
+        for problem in failures:
+            print(f"  {problem}")
+        return 1
+    print(f"\nPASS — {len(results)} benchmark(s) within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
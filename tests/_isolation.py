@@ -62,6 +62,8 @@ GLOBAL_RESET_HOOKS: tuple[tuple[str, str], ...] = (
     ("core.runtime.user_config", "_reset_for_tests"),
     ("core.runtime.scope_locks", "_reset_for_tests"),
     ("core.runtime.slow_path_log", "_reset_for_tests"),
+    ("core.runtime.query_profiler", "_reset_for_tests"),
+    ("core.runtime.import_profile", "_reset_for_tests"),
     ("core.runtime.participation_capabilities", "_reset_for_tests"),
     ("core.runtime.subsystem_capabilities", "_reset_for_tests"),
     # Process-local media (YouTube) diagnostics counters + last-purge state.
@@ -73,6 +75,26 @@ GLOBAL_RESET_HOOKS: tuple[tuple[str, str], ...] = (
     # wiping each test is baseline-safe and prevents a remembered answer in one
     # test from matching a correction in another under parallel runs.
     ("services.ai_review_log_service", "_reset_for_tests"),
+    # BTD6 deterministic-reply memo (normalised question → floor reply/miss).
+    # Empty-at-import; a reply memoised under one test's patched builders or
+    # introspection snapshot must not answer another test's question.
+    ("services.btd6_context_service", "_reset_for_tests"),
+    # Typed-policy memo keyed on (guild_id, subsystem) → (snapshot version,
+    # policy). Empty-at-import; a policy memoised against one test's settings
+    # snapshot must not be served to another test that reuses the guild id.
+    ("services.settings_resolution", "_reset_for_tests"),
+    # Image-moderation verdict cache (content digest / dHash → category
+    # scores). Empty-at-import; scores cached under one test's stub classifier
+    # must not answer another test's repost.
+    ("services.image_moderation_cache", "_reset_for_tests"),
+    # Open-ticket channel map (channel_id → ticket_id) the transcript listener
+    # filters on. Empty-at-import; a channel tracked by one test's open must
+    # not start recording another test's messages.
+    ("services.ticket_transcript", "_reset_for_tests"),
+    # DB lane pools (hot / replica) + the read-your-writes marker. Empty-at-
+    # import; a lane one test installed must not route another test's queries,
+    # and a write marker must not pin another test's replica reads.
+    ("utils.db.pool", "_reset_for_tests"),
 )
 
 # feature_flags is global too, but its _reset_for_tests() *wipes* an
@@ -101,6 +123,7 @@ PER_FILE_RESET_HOOKS: dict[str, str] = {
     # heavier to import suite-wide. Wired per-file. Promote to GLOBAL only if one
     # ever leaks across files under a parallel run.
     "services.ai_conversation_service": "conversation cache; wired in AI conversation tests",
+    "services.ai_instruction_service": "profile-layer memo; wired in instruction-stack cache tests",
     "services.ai_natural_language_policy": "policy cache; wired in NL policy tests",
     "services.ai_orchestration_policy": "policy cache; wired in orchestration tests",
     "services.ai_permission_service": "permission cache; wired in AI permission tests",
@@ -0,0 +1 @@
+"""Performance benchmarks with stored baselines and regression budgets."""
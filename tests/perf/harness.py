@@ -0,0 +1,172 @@
+"""Benchmark model, timer, and regression budgets for ``tests/perf``.
+
+A :class:`Benchmark` names one deterministic workload. Its ``prepare`` is a
+context manager that does the setup (fixtures, stub stages, an event loop),
+yields a zero-argument callable — one *call* is the unit that gets timed —
+and undoes the setup on exit.
+
+Absolute wall time is meaningless across machines, so every timing is
+divided by a fixed pure-Python calibration workload sampled in the same
+process, interleaved with the benchmark's own samples. The resulting
+*calibrated units* are what ``baselines.json`` stores; a benchmark regresses
+when its units exceed the baseline by more than its ``tolerance`` factor.
+Timings are the minimum over several samples — noise only ever adds time,
+so the minimum is the most repeatable estimate of the code's own cost.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import warnings
+from collections.abc import Callable, Iterable
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+__all__ = [
+    "BASELINES_PATH",
+    "Benchmark",
+    "BenchResult",
+    "calibrate",
+    "measure",
+    "run_all",
+    "load_baselines",
+    "save_baselines",
+    "budget_violation",
+]
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+
+#: each timed sample runs the workload for at least this long
+_MIN_SAMPLE_S = 0.05
+_REPEAT = 7
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """One deterministic, offline workload with a regression budget.
+
+    ``tolerance`` is the allowed slowdown factor against the stored baseline
+    (macro benchmarks touch more code and allocate more, so they get more
+    headroom than tight micro loops). ``requires`` names an optional import
+    the workload needs; the benchmark is skipped, not failed, without it.
+    """
+
+    name: str
+    kind: Literal["micro", "macro"]
+    prepare: Callable[[], AbstractContextManager[Callable[[], object]]]
+    description: str
+    tolerance: float = 3.0
+    requires: str = ""
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    name: str
+    seconds: float  # best per-call wall time
+    units: float  # seconds / calibration seconds
+
+
+def _loops_for(fn: Callable[[], object]) -> int:
+    """Calls per sample so one sample lasts at least ``_MIN_SAMPLE_S``."""
+    fn()  # warm-up: lazy imports, first-use caches, allocator growth
+    loops = 1
+    while loops < 1 << 20:
+        if _sample(fn, loops) * loops >= _MIN_SAMPLE_S:
+            break
+        loops *= 2
+    return loops
+
+
+def _sample(fn: Callable[[], object], loops: int) -> float:
+    """Mean seconds per call over ``loops`` back-to-back calls."""
+    started = time.perf_counter()
+    for _ in range(loops):
+        fn()
+    return (time.perf_counter() - started) / loops
+
+
+def _calibration_workload() -> int:
+    # Interpreter-bound mix of the operations the benchmarks lean on:
+    # arithmetic, dict/str churn, small-object allocation.
+    table: dict[str, int] = {}
+    total = 0
+    for i in range(20_000):
+        key = f"k{i % 512}"
+        table[key] = table.get(key, 0) + i
+        total += i * i % 7
+    return total + len(table)
+
+
+def calibrate() -> float:
+    """Best seconds per call of the fixed reference workload on this machine."""
+    loops = _loops_for(_calibration_workload)
+    return min(_sample(_calibration_workload, loops) for _ in range(_REPEAT))
+
+
+def measure(bench: Benchmark) -> BenchResult:
+    """Time ``bench`` against the calibration workload.
+
+    Benchmark and calibration samples are interleaved, so a slow patch on
+    the machine (a noisy neighbour, frequency scaling) lands on both sides
+    of the ratio instead of skewing one of them.
+    """
+    calib_loops = _loops_for(_calibration_workload)
+    # pytest records every warning; the script run does not — mute both so
+    # a deprecation inside a workload times the same under either runner.
+    with warnings.catch_warnings(), bench.prepare() as fn:
+        warnings.simplefilter("ignore")
+        loops = _loops_for(fn)
+        best = calib = float("inf")
+        for _ in range(_REPEAT):
+            calib = min(calib, _sample(_calibration_workload, calib_loops))
+            best = min(best, _sample(fn, loops))
+    return BenchResult(bench.name, best, best / calib)
+
+
+def run_all(benches: Iterable[Benchmark]) -> list[BenchResult]:
+    """Measure ``benches`` in order."""
+    return [measure(bench) for bench in benches]
+
+
+def load_baselines(path: Path = BASELINES_PATH) -> dict[str, float]:
+    """``{benchmark name: baseline calibrated units}``."""
+    if not path.exists():
+        return {}
+    return {
+        name: float(entry["units"])
+        for name, entry in json.loads(path.read_text())["benchmarks"].items()
+    }
+
+
+def save_baselines(results: list[BenchResult], path: Path = BASELINES_PATH) -> None:
+    """Merge ``results`` into the stored baselines (other entries are kept)."""
+    doc = json.loads(path.read_text()) if path.exists() else {"benchmarks": {}}
+    for result in results:
+        doc["benchmarks"][result.name] = {"units": round(result.units, 4)}
+    doc["benchmarks"] = dict(sorted(doc["benchmarks"].items()))
+    path.write_text(json.dumps(doc, indent=2) + "\n")
+
+
+def budget_violation(
+    bench: Benchmark,
+    result: BenchResult,
+    baselines: dict[str, float],
+) -> str | None:
+    """Why ``result`` fails ``bench``'s budget, or ``None`` when within it."""
+    baseline = baselines.get(bench.name)
+    if baseline is None:
+        return (
+            f"{bench.name}: no stored baseline — record one with "
+            "`python3.10 scripts/run_perf.py --update`"
+        )
+    ratio = result.units / baseline
+    if ratio > bench.tolerance:
+        return (
+            f"{bench.name}: {ratio:.2f}x its baseline "
+            f"({result.units:.3f} vs {baseline:.3f} calibrated units; "
+            f"budget {bench.tolerance:.1f}x)"
+        )
+    return None
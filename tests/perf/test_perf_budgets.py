@@ -0,0 +1,33 @@
+"""Timed regression budgets — opt-in with ``RUN_PERF=1``.
+
+Each benchmark is measured against the calibration workload and must stay
+within its ``tolerance`` of the stored baseline (``baselines.json``). Run it
+serially — parallel workers share the CPU and skew the timings::
+
+    RUN_PERF=1 python3.10 -m pytest tests/perf -p no:xdist -q
+
+``scripts/run_perf.py`` prints the same check as a table and re-records
+baselines (``--update``).
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+
+import pytest
+from tests.perf.benchmarks import BENCHMARKS
+from tests.perf.harness import budget_violation, load_baselines, measure
+
+pytestmark = pytest.mark.skipif(
+    os.environ.get("RUN_PERF") != "1",
+    reason="opt-in: RUN_PERF=1 (timing-sensitive; run serially)",
+)
+
+
+@pytest.mark.parametrize("bench", BENCHMARKS, ids=lambda b: b.name)
+def test_benchmark_within_budget(bench):
+    if bench.requires and importlib.util.find_spec(bench.requires) is None:
+        pytest.skip(f"{bench.requires} not installed")
+    problem = budget_violation(bench, measure(bench), load_baselines())
+    assert problem is None, problem
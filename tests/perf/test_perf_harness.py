@@ -0,0 +1,59 @@
+"""Perf-suite machinery — runs on every PR (no timing assertions).
+
+Proves each benchmark workload runs offline and leaves no state behind, that
+every benchmark has a stored baseline, and that the budget check flags a
+regression. The timed budget check itself is ``test_perf_budgets.py``
+(``RUN_PERF=1``).
+"""
+
+from __future__ import annotations
+
+import importlib.util
+
+import pytest
+from tests.perf.benchmarks import BENCHMARKS
+from tests.perf.harness import (
+    Benchmark,
+    BenchResult,
+    budget_violation,
+    load_baselines,
+    save_baselines,
+)
+
+from core.runtime import message_pipeline
+
+
+@pytest.mark.parametrize("bench", BENCHMARKS, ids=lambda b: b.name)
+def test_workload_runs_offline(bench):
+    if bench.requires and importlib.util.find_spec(bench.requires) is None:
+        pytest.skip(f"{bench.requires} not installed")
+    stages_before = message_pipeline.stages_snapshot()
+    with bench.prepare() as run:
+        run()
+    assert message_pipeline.stages_snapshot() == stages_before
+
+
+def test_every_benchmark_has_a_baseline():
+    names = [b.name for b in BENCHMARKS]
+    assert len(names) == len(set(names))
+    baselines = load_baselines()
+    assert sorted(baselines) == sorted(names), (
+        "record missing baselines with `python3.10 scripts/run_perf.py --update`"
+    )
+    assert all(units > 0 for units in baselines.values())
+
+
+def test_budget_violation_flags_only_over_tolerance(tmp_path):
+    bench = Benchmark("x.y", "micro", lambda: None, "test", tolerance=3.0)
+    path = tmp_path / "baselines.json"
+    save_baselines([BenchResult("x.y", 0.001, 2.0)], path)
+    baselines = load_baselines(path)
+    assert baselines == {"x.y": 2.0}
+    assert budget_violation(bench, BenchResult("x.y", 0.001, 5.9), baselines) is None
+    problem = budget_violation(bench, BenchResult("x.y", 0.01, 20.0), baselines)
+    assert problem is not None and "10.00x" in problem
+    assert "no stored baseline" in budget_violation(
+        bench,
+        BenchResult("x.y", 0.001, 1.0),
+        {},
+    )
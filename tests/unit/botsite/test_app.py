@@ -47,7 +47,7 @@ def test_healthz_ok(client):
     assert resp.json() == {"status": "ok"}
 
 
-def test_index_serves_spa_shell(client):
+def test_index_serves_spa_shell(client, app_module):
     # `/` now serves the Claude-Design SPA shell (the public front-end). It is a
     # hash-routed app: the empty <main id="app"> is filled client-side from
     # window.SBDATA, loaded via /data.js then driven by /app.js.
@@ -55,7 +55,11 @@ def test_index_serves_spa_shell(client):
     assert resp.status_code == 200
     assert "SuperBot" in resp.text
     assert 'id="app"' in resp.text
-    assert "data.js" in resp.text and "app.js" in resp.text
+    assert "app.js" in resp.text
+    # The data tag is rewritten to the content-hashed, immutably cached URL.
+    digest = app_module.current_data_js().digest
+    assert f'src="/data.{digest}.js"' in resp.text
+    assert 'src="data.js"' not in resp.text
 
 
 def test_spa_static_assets_served(client):
@@ -94,6 +98,54 @@ def test_data_js_is_generated_live_and_truthful(client, app_module):
         assert forbidden not in lowered
 
 
+def test_data_js_is_rendered_once_per_site_json_version(app_module, monkeypatch):
+    calls = []
+    real = app_module.site_data.render_from_site
+
+    def _counting(site):
+        calls.append(1)
+        return real(site)
+
+    monkeypatch.setattr(app_module.site_data, "render_from_site", _counting)
+    monkeypatch.setitem(app_module._data_js_state, "asset", None)
+    first = app_module.current_data_js()
+    assert app_module.current_data_js() is first
+    assert len(calls) == 1
+    # A changed site.json (different mtime/size key) triggers one re-render.
+    monkeypatch.setitem(app_module._data_js_state, "key", (0, 0))
+    assert app_module.current_data_js() == first
+    assert len(calls) == 2
+    assert app_module.gzip.decompress(first.gzip) == first.body
+
+
+def test_data_js_conditional_get_and_precompressed_variants(client, app_module):
+    asset = app_module.current_data_js()
+    resp = client.get("/data.js", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["etag"] == f'"{asset.digest}-gzip"'
+    assert resp.headers["cache-control"] == "no-cache"
+    assert resp.content == asset.body  # httpx decodes the gzip body
+
+    plain = client.get("/data.js", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"] == f'"{asset.digest}"'
+
+    revisit = client.get("/data.js", headers={"If-None-Match": plain.headers["etag"]})
+    assert revisit.status_code == 304 and revisit.content == b""
+
+
+def test_hashed_data_js_is_immutable_and_stale_hashes_redirect(client, app_module):
+    asset = app_module.current_data_js()
+    resp = client.get(asset.url)
+    assert resp.status_code == 200
+    assert "immutable" in resp.headers["cache-control"]
+    assert resp.content == asset.body
+
+    stale = client.get("/data.0000000000000000.js", follow_redirects=False)
+    assert stale.status_code == 307
+    assert stale.headers["location"] == "/data.js"
+
+
 def test_site_data_json_is_truthful_for_the_react_app(client, app_module):
     # /site-data.json is the React-SPA data seam — the same public data as /data.js,
     # as pure JSON. It must carry the real bot data + the install URL the React pages
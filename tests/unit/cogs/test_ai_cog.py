@@ -123,3 +123,38 @@ async def test_setup_adds_cog_to_bot():
     await setup(_FakeBot())
     assert len(added) == 1
     assert isinstance(added[0], AICog)
+
+
+def test_usage_embed_renders_lines_and_budgets():
+    from cogs.ai_cog import build_usage_embed
+    from core.runtime.ai.budget import BudgetLimits
+    from services.ai_usage_service import UsageLine
+
+    line = UsageLine(
+        task="btd6.answer",
+        provider="anthropic",
+        model="claude-haiku-4-5",
+        requests=4,
+        input_tokens=250,
+        cached_input_tokens=750,
+        output_tokens=80,
+        cost_usd=0.0123,
+    )
+    embed = build_usage_embed(
+        [line],
+        [("guild", 0.5, BudgetLimits(soft_usd=1.0, hard_usd=2.0))],
+        days=7,
+    )
+
+    assert "$0.0123" in (embed.description or "")
+    assert "75% of input tokens cached" in (embed.description or "")
+    assert embed.fields[0].name == "btd6.answer · claude-haiku-4-5"
+    assert "soft $1.00 / hard $2.00" in embed.fields[-1].value
+
+
+def test_usage_embed_handles_no_usage():
+    from cogs.ai_cog import build_usage_embed
+
+    embed = build_usage_embed([], [], days=1)
+
+    assert embed.fields[0].name == "No usage recorded"
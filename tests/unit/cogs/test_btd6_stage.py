@@ -23,13 +23,16 @@ from cogs.btd6.stage import (
     REASON_DISABLED,
     REASON_EMPTY,
     REASON_LOW_CONFIDENCE,
+    REASON_SHED,
     REASON_SYSTEM_MESSAGE,
     REASON_WEBHOOK,
     STAGE_NAME,
     STAGE_ORDER,
+    LOAD_POLICY,
     BTD6AssistantMessageStage,
 )
 from core.runtime.message_pipeline import MessagePipelineContext
+from services import ai_conversation_service
 
 
 def _make_message(
@@ -214,3 +217,27 @@ def test_skip_buffer_is_bounded(stage):
         asyncio.run(stage.process(_make_ctx(msg)))
     skips = stage.latest_skips(1234)
     assert len(skips) <= 8  # _SKIP_BUFFER_PER_CHANNEL
+
+
+def test_shed_messages_are_reported_by_why_no_response(stage):
+    msg = _make_message()
+    stage.on_shed(_make_ctx(msg))
+    assert stage.latest_skips(msg.channel.id)[-1].reason == REASON_SHED
+
+
+def test_conversation_followups_are_never_shed():
+    ai_conversation_service._reset_for_tests()
+    msg = _make_message(content="and what about round 64?")
+    ctx = _make_ctx(msg)
+    ctx.channel_rate = LOAD_POLICY.channel_per_minute + 1
+    assert LOAD_POLICY.overloaded(ctx)
+    assert LOAD_POLICY.keep is not None and not LOAD_POLICY.keep(ctx)
+
+    ai_conversation_service.append(
+        9999, 1234, user_id=42, role="assistant", text="Round 63 is a ceramic rush."
+    )
+    try:
+        assert LOAD_POLICY.keep(ctx)
+        assert not LOAD_POLICY.sheds(ctx)
+    finally:
+        ai_conversation_service._reset_for_tests()
@@ -15,6 +15,13 @@ import pytest
 from core.runtime import subsystem_schema as schema_mod
 
 
+def _stored(raw: str) -> AsyncMock:
+    """Fake the guild's settings-snapshot load with the window row set to ``raw``."""
+    from utils.settings_keys import CLEANUP_SPAM_WINDOW_SECONDS
+
+    return AsyncMock(return_value={42: {CLEANUP_SPAM_WINDOW_SECONDS: raw}})
+
+
 @pytest.fixture(autouse=True)
 def _isolated_state():
     saved = schema_mod.all_schemas()
@@ -29,37 +36,33 @@ def _isolated_state():
 
 
 async def test_resolves_a_set_per_guild_value(monkeypatch):
-    import utils.guild_config_accessors as accessors
     from cogs.cleanup_cog import _resolve_spam_window
 
-    monkeypatch.setattr(accessors, "get_setting_value", AsyncMock(return_value="30"))
+    monkeypatch.setattr("utils.db.get_settings_for_guilds", _stored("30"))
     assert await _resolve_spam_window(42) == 30
 
 
 async def test_falls_back_to_default_when_unset(monkeypatch):
-    import utils.guild_config_accessors as accessors
     from cogs.cleanup.schemas import DEFAULT_SPAM_WINDOW_SECONDS
     from cogs.cleanup_cog import _resolve_spam_window
 
-    monkeypatch.setattr(accessors, "get_setting_value", AsyncMock(return_value=""))
+    monkeypatch.setattr("utils.db.get_settings_for_guilds", _stored(""))
     assert await _resolve_spam_window(42) == DEFAULT_SPAM_WINDOW_SECONDS
 
 
 async def test_falls_back_to_default_on_malformed_value(monkeypatch):
-    import utils.guild_config_accessors as accessors
     from cogs.cleanup.schemas import DEFAULT_SPAM_WINDOW_SECONDS
     from cogs.cleanup_cog import _resolve_spam_window
 
     # A non-int KV row must not raise — the resolver coerces, fails, defaults.
-    monkeypatch.setattr(accessors, "get_setting_value", AsyncMock(return_value="abc"))
+    monkeypatch.setattr("utils.db.get_settings_for_guilds", _stored("abc"))
     assert await _resolve_spam_window(42) == DEFAULT_SPAM_WINDOW_SECONDS
 
 
 async def test_out_of_range_value_falls_back_to_default(monkeypatch):
     """A stored value outside the validator bounds falls back, never crashes."""
-    import utils.guild_config_accessors as accessors
     from cogs.cleanup.schemas import DEFAULT_SPAM_WINDOW_SECONDS
     from cogs.cleanup_cog import _resolve_spam_window
 
-    monkeypatch.setattr(accessors, "get_setting_value", AsyncMock(return_value="99999"))
+    monkeypatch.setattr("utils.db.get_settings_for_guilds", _stored("99999"))
     assert await _resolve_spam_window(42) == DEFAULT_SPAM_WINDOW_SECONDS
@@ -177,3 +177,127 @@ async def test_dm_message_is_a_noop():
     msg.guild = None
     result = await listener.process_message(MagicMock(), msg)
     assert result.deleted is False
+
+
+# ---------------------------------------------------------------------------
+# Concurrent classification + verdict cache (offline, via the stub classifier)
+# ---------------------------------------------------------------------------
+
+
+def _png_bytes(colour: str) -> bytes:
+    import io
+
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGB", (48, 48), "white")
+    canvas = ImageDraw.Draw(image)
+    for x in range(0, 48, 12):
+        canvas.rectangle((x, 0, x + 5, 48), fill=colour)
+    canvas.ellipse((12, 12, 36, 36), fill="black")
+    buf = io.BytesIO()
+    image.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _downloadable(url: str, data: bytes) -> MagicMock:
+    att = _attachment(url)
+    att.size = len(data)
+    att.read = AsyncMock(return_value=data)
+    return att
+
+
+def _message_with(*attachments) -> MagicMock:
+    msg = _message(with_image=False)
+    msg.attachments = list(attachments)
+    return msg
+
+
+@pytest.fixture
+def _enabled(monkeypatch):
+    monkeypatch.setattr(
+        listener.image_moderation_config,
+        "load_policy",
+        AsyncMock(return_value=_enabled_policy()),
+    )
+    monkeypatch.setattr(listener.moderation_service, "auto_delete", AsyncMock())
+    monkeypatch.setattr(listener.moderation_service, "warn", AsyncMock())
+    import core.events
+
+    monkeypatch.setattr(core.events.bus, "emit", AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_images_in_one_message_are_classified_concurrently(_enabled):
+    import time
+
+    from core.runtime.ai.providers.stub_moderation import StubModerationProvider
+
+    stub = StubModerationProvider(latency=0.2)
+    msg = _message_with(*(_attachment(f"http://cdn/{n}.png") for n in range(3)))
+
+    started = time.perf_counter()
+    result = await listener.process_message(
+        MagicMock(), msg, classifier=stub.classify_image
+    )
+
+    assert time.perf_counter() - started < 0.5
+    assert result.deleted is False
+    assert sorted(stub.calls) == [f"http://cdn/{n}.png" for n in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_first_flagged_attachment_in_order_is_acted_on(_enabled):
+    from core.runtime.ai.providers.stub_moderation import StubModerationProvider
+
+    stub = StubModerationProvider(
+        {"a.png": {"sexual": 0.1}, "b.png": {"sexual": 0.95}},
+        default={"sexual": 0.99},
+    )
+    msg = _message_with(_attachment("http://cdn/a.png"), _attachment("http://cdn/b.png"))
+
+    result = await listener.process_message(
+        MagicMock(), msg, classifier=stub.classify_image
+    )
+
+    assert result.deleted is True
+    verdict_reason = listener.moderation_service.auto_delete.await_args.kwargs["reason"]
+    assert "95%" in verdict_reason
+
+
+@pytest.mark.asyncio
+async def test_reposted_image_is_served_from_the_verdict_cache(_enabled):
+    from core.runtime.ai.providers.stub_moderation import StubModerationProvider
+    from services import image_moderation_cache
+
+    stub = StubModerationProvider(default={"sexual": 0.95})
+    data = _png_bytes("green")
+
+    first = await listener.process_message(
+        MagicMock(),
+        _message_with(_downloadable("http://cdn/original.png", data)),
+        classifier=stub.classify_image,
+    )
+    repost = await listener.process_message(
+        MagicMock(),
+        _message_with(_downloadable("http://cdn/repost.png", data)),
+        classifier=stub.classify_image,
+    )
+
+    assert first.deleted is True and repost.deleted is True
+    assert stub.calls == ["http://cdn/original.png"]
+    assert image_moderation_cache.cache_stats().exact_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_download_failure_still_classifies_by_url(_enabled):
+    from core.runtime.ai.providers.stub_moderation import StubModerationProvider
+
+    stub = StubModerationProvider(default={"sexual": 0.0})
+    att = _downloadable("http://cdn/x.png", b"")
+    att.read = AsyncMock(side_effect=discord.HTTPException(MagicMock(), "gone"))
+
+    await listener.process_message(
+        MagicMock(), _message_with(att), classifier=stub.classify_image
+    )
+
+    assert stub.calls == ["http://cdn/x.png"]
@@ -554,3 +554,57 @@ def test_admin_edit_is_rate_limited(client, monkeypatch):
     assert second.status_code == 200
     assert "too many" in second.text.lower() or "slow down" in second.text.lower()
     appmod._EDIT_LIMITER.reset()
+
+
+def test_load_data_parses_once_per_file_version(app_module, tmp_path, monkeypatch):
+    data_file = tmp_path / "dashboard.json"
+    data_file.write_text('{"meta": {"counts": {"cogs": 1}}}', encoding="utf-8")
+    monkeypatch.setattr(app_module, "DATA_FILE", data_file)
+    monkeypatch.setattr(
+        app_module, "_data_cache", {"key": None, "data": None, "derived": {}}
+    )
+
+    first = app_module.load_data()
+    assert app_module.load_data() is first  # served from memory
+    assert app_module._derived(first, "n", lambda d: object()) is app_module._derived(
+        first, "n", lambda d: object()
+    )
+
+    data_file.write_text('{"meta": {"counts": {"cogs": 22}}}', encoding="utf-8")
+    reloaded = app_module.load_data()
+    assert reloaded is not first
+    assert reloaded["meta"]["counts"]["cogs"] == 22
+
+    data_file.write_text("{not json", encoding="utf-8")
+    assert app_module.load_data()["catalogue"] == []  # empty shape, not cached
+    assert app_module._data_cache["data"] is reloaded
+
+
+def test_pages_carry_strong_etags_and_revalidate_with_304(client):
+    first = client.get("/functions")
+    etag = first.headers["etag"]
+    assert first.headers["content-encoding"] == "gzip"  # httpx asks for gzip
+    assert etag.startswith('"') and not etag.startswith("W/")
+
+    again = client.get("/functions", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+
+    plain = client.get("/functions", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"] == etag.replace("-gzip", "")
+    assert int(plain.headers["content-length"]) == len(plain.content)
+    # Either representation's tag validates the page.
+    assert client.get(
+        "/functions", headers={"If-None-Match": plain.headers["etag"]}
+    ).status_code == 304
+
+
+def test_small_and_non_get_responses_are_left_alone(client):
+    resp = client.get("/healthz", headers={"Accept-Encoding": "gzip"})
+    assert resp.json() == {"status": "ok"}
+    assert "content-encoding" not in resp.headers
+    assert client.get(
+        "/healthz", headers={"If-None-Match": resp.headers["etag"]}
+    ).status_code == 304
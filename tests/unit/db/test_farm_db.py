@@ -41,3 +41,53 @@ async def test_top_farmers_default_limit_is_ten():
     _, params = mock_fetch.await_args.args
     assert params == (42, 10)
     assert out == []
+
+
+@pytest.mark.asyncio
+async def test_load_farm_player_state_reads_farm_and_coins_in_one_statement():
+    with patch(
+        "utils.db.games.farm.pool.fetchone",
+        new_callable=AsyncMock,
+        return_value={
+            "chickens": 4,
+            "eggs": 9,
+            "eggs_updated_at": 123,
+            "coop_level": 2,
+            "coins": 500,
+        },
+    ) as mock_fetch:
+        out = await farm.load_farm_player_state(7, 1)
+    query, params = mock_fetch.await_args.args
+    flat = " ".join(query.split())
+    assert "LEFT JOIN chicken_farm" in flat
+    assert "FROM xp" in flat
+    assert params == (7, 1)
+    assert out == farm.FarmPlayerState(4, 9, 123, 2, 500)
+
+
+@pytest.mark.asyncio
+async def test_load_farm_player_state_defaults_a_new_player_to_the_starter_farm():
+    with patch(
+        "utils.db.games.farm.pool.fetchone",
+        new_callable=AsyncMock,
+        return_value={
+            "chickens": None,
+            "eggs": None,
+            "eggs_updated_at": None,
+            "coop_level": None,
+            "coins": None,
+        },
+    ):
+        out = await farm.load_farm_player_state(7, 1)
+    starter = await _starter_farm()
+    assert (out.chickens, out.eggs, out.eggs_updated_at, out.coop_level) == starter
+    assert out.coins == 0
+
+
+async def _starter_farm():
+    with patch(
+        "utils.db.games.farm.pool.fetchone",
+        new_callable=AsyncMock,
+        return_value=None,
+    ):
+        return await farm.get_chicken_farm(7, 1)
@@ -0,0 +1,95 @@
+"""fishing_player_state loader — SQL-shape pins (mock-pool idiom)."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from utils.db.games import fishing_player_state as fps
+
+_EMPTY_ROW = {
+    "energy": None,
+    "energy_updated_at": None,
+    "rod_tier": None,
+    "venue": None,
+    "bait_key": None,
+    "bait_charges": None,
+    "structures": None,
+    "equipment": None,
+    "skills": None,
+    "game_xp": None,
+}
+
+
+@pytest.mark.asyncio
+async def test_load_reads_every_cast_input_in_one_statement():
+    with patch(
+        "utils.db.games.fishing_player_state.pool.fetchone",
+        new_callable=AsyncMock,
+        return_value={
+            "energy": 7,
+            "energy_updated_at": 12345,
+            "rod_tier": 2,
+            "venue": "deepwater",
+            "bait_key": "worm",
+            "bait_charges": 3,
+            "structures": {"dock": 1},
+            "equipment": {"charm": "master angler charm"},
+            "skills": {"angler": 2},
+            "game_xp": {"fishing": 40, "mining": 5},
+        },
+    ) as mock_fetch:
+        state = await fps.load_fishing_player_state(99, 1)
+    query, params = mock_fetch.await_args.args
+    for table in (
+        "fishing_energy",
+        "fishing_rod",
+        "fishing_venue",
+        "fishing_bait",
+        "mining_structures",
+        "mining_equipment",
+        "player_skills",
+        "game_xp",
+    ):
+        assert table in query
+    # mining_equipment keys on the legacy TEXT user id; everything else BIGINT.
+    assert params == (99, 1, "99")
+    assert state == fps.FishingPlayerState(
+        energy=7,
+        energy_updated_at=12345,
+        rod_tier=2,
+        venue="deepwater",
+        bait_key="worm",
+        bait_charges=3,
+        structures={"dock": 1},
+        equipment={"charm": "master angler charm"},
+        skills={"angler": 2},
+        game_xp={"fishing": 40, "mining": 5},
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_defaults_a_new_player_like_the_single_getters():
+    with patch(
+        "utils.db.games.fishing_player_state.pool.fetchone",
+        new_callable=AsyncMock,
+        return_value=_EMPTY_ROW,
+    ):
+        state = await fps.load_fishing_player_state(99, 1)
+    # Full energy bar at epoch, starter rod, shore, no bait, nothing built.
+    assert state == fps.FishingPlayerState()
+    assert (state.energy, state.energy_updated_at) == (60, 0)
+    assert (state.rod_tier, state.venue) == (0, "shore")
+    assert (state.bait_key, state.bait_charges) == ("", 0)
+
+
+@pytest.mark.asyncio
+async def test_load_keeps_a_stored_empty_energy_bar():
+    with patch(
+        "utils.db.games.fishing_player_state.pool.fetchone",
+        new_callable=AsyncMock,
+        return_value={**_EMPTY_ROW, "energy": 0, "energy_updated_at": 500},
+    ):
+        state = await fps.load_fishing_player_state(99, 1)
+    assert (state.energy, state.energy_updated_at) == (0, 500)
@@ -7,7 +7,8 @@ behaviour: `_ordered_migration_versions` must REJECT a structurally invalid set
 silent skip was the RC-6 latent bug (a duplicate version meant the second file
 never applied once the first was recorded).
 
-All tests here are DB-free (pure filename validation), so they run in CI without
+All tests here are DB-free (pure filename validation, and the schema-fingerprint
+fast path against a scripted fake connection), so they run in CI without
 Postgres.  A live fresh-DB bootstrap test is intentionally deferred: it needs a
 Postgres test fixture, which `tests/conftest.py` does not provide and which the
 plan keeps out of scope (adding the fixture is its own infra change).
@@ -16,7 +17,10 @@ plan keeps out of scope (adding the fixture is its own infra change).
 from __future__ import annotations
 
 import os
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
 
+import asyncpg
 import pytest
 
 from utils.db import migrations as runner
@@ -67,3 +71,108 @@ def test_real_migrations_dir_is_valid():
     assert versions == list(range(1, len(versions) + 1)), (
         f"real migrations are not contiguous from 1: {versions}"
     )
+
+
+# ---------------------------------------------------------------------------
+# Schema fingerprint fast path
+# ---------------------------------------------------------------------------
+
+
+def test_schema_fingerprint_tracks_migration_names_and_content(tmp_path, monkeypatch):
+    monkeypatch.setattr(runner, "_MIGRATIONS_DIR", str(tmp_path))
+    (tmp_path / "001_first.sql").write_text("CREATE TABLE a (id INT);")
+    first = runner.schema_fingerprint()
+    assert runner.schema_fingerprint() == first
+
+    (tmp_path / "001_first.sql").write_text("CREATE TABLE a (id BIGINT);")
+    edited = runner.schema_fingerprint()
+    (tmp_path / "002_second.sql").write_text("CREATE TABLE b (id INT);")
+    added = runner.schema_fingerprint()
+    assert len({first, edited, added}) == 3
+
+    (tmp_path / "003-bad.sql").write_text("SELECT 1;")
+    with pytest.raises(MigrationError):
+        runner.schema_fingerprint()
+
+
+def _fake_pool(recorded: list[bool]):
+    """A pool whose one connection answers the fingerprint check from ``recorded``."""
+    conn = MagicMock(name="conn")
+    conn.fetchval = AsyncMock(side_effect=recorded)
+    conn.fetch = AsyncMock(
+        return_value=[{"version": v} for v in range(1, 200)],
+    )
+    conn.execute = AsyncMock()
+
+    @asynccontextmanager
+    async def _acquire():
+        yield conn
+
+    fake = MagicMock()
+    fake.acquire = MagicMock(side_effect=lambda: _acquire())
+    return fake, conn
+
+
+def _statements(conn) -> list[str]:
+    return [c.args[0] for c in conn.execute.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_fast_path_skips_lock_and_ddl(monkeypatch):
+    fake, conn = _fake_pool([True])
+    monkeypatch.setattr(runner.pool, "get", lambda: fake)
+
+    timings = await runner.bootstrap()
+
+    assert timings["fast_path"] is True
+    assert timings["applied"] == 0
+    conn.execute.assert_not_awaited()
+    conn.fetch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_slow_path_runs_ddl_and_records_fingerprint(monkeypatch):
+    fake, conn = _fake_pool([False, False])
+    monkeypatch.setattr(runner.pool, "get", lambda: fake)
+
+    timings = await runner.bootstrap()
+
+    statements = _statements(conn)
+    assert statements[0] == "SELECT pg_advisory_lock($1)"
+    assert any("schema_migrations" in sql for sql in statements)
+    assert any("CREATE TABLE IF NOT EXISTS economy" in sql for sql in statements)
+    insert = next(
+        c for c in conn.execute.await_args_list if "schema_fingerprints" in c.args[0]
+    )
+    assert insert.args[1] == runner.schema_fingerprint()
+    assert statements[-1] == "SELECT pg_advisory_unlock($1)"
+    assert timings["fast_path"] is False
+    assert {"lock_wait_ms", "bootstrap_ddl_ms", "migrations_ms", "total_ms"} <= set(
+        timings,
+    )
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_rechecks_after_waiting_for_the_lock(monkeypatch):
+    """A second replica that waited on the lock finds the first one's fingerprint."""
+    fake, conn = _fake_pool([False, True])
+    monkeypatch.setattr(runner.pool, "get", lambda: fake)
+
+    timings = await runner.bootstrap()
+
+    assert _statements(conn) == [
+        "SELECT pg_advisory_lock($1)",
+        "SELECT pg_advisory_unlock($1)",
+    ]
+    assert timings["fast_path"] is True
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_treats_a_pre_109_database_as_unrecorded(monkeypatch):
+    fake, conn = _fake_pool([asyncpg.UndefinedTableError(""), True])
+    monkeypatch.setattr(runner.pool, "get", lambda: fake)
+
+    timings = await runner.bootstrap()
+
+    assert timings["fast_path"] is True
+    assert _statements(conn)[0] == "SELECT pg_advisory_lock($1)"
@@ -76,27 +76,45 @@ async def test_set_world_seed_upserts():
 
 
 @pytest.mark.asyncio
-async def test_mark_discovered_is_idempotent_insert():
+async def test_mark_discovered_ors_the_cell_bit_into_its_chunk():
     with patch(
         "utils.db.games.mining_grid.pool.execute",
         new_callable=AsyncMock,
     ) as mock_exec:
         await mg.mark_discovered("123", 999, 1, 2, 3)
     query, params = mock_exec.await_args.args
-    assert "INSERT INTO mining_discovered" in query
-    assert "ON CONFLICT" in query and "DO NOTHING" in query
-    assert params == ("123", 999, 1, 2, 3)
+    assert "INSERT INTO mining_discovered_chunks" in query
+    assert "ON CONFLICT" in query and "bits | EXCLUDED.bits" in query
+    # (2, 3) → chunk (0, 0), bit 3 * 8 + 2.
+    assert params == ("123", 999, 1, 0, 0, 1 << 26)
 
 
 @pytest.mark.asyncio
-async def test_get_discovered_window_returns_xy_set():
+async def test_mark_discovered_top_bit_fits_a_signed_bigint():
+    with patch(
+        "utils.db.games.mining_grid.pool.execute",
+        new_callable=AsyncMock,
+    ) as mock_exec:
+        await mg.mark_discovered("123", 999, 0, -1, -1)
+    _, params = mock_exec.await_args.args
+    # (-1, -1) → chunk (-1, -1), bit 63: stored as BIGINT's minimum value.
+    assert params == ("123", 999, 0, -1, -1, -(1 << 63))
+
+
+@pytest.mark.asyncio
+async def test_get_discovered_window_is_one_chunk_query_clipped_to_the_box():
     with patch(
         "utils.db.games.mining_grid.pool.fetchall",
         new_callable=AsyncMock,
-        return_value=[{"x": 1, "y": 2}, {"x": -1, "y": 0}],
+        return_value=[
+            # chunk (0, 0): cells (1, 2) and (7, 7) — the latter is outside the box.
+            {"cx": 0, "cy": 0, "bits": (1 << 17) | -(1 << 63)},
+            # chunk (-1, 0): bit 7 is cell (-1, 0).
+            {"cx": -1, "cy": 0, "bits": 1 << 7},
+        ],
     ) as mock_fetch:
         result = await mg.get_discovered_window("123", 999, 0, -2, 2, -2, 2)
     assert result == {(1, 2), (-1, 0)}
     query, params = mock_fetch.await_args.args
-    assert "FROM mining_discovered" in query
-    assert params == ("123", 999, 0, -2, 2, -2, 2)
+    assert "FROM mining_discovered_chunks" in query
+    assert params == ("123", 999, 0, -1, 0, -1, 0)
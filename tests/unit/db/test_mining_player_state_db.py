@@ -44,3 +44,145 @@ async def test_set_depth_upserts_on_conflict():
     assert "INSERT INTO mining_player_state" in query
     assert "(user_id, guild_id)" in query
     assert params == ("123", 999, 3)
+
+
+# ---------------------------------------------------------------------------
+# load_mining_player_state — the one-round-trip action read
+# ---------------------------------------------------------------------------
+
+
+def _state_row(**overrides):
+    row = {
+        "depth": 0,
+        "x": 0,
+        "y": 0,
+        "energy": 0,
+        "energy_updated_at": 0,
+        "seed": 999,
+        "inventory": None,
+        "equipment": None,
+        "wear": None,
+        "skills": None,
+        "discovered": None,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.mark.asyncio
+async def test_load_state_is_one_query_keyed_text_and_bigint():
+    """The mining tables key on TEXT user ids, ``player_skills`` on BIGINT — the
+    loader takes the int and binds both (the ``!mine`` DataError regression)."""
+    with patch(
+        "utils.db.games.mining_player_state.pool.fetchone",
+        new_callable=AsyncMock,
+        return_value=_state_row(),
+    ) as mock_fetch:
+        await mps.load_mining_player_state(1234, 999)
+    mock_fetch.assert_awaited_once()
+    query, params = mock_fetch.await_args.args
+    assert params == ("1234", 999, 1234, None)
+    assert "FOR UPDATE" not in query
+    for table in (
+        "mining_player_state",
+        "mining_world",
+        "mining_inventory",
+        "mining_equipment",
+        "mining_gear_wear",
+        "player_skills",
+        "mining_discovered_chunks",
+    ):
+        assert table in query
+
+
+@pytest.mark.asyncio
+async def test_load_state_for_update_locks_the_state_row():
+    with (
+        patch("utils.db.games.mining_player_state.pool.execute", new_callable=AsyncMock),
+        patch(
+            "utils.db.games.mining_player_state.pool.fetchone",
+            new_callable=AsyncMock,
+            return_value=_state_row(),
+        ) as mock_fetch,
+    ):
+        await mps.load_mining_player_state(1, 2, for_update=True)
+    query, _ = mock_fetch.await_args.args
+    assert "guild_id = $2 FOR UPDATE" in query
+
+
+@pytest.mark.asyncio
+async def test_load_state_for_update_creates_the_row_to_lock_first():
+    """A first-ever dig has no state row; the locked load inserts one so the
+    lock covers it and a double-clicked first dig still serialises."""
+    calls = []
+    with (
+        patch(
+            "utils.db.games.mining_player_state.pool.execute",
+            new_callable=AsyncMock,
+            side_effect=lambda *a, **k: calls.append("insert"),
+        ) as mock_exec,
+        patch(
+            "utils.db.games.mining_player_state.pool.fetchone",
+            new_callable=AsyncMock,
+            side_effect=lambda *a, **k: calls.append("select") or _state_row(),
+        ),
+    ):
+        await mps.load_mining_player_state(1, 2, for_update=True, conn="tx")
+    assert calls == ["insert", "select"]
+    query, params = mock_exec.await_args.args
+    assert "INSERT INTO mining_player_state" in query
+    assert "DO NOTHING" in query
+    assert params == ("1", 2)
+    assert mock_exec.await_args.kwargs["conn"] == "tx"
+
+
+@pytest.mark.asyncio
+async def test_unlocked_load_writes_nothing():
+    with (
+        patch(
+            "utils.db.games.mining_player_state.pool.execute",
+            new_callable=AsyncMock,
+        ) as mock_exec,
+        patch(
+            "utils.db.games.mining_player_state.pool.fetchone",
+            new_callable=AsyncMock,
+            return_value=_state_row(),
+        ),
+    ):
+        await mps.load_mining_player_state(1, 2)
+    mock_exec.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_load_state_of_a_fresh_player_matches_the_getters_defaults():
+    with patch(
+        "utils.db.games.mining_player_state.pool.fetchone",
+        new_callable=AsyncMock,
+        return_value=_state_row(),
+    ):
+        state = await mps.load_mining_player_state(1, 999)
+    assert (state.x, state.y, state.depth) == (0, 0, 0)
+    assert (state.energy, state.energy_updated_at) == (0, 0)  # get_energy's (0, 0)
+    assert state.seed == 999
+    assert state.inventory == state.equipment == state.wear == state.skills == {}
+    assert state.discovered == frozenset()
+
+
+@pytest.mark.asyncio
+async def test_load_state_decodes_the_discovered_chunks_clipped_to_the_window():
+    row = _state_row(
+        x=1,
+        y=1,
+        inventory={"stone": 3},
+        # chunk (0, 0): cells (1, 2) and (7, 7); chunk (-1, -1): cell (-1, -1).
+        discovered=[[0, 0, (1 << 17) | -(1 << 63)], [-1, -1, -(1 << 63)]],
+    )
+    with patch(
+        "utils.db.games.mining_player_state.pool.fetchone",
+        new_callable=AsyncMock,
+        return_value=row,
+    ) as mock_fetch:
+        state = await mps.load_mining_player_state(1, 999, window=2)
+    assert mock_fetch.await_args.args[1][3] == 2
+    assert state.inventory == {"stone": 3}
+    assert state.discovered == {(1, 2), (-1, -1)}  # (7, 7) is outside the window
@@ -0,0 +1,121 @@
+"""Pool lanes — primary / hot / replica routing + read-your-writes."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import asyncpg
+import pytest
+
+from utils.db import pool
+
+
+def _fake(name: str) -> MagicMock:
+    fake = MagicMock(name=name)
+    fake.fetchrow = AsyncMock(return_value={"lane": name})
+    fake.fetch = AsyncMock(return_value=[{"lane": name}])
+    fake.execute = AsyncMock(return_value="UPDATE 1")
+    return fake
+
+
+@pytest.fixture
+def lanes(monkeypatch):
+    primary, hot, replica = _fake("primary"), _fake("hot"), _fake("replica")
+    monkeypatch.setattr(pool, "get", lambda: primary)
+    pool._lanes.update({pool.LANE_HOT: hot, pool.LANE_REPLICA: replica})
+    return primary, hot, replica
+
+
+@pytest.mark.asyncio
+async def test_default_calls_use_the_primary(lanes):
+    primary, hot, replica = lanes
+    assert await pool.fetchone("SELECT 1 FROM xp") == {"lane": "primary"}
+    hot.fetchrow.assert_not_awaited()
+    replica.fetchrow.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_read_only_goes_to_the_replica_and_hot_lane_is_explicit(lanes):
+    assert await pool.fetchall("SELECT 1 FROM xp", read_only=True) == [
+        {"lane": "replica"},
+    ]
+    await pool.execute("UPDATE xp SET xp = 1", lane=pool.LANE_HOT)
+    lanes[1].execute.assert_awaited_once()
+    lanes[0].execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_missing_lane_falls_back_to_the_primary(monkeypatch):
+    primary = _fake("primary")
+    monkeypatch.setattr(pool, "get", lambda: primary)
+    assert await pool.fetchone("SELECT 1 FROM xp", read_only=True) == {
+        "lane": "primary",
+    }
+    assert pool.lane_pool(pool.LANE_HOT) is primary
+
+
+@pytest.mark.asyncio
+async def test_reads_after_a_write_stay_on_the_primary(lanes, monkeypatch):
+    await pool.execute("UPDATE xp SET coins = 1")
+    assert await pool.fetchone("SELECT 1 FROM xp", read_only=True) == {
+        "lane": "primary",
+    }
+    monkeypatch.setattr(pool, "READ_YOUR_WRITES_SECONDS", 0.0)
+    assert await pool.fetchone("SELECT 1 FROM xp", read_only=True) == {
+        "lane": "replica",
+    }
+
+
+@pytest.mark.asyncio
+async def test_returning_writes_through_fetchone_count_as_writes(lanes):
+    await pool.fetchone("INSERT INTO xp (user_id) VALUES ($1) RETURNING xp", (1,))
+    assert pool.lane_pool(pool.LANE_REPLICA) is lanes[0]
+
+
+@pytest.mark.asyncio
+async def test_rejects_unknown_lanes_and_replica_writes(lanes):
+    with pytest.raises(ValueError):
+        await pool.fetchone("SELECT 1", lane="bulk")
+    with pytest.raises(ValueError):
+        await pool.execute("DELETE FROM xp", lane=pool.LANE_REPLICA)
+
+
+@pytest.mark.asyncio
+async def test_real_pools_report_acquire_wait_and_saturation(monkeypatch):
+    conn = _fake("conn")
+
+    @asynccontextmanager
+    async def _acquire():
+        yield conn
+
+    hot = MagicMock(spec=asyncpg.Pool)
+    hot.acquire = MagicMock(side_effect=lambda: _acquire())
+    hot.get_size.return_value = 3
+    hot.get_idle_size.return_value = 0
+    hot.get_max_size.return_value = 3
+    pool._lanes[pool.LANE_HOT] = hot
+
+    with (
+        patch.object(pool._metrics, "db_pool_acquire_seconds") as wait,
+        patch.object(pool._metrics, "db_pool_saturation") as saturation,
+    ):
+        await pool.execute("UPDATE xp SET xp = 1", lane=pool.LANE_HOT)
+
+    conn.execute.assert_awaited_once_with("UPDATE xp SET xp = 1")
+    wait.labels.assert_called_once_with(lane="hot")
+    saturation.labels.return_value.observe.assert_called_once_with(1.0)
+    assert pool.lane_stats()["hot"] == {"size": 3, "idle": 0, "max": 3}
+
+
+@pytest.mark.asyncio
+async def test_add_xp_runs_on_the_hot_lane_through_the_helpers(lanes):
+    from utils.db import xp
+
+    primary, hot, _ = lanes
+    hot.fetchrow.return_value = {"xp": 10, "level": 0}
+    with patch.object(pool, "_run", wraps=pool._run) as run:
+        assert await xp.add_xp(1, 2, 10, 100) == (10, 0, False)
+    assert run.call_args.args[1] == pool.LANE_HOT
+    primary.fetchrow.assert_not_awaited()
+    assert pool.lane_pool(pool.LANE_REPLICA) is primary
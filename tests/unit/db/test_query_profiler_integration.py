@@ -0,0 +1,85 @@
+"""Real-Postgres integration for the query profiler's plan capture.
+
+``test_query_profiler.py`` fakes the dedicated connection, so it never runs
+``EXPLAIN`` for real.  This suite drives a query through ``utils.db.pool``
+against a live database with the capture threshold at 0 and asserts the
+captured plan is an ANALYZE plan, and that a write is explained without being
+executed.
+
+Like ``test_health_findings_integration.py``, the module-local fixture
+``pytest.skip()``s cleanly when ``DATABASE_URL`` is unset (CI) or the database
+is unreachable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+
+import asyncpg
+import pytest
+import pytest_asyncio
+
+from core.runtime import query_profiler
+from utils.db import pool
+
+
+@pytest_asyncio.fixture
+async def postgres_pool():
+    """Module-local live-Postgres pool; skips cleanly when none is available."""
+    if not os.environ.get("DATABASE_URL"):
+        pytest.skip("DATABASE_URL unset — real-Postgres integration test skipped (CI)")
+    try:
+        await pool.init()
+    except (OSError, asyncpg.PostgresError) as exc:
+        pytest.skip(
+            f"Postgres unreachable ({type(exc).__name__}) — integration test skipped",
+        )
+    query_profiler._reset_for_tests()
+    query_profiler.install()
+    try:
+        yield pool
+    finally:
+        query_profiler._reset_for_tests()
+        await pool.close()
+
+
+async def _wait_for_plan(stats: query_profiler.QueryStats) -> None:
+    for _ in range(100):
+        if stats.plan_state in ("captured", "failed"):
+            return
+        await asyncio.sleep(0.05)
+
+
+@pytest.mark.asyncio
+async def test_slow_read_gets_an_analyze_plan(postgres_pool):
+    query_profiler.configure(explain_threshold_ms=0)
+    rows = await pool.fetchall(
+        "SELECT g FROM generate_series(1, $1::int) AS g WHERE g % 2 = 0",
+        (100,),
+    )
+    assert len(rows) == 50
+
+    [stats] = query_profiler.top(1)
+    await _wait_for_plan(stats)
+    assert stats.fingerprint == (
+        "SELECT g FROM generate_series(?, ?::int) AS g WHERE g % ? = ?"
+    )
+    assert stats.rows == 50
+    assert stats.plan_state == "captured"
+    assert "Function Scan" in stats.plan
+    assert "Execution Time" in stats.plan  # ANALYZE ran
+
+
+@pytest.mark.asyncio
+async def test_slow_write_is_explained_not_executed(postgres_pool):
+    query_profiler.configure(explain_threshold_ms=0)
+    # Matches no row (negative ids never exist); the capture must use plain
+    # EXPLAIN, never ANALYZE, on a write.
+    await pool.execute("UPDATE xp SET xp = xp WHERE user_id = $1", (-1,))
+
+    [stats] = query_profiler.top(1)
+    await _wait_for_plan(stats)
+    assert stats.plan_state == "captured"
+    assert "Update on xp" in stats.plan
+    assert "Execution Time" not in stats.plan
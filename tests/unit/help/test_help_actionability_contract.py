@@ -326,12 +326,6 @@ def _panel_construction_patches(subsystem: str):
                 ),
             )
         )
-        patches.append(
-            patch(
-                "views.farm.menu.db.get_coins",
-                new=AsyncMock(return_value=0),
-            )
-        )
     with contextlib.ExitStack() as stack:
         for p in patches:
             stack.enter_context(p)
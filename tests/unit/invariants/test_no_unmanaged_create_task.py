@@ -6,7 +6,7 @@ strong reference, log exceptions, increment the
 ``task_outcome_total{name,outcome}`` Prometheus counter, and (for
 app-level callers) invoke an ``on_error`` hook.
 
-Bare ``asyncio.create_task`` is allowed only at two locations:
+Bare ``asyncio.create_task`` is allowed only at three locations:
 
 1. ``disbot/core/runtime/tasks.py`` — the legitimate definition site
    inside ``spawn()`` itself.
@@ -14,6 +14,9 @@ Bare ``asyncio.create_task`` is allowed only at two locations:
    inside ``asyncio.wait({...}, timeout=5.0)`` to race the
    health-server bind-ready event against a supervised task.  This is
    not a long-lived background task; it's a transient join helper.
+3. ``disbot/core/runtime/ai/natural_language_stage.py`` — the same
+   shape: a reply's enrichment legs raced inside ``asyncio.wait`` and
+   cancelled in scope when the budget lapses.
 
 PR-02b migrated ``session_gc.start()`` to ``tasks.spawn``; the
 allowlist entry for ``core/runtime/session_gc.py`` has been removed.
@@ -42,6 +45,10 @@ _ALLOWED_CREATE_TASK_SITES: dict[str, int] = {
     # One-shot coordination primitive racing health-bind vs supervised
     # task inside asyncio.wait.  Not a background root.
     "bot1.py": 1,
+    # Per-reply enrichment legs raced inside asyncio.wait under one budget;
+    # every leg is awaited or cancelled before the stage returns.  Not a
+    # background root.
+    "core/runtime/ai/natural_language_stage.py": 1,
 }
 
 
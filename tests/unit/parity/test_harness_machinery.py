@@ -15,6 +15,8 @@ import sys
 import uuid
 from pathlib import Path
 
+import pytest
+
 _REPO_ROOT = Path(__file__).resolve().parents[3]
 if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
@@ -130,6 +132,96 @@ def test_diff_snapshots_empty_on_identical():
     assert diff_snapshots(snap, snap) == {}
 
 
+def test_rebuild_rows_matches_the_full_dump_shape():
+    """The change-log rebuild must equal what ``snapshot`` would dump:
+    normalized, volatile columns scrubbed, same order, duplicates kept."""
+    from parity.harness.dbsnap import rebuild_rows
+
+    stamp = dt.datetime(2026, 1, 1)
+    written = [
+        (1, {"id": 1, "v": "gone", "at": stamp}),  # wiped by TRUNCATE at seq 2
+        (3, {"id": 2, "v": "a", "at": stamp, "snapshot_id": "ab12"}),
+        (4, {"id": 1, "v": "x", "at": stamp}),
+        (5, {"id": 1, "v": "y", "at": stamp}),  # UPDATE x → y
+        (6, {"id": 3, "v": "dup", "at": stamp}),
+        (7, {"id": 3, "v": "dup", "at": stamp}),
+        (8, {"id": 4, "v": "deleted", "at": stamp}),
+    ]
+    removed = [
+        (5, {"id": 1, "v": "x", "at": stamp}),
+        (9, {"id": 4, "v": "deleted", "at": stamp}),
+    ]
+    rows = rebuild_rows(written, removed, since=2)
+    assert rows == [
+        {"id": 1, "v": "y", "at": "<ts>"},
+        {"id": 2, "v": "a", "at": "<ts>", "snapshot_id": "<hexid>"},
+        {"id": 3, "v": "dup", "at": "<ts>"},
+        {"id": 3, "v": "dup", "at": "<ts>"},
+    ]
+    assert rebuild_rows([], []) == []
+
+
+def test_database_dsn_swaps_only_the_database_name():
+    from parity.harness.dbsnap import database_dsn
+
+    dsn = "postgresql://u:p@db.host:5432/superbot?sslmode=disable"
+    assert (
+        database_dsn(dsn, "superbot_parity_w3")
+        == "postgresql://u:p@db.host:5432/superbot_parity_w3?sslmode=disable"
+    )
+
+
+# ---------------------------------------------------------------- parallel
+
+
+def test_shards_partition_the_corpus_independent_of_build_order():
+    from parity.harness.cases import GoldenCase
+    from parity.harness.parallel import shard_cases, worker_database_names
+
+    cases = [
+        GoldenCase(id=f"s.case{i:02d}", subsystem="s", steps=()) for i in range(10)
+    ]
+    shards = [shard_cases(cases, i, 3) for i in range(3)]
+    ids = [c.id for shard in shards for c in shard]
+    assert sorted(ids) == sorted(c.id for c in cases)
+    assert [len(s) for s in shards] == [4, 3, 3]
+    assert shard_cases(list(reversed(cases)), 1, 3) == shards[1]
+    assert worker_database_names("postgresql://h/superbot", 2) == (
+        "superbot_parity_tpl",
+        ["superbot_parity_w0", "superbot_parity_w1"],
+    )
+
+
+def test_merge_shard_results_rejects_gaps_and_disagreement():
+    from parity.harness.parallel import ShardError, merge_shard_results
+
+    ok = {"match": True, "problems": [], "ms": 1.0}
+    corpus = ["b", "a", "c"]
+    merged = merge_shard_results(
+        [
+            {"case_ids": corpus, "results": {"a": ok, "c": ok}},
+            {"case_ids": corpus, "results": {"b": ok}},
+        ],
+    )
+    assert list(merged) == corpus  # corpus order, for a stable report
+    with pytest.raises(ShardError, match="never replayed"):
+        merge_shard_results([{"case_ids": corpus, "results": {"a": ok}}])
+    with pytest.raises(ShardError, match="more than one"):
+        merge_shard_results(
+            [
+                {"case_ids": corpus, "results": {"a": ok, "b": ok, "c": ok}},
+                {"case_ids": corpus, "results": {"a": ok}},
+            ],
+        )
+    with pytest.raises(ShardError, match="different case corpora"):
+        merge_shard_results(
+            [
+                {"case_ids": corpus, "results": {}},
+                {"case_ids": ["a"], "results": {}},
+            ],
+        )
+
+
 # ----------------------------------------------------------------- goldens
 
 
@@ -0,0 +1,234 @@
+"""Token ledger and per-guild / per-task spend budgets.
+
+Pins:
+
+* The gateway records each attempt's provider-reported usage into the
+  collector's ledger (with an estimated cost) and on the ``AIResponse``.
+* ``drain_usage`` / ``restore_usage`` / ``seed_spend`` keep the ledger and the
+  budget totals consistent across flushes, failed flushes and re-seeding.
+* A soft budget breach reroutes to the provider's economy model; a hard breach
+  degrades with ``budget_exhausted:<scope>`` without calling the provider.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.runtime.ai import budget
+from core.runtime.ai.contracts import (
+    AIRequest,
+    AIRequestContext,
+    AIResponseMode,
+    AIScope,
+    AITask,
+)
+from core.runtime.ai.diagnostics import DiagnosticsCollector, TokenUsageRow, _utc_today
+from core.runtime.ai.gateway import AIGateway
+from core.runtime.ai.providers import base
+
+
+@pytest.fixture(autouse=True)
+def _no_guild_policy(monkeypatch):
+    from utils.db import ai as ai_db
+
+    monkeypatch.setattr(ai_db, "get_guild_policy", AsyncMock(return_value=None))
+    monkeypatch.setenv("AI_ENABLED", "1")
+    monkeypatch.setenv("AI_ROUTING_BTD6_ANSWER", "anthropic:claude-haiku-4-5")
+    for name in ("AI_BUDGET_GUILD_DAILY_USD", "AI_BUDGET_BTD6_ANSWER_DAILY_USD"):
+        monkeypatch.delenv(name, raising=False)
+
+
+class _BillingProvider:
+    """Fake provider that reports a fixed usage block per call."""
+
+    name = "anthropic"
+
+    def __init__(self):
+        self.models: list[str] = []
+
+    async def execute(self, request, *, model, dispatch=None):
+        self.models.append(model)
+        base.record_usage(
+            input_tokens=1_000,
+            cached_input_tokens=4_000,
+            output_tokens=200,
+        )
+        return "ok"
+
+
+def _request(guild_id: int | None = 42) -> AIRequest:
+    return AIRequest(
+        context=AIRequestContext(
+            task=AITask.BTD6_ANSWER,
+            scope=AIScope.USER,
+            source="test",
+            guild_id=guild_id,
+        ),
+        system_prompt="system",
+        payload={"text": "hi"},
+        mode=AIResponseMode.TEXT,
+        timeout_seconds=5.0,
+    )
+
+
+def _gateway() -> tuple[AIGateway, _BillingProvider, DiagnosticsCollector]:
+    provider = _BillingProvider()
+    collector = DiagnosticsCollector()
+    gateway = AIGateway(providers={"anthropic": provider}, collector=collector)
+    return gateway, provider, collector
+
+
+def _spend(collector: DiagnosticsCollector, guild_id: int, task: str, micros: int):
+    collector.seed_spend(
+        [
+            TokenUsageRow(
+                day=_utc_today(),
+                guild_id=guild_id,
+                task=task,
+                provider="",
+                model="",
+                cost_micros=micros,
+            ),
+        ],
+    )
+
+
+# --- pricing / limits -------------------------------------------------------
+
+
+def test_cost_uses_longest_prefix_and_prices_unknown_models():
+    mini = budget.cost_micros(
+        "gpt-4o-mini-2024",
+        input_tokens=1_000_000,
+        cached_input_tokens=0,
+        output_tokens=0,
+    )
+    full = budget.cost_micros(
+        "gpt-4o",
+        input_tokens=1_000_000,
+        cached_input_tokens=0,
+        output_tokens=0,
+    )
+    unknown = budget.cost_micros(
+        "mystery-model",
+        input_tokens=1_000_000,
+        cached_input_tokens=0,
+        output_tokens=0,
+    )
+
+    assert (mini, full, unknown) == (150_000, 2_500_000, 3_000_000)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("1.5:4", budget.BudgetLimits(soft_usd=1.5, hard_usd=4.0)),
+        ("4", budget.BudgetLimits(soft_usd=None, hard_usd=4.0)),
+        ("2:", budget.BudgetLimits(soft_usd=2.0, hard_usd=None)),
+        ("lots", budget.BudgetLimits()),
+    ],
+)
+def test_limits_parse(monkeypatch, raw, expected):
+    monkeypatch.setenv("AI_BUDGET_GUILD_DAILY_USD", raw)
+
+    assert budget.guild_daily_limits() == expected
+
+
+def test_check_prefers_a_hard_breach_over_a_soft_one(monkeypatch):
+    collector = DiagnosticsCollector()
+    _spend(collector, 42, AITask.BTD6_ANSWER.value, 3_000_000)
+    monkeypatch.setenv("AI_BUDGET_GUILD_DAILY_USD", "2:10")
+    monkeypatch.setenv("AI_BUDGET_BTD6_ANSWER_DAILY_USD", "1:3")
+
+    verdict = budget.check(collector, 42, AITask.BTD6_ANSWER)
+
+    assert verdict.level is budget.BudgetLevel.HARD
+    assert verdict.scope == "task"
+    assert budget.check(collector, None, AITask.BTD6_ANSWER).level is (
+        budget.BudgetLevel.OK
+    )
+
+
+# --- ledger -----------------------------------------------------------------
+
+
+async def test_gateway_records_usage_in_ledger_and_response():
+    gateway, _provider, collector = _gateway()
+
+    response = await gateway.execute(_request())
+
+    assert (
+        response.input_tokens,
+        response.cached_input_tokens,
+        response.output_tokens,
+    ) == (1_000, 4_000, 200)
+    [row] = collector.drain_usage()
+    assert (row.guild_id, row.task, row.provider, row.requests) == (
+        42,
+        "btd6.answer",
+        "anthropic",
+        1,
+    )
+    # claude-haiku list prices: 1000*1.00 + 4000*0.10 + 200*5.00 micro-USD.
+    assert row.cost_micros == 2_400
+    assert collector.spend_micros(42) == 2_400
+    snap = collector.snapshot()
+    assert snap.cached_input_tokens_observed == 4_000
+
+
+async def test_drain_restore_and_reseed_never_double_count():
+    gateway, _provider, collector = _gateway()
+    await gateway.execute(_request())
+    await gateway.execute(_request())
+
+    rows = collector.drain_usage()
+    assert [r.requests for r in rows] == [2]
+    assert collector.drain_usage() == []
+
+    collector.restore_usage(rows)
+    assert collector.drain_usage()[0].requests == 2
+
+    # Re-seeding with what was already flushed (a cog reload) keeps the
+    # larger in-memory total instead of adding it again.
+    _spend(collector, 42, "btd6.answer", 4_800)
+    assert collector.spend_micros(42, task="btd6.answer") == 4_800
+
+
+async def test_no_guild_usage_lands_under_guild_zero():
+    gateway, _provider, collector = _gateway()
+
+    await gateway.execute(_request(guild_id=None))
+
+    assert collector.drain_usage()[0].guild_id == 0
+
+
+# --- budgets in execute -----------------------------------------------------
+
+
+async def test_soft_budget_reroutes_to_the_economy_model(monkeypatch):
+    monkeypatch.setenv("AI_ROUTING_BTD6_ANSWER", "anthropic:claude-sonnet-4-6")
+    monkeypatch.setenv("AI_BUDGET_GUILD_DAILY_USD", "0.001:5")
+    gateway, provider, collector = _gateway()
+    _spend(collector, 42, "btd6.answer", 2_000)
+
+    response = await gateway.execute(_request())
+
+    assert not response.degraded
+    assert provider.models == ["claude-haiku-4-5"]
+
+
+async def test_hard_budget_degrades_without_calling_the_provider(monkeypatch):
+    monkeypatch.setenv("AI_BUDGET_BTD6_ANSWER_DAILY_USD", "0.01")
+    gateway, provider, collector = _gateway()
+    _spend(collector, 42, "btd6.answer", 10_000)
+
+    response = await gateway.execute(_request())
+
+    assert response.degraded
+    assert response.fallback_reason == "budget_exhausted:task"
+    assert provider.models == []
+    # Another guild is unaffected.
+    other = await gateway.execute(_request(guild_id=7))
+    assert not other.degraded
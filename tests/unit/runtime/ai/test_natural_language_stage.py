@@ -282,6 +282,28 @@ async def test_replied_audit_carries_provider_and_model(
     assert am.everyone is False
 
 
+@pytest.mark.asyncio
+async def test_replied_audit_carries_enrichment_timings(
+    monkeypatch,
+    stub_services,
+):
+    """The reply row records every enrichment leg's duration and outcome."""
+    from services import ai_gateway
+
+    monkeypatch.setattr(
+        ai_gateway,
+        "execute",
+        AsyncMock(return_value=_make_response(text="here is my reply")),
+    )
+
+    await AINaturalLanguageStage().process(_make_ctx(_make_message()))
+
+    [row] = stub_services
+    timings = row["enrichment_timings"]
+    assert set(timings) == {"feature_facts", "recent_turns", "self_knowledge"}
+    assert all(t["outcome"] == "ok" for t in timings.values())
+
+
 @pytest.mark.asyncio
 async def test_preset_short_circuits_before_gateway(monkeypatch, stub_services):
     """An operator-authored vetted preset is served verbatim with NO model call.
@@ -0,0 +1,187 @@
+"""Concurrent enrichment gather in the natural-language stage.
+
+Pins: the legs run concurrently (total ≈ slowest leg, not the sum), a leg
+that misses the budget is cancelled and reported as ``timeout`` while the
+others' results are kept, a raising leg re-raises after the others settle,
+and ``_gather_enrichment`` falls back to empty defaults for missing legs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from core.runtime.ai import natural_language_stage as mod
+from core.runtime.ai.contracts import AITask
+from core.runtime.ai.feature_facts import FeatureFactRequest, FeatureFactsResult
+
+
+async def _sleep_then(seconds: float, value):
+    await asyncio.sleep(seconds)
+    return value
+
+
+@pytest.mark.asyncio
+async def test_legs_run_concurrently():
+    started = time.perf_counter()
+
+    results, timings = await mod._run_enrichment_legs(
+        {
+            "a": _sleep_then(0.2, "A"),
+            "b": _sleep_then(0.2, "B"),
+            "c": _sleep_then(0.2, "C"),
+        },
+        budget_seconds=5.0,
+    )
+
+    assert time.perf_counter() - started < 0.5
+    assert results == {"a": "A", "b": "B", "c": "C"}
+    assert {t["outcome"] for t in timings.values()} == {"ok"}
+    assert all(t["ms"] >= 150 for t in timings.values())
+
+
+@pytest.mark.asyncio
+async def test_slow_leg_is_cancelled_and_reported_as_timeout():
+    cancelled = asyncio.Event()
+
+    async def _slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    results, timings = await mod._run_enrichment_legs(
+        {"fast": _sleep_then(0, "F"), "slow": _slow()},
+        budget_seconds=0.05,
+    )
+
+    assert results == {"fast": "F"}
+    assert timings["slow"] == {"ms": 50, "outcome": "timeout"}
+    assert timings["fast"]["outcome"] == "ok"
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_raising_leg_reraises_after_the_others_finish():
+    finished: list[str] = []
+
+    async def _boom():
+        raise RuntimeError("fact store down")
+
+    async def _other():
+        await asyncio.sleep(0.05)
+        finished.append("other")
+        return "O"
+
+    with pytest.raises(RuntimeError, match="fact store down"):
+        await mod._run_enrichment_legs(
+            {"boom": _boom(), "other": _other()},
+            budget_seconds=5.0,
+        )
+
+    assert finished == ["other"]
+
+
+def _message():
+    return SimpleNamespace(
+        id=1,
+        channel=SimpleNamespace(),
+        author=SimpleNamespace(id=3),
+        guild=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_gather_enrichment_defaults_missing_legs(monkeypatch):
+    monkeypatch.setattr(mod, "_ENRICHMENT_BUDGET_SECONDS", 0.05)
+
+    async def _slow_facts(_req):
+        await asyncio.sleep(10)
+
+    async def _turns(*_a, **_kw):
+        return ["turn"]
+
+    async def _self_blocks(*_a, **_kw):
+        return ("self",)
+
+    async def _btd6_blocks(_text):
+        return ("btd6",)
+
+    monkeypatch.setattr(mod, "_gather_feature_facts", _slow_facts)
+    monkeypatch.setattr(mod, "_gather_recent_turns", _turns)
+    monkeypatch.setattr(mod, "_gather_self_knowledge_blocks", _self_blocks)
+    monkeypatch.setattr(mod, "_gather_btd6_knowledge_blocks", _btd6_blocks)
+
+    enrichment, timings = await mod._gather_enrichment(
+        _message(),
+        fact_req=FeatureFactRequest(
+            task=AITask.BTD6_ANSWER,
+            text="how much is a 0-2-4 dart",
+            guild_id=1,
+            channel_id=2,
+            author_id=3,
+            message_id=1,
+        ),
+        user_text="how much is a 0-2-4 dart",
+        task=AITask.BTD6_ANSWER,
+        guild_id=1,
+        channel_id=2,
+        user_id=3,
+        bot_user_id=None,
+    )
+
+    assert enrichment.feature == FeatureFactsResult(
+        facts=(),
+        error_reason="enrichment_timeout",
+    )
+    assert enrichment.recent_turns == ["turn"]
+    assert enrichment.bot_knowledge_blocks == ("self", "btd6")
+    assert set(timings) == {
+        "feature_facts",
+        "recent_turns",
+        "self_knowledge",
+        "btd6_knowledge",
+    }
+    assert timings["feature_facts"]["outcome"] == "timeout"
+
+
+@pytest.mark.asyncio
+async def test_non_btd6_turn_skips_the_btd6_leg(monkeypatch):
+    async def _facts(_req):
+        return FeatureFactsResult(facts=("f",))
+
+    async def _empty(*_a, **_kw):
+        return ()
+
+    async def _btd6_blocks(_text):  # pragma: no cover - must not run
+        raise AssertionError("btd6 leg ran for a general turn")
+
+    monkeypatch.setattr(mod, "_gather_feature_facts", _facts)
+    monkeypatch.setattr(mod, "_gather_recent_turns", _empty)
+    monkeypatch.setattr(mod, "_gather_self_knowledge_blocks", _empty)
+    monkeypatch.setattr(mod, "_gather_btd6_knowledge_blocks", _btd6_blocks)
+
+    enrichment, timings = await mod._gather_enrichment(
+        _message(),
+        fact_req=FeatureFactRequest(
+            task=AITask.GENERAL_NL_ANSWER,
+            text="hi",
+            guild_id=1,
+            channel_id=2,
+            author_id=3,
+            message_id=1,
+        ),
+        user_text="hi",
+        task=AITask.GENERAL_NL_ANSWER,
+        guild_id=1,
+        channel_id=2,
+        user_id=3,
+        bot_user_id=None,
+    )
+
+    assert enrichment.feature.facts == ("f",)
+    assert "btd6_knowledge" not in timings
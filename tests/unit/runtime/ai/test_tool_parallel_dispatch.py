@@ -0,0 +1,312 @@
+"""Concurrent tool dispatch within one assistant turn.
+
+Pins the contract of the parallel tool path:
+
+* ``run_tool_calls`` runs a turn's calls concurrently under the
+  ``max_parallel_calls`` cap and returns results in call order.
+* Both adapters feed results back in the order the model asked for them,
+  even when a later call finishes first.
+* The gateway's dispatch bounds each handler by a per-call timeout
+  (converted to a ``tool_timeout`` JSON error, never raised).
+* Identical ``(tool, arguments)`` calls within a conversation run the
+  handler once — concurrently or across hops — and failures are not
+  memoised.
+* Tools the catalogue marks not parallel-safe are serialised per request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from core.runtime.ai.contracts import (
+    AIRequest,
+    AIRequestContext,
+    AIResponseMode,
+    AIScope,
+    AITask,
+    AIToolBudget,
+    AIToolSpec,
+)
+from core.runtime.ai.gateway import AIGateway
+from core.runtime.ai.providers import base
+from core.runtime.ai.providers.anthropic_provider import AnthropicProvider
+from core.runtime.ai.providers.openai_provider import OpenAIProvider
+from services import ai_tool_catalogue, ai_tools
+
+
+def _request(*names: str, budget: AIToolBudget | None = None) -> AIRequest:
+    return AIRequest(
+        context=AIRequestContext(
+            task=AITask.GENERAL_NL_ANSWER,
+            scope=AIScope.USER,
+            source="test",
+        ),
+        system_prompt="system",
+        payload={"text": "hi"},
+        mode=AIResponseMode.TEXT,
+        timeout_seconds=5.0,
+        tools=tuple(
+            AIToolSpec(
+                name=name,
+                description=name,
+                parameters={"type": "object", "properties": {}},
+            )
+            for name in names
+        ),
+        tool_budget=budget or AIToolBudget(),
+    )
+
+
+class _CapturingProvider:
+    name = "openai"
+
+    def __init__(self):
+        self.dispatch = None
+
+    async def execute(self, request, *, model, dispatch=None):
+        self.dispatch = dispatch
+        return "ok"
+
+
+async def _dispatch_for(monkeypatch, request, handlers):
+    monkeypatch.setenv("AI_ENABLED", "1")
+    monkeypatch.setenv("AI_TOOLS_ENABLED", "1")
+    provider = _CapturingProvider()
+    gateway = AIGateway(providers={"openai": provider})
+    await gateway.execute(request, provider_override=provider, tool_handlers=handlers)
+    assert provider.dispatch is not None
+    return provider.dispatch
+
+
+# --- run_tool_calls -----------------------------------------------------
+
+
+async def test_run_tool_calls_is_concurrent_and_ordered():
+    active = 0
+    peak = 0
+
+    async def dispatch(name, _args):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        # Later calls finish first: order must still follow the request.
+        await asyncio.sleep(0.01 * (5 - int(name)))
+        active -= 1
+        return name
+
+    calls = [(str(i), {}) for i in range(5)]
+    results = await base.run_tool_calls(dispatch, calls, max_parallel=3)
+
+    assert results == ["0", "1", "2", "3", "4"]
+    assert peak == 3
+
+
+async def test_run_tool_calls_single_lane_is_sequential():
+    active = 0
+    peak = 0
+
+    async def dispatch(name, _args):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return name
+
+    results = await base.run_tool_calls(
+        dispatch,
+        [("a", {}), ("b", {})],
+        max_parallel=1,
+    )
+
+    assert results == ["a", "b"]
+    assert peak == 1
+
+
+# --- adapters -----------------------------------------------------------
+
+
+def _openai_call(call_id, name):
+    return SimpleNamespace(
+        id=call_id,
+        type="function",
+        function=SimpleNamespace(name=name, arguments="{}"),
+    )
+
+
+class _OpenAIClient:
+    def __init__(self, responses):
+        self.calls: list[dict] = []
+        responses = list(responses)
+
+        async def create(**kwargs):
+            self.calls.append(kwargs)
+            return responses.pop(0)
+
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+
+async def _slow_first_dispatch(name, _args):
+    await asyncio.sleep(0.02 if name == "slow" else 0)
+    return name
+
+
+async def test_openai_feeds_parallel_results_in_call_order():
+    client = _OpenAIClient(
+        [
+            SimpleNamespace(
+                choices=[
+                    SimpleNamespace(
+                        message=SimpleNamespace(
+                            content=None,
+                            tool_calls=[
+                                _openai_call("c1", "slow"),
+                                _openai_call("c2", "fast"),
+                            ],
+                        ),
+                    ),
+                ],
+            ),
+            SimpleNamespace(
+                choices=[
+                    SimpleNamespace(
+                        message=SimpleNamespace(content="done", tool_calls=None),
+                    ),
+                ],
+            ),
+        ],
+    )
+    provider = OpenAIProvider(client=client)
+
+    text = await provider.execute(
+        _request("slow", "fast"),
+        model="m",
+        dispatch=_slow_first_dispatch,
+    )
+
+    assert text == "done"
+    tool_turns = [m for m in client.calls[1]["messages"] if m.get("role") == "tool"]
+    assert [(m["tool_call_id"], m["content"]) for m in tool_turns] == [
+        ("c1", "slow"),
+        ("c2", "fast"),
+    ]
+
+
+async def test_anthropic_feeds_parallel_results_in_call_order():
+    calls: list[dict] = []
+    responses = [
+        SimpleNamespace(
+            content=[
+                SimpleNamespace(type="tool_use", id="t1", name="slow", input={}),
+                SimpleNamespace(type="tool_use", id="t2", name="fast", input={}),
+            ],
+        ),
+        SimpleNamespace(content=[SimpleNamespace(type="text", text="done")]),
+    ]
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        return responses.pop(0)
+
+    client = SimpleNamespace(messages=SimpleNamespace(create=create))
+    provider = AnthropicProvider(client=client)
+
+    text = await provider.execute(
+        _request("slow", "fast"),
+        model="claude-x",
+        dispatch=_slow_first_dispatch,
+    )
+
+    assert text == "done"
+    results = calls[1]["messages"][-1]["content"]
+    assert [(r["tool_use_id"], r["content"]) for r in results] == [
+        ("t1", "slow"),
+        ("t2", "fast"),
+    ]
+
+
+# --- gateway dispatch ---------------------------------------------------
+
+
+async def test_dispatch_times_out_a_hung_handler(monkeypatch):
+    async def hung(_args):
+        await asyncio.sleep(5)
+
+    dispatch = await _dispatch_for(
+        monkeypatch,
+        _request("hung", budget=AIToolBudget(max_call_seconds=0.01)),
+        {"hung": hung},
+    )
+
+    out = await dispatch("hung", {})
+
+    assert json.loads(out) == {"error": "tool_timeout", "tool": "hung"}
+
+
+async def test_dispatch_memoises_identical_calls(monkeypatch):
+    runs: list[dict] = []
+
+    async def lookup(args):
+        runs.append(args)
+        await asyncio.sleep(0.01)
+        return {"name": args.get("name")}
+
+    dispatch = await _dispatch_for(monkeypatch, _request("lookup"), {"lookup": lookup})
+
+    # Two identical calls in flight at once, plus a later repeat with the
+    # arguments in a different order: one handler run.
+    first, second = await asyncio.gather(
+        dispatch("lookup", {"name": "Ezili", "tier": 3}),
+        dispatch("lookup", {"name": "Ezili", "tier": 3}),
+    )
+    third = await dispatch("lookup", {"tier": 3, "name": "Ezili"})
+    other = await dispatch("lookup", {"name": "Obyn"})
+
+    assert first == second == third
+    assert json.loads(other)["name"] == "Obyn"
+    assert runs == [{"name": "Ezili", "tier": 3}, {"name": "Obyn"}]
+
+
+async def test_dispatch_does_not_memoise_failures(monkeypatch):
+    attempts = 0
+
+    async def flaky(_args):
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("transient")
+        return {"ok": True}
+
+    dispatch = await _dispatch_for(monkeypatch, _request("flaky"), {"flaky": flaky})
+
+    assert json.loads(await dispatch("flaky", {}))["error"] == "tool_failed"
+    assert json.loads(await dispatch("flaky", {})) == {"ok": True}
+    assert attempts == 2
+
+
+# --- registry serialisation ----------------------------------------------
+
+
+def test_open_support_ticket_is_the_only_serial_tool():
+    assert ai_tool_catalogue.serial_tool_names() == frozenset({"open_support_ticket"})
+
+
+async def test_serialised_handler_never_overlaps():
+    lock = asyncio.Lock()
+    active = 0
+    peak = 0
+
+    async def handler(_args):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {}
+
+    wrapped = ai_tools._serialised(handler, lock)
+    await asyncio.gather(wrapped({"a": 1}), wrapped({"a": 2}), wrapped({"a": 3}))
+
+    assert peak == 1
@@ -0,0 +1,99 @@
+"""Tests for core.runtime.extension_waves + the wave loader in bot1._load_cogs."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import bot1
+import config
+from core.runtime import extension_waves, startup_outcome
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    startup_outcome.reset_for_tests()
+    yield
+    startup_outcome.reset_for_tests()
+
+
+def test_plan_puts_first_alone_and_dependents_after_their_dependencies():
+    waves = extension_waves.plan_waves(
+        ["cogs.guard", "cogs.a", "cogs.b", "cogs.c", "cogs.d"],
+        first=["cogs.guard"],
+        dependencies={"cogs.c": ["cogs.a"], "cogs.d": ["cogs.c", "cogs.missing"]},
+    )
+    assert waves == [["cogs.guard"], ["cogs.a", "cogs.b"], ["cogs.c"], ["cogs.d"]]
+
+
+def test_plan_infers_registry_dependencies():
+    # inventory declares `dependencies: ["economy"]` in the subsystem registry.
+    waves = extension_waves.plan_waves(["cogs.inventory_cog", "cogs.economy_cog"])
+    assert waves == [["cogs.economy_cog"], ["cogs.inventory_cog"]]
+
+
+def test_plan_rejects_cycles():
+    with pytest.raises(ValueError, match="cycle"):
+        extension_waves.plan_waves(
+            ["cogs.a", "cogs.b"],
+            dependencies={"cogs.a": ["cogs.b"], "cogs.b": ["cogs.a"]},
+        )
+
+
+def test_real_extension_list_plans_cleanly():
+    waves = extension_waves.plan_waves(
+        config.INITIAL_EXTENSIONS,
+        first=config.EXTENSIONS_LOAD_FIRST,
+        dependencies=config.EXTENSION_DEPENDENCIES,
+    )
+    assert waves[0] == ["cogs.bootstrap_access_cog"]
+    assert sorted(ext for wave in waves for ext in wave) == sorted(
+        config.INITIAL_EXTENSIONS,
+    )
+    for dependent, deps in config.EXTENSION_DEPENDENCIES.items():
+        assert dependent in config.INITIAL_EXTENSIONS
+        assert set(deps) <= set(config.INITIAL_EXTENSIONS)
+
+
+@pytest.mark.asyncio
+async def test_load_cogs_runs_a_wave_concurrently_and_records_timings(monkeypatch):
+    monkeypatch.setattr(
+        config,
+        "INITIAL_EXTENSIONS",
+        ["cogs.guard", "cogs.a", "cogs.b", "cogs.c"],
+    )
+    monkeypatch.setattr(config, "EXTENSIONS_LOAD_FIRST", ("cogs.guard",))
+    monkeypatch.setattr(config, "EXTENSION_DEPENDENCIES", {"cogs.c": ("cogs.a",)})
+    monkeypatch.setattr(config, "COG_LOAD_CONCURRENCY", 8)
+    monkeypatch.setattr(bot1, "reporter", None)
+
+    in_flight: list[str] = []
+    overlaps: set[frozenset[str]] = set()
+    loaded: list[str] = []
+
+    async def _load_extension(ext: str) -> None:
+        in_flight.append(ext)
+        overlaps.add(frozenset(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(ext)
+        loaded.append(ext)
+
+    monkeypatch.setattr(bot1.bot, "load_extension", _load_extension)
+    await bot1._load_cogs()
+
+    assert loaded[0] == "cogs.guard"
+    assert loaded.index("cogs.c") > loaded.index("cogs.a")
+    assert frozenset({"cogs.a", "cogs.b"}) in overlaps
+    outcomes = {o.name: o for o in startup_outcome.all_extension_outcomes()}
+    assert [outcomes[n].wave for n in ("cogs.guard", "cogs.a", "cogs.c")] == [0, 1, 2]
+    assert all(o.success and o.duration_ms >= 5 for o in outcomes.values())
+    assert len(startup_outcome.slowest_extensions(2)) == 2
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("", 8), ("4", 4), (" 2 ", 2), ("0", 1), ("-3", 1), ("eight", 8), ("1.5", 8)],
+)
+def test_cog_load_concurrency_parse_never_raises(raw: str, expected: int):
+    assert config._parse_positive_int(raw, 8) == expected
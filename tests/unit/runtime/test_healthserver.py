@@ -404,3 +404,43 @@ async def test_lifecycle_endpoint_is_registered_on_the_router():
     app = app_captured[0]
     paths = {route.resource.canonical for route in app.router.routes()}
     assert "/lifecycle" in paths
+    assert "/queries" in paths
+
+
+# ---------------------------------------------------------------------------
+# /queries — top-N query-profiler fingerprints as JSON (stats, no plans).
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_queries_endpoint_returns_top_fingerprints():
+    import json as _json
+
+    from core.runtime import query_profiler
+    from healthserver import _queries_handler
+
+    query_profiler._reset_for_tests()
+    query_profiler.configure(explain_threshold_ms=10_000)
+    query_profiler.observe("SELECT * FROM xp WHERE user_id = $1", (1,), 40.0, 1)
+    query_profiler.observe("SELECT * FROM economy WHERE user_id = $1", (1,), 5.0, 1)
+
+    request = MagicMock()
+    request.query = {"limit": "1", "sort": "total"}
+    response = await _queries_handler(request)
+
+    assert response.status == 200
+    body = _json.loads(response.text)
+    assert body["tracked"] == 2
+    [top] = body["queries"]
+    assert top["fingerprint"] == "SELECT * FROM xp WHERE user_id = ?"
+    assert top["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queries_endpoint_rejects_a_bad_sort():
+    from healthserver import _queries_handler
+
+    request = MagicMock()
+    request.query = {"sort": "bogus"}
+    response = await _queries_handler(request)
+    assert response.status == 400
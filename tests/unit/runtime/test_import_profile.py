@@ -0,0 +1,99 @@
+"""Tests for core.runtime.import_profile + the boot import budget."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from core.runtime import import_profile
+
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture
+def fake_pkg(tmp_path, monkeypatch):
+    pkg = tmp_path / "_profiled_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("import time\ntime.sleep(0.01)\n")
+    (pkg / "child.py").write_text(
+        "import time\ntime.sleep(0.02)\nimport _profiled_pkg.leaf\n",
+    )
+    (pkg / "leaf.py").write_text("import time\ntime.sleep(0.03)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    for name in list(sys.modules):
+        if name.startswith("_profiled_pkg"):
+            del sys.modules[name]
+
+
+def test_capture_splits_self_and_cumulative_time(fake_pkg):
+    summary: dict = {}
+    with import_profile.capture(summary):
+        import _profiled_pkg.child  # noqa: F401
+
+    by_name = {t.name: t for t in import_profile.timings()}
+    leaf, child = by_name["_profiled_pkg.leaf"], by_name["_profiled_pkg.child"]
+    assert leaf.depth == child.depth + 1
+    assert child.cumulative_ms >= leaf.cumulative_ms + 15
+    assert child.self_ms == pytest.approx(
+        child.cumulative_ms - leaf.cumulative_ms,
+        abs=0.01,
+    )
+    assert summary["modules"] == 3
+    assert summary["slowest"][0].startswith("_profiled_pkg.leaf ")
+    assert import_profile.slowest(1)[0].name == "_profiled_pkg.leaf"
+    assert import_profile.slowest(1, by="cumulative")[0].name == "_profiled_pkg.child"
+
+
+def test_capture_uninstalls_its_finder_and_reports_deferred(fake_pkg, monkeypatch):
+    monkeypatch.setitem(sys.modules, "anthropic", object())
+    summary: dict = {}
+    with pytest.raises(RuntimeError), import_profile.capture(summary):
+        raise RuntimeError("boom")
+    assert not any(
+        isinstance(f, import_profile._TimingFinder) for f in sys.meta_path
+    )
+    assert summary["modules"] == 0
+    assert "anthropic" in summary["deferred_loaded"]
+
+    import _profiled_pkg  # noqa: F401  — not timed outside capture()
+
+    assert import_profile.timings() == ()
+
+
+def test_boot_does_not_import_deferred_modules(tmp_path):
+    """Importing bot1 + every startup extension (what `_load_cogs` imports)
+    must leave BOOT_DEFERRED_MODULES unimported.  Runs in a fresh
+    interpreter so modules cached by other tests cannot mask or fake it."""
+    script = textwrap.dedent(
+        f"""
+        import importlib, json, sys
+        sys.path.insert(0, {str(_REPO_ROOT / "disbot")!r})
+        import bot1, config
+        from core.runtime import import_profile
+        for ext in config.INITIAL_EXTENSIONS:
+            importlib.import_module(ext)
+        print(json.dumps(import_profile.deferred_loaded()))
+        """,
+    )
+    result = subprocess.run(  # noqa: S603 — script literal under our control
+        [sys.executable, "-c", script],
+        cwd=tmp_path,  # bot1 opens bot.log in the working directory
+        env={**os.environ, "DISCORD_BOT_TOKEN_PRODUCTION": "TEST_TOKEN_PLACEHOLDER"},
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    assert loaded == [], (
+        f"imported at boot: {loaded} — load them on first use "
+        "(utils.lazy_import.lazy_module or a function-local import)"
+    )
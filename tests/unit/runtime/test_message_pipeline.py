@@ -10,6 +10,9 @@ Covers the orchestrator contract:
   - moderation_action triggers the routing hook
   - latency metric is observed per (stage, message) regardless of outcome
   - setup(bot) is idempotent
+  - routed stages are skipped (no call, no metric) outside their channels
+  - per-channel/guild EWMA rates drive LoadPolicy shedding (shed counted)
+  - the command-prefix flag and command context are parsed once per message
 """
 
 from __future__ import annotations
@@ -22,6 +25,7 @@ import pytest
 
 from core.runtime import message_pipeline
 from core.runtime.message_pipeline import (
+    LoadPolicy,
     MessagePipelineContext,
     ModerationActionDescriptor,
     StageResult,
@@ -32,11 +36,19 @@ from core.runtime.message_pipeline import (
 # ---------------------------------------------------------------------------
 
 
-def _make_message(*, is_bot: bool = False, has_guild: bool = True):
+def _make_message(
+    *,
+    is_bot: bool = False,
+    has_guild: bool = True,
+    channel_id: int = 2,
+    content: str = "hello",
+):
     msg = SimpleNamespace()
     msg.id = 12345
+    msg.content = content
     msg.author = SimpleNamespace(bot=is_bot)
     msg.guild = SimpleNamespace(id=1) if has_guild else None
+    msg.channel = SimpleNamespace(id=channel_id)
     return msg
 
 
@@ -239,6 +251,233 @@ class TestDispatchOrdering:
         assert seen_metadata == [{"from_a": "hello"}]
 
 
+# ---------------------------------------------------------------------------
+# Channel routing
+# ---------------------------------------------------------------------------
+
+
+class TestChannelRouting:
+    @pytest.mark.asyncio
+    async def test_unrouted_stage_runs_everywhere(self):
+        s = _SpyStage(name="x", order=10)
+        message_pipeline.register(s)
+        message_pipeline.bind_channel("x", 1, 99)  # bind alone never routes
+
+        await message_pipeline.dispatch(MagicMock(), _make_message(channel_id=2))
+        assert len(s.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_routed_stage_skipped_outside_its_channels(self):
+        routed = _SpyStage(name="chain", order=10)
+        everywhere = _SpyStage(name="xp", order=20)
+        message_pipeline.register(routed)
+        message_pipeline.register(everywhere)
+        message_pipeline.load_routes("chain", [(1, 7)])
+
+        with patch.object(message_pipeline.metrics, "message_pipeline_stage_seconds") as h:
+            await message_pipeline.dispatch(MagicMock(), _make_message(channel_id=2))
+            await message_pipeline.dispatch(MagicMock(), _make_message(channel_id=7))
+
+        assert len(routed.calls) == 1
+        assert routed.calls[0].message.channel.id == 7
+        assert len(everywhere.calls) == 2
+        observed = [c.kwargs["stage"] for c in h.labels.call_args_list]
+        assert observed.count("chain") == 1
+
+    def test_load_routes_unions_with_racing_binds(self):
+        message_pipeline.bind_channel("chain", 1, 5)
+        message_pipeline.load_routes("chain", [(1, 6)])
+        assert message_pipeline.channel_stages(1, 5) == {"chain"}
+        assert message_pipeline.channel_stages(1, 6) == {"chain"}
+
+    def test_set_guild_routes_replaces_only_that_guild_and_stage(self):
+        message_pipeline.set_guild_routes("counting", 1, [5, 6])
+        message_pipeline.set_guild_routes("counting", 2, [9])
+        message_pipeline.bind_channel("chain", 1, 5)
+
+        message_pipeline.set_guild_routes("counting", 1, [6])
+
+        assert message_pipeline.channel_stages(1, 5) == {"chain"}
+        assert message_pipeline.channel_stages(1, 6) == {"counting"}
+        assert message_pipeline.channel_stages(2, 9) == {"counting"}
+
+    def test_unbind_without_guild_searches_every_guild(self):
+        message_pipeline.load_routes("chain", [(1, 5), (2, 5)])
+        message_pipeline.unbind_channel("chain", None, 5)
+        assert message_pipeline.channel_stages(1, 5) == frozenset()
+        assert message_pipeline._ROUTES == {}
+
+    @pytest.mark.asyncio
+    async def test_unregister_unroutes_the_stage(self):
+        s = _SpyStage(name="chain", order=10)
+        message_pipeline.register(s)
+        message_pipeline.load_routes("chain", [(1, 7)])
+        message_pipeline.unregister("chain")
+        message_pipeline.register(s)
+
+        await message_pipeline.dispatch(MagicMock(), _make_message(channel_id=2))
+        assert len(s.calls) == 1
+
+
+@dataclass
+class _PolicyStage(_SpyStage):
+    load_policy: LoadPolicy | None = None
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = _Clock()
+    monkeypatch.setattr(message_pipeline.time, "monotonic", c)
+    return c
+
+
+class TestLoadShedding:
+    @pytest.mark.asyncio
+    async def test_rate_counts_messages_and_decays(self, clock):
+        for _ in range(10):
+            await message_pipeline.dispatch(MagicMock(), _make_message(channel_id=2))
+        assert message_pipeline.channel_rate(2) == pytest.approx(10.0)
+        assert message_pipeline.guild_rate(1) == pytest.approx(10.0)
+        assert message_pipeline.channel_rate(3) == 0.0
+
+        clock.now += message_pipeline.RATE_WINDOW_SECONDS
+        assert message_pipeline.channel_rate(2) == pytest.approx(10.0 / 2.718281828)
+
+    @pytest.mark.asyncio
+    async def test_prefiltered_messages_do_not_count(self, clock):
+        await message_pipeline.dispatch(MagicMock(), _make_message(is_bot=True))
+        assert message_pipeline.channel_rate(2) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_context_carries_the_rates(self, clock):
+        s = _SpyStage(name="x", order=10)
+        message_pipeline.register(s)
+        await message_pipeline.dispatch(MagicMock(), _make_message(channel_id=2))
+        await message_pipeline.dispatch(MagicMock(), _make_message(channel_id=3))
+        assert s.calls[1].channel_rate == pytest.approx(1.0)
+        assert s.calls[1].guild_rate == pytest.approx(2.0)
+
+    @pytest.mark.asyncio
+    async def test_stage_is_shed_over_threshold_and_counted(self, clock):
+        optional = _PolicyStage(
+            name="ai", order=70, load_policy=LoadPolicy(channel_per_minute=3)
+        )
+        always = _SpyStage(name="xp", order=30)
+        message_pipeline.register(optional)
+        message_pipeline.register(always)
+
+        with patch.object(message_pipeline.metrics, "message_pipeline_shed_total") as c:
+            for _ in range(5):
+                await message_pipeline.dispatch(MagicMock(), _make_message())
+
+        assert len(optional.calls) == 3
+        assert len(always.calls) == 5
+        c.labels.assert_called_with(stage="ai")
+        assert c.labels.return_value.inc.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_guild_threshold_sheds_across_channels(self, clock):
+        optional = _PolicyStage(
+            name="ai", order=70, load_policy=LoadPolicy(guild_per_minute=2)
+        )
+        message_pipeline.register(optional)
+        for channel_id in (2, 3, 4):
+            await message_pipeline.dispatch(
+                MagicMock(), _make_message(channel_id=channel_id)
+            )
+        assert [c.message.channel.id for c in optional.calls] == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_keep_predicate_exempts_messages(self, clock):
+        policy = LoadPolicy(
+            channel_per_minute=0, keep=lambda ctx: ctx.message.content == "@bot"
+        )
+        optional = _PolicyStage(name="ai", order=70, load_policy=policy)
+        message_pipeline.register(optional)
+        await message_pipeline.dispatch(MagicMock(), _make_message(content="hi"))
+        await message_pipeline.dispatch(MagicMock(), _make_message(content="@bot"))
+        assert [c.message.content for c in optional.calls] == ["@bot"]
+
+    @pytest.mark.asyncio
+    async def test_on_shed_hook_hears_each_shed_message(self, clock):
+        shed: list[int] = []
+
+        @dataclass
+        class _HookStage(_PolicyStage):
+            def on_shed(self, ctx):
+                shed.append(ctx.message.id)
+
+        optional = _HookStage(
+            name="ai", order=70, load_policy=LoadPolicy(channel_per_minute=1)
+        )
+        message_pipeline.register(optional)
+        messages = [_make_message() for _ in range(3)]
+        for message in messages:
+            await message_pipeline.dispatch(MagicMock(), message)
+
+        assert len(optional.calls) == 1
+        assert shed == [m.id for m in messages[1:]]
+
+    @pytest.mark.asyncio
+    async def test_sample_lets_a_fraction_through(self, clock, monkeypatch):
+        optional = _PolicyStage(
+            name="ai",
+            order=70,
+            load_policy=LoadPolicy(channel_per_minute=0, sample=0.25),
+        )
+        message_pipeline.register(optional)
+        rolls = iter([0.1, 0.5, 0.2, 0.9])
+        monkeypatch.setattr(message_pipeline.random, "random", lambda: next(rolls))
+        for _ in range(4):
+            await message_pipeline.dispatch(MagicMock(), _make_message())
+        assert len(optional.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_table_is_bounded(self, clock, monkeypatch):
+        monkeypatch.setattr(message_pipeline, "_MAX_TRACKED_CHANNELS", 2)
+        for channel_id in (2, 3, 4):
+            await message_pipeline.dispatch(
+                MagicMock(), _make_message(channel_id=channel_id)
+            )
+        assert list(message_pipeline._CHANNEL_RATES) == [3, 4]
+
+
+class TestSharedCommandParse:
+    @pytest.mark.parametrize(
+        ("prefix", "content", "expected"),
+        [
+            ("!", "  !help", True),
+            ("!", "hello", False),
+            (["?", "!"], "?rank", True),
+            (lambda bot, msg: "!", "!help", True),
+        ],
+    )
+    def test_command_prefixed(self, prefix, content, expected):
+        bot = SimpleNamespace(command_prefix=prefix)
+        ctx = MessagePipelineContext(bot=bot, message=_make_message(content=content))
+        assert ctx.command_prefixed is expected
+
+    @pytest.mark.asyncio
+    async def test_command_context_parsed_once(self):
+        bot = MagicMock()
+        bot.get_context = AsyncMock(return_value=MagicMock(valid=False))
+        ctx = MessagePipelineContext(bot=bot, message=_make_message())
+
+        first = await ctx.command_context()
+        second = await ctx.command_context()
+
+        assert first is second
+        bot.get_context.assert_awaited_once()
+
+
 # ---------------------------------------------------------------------------
 # Moderation routing
 # ---------------------------------------------------------------------------
@@ -0,0 +1,244 @@
+"""Tests for core.runtime.query_profiler — per-fingerprint stats + plan capture."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.runtime import query_profiler as qp
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    qp._reset_for_tests()
+    yield
+    qp._reset_for_tests()
+
+
+def _fake_connection(plan_rows):
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.fetch = AsyncMock(return_value=[(line,) for line in plan_rows])
+    tr = MagicMock()
+    tr.start = AsyncMock()
+    tr.rollback = AsyncMock()
+    conn.transaction = MagicMock(return_value=tr)
+
+    @asynccontextmanager
+    async def _dedicated():
+        yield conn
+
+    return conn, tr, _dedicated
+
+
+async def _drain() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+# ---------------------------------------------------------------------------
+# fingerprint
+# ---------------------------------------------------------------------------
+
+
+def test_fingerprint_strips_literals_params_and_whitespace():
+    a = qp.fingerprint("SELECT * FROM xp\n  WHERE user_id = $1 AND note = 'it''s'  -- c")
+    b = qp.fingerprint("select * FROM xp WHERE user_id = 42 AND note = 'other'")
+    assert a == "SELECT * FROM xp WHERE user_id = ? AND note = ?"
+    assert b == "select * FROM xp WHERE user_id = ? AND note = ?"
+
+
+def test_fingerprint_folds_in_lists_and_keeps_identifiers():
+    shape = qp.fingerprint("SELECT t1.a FROM t1 WHERE id IN ($1, $2, $3) LIMIT 10")
+    assert shape == "SELECT t1.a FROM t1 WHERE id IN (...) LIMIT ?"
+
+
+# ---------------------------------------------------------------------------
+# observe / top / get
+# ---------------------------------------------------------------------------
+
+
+def test_observe_aggregates_per_fingerprint():
+    qp.configure(explain_threshold_ms=10_000)
+    for ms in range(1, 21):
+        qp.observe("SELECT * FROM xp WHERE user_id = $1", (ms,), float(ms), 1)
+    qp.observe("SELECT * FROM xp WHERE user_id = 7", (), 5.0, 0)
+
+    [stats] = qp.top(5)
+    assert stats.calls == 21
+    assert stats.total_ms == pytest.approx(215.0)
+    assert stats.max_ms == 20.0
+    assert stats.rows == 20
+    assert stats.p95_ms == 19.0
+    assert qp.get(stats.query_id[:6]) is stats
+
+
+def test_top_sorts_and_rejects_unknown_keys():
+    qp.configure(explain_threshold_ms=10_000)
+    qp.observe("SELECT 1 FROM a", (), 100.0, 1)
+    for _ in range(5):
+        qp.observe("SELECT 1 FROM b", (), 1.0, 50)
+
+    assert [s.fingerprint for s in qp.top(2)] == ["SELECT ? FROM a", "SELECT ? FROM b"]
+    assert qp.top(1, sort="calls")[0].fingerprint == "SELECT ? FROM b"
+    assert qp.top(1, sort="rows")[0].fingerprint == "SELECT ? FROM b"
+    with pytest.raises(ValueError):
+        qp.top(1, sort="nope")
+
+
+def test_table_is_bounded(monkeypatch):
+    monkeypatch.setattr(qp, "_MAX_FINGERPRINTS", 2)
+    qp.configure(explain_threshold_ms=10_000)
+    for table in ("a", "b", "c"):
+        qp.observe(f"SELECT * FROM {table}", (), 1.0, 0)
+    assert sorted(s.fingerprint for s in qp.top(10)) == [
+        "SELECT * FROM b",
+        "SELECT * FROM c",
+    ]
+
+
+def test_disabled_records_nothing():
+    qp.configure(enabled=False)
+    qp.observe("SELECT 1", (), 1.0, 1)
+    assert qp.tracked() == 0
+
+
+# ---------------------------------------------------------------------------
+# plan capture
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_slow_read_captures_an_analyze_plan_once(monkeypatch):
+    from utils.db import pool
+
+    conn, tr, dedicated = _fake_connection(["Seq Scan on xp", "Execution Time: 1 ms"])
+    monkeypatch.setattr(pool, "dedicated_connection", dedicated)
+    qp.configure(explain_threshold_ms=50)
+
+    qp.observe("SELECT * FROM xp WHERE user_id = $1", (9,), 10.0, 1)  # fast
+    qp.observe("SELECT * FROM xp WHERE user_id = $1", (9,), 80.0, 1)  # slow
+    qp.observe("SELECT * FROM xp WHERE user_id = $1", (9,), 90.0, 1)  # in flight
+    await _drain()
+    qp.observe("SELECT * FROM xp WHERE user_id = $1", (9,), 95.0, 1)  # captured
+    await _drain()
+
+    conn.fetch.assert_awaited_once_with(
+        "EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM xp WHERE user_id = $1",
+        9,
+    )
+    tr.rollback.assert_awaited_once()
+    [stats] = qp.top(1)
+    assert stats.plan_state == "captured"
+    assert stats.plan == "Seq Scan on xp\nExecution Time: 1 ms"
+    assert stats.as_dict()["plan"] == "captured"
+    assert "Seq Scan" not in str(stats.as_dict())  # the JSON view carries no plan
+
+
+@pytest.mark.asyncio
+async def test_slow_write_is_explained_without_analyze(monkeypatch):
+    from utils.db import pool
+
+    conn, tr, dedicated = _fake_connection(["Update on xp"])
+    monkeypatch.setattr(pool, "dedicated_connection", dedicated)
+    qp.configure(explain_threshold_ms=0)
+
+    qp.observe("UPDATE xp SET xp = xp + $1 WHERE user_id = $2", (1, 9), 5.0, 1)
+    await _drain()
+
+    assert conn.fetch.await_args.args[0].startswith("EXPLAIN (COSTS) UPDATE xp")
+    tr.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT * FROM economy WHERE user_id = $1 FOR UPDATE",
+        "SELECT * FROM economy WHERE user_id = $1 FOR NO KEY UPDATE SKIP LOCKED",
+        "SELECT id FROM jobs WHERE done = false FOR SHARE",
+        "SELECT pg_advisory_lock($1)",
+        "SELECT pg_try_advisory_xact_lock($1)",
+        "SELECT nextval('tickets_id_seq')",
+    ],
+)
+async def test_locking_reads_are_explained_without_analyze(monkeypatch, query):
+    from utils.db import pool
+
+    conn, tr, dedicated = _fake_connection(["LockRows"])
+    monkeypatch.setattr(pool, "dedicated_connection", dedicated)
+    qp.configure(explain_threshold_ms=0)
+
+    qp.observe(query, (9,), 5.0, 1)
+    await _drain()
+
+    assert conn.fetch.await_args.args[0].startswith("EXPLAIN (COSTS) SELECT")
+
+
+@pytest.mark.asyncio
+async def test_failed_capture_is_not_retried(monkeypatch):
+    from utils.db import pool
+
+    @asynccontextmanager
+    async def _broken():
+        raise OSError("no database")
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(pool, "dedicated_connection", _broken)
+    qp.configure(explain_threshold_ms=0)
+    qp.observe("SELECT 1 FROM a", (), 5.0, 1)
+    await _drain()
+    qp.observe("SELECT 1 FROM a", (), 5.0, 1)
+    await _drain()
+
+    [stats] = qp.top(1)
+    assert stats.plan_state == "failed"
+    assert qp._explain_inflight is False
+
+
+def test_no_running_loop_skips_capture_quietly():
+    qp.configure(explain_threshold_ms=0)
+    qp.observe("SELECT 1 FROM a", (), 5.0, 1)
+    [stats] = qp.top(1)
+    assert stats.plan_state is None
+
+
+# ---------------------------------------------------------------------------
+# pool wiring
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_pool_primitives_feed_the_profiler(monkeypatch):
+    from utils.db import pool
+
+    qp.configure(explain_threshold_ms=10_000)
+    qp.install()
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=[{"a": 1}, {"a": 2}])
+    conn.execute = AsyncMock(return_value="UPDATE 3")
+
+    await pool.fetchall("SELECT a FROM t WHERE b = $1", (1,), conn=conn)
+    await pool.execute("UPDATE t SET a = $1", (1,), conn=conn)
+
+    rows = {s.fingerprint: s.rows for s in qp.top(10)}
+    assert rows == {"SELECT a FROM t WHERE b = ?": 2, "UPDATE t SET a = ?": 3}
+
+
+@pytest.mark.asyncio
+async def test_pool_does_not_profile_until_installed():
+    from utils.db import pool
+
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=[])
+    await pool.fetchall("SELECT a FROM t", conn=conn)
+    assert qp.tracked() == 0
+
+    qp.install()
+    qp.install()  # idempotent: one observer, one call recorded
+    await pool.fetchall("SELECT a FROM t", conn=conn)
+    [stats] = qp.top(1)
+    assert stats.calls == 1
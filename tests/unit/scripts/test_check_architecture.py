@@ -139,6 +139,18 @@ def test_visitor_separates_lazy_from_module_level(mod):
     assert "cogs.a" not in [m for _, m, _ in v.lazy_imports]
 
 
+def test_visitor_treats_lazy_module_calls_as_imports(mod):
+    tree = ast.parse(
+        'x = lazy_module("services.a")\n'
+        "def f():\n"
+        '    return lazy_import.lazy_module("cogs.b")\n',
+    )
+    v = mod._ImportVisitor()
+    v.visit(tree)
+    assert "services.a" in [m for _, m, _ in v.imports]
+    assert "cogs.b" in [m for _, m, _ in v.lazy_imports]
+
+
 def test_counts_by_check(mod):
     V = mod.Violation
     vs = [
@@ -198,3 +198,15 @@ def test_channel_stats_per_guild():
     svc.append(99, 4, user_id=1, role="user", text="z")
     out = svc.channel_stats(1)
     assert out == {2: 1, 3: 1}
+
+
+def test_replied_recently_finds_the_bots_answer_to_that_user_only():
+    now = time.time()
+    svc.append(1, 2, user_id=99, role="user", text="hi bot", ts=now - 30)
+    svc.append(1, 2, user_id=99, role="assistant", text="hello!", ts=now - 29)
+    svc.append(1, 2, user_id=7, role="user", text="chatter", ts=now - 1)
+
+    assert svc.replied_recently(1, 2, 99, within_seconds=60)
+    assert not svc.replied_recently(1, 2, 99, within_seconds=10)  # too old
+    assert not svc.replied_recently(1, 2, 7, within_seconds=60)  # never answered
+    assert not svc.replied_recently(1, 3, 99, within_seconds=60)  # other channel
@@ -0,0 +1,260 @@
+"""Cacheable instruction-stack assembly and provider prompt-cache mapping.
+
+Pins:
+
+* ``assemble`` memoises the guild's profile layers per policy version (one
+  profile read per version) and ``invalidate`` drops them.
+* The rendered system prompt carries cache breakpoints after the shared
+  constants and after the guild's layers; per-turn blocks appended by the NL
+  stage come after them.
+* The Anthropic adapter maps breakpoints to ``cache_control`` blocks and never
+  caches the per-turn tail; the OpenAI adapter strips the markers and derives
+  a stable ``prompt_cache_key``.
+* Provider usage blocks are split into cached / uncached input tokens.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from core.runtime.ai.contracts import (
+    PROMPT_CACHE_BREAKPOINT,
+    AIRequest,
+    AIRequestContext,
+    AIResponseMode,
+    AIScope,
+    AITask,
+    split_prompt_cache_segments,
+)
+from core.runtime.ai.providers import base
+from core.runtime.ai.providers.anthropic_provider import (
+    AnthropicProvider,
+    _system_blocks,
+)
+from core.runtime.ai.providers.openai_provider import (
+    OpenAIProvider,
+    _system_prompt_and_cache_key,
+)
+from services import ai_instruction_service
+from utils.db import ai as ai_db
+
+
+@pytest.fixture(autouse=True)
+def _reset_layer_cache():
+    ai_instruction_service._reset_for_tests()
+    yield
+    ai_instruction_service._reset_for_tests()
+
+
+@pytest.fixture
+def profile_reads(monkeypatch):
+    reads: list[int] = []
+
+    async def _get(pid):
+        reads.append(pid)
+        return {"body": f"profile body {pid}", "scope": "guild"}
+
+    monkeypatch.setattr(ai_db, "get_instruction_profile", _get)
+    return reads
+
+
+async def _assemble(policy_version, *, guild_id=1, profile_ids=(7, 8)):
+    return await ai_instruction_service.assemble(
+        guild_id=guild_id,
+        user_message="hi",
+        profile_ids=profile_ids,
+        policy_version=policy_version,
+    )
+
+
+# --- memo -----------------------------------------------------------------
+
+
+async def test_profile_layers_are_memoised_per_policy_version(profile_reads):
+    first = await _assemble("v1")
+    second = await _assemble("v1")
+
+    assert profile_reads == [7, 8]
+    assert first.system == second.system
+
+    await _assemble("v2")
+    assert profile_reads == [7, 8, 7, 8]
+
+
+async def test_no_policy_version_always_reads(profile_reads):
+    await _assemble(None)
+    await _assemble(None)
+
+    assert profile_reads == [7, 8, 7, 8]
+
+
+async def test_invalidate_drops_only_that_guild(profile_reads):
+    await _assemble("v1", guild_id=1)
+    await _assemble("v1", guild_id=2)
+
+    ai_instruction_service.invalidate(1)
+    await _assemble("v1", guild_id=1)
+    await _assemble("v1", guild_id=2)
+
+    assert profile_reads == [7, 8, 7, 8, 7, 8]
+
+    ai_instruction_service.invalidate(None)
+    await _assemble("v1", guild_id=2)
+    assert len(profile_reads) == 8
+
+
+# --- rendering --------------------------------------------------------------
+
+
+async def test_system_prompt_has_shared_and_guild_breakpoints(profile_reads):
+    stack = await _assemble("v1")
+
+    segments = split_prompt_cache_segments(stack.render_system_prompt())
+
+    assert len(segments) == 2
+    shared, guild = segments
+    assert shared[1] and guild[1]
+    assert "Task contract" in shared[0]
+    assert "profile body 7" in guild[0] and "profile body 8" in guild[0]
+    assert "profile body" not in shared[0]
+
+
+async def test_shared_head_is_identical_across_guilds(profile_reads):
+    one = await _assemble("v1", guild_id=1, profile_ids=(7,))
+    two = await _assemble("v1", guild_id=2, profile_ids=(8,))
+
+    head_one = split_prompt_cache_segments(one.render_system_prompt())[0]
+    head_two = split_prompt_cache_segments(two.render_system_prompt())[0]
+    assert head_one == head_two
+
+
+def test_split_without_markers_is_unchanged():
+    assert split_prompt_cache_segments("plain\n\nprompt") == (
+        ("plain\n\nprompt", True),
+    )
+
+
+def test_split_marks_the_per_turn_tail_uncacheable():
+    prompt = f"stable\n\n{PROMPT_CACHE_BREAKPOINT}\n\nper turn"
+
+    assert split_prompt_cache_segments(prompt) == (
+        ("stable", True),
+        ("per turn", False),
+    )
+
+
+# --- provider mapping -------------------------------------------------------
+
+
+def test_anthropic_blocks_cache_only_stable_segments():
+    prompt = "\n\n".join(
+        ["shared", PROMPT_CACHE_BREAKPOINT, "guild", PROMPT_CACHE_BREAKPOINT, "turn"],
+    )
+
+    blocks = _system_blocks(prompt)
+
+    assert [b["text"] for b in blocks] == ["shared", "guild", "turn"]
+    assert [("cache_control" in b) for b in blocks] == [True, True, False]
+
+
+def test_anthropic_blocks_respect_breakpoint_cap():
+    prompt = "\n\n".join(
+        part for i in range(6) for part in (f"s{i}", PROMPT_CACHE_BREAKPOINT)
+    )
+
+    blocks = _system_blocks(prompt)
+
+    cached = [b["text"] for b in blocks if "cache_control" in b]
+    assert cached == ["s2", "s3", "s4", "s5"]
+
+
+def test_openai_strips_markers_and_keys_on_stable_prefix():
+    stable = (
+        f"shared\n\n{PROMPT_CACHE_BREAKPOINT}\n\nguild\n\n{PROMPT_CACHE_BREAKPOINT}"
+    )
+
+    text_a, key_a = _system_prompt_and_cache_key(f"{stable}\n\nturn one")
+    text_b, key_b = _system_prompt_and_cache_key(f"{stable}\n\nturn two")
+
+    assert text_a == "shared\n\nguild\n\nturn one"
+    assert PROMPT_CACHE_BREAKPOINT not in text_b
+    assert key_a is not None and key_a == key_b
+
+
+def test_openai_unmarked_prompt_has_no_cache_key():
+    assert _system_prompt_and_cache_key("system") == ("system", None)
+
+
+# --- usage ------------------------------------------------------------------
+
+
+def _request(system_prompt="system"):
+    return AIRequest(
+        context=AIRequestContext(
+            task=AITask.GENERAL_NL_ANSWER,
+            scope=AIScope.USER,
+            source="test",
+        ),
+        system_prompt=system_prompt,
+        payload={"text": "hi"},
+        mode=AIResponseMode.TEXT,
+    )
+
+
+async def test_openai_reports_cached_and_uncached_input():
+    response = SimpleNamespace(
+        choices=[
+            SimpleNamespace(message=SimpleNamespace(content="ok", tool_calls=None))
+        ],
+        usage=SimpleNamespace(
+            prompt_tokens=1200,
+            completion_tokens=40,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=1024),
+        ),
+    )
+
+    async def create(**_kwargs):
+        return response
+
+    client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    with base.collect_usage() as usage:
+        await OpenAIProvider(client=client).execute(_request(), model="gpt-x")
+
+    assert (usage.input_tokens, usage.cached_input_tokens, usage.output_tokens) == (
+        176,
+        1024,
+        40,
+    )
+
+
+async def test_anthropic_counts_cache_writes_as_uncached_input():
+    response = SimpleNamespace(
+        content=[SimpleNamespace(type="text", text="ok")],
+        usage=SimpleNamespace(
+            input_tokens=30,
+            cache_creation_input_tokens=900,
+            cache_read_input_tokens=2000,
+            output_tokens=12,
+        ),
+    )
+
+    async def create(**_kwargs):
+        return response
+
+    client = SimpleNamespace(messages=SimpleNamespace(create=create))
+    with base.collect_usage() as usage:
+        await AnthropicProvider(client=client).execute(_request(), model="claude-x")
+
+    assert (usage.input_tokens, usage.cached_input_tokens, usage.output_tokens) == (
+        930,
+        2000,
+        12,
+    )
+
+
+def test_record_usage_outside_a_collector_is_a_noop():
+    base.record_usage(input_tokens=5)
@@ -0,0 +1,135 @@
+"""Persistence side of the gateway's token ledger (``services.ai_usage_service``).
+
+Pins: ``flush`` writes drained ledger rows as rollup tuples and puts them back
+when the write fails; ``hydrate`` seeds today's spend from the rollup;
+``usage_breakdown`` converts rollup rows to ``UsageLine`` with USD cost.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.runtime.ai.diagnostics import (
+    _utc_today,
+    get_default_collector,
+    reset_default_collector,
+)
+from services import ai_usage_service
+from utils.db import ai as ai_db
+
+
+@pytest.fixture(autouse=True)
+def _fresh_collector():
+    reset_default_collector()
+    yield
+    reset_default_collector()
+
+
+def _record(guild_id=42, cost=1_500):
+    get_default_collector().record_usage(
+        guild_id=guild_id,
+        task="btd6.answer",
+        provider="anthropic",
+        model="claude-haiku-4-5",
+        input_tokens=100,
+        cached_input_tokens=900,
+        output_tokens=50,
+        cost_micros=cost,
+    )
+
+
+async def test_flush_writes_drained_rows(monkeypatch):
+    written: list[tuple] = []
+
+    async def _add(rows):
+        written.extend(rows)
+        return len(written)
+
+    monkeypatch.setattr(ai_db, "add_token_usage", _add)
+    _record()
+    _record()
+
+    assert await ai_usage_service.flush() == 1
+    [row] = written
+    assert row[1:] == (
+        42,
+        "btd6.answer",
+        "anthropic",
+        "claude-haiku-4-5",
+        2,
+        200,
+        1_800,
+        100,
+        3_000,
+    )
+    assert await ai_usage_service.flush() == 0
+
+
+async def test_failed_flush_restores_rows(monkeypatch):
+    monkeypatch.setattr(
+        ai_db,
+        "add_token_usage",
+        AsyncMock(side_effect=RuntimeError("db down")),
+    )
+    _record()
+
+    with pytest.raises(RuntimeError):
+        await ai_usage_service.flush()
+
+    [row] = get_default_collector().drain_usage()
+    assert row.requests == 1
+
+
+async def test_hydrate_seeds_today_spend(monkeypatch):
+    monkeypatch.setattr(
+        ai_db,
+        "get_token_spend",
+        AsyncMock(
+            return_value=[{"guild_id": 42, "task": "btd6.answer", "cost_micros": 7_000}],
+        ),
+    )
+
+    assert await ai_usage_service.hydrate() == 1
+    collector = get_default_collector()
+    assert collector.spend_micros(42, task="btd6.answer") == 7_000
+    # Nothing was queued for a re-flush.
+    assert collector.drain_usage() == []
+
+
+async def test_usage_breakdown_converts_cost(monkeypatch):
+    get_usage = AsyncMock(
+        return_value=[
+            {
+                "task": "btd6.answer",
+                "provider": "anthropic",
+                "model": "claude-haiku-4-5",
+                "requests": 3,
+                "input_tokens": 10,
+                "cached_input_tokens": 90,
+                "output_tokens": 5,
+                "cost_micros": 2_500_000,
+            },
+        ],
+    )
+    monkeypatch.setattr(ai_db, "get_token_usage", get_usage)
+
+    [line] = await ai_usage_service.usage_breakdown(42, days=7)
+
+    assert line.cost_usd == 2.5
+    assert line.requests == 3
+    since = get_usage.await_args.kwargs["since"]
+    assert (_utc_today() - since).days == 6
+
+
+def test_budget_status_lists_only_configured_budgets(monkeypatch):
+    monkeypatch.setenv("AI_BUDGET_GUILD_DAILY_USD", "1:2")
+    monkeypatch.delenv("AI_BUDGET_BTD6_ANSWER_DAILY_USD", raising=False)
+    _record(cost=250_000)
+
+    [(label, spent, limits)] = ai_usage_service.budget_status(42)
+
+    assert label == "guild"
+    assert spent == 0.25
+    assert limits.hard_usd == 2.0
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock
+
 import pytest
 
 from services import automod_config
@@ -52,6 +54,10 @@ async def test_load_policy_composes_typed_values(monkeypatch):
     import services.settings_resolution as sr
 
     monkeypatch.setattr(sr, "resolve_value", fake_resolve)
+    monkeypatch.setattr(
+        "utils.db.get_settings_for_guilds",
+        AsyncMock(return_value={}),
+    )
 
     pol = await automod_config.load_policy(guild_id=123)
     assert pol.enabled is True
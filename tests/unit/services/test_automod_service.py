@@ -7,7 +7,9 @@ and no DB — the engine is deliberately side-effect-free.
 
 from __future__ import annotations
 
+import random
 from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 from services import automod_service
 from services.automod_config import AutomodPolicy
@@ -172,6 +174,100 @@ def test_duplicate_tracker_evicts_outside_window():
     assert trk.record_and_count(1, 2, "spam", window_seconds=5, now=10.0) == 1
 
 
+def test_duplicate_tracker_catches_one_character_variants_of_long_text():
+    trk = automod_service.DuplicateTracker()
+    base = "join my server for free nitro giveaway now"
+    variants = [base[:i] + "x" + base[i + 1 :] for i in (3, 17, 30)]
+    counts = [
+        trk.record_and_count(1, 2, text, window_seconds=10, now=0.0)
+        for text in variants
+    ]
+    assert counts == [1, 2, 3]
+
+
+def test_duplicate_tracker_keeps_unrelated_long_text_apart():
+    trk = automod_service.DuplicateTracker()
+    first = "hey does anyone know how to beat round 63"
+    second = "i think the new update broke the shop menu"
+    trk.record_and_count(1, 2, first, window_seconds=10, now=0.0)
+    assert trk.record_and_count(1, 2, second, window_seconds=10, now=0.0) == 1
+
+
+def test_duplicate_tracker_does_not_keep_message_bodies():
+    trk = automod_service.DuplicateTracker()
+    trk.record_and_count(1, 2, "a secret message body here", window_seconds=10, now=0.0)
+    ((_, bucket),) = trk._hits._windows.values()
+    ((_, fp),) = bucket
+    # Only a 64-bit digest and a bounded integer sketch are retained.
+    assert isinstance(fp.digest, int)
+    assert 0 < len(fp.sketch) <= automod_service._SKETCH_SIZE
+    assert all(isinstance(v, int) for v in fp.sketch)
+
+
+def test_duplicate_tracker_reuses_the_fingerprint_of_an_exact_repeat(monkeypatch):
+    trk = automod_service.DuplicateTracker()
+    text = "join my server for free nitro giveaway now"
+    trk.record_and_count(1, 2, text, window_seconds=10, now=0.0)
+    sketch = MagicMock(side_effect=AssertionError("exact repeat was re-sketched"))
+    monkeypatch.setattr(automod_service, "_minhash", sketch)
+    assert trk.record_and_count(1, 2, text.upper(), window_seconds=10, now=1.0) == 2
+
+
+def test_near_duplicate_sketch_cost_is_linear_and_capped():
+    rng = random.Random(0)
+    long_text = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz ") for _ in range(5000))
+    sketch = automod_service._minhash(long_text)
+    assert len(sketch) == automod_service._SKETCH_SIZE
+    # Only the first _SKETCH_MAX_CHARS characters are shingled.
+    assert sketch == automod_service._minhash(
+        long_text[: automod_service._SKETCH_MAX_CHARS] + "tail ignored",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Tracker memory bounds
+# ---------------------------------------------------------------------------
+
+
+def test_spam_tracker_lru_cap_evicts_least_recently_active_key():
+    trk = automod_service.SpamTracker(max_keys=2)
+    trk.record_and_count(1, 1, 100, window_seconds=10, now=0.0)
+    trk.record_and_count(1, 2, 100, window_seconds=10, now=1.0)
+    trk.record_and_count(1, 1, 100, window_seconds=10, now=2.0)  # user 1 refreshed
+    trk.record_and_count(1, 3, 100, window_seconds=10, now=3.0)  # evicts user 2
+
+    assert trk.tracked_keys() == 2
+    assert trk.record_and_count(1, 1, 100, window_seconds=10, now=4.0) == 3
+    assert trk.record_and_count(1, 2, 100, window_seconds=10, now=4.0) == 1
+
+
+def test_trackers_sweep_idle_keys():
+    spam = automod_service.SpamTracker(idle_seconds=30)
+    dup = automod_service.DuplicateTracker(idle_seconds=30)
+    for user in range(10):
+        spam.record_and_count(1, user, 100, window_seconds=5, now=0.0)
+        dup.record_and_count(1, user, "hi", window_seconds=5, now=0.0)
+
+    # The next record after the sweep interval reclaims every idle author.
+    spam.record_and_count(1, 99, 100, window_seconds=5, now=120.0)
+    dup.record_and_count(1, 99, "hi", window_seconds=5, now=120.0)
+
+    assert spam.tracked_keys() == 1
+    assert dup.tracked_keys() == 1
+
+
+def test_tracker_size_is_exported_as_a_gauge():
+    from services import metrics
+
+    trk = automod_service.SpamTracker()
+    for user in range(3):
+        trk.record_and_count(1, user, 100, window_seconds=5, now=0.0)
+    trk._hits.sweep_idle(0.0)
+
+    gauge = metrics.automod_tracker_keys.labels(tracker="spam")
+    assert gauge._value.get() == 3
+
+
 # ---------------------------------------------------------------------------
 # evaluate — rule ordering + exemptions
 # ---------------------------------------------------------------------------
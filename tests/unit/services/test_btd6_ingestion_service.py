@@ -84,6 +84,25 @@ async def test_ok_path(monkeypatch):
     assert "ct_123" in result.written_entity_keys
 
 
+@pytest.mark.parametrize("loaded", [True, False])
+async def test_ok_path_clears_the_reply_memo_only_once_loaded(monkeypatch, loaded):
+    monkeypatch.setattr("services.btd6_source_registry.get_by_key", AsyncMock(return_value=_FAKE_SOURCE))
+    monkeypatch.setattr("services.btd6_fetch_service.fetch", AsyncMock(return_value=_FAKE_FETCH_RESULT))
+    monkeypatch.setattr("services.btd6_source_parser.get", MagicMock(return_value=_FAKE_PARSER))
+    monkeypatch.setattr("services.btd6_fact_store.store_facts", AsyncMock(return_value=[_FAKE_FACT_RESULT]))
+    monkeypatch.setattr("utils.db.btd6_sources.insert_ingestion_run", AsyncMock(return_value=7))
+    monkeypatch.setattr("utils.db.btd6_sources.update_ingestion_run", AsyncMock())
+    monkeypatch.setattr("utils.db.btd6_sources.insert_source_snapshot", AsyncMock())
+    context = MagicMock()
+    monkeypatch.setattr(btd6_ingestion_service, "btd6_context_service", context)
+    monkeypatch.setattr(btd6_ingestion_service, "is_loaded", lambda module: loaded)
+
+    result = await btd6_ingestion_service.refresh_source("nk_btd6_ct")
+
+    assert result.status == "ok"
+    assert context.invalidate_reply_memo.called is loaded
+
+
 # ---------------------------------------------------------------------------
 # skipped — lock already held
 # ---------------------------------------------------------------------------
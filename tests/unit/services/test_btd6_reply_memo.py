@@ -0,0 +1,144 @@
+"""Deterministic-reply memo in front of the BTD6 floor chains.
+
+Pins: a repeated (normalised) question is served from the memo without
+re-running the builders, misses are memoised too, the memo is bounded, and it
+is dropped when the dataset reloads or an ingestion run stores new facts.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_DISBOT = Path(__file__).parents[3] / "disbot"
+if str(_DISBOT) not in sys.path:
+    sys.path.insert(0, str(_DISBOT))
+
+from services import btd6_context_service, btd6_data_service  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memo():
+    btd6_data_service.reset_cache()
+    btd6_context_service._reset_for_tests()
+    yield
+    btd6_context_service._reset_for_tests()
+    btd6_data_service.reset_cache()
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Count list-floor builds; answer only the 'list all relics' shape."""
+    seen: list[str] = []
+
+    def _build(text):
+        seen.append(text)
+        return "RELICS" if "relics" in text.lower() else None
+
+    monkeypatch.setattr(btd6_context_service, "_build_btd6_list_reply", _build)
+    return seen
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        ("list all relics", "List all relics?"),
+        ("list  all\trelics", "LIST ALL RELICS!!"),
+        ("what’s a relic", "what's a relic"),
+    ],
+)
+def test_normalisation_folds_case_whitespace_and_edge_punctuation(first, second):
+    assert btd6_context_service._normalise_question(
+        first,
+    ) == btd6_context_service._normalise_question(second)
+
+
+def test_normalisation_keeps_plurals_and_inner_punctuation_distinct():
+    norm = btd6_context_service._normalise_question
+    assert norm("list all towers") != norm("list all tower")
+    assert norm("is 0-2-4 good") != norm("is 024 good")
+
+
+def test_repeat_question_is_served_from_the_memo(calls):
+    assert btd6_context_service.deterministic_btd6_list_reply("list all relics") == (
+        "RELICS"
+    )
+    assert btd6_context_service.deterministic_btd6_list_reply("List all relics?") == (
+        "RELICS"
+    )
+
+    assert calls == ["list all relics"]
+    stats = btd6_context_service.reply_memo_stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_misses_are_memoised(calls):
+    for _ in range(3):
+        assert btd6_context_service.deterministic_btd6_list_reply("hi there") is None
+
+    assert calls == ["hi there"]
+
+
+def test_chains_do_not_share_entries(calls, monkeypatch):
+    monkeypatch.setattr(
+        btd6_context_service,
+        "_build_floor_reply",
+        lambda text: "FLOOR",
+    )
+
+    assert btd6_context_service.deterministic_btd6_list_reply("hello") is None
+    assert btd6_context_service.deterministic_floor_reply("hello") == "FLOOR"
+
+
+def test_memo_is_bounded_lru(calls, monkeypatch):
+    monkeypatch.setattr(btd6_context_service, "_REPLY_MEMO_MAX", 2)
+
+    for text in ("a", "b", "a", "c"):
+        btd6_context_service.deterministic_btd6_list_reply(text)
+    # "b" was least recently used when "c" arrived.
+    btd6_context_service.deterministic_btd6_list_reply("b")
+
+    assert calls == ["a", "b", "c", "b"]
+    assert btd6_context_service.reply_memo_stats().size == 2
+
+
+def test_dataset_reload_drops_the_memo(calls):
+    btd6_context_service.deterministic_btd6_list_reply("list all relics")
+    btd6_data_service.reset_cache()
+    btd6_context_service.deterministic_btd6_list_reply("list all relics")
+
+    assert len(calls) == 2
+
+
+def test_ingestion_invalidation_drops_the_memo(calls):
+    btd6_context_service.deterministic_btd6_list_reply("list all relics")
+    btd6_context_service.invalidate_reply_memo()
+    btd6_context_service.deterministic_btd6_list_reply("list all relics")
+
+    assert len(calls) == 2
+
+
+def test_unavailable_dataset_bypasses_the_memo(calls, monkeypatch):
+    def _boom():
+        raise RuntimeError("no data")
+
+    monkeypatch.setattr(btd6_data_service, "get_dataset", _boom)
+    btd6_context_service.deterministic_btd6_list_reply("list all relics")
+    btd6_context_service.deterministic_btd6_list_reply("list all relics")
+
+    assert len(calls) == 2
+    assert btd6_context_service.reply_memo_stats().size == 0
+
+
+def test_real_floor_reply_matches_unmemoised_chain():
+    question = "what do you know about btd6?"
+    expected = btd6_context_service.deterministic_roster_reply(
+        question,
+    ) or btd6_context_service.deterministic_meta_reply(question)
+
+    assert btd6_context_service.deterministic_floor_reply(question) == expected
+    assert btd6_context_service.deterministic_floor_reply(question) == expected
+    assert btd6_context_service.reply_memo_stats().hits == 1
@@ -12,6 +12,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from core.runtime import message_pipeline
 from services import chain_service
 
 
@@ -137,6 +138,28 @@ async def test_delete_chain_audits_with_real_prev_value():
     assert kwargs["new_value"] is None
 
 
+@pytest.mark.asyncio
+async def test_create_and_delete_keep_the_pipeline_route_current():
+    message_pipeline.clear()
+    try:
+        get, set_, delete, limit, emit = _patches(existing=None)
+        with get, set_, delete, limit, emit:
+            await chain_service.create_chain(
+                guild_id=99,
+                channel_id=5,
+                word="hi",
+                actor_id=1,
+            )
+        assert message_pipeline.channel_stages(99, 5) == {"chain"}
+
+        get, set_, delete, limit, emit = _patches({"word": "hi", "word_limit": 0})
+        with get, set_, delete, limit, emit:
+            await chain_service.delete_chain(guild_id=99, channel_id=5, actor_id=1)
+        assert message_pipeline.channel_stages(99, 5) == frozenset()
+    finally:
+        message_pipeline.clear()
+
+
 @pytest.mark.asyncio
 async def test_delete_chain_not_found_skips_write_and_audit():
     get, set_, delete, limit, emit = _patches(existing=None)
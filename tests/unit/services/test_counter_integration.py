@@ -74,6 +74,10 @@ async def test_preset_apply_then_sync_renames_and_emits(monkeypatch):
     import services.settings_resolution as sr
 
     monkeypatch.setattr(sr, "resolve_value", fake_resolve)
+    monkeypatch.setattr(
+        "utils.db.get_settings_for_guilds",
+        AsyncMock(return_value={}),
+    )
 
     import core.events
 
@@ -107,6 +111,10 @@ async def test_master_off_syncs_nothing_end_to_end(monkeypatch):
     import services.settings_resolution as sr
 
     monkeypatch.setattr(sr, "resolve_value", fake_resolve)
+    monkeypatch.setattr(
+        "utils.db.get_settings_for_guilds",
+        AsyncMock(return_value={}),
+    )
     import core.events
 
     emit = AsyncMock()
@@ -13,11 +13,16 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from services import farm_workflow
+from utils import db
 from utils import farm as farm_mod
 
 _NOW = 1_000_000_000
 
 
+def _row(chickens, eggs, ts, coop, coins=0):
+    return db.FarmPlayerState(chickens, eggs, ts, coop, coins)
+
+
 # --------------------------------------------------------------- fresh-start fix
 
 
@@ -44,8 +49,8 @@ def test_real_timestamp_is_preserved():
 @pytest.mark.asyncio
 async def test_get_status_fresh_farm_reports_no_away_progress():
     with patch(
-        "services.farm_workflow.db.get_chicken_farm",
-        new=AsyncMock(return_value=(1, 0, 0, 0)),
+        "services.farm_workflow.db.load_farm_player_state",
+        new=AsyncMock(return_value=_row(1, 0, 0, 0)),
     ):
         status = await farm_workflow.get_status(123, 456)
     assert status.eggs_gained == 0
@@ -61,8 +66,8 @@ async def test_get_status_reports_accrued_delta():
     ts = 1_700_000_000
     with (
         patch(
-            "services.farm_workflow.db.get_chicken_farm",
-            new=AsyncMock(return_value=(2, 1, ts, 0)),
+            "services.farm_workflow.db.load_farm_player_state",
+            new=AsyncMock(return_value=_row(2, 1, ts, 0)),
         ),
         patch("services.farm_workflow.time.time", return_value=ts + 3 * interval),
     ):
@@ -77,11 +82,20 @@ async def test_get_status_reports_accrued_delta():
 async def test_get_status_flags_capacity():
     with (
         patch(
-            "services.farm_workflow.db.get_chicken_farm",
-            new=AsyncMock(return_value=(1, 0, 1, 0)),
+            "services.farm_workflow.db.load_farm_player_state",
+            new=AsyncMock(return_value=_row(1, 0, 1, 0)),
         ),
         patch("services.farm_workflow.time.time", return_value=10**9),
     ):
         status = await farm_workflow.get_status(123, 456)
     assert status.at_capacity is True
     assert status.state.eggs == farm_mod.coop_capacity(0)
+
+
+@pytest.mark.asyncio
+async def test_get_status_carries_the_balance_from_the_same_read():
+    load = AsyncMock(return_value=_row(1, 0, 0, 0, coins=250))
+    with patch("services.farm_workflow.db.load_farm_player_state", new=load):
+        status = await farm_workflow.get_status(123, 456)
+    load.assert_awaited_once_with(123, 456)
+    assert status.balance == 250
@@ -51,6 +51,11 @@ def _award(*, game_total, leveled_up=False, level=1, amount=5):
     )
 
 
+def _player(**fields):
+    """The one ``load_fishing_player_state`` read a cast makes (defaults = fresh)."""
+    return wf.db.FishingPlayerState(**fields)
+
+
 # ---------------------------------------------------------------------------
 # fishing_level_from_xp — the level curve reuse
 # ---------------------------------------------------------------------------
@@ -673,14 +678,16 @@ async def test_get_rod_resolves_the_owned_tier():
 async def test_begin_cast_spends_energy_and_rolls_when_charged():
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_rod_tier", AsyncMock(return_value=0)),
-        patch.object(wf.db, "get_equipment", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_skills", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_structures", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={"fishing": 0})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("", 0))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="shore")),
+        patch.object(
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                ),
+            ),
+        ),
         patch.object(
             wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0],
         ),
@@ -695,36 +702,69 @@ async def test_begin_cast_spends_energy_and_rolls_when_charged():
     set_energy.assert_awaited_once()  # the spend was persisted
 
 
+@pytest.mark.asyncio
+async def test_begin_cast_reads_the_player_once_and_levels_from_that_read():
+    """Every cast input comes from ONE state read — the level included, so
+    ``roll_cast`` does not go back to ``get_game_xp``."""
+    rec: dict = {}
+    player = _player(energy=10, energy_updated_at=1000, game_xp={"fishing": 10**6})
+    with (
+        patch.object(wf.time, "time", lambda: 1000),
+        patch.object(
+            wf.db, "load_fishing_player_state", AsyncMock(return_value=player),
+        ) as load,
+        patch.object(wf.db, "get_game_xp", AsyncMock()) as get_xp,
+        patch.object(wf, "roll_catch", recording_roll_catch(rec)),
+        patch.object(wf.db, "set_fishing_energy", AsyncMock()),
+    ):
+        start = await wf.begin_cast(99, 1)
+
+    assert start.ok is True
+    load.assert_awaited_once_with(99, 1)
+    get_xp.assert_not_awaited()
+    assert rec["level"] == wf.fishing_level_from_xp(10**6)
+
+
 @pytest.mark.asyncio
 async def test_begin_cast_blocks_and_never_spends_when_out_of_energy():
     # 0 energy, just updated → nothing regened yet
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(0, 1000))),
-        patch.object(wf.db, "get_structures", AsyncMock(return_value={})),
+        patch.object(
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=0,
+                    energy_updated_at=1000,
+                ),
+            ),
+        ),
         patch.object(wf.db, "set_fishing_energy", AsyncMock()) as set_energy,
-        patch.object(wf.db, "get_rod_tier", AsyncMock()) as rod,
+        patch.object(wf, "roll_catch", MagicMock()) as roll,
     ):
         start = await wf.begin_cast(99, 1)
 
     assert start.ok is False
     assert "energy" in (start.message or "").lower()
     set_energy.assert_not_awaited()  # no spend
-    rod.assert_not_awaited()  # bailed before even rolling
+    roll.assert_not_called()  # bailed before even rolling
 
 
 @pytest.mark.asyncio
 async def test_begin_cast_does_not_charge_on_an_empty_catalog():
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_rod_tier", AsyncMock(return_value=0)),
-        patch.object(wf.db, "get_equipment", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_skills", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_structures", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("", 0))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="shore")),
+        patch.object(
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                ),
+            ),
+        ),
         patch.object(
             wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0],
         ),
@@ -742,8 +782,16 @@ async def test_get_energy_returns_the_settled_value():
     # 5 stored at epoch, now = 3 regen intervals later → 5 + 3 = 8
     now_intervals = 3 * wf.fish_energy.REGEN_SECONDS
     with (
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(5, 0))),
-        patch.object(wf.db, "get_structures", AsyncMock(return_value={})),
+        patch.object(
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=5,
+                    energy_updated_at=0,
+                ),
+            ),
+        ),
         patch.object(wf.time, "time", lambda: now_intervals),
     ):
         cur = await wf.get_energy(99, 1)
@@ -801,17 +849,20 @@ async def test_begin_cast_threads_the_stored_venue_into_the_roll_and_profile():
     rec: dict = {}
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="deepwater")),
+        patch.object(
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                    venue="deepwater",
+                ),
+            ),
+        ),
         patch.object(
             wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0],
         ),
-        patch.object(wf.db, "get_rod_tier", AsyncMock(return_value=0)),
-        patch.object(wf.db, "get_equipment", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_skills", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_structures", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={"fishing": 0})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("", 0))),
         patch.object(wf, "roll_catch", recording_roll_catch(rec)),
         patch.object(wf.db, "set_fishing_energy", AsyncMock()),
     ):
@@ -841,15 +892,18 @@ async def test_begin_cast_compounds_the_days_weather_onto_the_knobs():
     gold = rods.rod_for_tier(3)
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="shore")),
+        patch.object(
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                    rod_tier=3,
+                ),
+            ),
+        ),
         patch.object(wf.weather_mod, "current_weather", lambda: storm),
-        patch.object(wf.db, "get_rod_tier", AsyncMock(return_value=3)),
-        patch.object(wf.db, "get_equipment", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_skills", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_structures", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={"fishing": 0})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("", 0))),
         patch.object(wf, "roll_catch", recording_roll_catch(rec)),
         patch.object(wf.db, "set_fishing_energy", AsyncMock()),
     ):
@@ -887,17 +941,20 @@ async def test_begin_cast_folds_equipped_fishing_gear_into_the_knobs():
     equipped = {"charm": "master angler charm"}
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="shore")),
+        patch.object(
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                    equipment=equipped,
+                ),
+            ),
+        ),
         patch.object(
             wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0],
         ),
-        patch.object(wf.db, "get_rod_tier", AsyncMock(return_value=0)),
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={"fishing": 0})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("", 0))),
-        patch.object(wf.db, "get_equipment", AsyncMock(return_value=equipped)),
-        patch.object(wf.db, "get_skills", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_structures", AsyncMock(return_value={})),
         patch.object(wf, "roll_catch", recording_roll_catch(rec)),
         patch.object(wf.db, "set_fishing_energy", AsyncMock()),
     ):
@@ -924,21 +981,20 @@ async def test_begin_cast_with_no_fishing_gear_is_byte_identical():
     starter = rods.rod_for_tier(0)
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="shore")),
         patch.object(
-            wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0],
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                    equipment={"tool": "diamond pickaxe"},
+                ),
+            ),
         ),
-        patch.object(wf.db, "get_rod_tier", AsyncMock(return_value=0)),
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={"fishing": 0})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("", 0))),
         patch.object(
-            wf.db,
-            "get_equipment",
-            AsyncMock(return_value={"tool": "diamond pickaxe"}),
+            wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0],
         ),
-        patch.object(wf.db, "get_skills", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_structures", AsyncMock(return_value={})),
         patch.object(wf, "roll_catch", recording_roll_catch(rec)),
         patch.object(wf.db, "set_fishing_energy", AsyncMock()),
     ):
@@ -966,20 +1022,19 @@ async def test_begin_cast_folds_a_built_tide_pool_into_the_pull():
     starter = rods.rod_for_tier(0)
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="shore")),
         patch.object(
-            wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0],
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                    structures={structures.TIDE_POOL: 3},
+                ),
+            ),
         ),
-        patch.object(wf.db, "get_rod_tier", AsyncMock(return_value=0)),
-        patch.object(wf.db, "get_equipment", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_skills", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={"fishing": 0})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("", 0))),
         patch.object(
-            wf.db,
-            "get_structures",
-            AsyncMock(return_value={structures.TIDE_POOL: 3}),
+            wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0],
         ),
         patch.object(wf, "roll_catch", recording_roll_catch(rec)),
         patch.object(wf.db, "set_fishing_energy", AsyncMock()),
@@ -1004,17 +1059,19 @@ async def test_begin_cast_with_no_tide_pool_is_byte_identical():
     starter = rods.rod_for_tier(0)
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="shore")),
+        patch.object(
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                ),
+            ),
+        ),
         patch.object(
             wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0],
         ),
-        patch.object(wf.db, "get_rod_tier", AsyncMock(return_value=0)),
-        patch.object(wf.db, "get_equipment", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_skills", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={"fishing": 0})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("", 0))),
-        patch.object(wf.db, "get_structures", AsyncMock(return_value={})),
         patch.object(wf, "roll_catch", recording_roll_catch(rec)),
         patch.object(wf.db, "set_fishing_energy", AsyncMock()),
     ):
@@ -1040,20 +1097,19 @@ async def test_begin_cast_folds_a_built_dock_into_the_bite_speed():
     starter = rods.rod_for_tier(0)
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="shore")),
         patch.object(
-            wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0],
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                    structures={structures.DOCK: 2},
+                ),
+            ),
         ),
-        patch.object(wf.db, "get_rod_tier", AsyncMock(return_value=0)),
-        patch.object(wf.db, "get_equipment", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_skills", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={"fishing": 0})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("", 0))),
         patch.object(
-            wf.db,
-            "get_structures",
-            AsyncMock(return_value={structures.DOCK: 2}),
+            wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0],
         ),
         patch.object(wf, "roll_catch", fake_roll_catch()),
         patch.object(wf.db, "set_fishing_energy", AsyncMock()),
@@ -1075,17 +1131,19 @@ async def test_begin_cast_with_no_dock_is_byte_identical():
     starter = rods.rod_for_tier(0)
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="shore")),
+        patch.object(
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                ),
+            ),
+        ),
         patch.object(
             wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0],
         ),
-        patch.object(wf.db, "get_rod_tier", AsyncMock(return_value=0)),
-        patch.object(wf.db, "get_equipment", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_skills", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={"fishing": 0})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("", 0))),
-        patch.object(wf.db, "get_structures", AsyncMock(return_value={})),
         patch.object(wf, "roll_catch", fake_roll_catch()),
         patch.object(wf.db, "set_fishing_energy", AsyncMock()),
     ):
@@ -1107,8 +1165,17 @@ async def test_get_energy_regens_faster_with_a_built_boathouse():
     async def _energy(built):
         with (
             patch.object(wf.time, "time", lambda: now),
-            patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(5, 0))),
-            patch.object(wf.db, "get_structures", AsyncMock(return_value=built)),
+            patch.object(
+                wf.db,
+                "load_fishing_player_state",
+                AsyncMock(
+                    return_value=_player(
+                        energy=5,
+                        energy_updated_at=0,
+                        structures=built,
+                    ),
+                ),
+            ),
         ):
             return await wf.get_energy(99, 1)
 
@@ -1129,8 +1196,17 @@ async def test_begin_cast_out_of_energy_wait_is_shorter_with_a_built_boathouse()
     async def _wait_message(built):
         with (
             patch.object(wf.time, "time", lambda: 0),
-            patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(0, 0))),
-            patch.object(wf.db, "get_structures", AsyncMock(return_value=built)),
+            patch.object(
+                wf.db,
+                "load_fishing_player_state",
+                AsyncMock(
+                    return_value=_player(
+                        energy=0,
+                        energy_updated_at=0,
+                        structures=built,
+                    ),
+                ),
+            ),
         ):
             start = await wf.begin_cast(99, 1)
         assert start.ok is False
@@ -30,17 +30,11 @@ _FEAST = bait_mod.bait_by_key("feast")  # the premium combo — pearl-craft only
 _FEAST_PEARLS = bait_mod.pearl_recipe("feast")  # pearls per Royal Feast pack
 
 
-@pytest.fixture(autouse=True)
-def _no_fishing_gear():
-    """Default the cast's gear + structure reads (the 4th/5th knobs) to empty so the
-    bait-layer assertions stay rod×bait-only — fishing gear is exercised in
-    ``test_fishing_workflow.py``. Tests that need gear can re-patch these."""
-    with (
-        patch.object(wf.db, "get_equipment", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_skills", AsyncMock(return_value={})),
-        patch.object(wf.db, "get_structures", AsyncMock(return_value={})),
-    ):
-        yield
+def _player(**fields):
+    """The one ``load_fishing_player_state`` read a cast makes. Gear + structures
+    default to empty so the bait-layer assertions stay rod×bait-only — fishing
+    gear is exercised in ``test_fishing_workflow.py``."""
+    return wf.db.FishingPlayerState(**fields)
 
 
 # ---------------------------------------------------------------------------
@@ -185,14 +179,19 @@ async def test_begin_cast_consumes_a_bait_charge_and_compounds_rarity():
     rec: dict = {}
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="shore")),
-        patch.object(wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0]),
         patch.object(
-            wf.db, "get_rod_tier", AsyncMock(return_value=0)
-        ),  # starter, pull 1.0
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={"fishing": 0})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("worm", 2))),
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                    bait_key="worm",
+                    bait_charges=2,
+                ),
+            ),
+        ),
+        patch.object(wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0]),
         patch.object(wf, "roll_catch", recording_roll_catch(rec)),
         patch.object(wf.db, "set_fishing_energy", AsyncMock()),
         patch.object(wf.db, "set_active_bait", AsyncMock()) as set_bait,
@@ -212,12 +211,19 @@ async def test_begin_cast_consumes_a_bait_charge_and_compounds_rarity():
 async def test_begin_cast_clears_bait_when_the_last_charge_is_spent():
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="shore")),
+        patch.object(
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                    bait_key="worm",
+                    bait_charges=1,
+                ),
+            ),
+        ),
         patch.object(wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0]),
-        patch.object(wf.db, "get_rod_tier", AsyncMock(return_value=0)),
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={"fishing": 0})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("worm", 1))),
         patch.object(
             wf, "roll_catch", fake_roll_catch()
         ),
@@ -237,12 +243,17 @@ async def test_begin_cast_without_bait_uses_only_the_rod_pull():
     rec: dict = {}
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="shore")),
+        patch.object(
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                ),
+            ),
+        ),
         patch.object(wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0]),
-        patch.object(wf.db, "get_rod_tier", AsyncMock(return_value=0)),
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={"fishing": 0})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("", 0))),
         patch.object(wf, "roll_catch", recording_roll_catch(rec)),
         patch.object(wf.db, "set_fishing_energy", AsyncMock()),
         patch.object(wf.db, "set_active_bait", AsyncMock()) as set_bait,
@@ -267,12 +278,20 @@ async def test_begin_cast_compounds_bite_speed_from_rod_and_bait():
     gold = rods_mod.rod_for_tier(3)
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="shore")),
+        patch.object(
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                    rod_tier=3,
+                    bait_key="spinner",
+                    bait_charges=2,
+                ),
+            ),
+        ),
         patch.object(wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0]),
-        patch.object(wf.db, "get_rod_tier", AsyncMock(return_value=3)),
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={"fishing": 0})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("spinner", 2))),
         patch.object(
             wf, "roll_catch", fake_roll_catch()
         ),
@@ -293,12 +312,18 @@ async def test_begin_cast_bite_speed_is_rod_only_without_bait():
     gold = rods_mod.rod_for_tier(3)
     with (
         patch.object(wf.time, "time", lambda: 1000),
-        patch.object(wf.db, "get_fishing_energy", AsyncMock(return_value=(10, 1000))),
-        patch.object(wf.db, "get_fishing_venue", AsyncMock(return_value="shore")),
+        patch.object(
+            wf.db,
+            "load_fishing_player_state",
+            AsyncMock(
+                return_value=_player(
+                    energy=10,
+                    energy_updated_at=1000,
+                    rod_tier=3,
+                ),
+            ),
+        ),
         patch.object(wf.weather_mod, "current_weather", lambda: wf.weather_mod.CONDITIONS[0]),
-        patch.object(wf.db, "get_rod_tier", AsyncMock(return_value=3)),
-        patch.object(wf.db, "get_game_xp", AsyncMock(return_value={"fishing": 0})),
-        patch.object(wf.db, "get_active_bait", AsyncMock(return_value=("", 0))),
         patch.object(
             wf, "roll_catch", fake_roll_catch()
         ),
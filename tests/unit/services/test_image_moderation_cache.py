@@ -0,0 +1,113 @@
+"""Image-moderation verdict cache (services.image_moderation_cache).
+
+Pins: a byte-identical repost is an exact hit, a re-encoded/resized copy is a
+perceptual (dHash) hit, unrelated and flat images never share scores, the cache
+is a bounded LRU, and the hit/miss counters feed ``cache_stats``.
+"""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+from PIL import Image, ImageDraw
+
+from services import image_moderation_cache as cache
+
+
+def _png(draw, *, size=(64, 64), fmt="PNG", **save) -> bytes:
+    image = Image.new("RGB", size, "white")
+    draw(ImageDraw.Draw(image), size)
+    buf = io.BytesIO()
+    image.save(buf, format=fmt, **save)
+    return buf.getvalue()
+
+
+def _stripes(canvas, size):
+    w, h = size
+    for x in range(0, w, w // 8):
+        canvas.rectangle((x, 0, x + w // 16, h), fill="black")
+    canvas.ellipse((w // 4, h // 4, 3 * w // 4, 3 * h // 4), fill="red")
+
+
+def _checker(canvas, size):
+    w, h = size
+    step = w // 4
+    for y in range(0, h, step):
+        for x in range(0, w, step):
+            if (x // step + y // step) % 2:
+                canvas.rectangle((x, y, x + step, y + step), fill="blue")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    cache._reset_for_tests()
+    yield
+    cache._reset_for_tests()
+
+
+def test_byte_identical_repost_is_an_exact_hit():
+    data = _png(_stripes)
+    cache.store(cache.fingerprint(data), {"sexual": 0.9})
+
+    assert cache.lookup(cache.fingerprint(data)) == {"sexual": 0.9}
+    assert cache.cache_stats().exact_hits == 1
+
+
+def test_reencoded_and_resized_copy_is_a_perceptual_hit():
+    original = _png(_stripes)
+    copy = _png(_stripes, size=(128, 128), fmt="JPEG", quality=60)
+    assert cache.fingerprint(original).digest != cache.fingerprint(copy).digest
+
+    cache.store(cache.fingerprint(original), {"violence": 0.4})
+
+    assert cache.lookup(cache.fingerprint(copy)) == {"violence": 0.4}
+    assert cache.cache_stats().perceptual_hits == 1
+
+
+def test_different_image_misses():
+    cache.store(cache.fingerprint(_png(_stripes)), {"sexual": 0.9})
+
+    assert cache.lookup(cache.fingerprint(_png(_checker))) is None
+    assert cache.cache_stats().misses == 1
+
+
+def test_flat_images_only_match_exactly():
+    black = _png(lambda c, s: c.rectangle((0, 0, *s), fill="black"))
+    grey = _png(lambda c, s: c.rectangle((0, 0, *s), fill="grey"))
+    assert cache.fingerprint(black).perceptual is False
+
+    cache.store(cache.fingerprint(black), {"sexual": 0.9})
+
+    assert cache.lookup(cache.fingerprint(grey)) is None
+
+
+def test_undecodable_bytes_still_cache_by_digest():
+    fp = cache.fingerprint(b"not an image")
+    assert fp.dhash is None
+
+    cache.store(fp, {"hate": 0.1})
+
+    assert cache.lookup(cache.fingerprint(b"not an image")) == {"hate": 0.1}
+
+
+def test_cache_is_bounded_lru(monkeypatch):
+    monkeypatch.setattr(cache, "_CACHE_MAX", 2)
+    fps = [cache.fingerprint(bytes([n])) for n in range(3)]
+    cache.store(fps[0], {})
+    cache.store(fps[1], {})
+    cache.lookup(fps[0])  # fps[1] is now least recently used
+    cache.store(fps[2], {})
+
+    assert cache.lookup(fps[1]) is None
+    assert cache.lookup(fps[0]) == {}
+    assert cache.cache_stats().size == 2
+
+
+def test_hit_rate():
+    fp = cache.fingerprint(b"x")
+    cache.lookup(fp)
+    cache.store(fp, {})
+    cache.lookup(fp)
+
+    assert cache.cache_stats().hit_rate == 0.5
@@ -15,26 +15,31 @@ from unittest.mock import ANY, AsyncMock, MagicMock, patch
 import pytest
 
 from services import mining_workflow
+from utils.db import MiningPlayerState
 from utils.mining import grid
 
-# Reads every dig path needs up front (position, depth, gear, skills); loot paths
-# additionally read inventory + the world seed.  Per-test overrides layer on top.
-_BASE_READS = dict(
-    get_position=lambda: AsyncMock(return_value=(0, 0)),
-    get_depth=lambda: AsyncMock(return_value=0),
-    get_equipment=lambda: AsyncMock(return_value={}),
-    get_skills=lambda: AsyncMock(return_value={}),
-    get_mining_inventory=lambda: AsyncMock(return_value={}),
-    get_world_seed=lambda: AsyncMock(return_value=123),
-    # Energy fuel: (0, 0) settles to a full bar (epoch-0 timestamp), so digs are
-    # never energy-blocked in these move/loot tests; set_energy is a no-op write.
-    get_energy=lambda: AsyncMock(return_value=(0, 0)),
-    set_energy=lambda: AsyncMock(),
-)
-
-
-def _reads(**overrides: object) -> dict[str, object]:
-    base = {name: factory() for name, factory in _BASE_READS.items()}
+# Every dig path reads the player's whole state in ONE locked query up front;
+# per-test overrides layer fields onto the default.  (0, 0) energy settles to a
+# full bar (epoch-0 timestamp), so digs are never energy-blocked in the move/loot
+# tests; set_energy is a no-op write.
+def _state(**overrides: object) -> MiningPlayerState:
+    fields: dict[str, object] = dict(
+        x=0,
+        y=0,
+        depth=0,
+        energy=0,
+        energy_updated_at=0,
+        seed=123,
+    )
+    fields.update(overrides)
+    return MiningPlayerState(**fields)  # type: ignore[arg-type]
+
+
+def _reads(state: MiningPlayerState | None = None, **overrides: object) -> dict:
+    base: dict[str, object] = {
+        "load_mining_player_state": AsyncMock(return_value=state or _state()),
+        "set_energy": AsyncMock(),
+    }
     base.update(overrides)
     return base
 
@@ -90,6 +95,51 @@ async def test_dig_lateral_moves_into_cell_and_mines_it():
     mark_discovered.assert_awaited_once_with("7", 99, 0, 0, 1, conn=ANY)
 
 
+@pytest.mark.asyncio
+async def test_dig_is_one_read_round_trip_then_only_writes():
+    """Query-count guard: a dig costs ONE read (the locked state load, after the
+    insert that gives a first-ever dig a row to lock), then its writes — not the
+    nine separate getter round-trips it used to.  Counted at the pool, so a new
+    per-table getter slipped into the dig path fails here.
+    """
+    calls: list[str] = []
+    row = {
+        "depth": 0,
+        "x": 0,
+        "y": 0,
+        "energy": 0,
+        "energy_updated_at": 0,
+        "seed": 123,
+        "inventory": {"pickaxe": 1},
+        "equipment": None,
+        "wear": None,
+        "skills": None,
+        "discovered": None,
+    }
+
+    async def _read(query, params=(), *, conn=None):
+        calls.append("read")
+        return row
+
+    async def _fetchall(query, params=(), *, conn=None):
+        calls.append("read")
+        return []
+
+    async def _write(query, params=(), *, conn=None):
+        calls.append("write")
+
+    with (
+        patch("utils.db.pool.fetchone", _read),
+        patch("utils.db.pool.fetchall", _fetchall),
+        patch("utils.db.pool.execute", _write),
+    ):
+        result = await mining_workflow.dig(7, 99, grid.EAST)
+
+    assert result.moved is True
+    # state-row insert, then energy spend, move, loot grant, fog-of-war mark.
+    assert calls == ["write", "read", "write", "write", "write", "write"]
+
+
 @pytest.mark.asyncio
 async def test_dig_unknown_direction_does_nothing():
     set_position = AsyncMock()
@@ -97,7 +147,7 @@ async def test_dig_unknown_direction_does_nothing():
     with patch.multiple(
         "services.mining_workflow.db",
         **_reads(
-            get_position=AsyncMock(return_value=(2, 3)),
+            state=_state(x=2, y=3),
             set_position=set_position,
             update_mining_item=update_mining_item,
             mark_discovered=AsyncMock(),
@@ -148,7 +198,7 @@ async def test_dig_down_with_light_descends_mines_and_records_depth():
         patch.multiple(
             "services.mining_workflow.db",
             **_reads(
-                get_position=AsyncMock(return_value=(1, 1)),
+                state=_state(x=1, y=1),
                 set_depth=set_depth,
                 update_mining_item=update_mining_item,
                 mark_discovered=mark_discovered,
@@ -227,7 +277,7 @@ async def test_dig_blocked_when_out_of_energy():
     with patch.multiple(
         "services.mining_workflow.db",
         **_reads(
-            get_energy=AsyncMock(return_value=(0, 9_999_999_999)),
+            state=_state(energy=0, energy_updated_at=9_999_999_999),
             set_position=set_position,
             update_mining_item=update_mining_item,
             set_energy=set_energy,
@@ -250,7 +300,8 @@ async def test_dig_spends_energy_in_the_transaction():
     with patch.multiple(
         "services.mining_workflow.db",
         **_reads(
-            get_energy=AsyncMock(return_value=(10, 9_999_999_999)),  # 10, no regen
+            # 10 energy, no regen
+            state=_state(energy=10, energy_updated_at=9_999_999_999),
             set_position=AsyncMock(),
             update_mining_item=AsyncMock(),
             set_energy=set_energy,
@@ -6,7 +6,7 @@ The policy read model + the pure DM renderer that
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -140,9 +140,12 @@ async def test_load_policy_maps_resolved_values():
         assert subsystem == "moderation"
         return resolved[name]
 
-    with patch(
-        "services.settings_resolution.resolve_value",
-        side_effect=_fake_resolve,
+    with (
+        patch(
+            "services.settings_resolution.resolve_value",
+            side_effect=_fake_resolve,
+        ),
+        patch("utils.db.get_settings_for_guilds", AsyncMock(return_value={})),
     ):
         policy = await moderation_config.load_policy(42)
 
@@ -171,9 +174,12 @@ async def test_load_policy_falls_back_to_defaults():
     async def _echo_fallback(guild_id, subsystem, name, fallback):
         return fallback
 
-    with patch(
-        "services.settings_resolution.resolve_value",
-        side_effect=_echo_fallback,
+    with (
+        patch(
+            "services.settings_resolution.resolve_value",
+            side_effect=_echo_fallback,
+        ),
+        patch("utils.db.get_settings_for_guilds", AsyncMock(return_value={})),
     ):
         policy = await moderation_config.load_policy(7)
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -86,6 +87,10 @@ async def test_load_policy_clamps_and_coerces(monkeypatch):
     import services.settings_resolution as sr
 
     monkeypatch.setattr(sr, "resolve_value", _resolve)
+    monkeypatch.setattr(
+        "utils.db.get_settings_for_guilds",
+        AsyncMock(return_value={}),
+    )
 
     p = await security_config.load_policy(123)
     assert p.raid_join_count == security_config.MAX_RAID_JOIN_COUNT
@@ -106,5 +111,9 @@ async def test_load_policy_defaults_off(monkeypatch):
     import services.settings_resolution as sr
 
     monkeypatch.setattr(sr, "resolve_value", _resolve)
+    monkeypatch.setattr(
+        "utils.db.get_settings_for_guilds",
+        AsyncMock(return_value={}),
+    )
     p = await security_config.load_policy(1)
     assert not p.enabled and not p.any_tier_enabled
@@ -148,6 +148,10 @@ async def test_load_policy_composes_typed_values(monkeypatch):
     import services.settings_resolution as sr
 
     monkeypatch.setattr(sr, "resolve_value", fake_resolve)
+    monkeypatch.setattr(
+        "utils.db.get_settings_for_guilds",
+        AsyncMock(return_value={}),
+    )
 
     pol = await server_logging_config.load_policy(guild_id=1)
     assert pol.enabled is True
@@ -168,6 +172,10 @@ async def test_load_policy_rejects_unknown_routing(monkeypatch):
     import services.settings_resolution as sr
 
     monkeypatch.setattr(sr, "resolve_value", fake_resolve)
+    monkeypatch.setattr(
+        "utils.db.get_settings_for_guilds",
+        AsyncMock(return_value={}),
+    )
 
     pol = await server_logging_config.load_policy(guild_id=1)
     assert pol.routing == "combined"  # degraded to the default, not "garbage"
@@ -430,6 +438,10 @@ async def test_load_policy_parses_ignore_lists(monkeypatch):
     import services.settings_resolution as sr
 
     monkeypatch.setattr(sr, "resolve_value", fake_resolve)
+    monkeypatch.setattr(
+        "utils.db.get_settings_for_guilds",
+        AsyncMock(return_value={}),
+    )
 
     pol = await server_logging_config.load_policy(guild_id=1)
     assert pol.ignored_channel_ids == frozenset({42, 43})
@@ -111,6 +111,13 @@ def _isolated_state(monkeypatch):
     monkeypatch.setattr(settings_db, "get_setting", _fake_get_setting)
     monkeypatch.setattr(db_pkg, "get_setting", _fake_get_setting)
 
+    async def _fake_get_settings_for_guilds(guild_ids) -> dict:
+        return {
+            gid: {k: v for (g, k), v in _kv.items() if g == gid} for gid in guild_ids
+        }
+
+    monkeypatch.setattr(db_pkg, "get_settings_for_guilds", _fake_get_settings_for_guilds)
+
     # Audit DB stub: record every set_value_with_audit call AND
     # update the in-memory KV so resolve_setting reflects post-write
     # state on the next call.
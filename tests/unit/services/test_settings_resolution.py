@@ -22,6 +22,7 @@ from services.settings_resolution import (
 )
 from utils import db as db_pkg
 from utils.db import settings as settings_db
+from utils.db.settings import GLOBAL_GUILD_ID
 
 # ---------------------------------------------------------------------------
 # Fixtures — snapshot live module state around each test to stay isolated.
@@ -35,9 +36,10 @@ def _reset_state(monkeypatch):
     sr_mod._reset_counters_for_tests()
     guild_config._reset_for_tests()
 
-    # Replace the legacy KV read with an in-memory store so tests don't
-    # touch the DB. Tests populate `_kv` to control what get_setting
-    # returns. The same store is used to verify caching.
+    # Replace the legacy KV reads with an in-memory store so tests don't
+    # touch the DB. Tests populate `_kv` to control what the snapshot
+    # load returns. The fetch counter counts snapshot loads (one query
+    # each) to verify caching.
     _kv: dict[tuple[int, str], str] = {}
     fetch_counter = {"calls": 0}
 
@@ -46,14 +48,20 @@ def _reset_state(monkeypatch):
         key: str,
         default: str = "",
     ) -> str:
-        fetch_counter["calls"] += 1
         return _kv.get((guild_id, key), default)
 
+    async def _fake_get_settings_for_guilds(guild_ids) -> dict:
+        fetch_counter["calls"] += 1
+        return {
+            gid: {k: v for (g, k), v in _kv.items() if g == gid} for gid in guild_ids
+        }
+
     # Patch the function at every binding site — `utils.db.__init__`
     # re-exports `get_setting` from `utils.db.settings`, so patching only
     # the source module leaves the re-exported reference unchanged.
     monkeypatch.setattr(settings_db, "get_setting", _fake_get_setting)
     monkeypatch.setattr(db_pkg, "get_setting", _fake_get_setting)
+    monkeypatch.setattr(db_pkg, "get_settings_for_guilds", _fake_get_settings_for_guilds)
 
     yield {"kv": _kv, "fetches": fetch_counter}
 
@@ -500,6 +508,62 @@ async def test_guild_config_invalidate_drops_cached_value(_reset_state):
     assert _reset_state["fetches"]["calls"] == 2
 
 
+@pytest.mark.asyncio
+async def test_one_snapshot_load_serves_every_key_and_both_tiers(_reset_state):
+    _register(
+        "xp",
+        SettingSpec(name="xp_min", value_type=int, default=1, settings_key="XP_MIN"),
+        SettingSpec(name="xp_max", value_type=int, default=9, settings_key="XP_MAX"),
+        SettingSpec(name="cd", value_type=int, default=60, settings_key="XP_CD"),
+    )
+    _reset_state["kv"][(1, "XP_MIN")] = "5"
+    _reset_state["kv"][(GLOBAL_GUILD_ID, "XP_MAX")] = "7"
+
+    results = await resolve_batch(1, "xp")
+
+    assert [r.provenance for r in results] == ["legacy_kv", "global_kv", "default"]
+    # Unset keys are answered from the same snapshot — no per-key re-query.
+    await resolve_batch(1, "xp")
+    assert _reset_state["fetches"]["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_global_write_invalidation_refreshes_other_guilds(_reset_state):
+    from utils.guild_config_accessors import invalidate_setting_value
+
+    _register(
+        "xp",
+        SettingSpec(name="xp_min", value_type=int, default=1, settings_key="XP_MIN"),
+    )
+    assert (await resolve_setting(1, "xp", "xp_min")).provenance == "default"
+
+    _reset_state["kv"][(GLOBAL_GUILD_ID, "XP_MIN")] = "4"
+    invalidate_setting_value(GLOBAL_GUILD_ID, "XP_MIN")
+
+    result = await resolve_setting(1, "xp", "xp_min")
+    assert (result.value, result.provenance) == (4, "global_kv")
+
+
+@pytest.mark.asyncio
+async def test_memoised_policy_rebuilds_only_on_a_new_snapshot(_reset_state):
+    from utils.guild_config_accessors import invalidate_setting_value
+
+    builds: list[int] = []
+
+    @sr_mod.memoised_policy("automod")
+    async def _load(guild_id):
+        builds.append(guild_id)
+        return object()
+
+    first = await _load(1)
+    assert await _load(1) is first
+    assert builds == [1]
+
+    invalidate_setting_value(1, "ANY_KEY")
+    assert await _load(1) is not first
+    assert builds == [1, 1]
+
+
 # ---------------------------------------------------------------------------
 # Immutability
 # ---------------------------------------------------------------------------
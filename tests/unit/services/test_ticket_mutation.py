@@ -121,6 +121,8 @@ async def test_open_success_delegates_creates_row_and_emits(monkeypatch):
     _, payload = next(p for p in emitted if p[0] == "ticket.opened")
     assert payload["subject"] == "need help"
     assert payload["source"] == "ai"
+    # the new channel's messages are recorded into the transcript from now on
+    assert tm.ticket_transcript.ticket_for_channel(555) == 7
 
 
 @pytest.mark.asyncio
@@ -154,6 +156,71 @@ async def test_open_failure_when_channel_creation_blocked(monkeypatch):
     db_create.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_close_exports_the_recorded_transcript_then_discards_it(monkeypatch, tmp_path):
+    monkeypatch.setattr(tm.ticket_service, "get_config", AsyncMock(return_value=_cfg()))
+
+    @asynccontextmanager
+    async def _txn():
+        yield MagicMock(name="conn")
+
+    monkeypatch.setattr(tm.db, "transaction", _txn)
+    monkeypatch.setattr(tm.db, "ticket_close", AsyncMock())
+    monkeypatch.setattr(tm, "emit_audit_action", AsyncMock(return_value=True))
+    monkeypatch.setattr(tm.bus, "emit", AsyncMock())
+    path = tmp_path / "t.txt"
+    path.write_text("Transcript")
+    export = tm.ticket_transcript.TranscriptExport(path, message_count=1, truncated=False)
+    exporter = AsyncMock(return_value=export)
+    monkeypatch.setattr(tm.ticket_transcript, "export", exporter)
+    deliver = AsyncMock()
+    monkeypatch.setattr(tm, "_deliver_transcript", deliver)
+    tm.ticket_transcript.track(555, 7)
+    channel = MagicMock(id=555, guild=_guild())
+    ticket = {"id": 7, "status": "open", "opener_id": 2, "guild_id": 1}
+
+    result = await tm.close_ticket(channel, ticket, _member(), delete_after=False)
+
+    assert result.success
+    exporter.assert_awaited_once_with(channel, 7)
+    assert deliver.await_args.args[3] is export
+    assert not path.exists()  # the temp file is gone once delivered
+    assert tm.ticket_transcript.ticket_for_channel(555) is None
+
+
+@pytest.mark.asyncio
+async def test_close_still_closes_when_the_transcript_export_fails(monkeypatch):
+    monkeypatch.setattr(tm.ticket_service, "get_config", AsyncMock(return_value=_cfg()))
+
+    @asynccontextmanager
+    async def _txn():
+        yield MagicMock(name="conn")
+
+    monkeypatch.setattr(tm.db, "transaction", _txn)
+    close = AsyncMock()
+    monkeypatch.setattr(tm.db, "ticket_close", close)
+    monkeypatch.setattr(tm, "emit_audit_action", AsyncMock(return_value=True))
+    monkeypatch.setattr(tm.bus, "emit", AsyncMock())
+    monkeypatch.setattr(
+        tm.ticket_transcript,
+        "export",
+        AsyncMock(side_effect=OSError("disk full")),
+    )
+    deliver = AsyncMock()
+    monkeypatch.setattr(tm, "_deliver_transcript", deliver)
+    channel = MagicMock(id=555, guild=_guild())
+    ticket = {"id": 7, "status": "open", "opener_id": 2, "guild_id": 1}
+
+    result = await tm.close_ticket(channel, ticket, _member(), delete_after=False)
+
+    assert result.success
+    close.assert_awaited_once()
+    fallback = deliver.await_args.args[3]
+    assert fallback.path is None
+    upload = fallback.file("t.txt")
+    assert upload.fp.read().decode() == tm.ticket_transcript.UNAVAILABLE_TEXT
+
+
 @pytest.mark.asyncio
 async def test_claim_rejects_already_claimed():
     out = await tm.claim_ticket(
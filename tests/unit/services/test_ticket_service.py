@@ -1,4 +1,4 @@
-"""ticket_service — open-eligibility decisions + transcript rendering.
+"""ticket_service — open-eligibility decisions.
 
 The eligibility gate is the single source of truth every open path (command /
 panel / AI) shares, so its reason codes are pinned here.
@@ -82,30 +82,3 @@ def test_config_is_set_up_requires_enabled_and_role():
     assert _cfg().is_set_up
     assert not _cfg(enabled=False).is_set_up
     assert not _cfg(staff_role_id=None).is_set_up
-
-
-@pytest.mark.asyncio
-async def test_build_transcript_renders_messages():
-    class _Msg:
-        def __init__(self, author_name, content):
-            self.created_at = __import__("datetime").datetime(2026, 6, 24, 12, 0)
-            self.author = type("A", (), {"display_name": author_name})()
-            self.content = content
-            self.attachments = []
-            self.embeds = []
-
-    class _Channel:
-        name = "ticket-bob"
-        id = 5
-
-        def history(self, *, limit, oldest_first):  # noqa: ARG002
-            async def _gen():
-                for m in (_Msg("bob", "hello"), _Msg("staff", "hi there")):
-                    yield m
-
-            return _gen()
-
-    out = await ts.build_transcript(_Channel())
-    assert "bob: hello" in out
-    assert "staff: hi there" in out
-    assert "2 message(s)" in out
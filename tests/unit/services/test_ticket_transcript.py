@@ -0,0 +1,368 @@
+"""ticket_transcript — incremental recording, backfill, bounded export.
+
+Pins: a live message is rendered + appended under its ticket, and its
+attachments are archived in the background while their CDN URLs are valid; a
+public interaction reply in a ticket is recorded; the backfill reads history
+only *after* the newest recorded message (and all of it — no 500 cap — when
+nothing is recorded yet); the exported file never exceeds the upload limit
+and says how much it left out; the attachments zip is built from the stored
+bytes, one at a time, within the same limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import zipfile
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services import ticket_transcript as tt
+
+
+class _Attachment:
+    def __init__(self, aid, filename, data=b"png", *, fails=False):
+        self.id = aid
+        self.filename = filename
+        self.url = f"https://cdn.example/{filename}"
+        self.size = len(data)
+        self._data = data
+        self._fails = fails
+
+    async def read(self):
+        if self._fails:
+            raise RuntimeError("404 — link expired")
+        return self._data
+
+
+class _Msg:
+    def __init__(self, mid, author_name, content, *, attachments=()):
+        self.id = mid
+        self.created_at = datetime.datetime(2026, 6, 24, 12, 0)
+        self.author = type("A", (), {"display_name": author_name})()
+        self.content = content
+        self.attachments = list(attachments)
+        self.embeds = []
+
+
+class _Channel:
+    name = "ticket-bob"
+    id = 5
+    guild = None
+
+    def __init__(self, messages):
+        self.messages = messages
+        self.calls: list[dict] = []
+
+    def history(self, *, limit, oldest_first, after=None):
+        self.calls.append({"limit": limit, "after": after})
+        floor = after.id if after is not None else 0
+
+        async def _gen():
+            for m in self.messages:
+                if m.id > floor:
+                    yield m
+
+        return _gen()
+
+
+def test_format_line_points_attachments_at_their_archive_entry():
+    line = tt.format_line(
+        _Msg(1, "bob", "see", attachments=[_Attachment(9, "a/b.png")]),
+    )
+    assert line == (
+        "[2026-06-24 12:00] bob: see [attachments: a/b.png <attachments/9-a_b.png>]"
+    )
+
+
+def test_only_tracked_channels_resolve_to_a_ticket():
+    tt.track(5, 42)
+    assert tt.ticket_for_channel(5) == 42
+    assert tt.ticket_for_channel(6) is None
+    tt.untrack(5)
+    assert tt.ticket_for_channel(5) is None
+
+
+@pytest.mark.asyncio
+async def test_record_appends_one_rendered_line(monkeypatch):
+    append = AsyncMock()
+    monkeypatch.setattr(tt.db, "ticket_transcript_append", append)
+
+    await tt.record(42, _Msg(7, "bob", "hello"))
+
+    append.assert_awaited_once_with(42, [(7, "[2026-06-24 12:00] bob: hello")])
+
+
+@pytest.mark.asyncio
+async def test_record_if_tracked_skips_other_channels(monkeypatch):
+    append = AsyncMock()
+    monkeypatch.setattr(tt.db, "ticket_transcript_append", append)
+    tt.track(5, 42)
+    msg = _Msg(7, "bob", "hello")
+    msg.channel = type("C", (), {"id": 6})()
+
+    await tt.record_if_tracked(msg)
+    append.assert_not_awaited()
+
+    msg.channel.id = 5
+    await tt.record_if_tracked(msg)
+    append.assert_awaited_once_with(42, [(7, "[2026-06-24 12:00] bob: hello")])
+
+
+@pytest.mark.asyncio
+async def test_record_archives_attachments_in_the_background(monkeypatch):
+    monkeypatch.setattr(tt.db, "ticket_transcript_append", AsyncMock())
+    archive = AsyncMock()
+    monkeypatch.setattr(tt, "archive_attachments", archive)
+    shot = _Attachment(30, "shot.png")
+
+    await tt.record(42, _Msg(7, "bob", "see", attachments=[shot]))
+    await asyncio.sleep(0)
+
+    archive.assert_awaited_once_with(42, [shot], tt._DEFAULT_MAX_BYTES)
+
+
+@pytest.mark.asyncio
+async def test_public_interaction_replies_in_a_ticket_are_recorded(monkeypatch):
+    append = AsyncMock()
+    monkeypatch.setattr(tt.db, "ticket_transcript_append", append)
+    tt.track(5, 42)
+    reply = _Msg(8, "bot", "✋ claimed")
+    reply.channel = type("C", (), {"id": 5})()
+    elsewhere = MagicMock(channel_id=6, original_response=AsyncMock())
+    claimed = MagicMock(channel_id=5, original_response=AsyncMock(return_value=reply))
+
+    await tt.record_interaction_reply(elsewhere)
+    await tt.record_interaction_reply(claimed)
+
+    elsewhere.original_response.assert_not_awaited()  # no REST call outside tickets
+    append.assert_awaited_once_with(42, [(8, "[2026-06-24 12:00] bot: ✋ claimed")])
+
+
+@pytest.mark.asyncio
+async def test_archive_attachments_keeps_bytes_within_budget_and_notes_the_rest(
+    monkeypatch,
+):
+    monkeypatch.setattr(
+        tt.db, "ticket_transcript_attachment_bytes", AsyncMock(return_value=0),
+    )
+    store = AsyncMock()
+    monkeypatch.setattr(tt.db, "ticket_transcript_store_attachment", store)
+    kept = _Attachment(1, "kept.png", b"k" * 100)
+    too_big = _Attachment(2, "huge.mov", b"h" * 50_000)
+    expired = _Attachment(3, "gone.png", fails=True)
+
+    await tt.archive_attachments(42, [kept, too_big, expired], 40_000)
+
+    assert [c.args + (c.kwargs["note"],) for c in store.await_args_list] == [
+        (42, 1, "attachments/1-kept.png", b"k" * 100, None),
+        (42, 2, "attachments/2-huge.mov", None, "upload size limit"),
+        (42, 3, "attachments/3-gone.png", None, "download failed"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_backfill_reads_only_the_gap_after_the_newest_recorded(monkeypatch):
+    monkeypatch.setattr(
+        tt.db, "ticket_transcript_last_message_id", AsyncMock(return_value=2),
+    )
+    append = AsyncMock()
+    monkeypatch.setattr(tt.db, "ticket_transcript_append", append)
+    archive = AsyncMock()
+    monkeypatch.setattr(tt, "archive_attachments", archive)
+    msgs = [_Msg(i, "bob", f"m{i}") for i in range(1, 5)]
+    shot = _Attachment(30, "shot.png")
+    msgs[3].attachments = [shot]
+    channel = _Channel(msgs)
+
+    count = await tt.backfill(channel, 42)
+
+    assert count == 2
+    assert channel.calls[0]["after"].id == 2
+    (ticket_id, rows), _ = append.await_args
+    assert ticket_id == 42
+    assert [mid for mid, _ in rows] == [3, 4]
+    archive.assert_awaited_once_with(42, [shot], tt._DEFAULT_MAX_BYTES)
+
+
+@pytest.mark.asyncio
+async def test_backfill_of_an_unrecorded_ticket_is_uncapped_and_batched(monkeypatch):
+    monkeypatch.setattr(
+        tt.db, "ticket_transcript_last_message_id", AsyncMock(return_value=None),
+    )
+    append = AsyncMock()
+    monkeypatch.setattr(tt.db, "ticket_transcript_append", append)
+    channel = _Channel([_Msg(i, "bob", "x") for i in range(1, 651)])
+
+    count = await tt.backfill(channel, 42)
+
+    assert count == 650  # no 500-message cap
+    assert channel.calls[0] == {"limit": None, "after": None}
+    assert [len(c.args[1]) for c in append.await_args_list] == [100] * 6 + [50]
+
+
+def _recorded(monkeypatch, lines):
+    """Serve ``lines`` (message ids 1..n) through the count + page reads."""
+    rows = list(enumerate(lines, start=1))
+    pages = []
+
+    async def page(ticket_id, *, after=0, limit):
+        pages.append((after, limit))
+        return [row for row in rows if row[0] > after][:limit]
+
+    monkeypatch.setattr(
+        tt.db, "ticket_transcript_count", AsyncMock(return_value=len(rows)),
+    )
+    monkeypatch.setattr(tt.db, "ticket_transcript_page", page)
+    return pages
+
+
+def _no_gap_no_attachments(monkeypatch):
+    monkeypatch.setattr(tt, "backfill", AsyncMock(return_value=0))
+    monkeypatch.setattr(
+        tt.db, "ticket_transcript_attachment_index", AsyncMock(return_value=[]),
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_writes_the_header_and_every_line(monkeypatch):
+    _no_gap_no_attachments(monkeypatch)
+    _recorded(monkeypatch, ["[t] bob: hello", "[t] staff: hi there"])
+
+    out = await tt.export(_Channel([]), 42)
+    try:
+        text = out.path.read_text(encoding="utf-8")
+    finally:
+        out.discard()
+
+    assert text.startswith("Transcript — #ticket-bob (2 message(s))\n")
+    assert "bob: hello" in text
+    assert "staff: hi there" in text
+    assert out.message_count == 2
+    assert out.truncated is False
+    assert not out.path.exists()
+
+
+@pytest.mark.asyncio
+async def test_export_reads_and_writes_the_transcript_in_pages(monkeypatch):
+    _no_gap_no_attachments(monkeypatch)
+    monkeypatch.setattr(tt, "_EXPORT_PAGE", 100)
+    pages = _recorded(monkeypatch, [f"[t] bob: line {i}" for i in range(1, 251)])
+
+    out = await tt.export(_Channel([]), 42)
+    try:
+        text = out.path.read_text(encoding="utf-8")
+    finally:
+        out.discard()
+
+    # keyset pages on message_id, the last one capped at the counted rows
+    assert pages == [(0, 100), (100, 100), (200, 50)]
+    assert text.startswith("Transcript — #ticket-bob (250 message(s))\n")
+    assert text.index("line 1\n") < text.index("line 250\n")
+    assert out.message_count == 250
+
+
+@pytest.mark.asyncio
+async def test_export_stops_reading_once_the_upload_limit_is_hit(monkeypatch):
+    _no_gap_no_attachments(monkeypatch)
+    monkeypatch.setattr(tt, "_EXPORT_PAGE", 10)
+    pages = _recorded(monkeypatch, [f"[t] bob: {'x' * 90}" for _ in range(100)])
+
+    out = await tt.export(_Channel([]), 42, max_bytes=2048)
+    out.discard()
+
+    assert out.truncated is True
+    assert len(pages) < 10  # the rest of the transcript is never read
+
+
+@pytest.mark.asyncio
+async def test_export_stays_under_the_upload_limit(monkeypatch):
+    _no_gap_no_attachments(monkeypatch)
+    lines = [f"[t] bob: {'x' * 90}" for _ in range(100)]
+    _recorded(monkeypatch, lines)
+
+    out = await tt.export(_Channel([]), 42, max_bytes=2048)
+    try:
+        data = out.path.read_bytes()
+    finally:
+        out.discard()
+
+    assert len(data) <= 2048
+    assert out.truncated is True
+    assert data.decode("utf-8").endswith("more message(s) not included (upload size limit).")
+
+
+@pytest.mark.asyncio
+async def test_export_backfills_only_the_gap_before_reading(monkeypatch):
+    backfill = AsyncMock(return_value=0)
+    monkeypatch.setattr(tt, "backfill", backfill)
+    monkeypatch.setattr(
+        tt.db, "ticket_transcript_attachment_index", AsyncMock(return_value=[]),
+    )
+    _recorded(monkeypatch, [])
+    channel = _Channel([])
+
+    out = await tt.export(channel, 42)
+    out.discard()
+
+    backfill.assert_awaited_once_with(channel, 42)
+    assert channel.calls == []  # no history read of its own
+
+
+@pytest.mark.asyncio
+async def test_export_zips_the_stored_attachments_within_the_limit(monkeypatch):
+    monkeypatch.setattr(tt, "backfill", AsyncMock(return_value=0))
+    index = [
+        {"attachment_id": 1, "entry": "attachments/1-kept.png", "size": 100, "note": None},
+        {
+            "attachment_id": 2,
+            "entry": "attachments/2-huge.mov",
+            "size": None,
+            "note": "upload size limit",
+        },
+        {
+            "attachment_id": 3,
+            "entry": "attachments/3-gone.png",
+            "size": None,
+            "note": "download failed",
+        },
+        {"attachment_id": 4, "entry": "attachments/4-big.bin", "size": 30_000, "note": None},
+    ]
+    monkeypatch.setattr(
+        tt.db, "ticket_transcript_attachment_index", AsyncMock(return_value=index),
+    )
+    data = AsyncMock(return_value=b"k" * 100)
+    monkeypatch.setattr(tt.db, "ticket_transcript_attachment_data", data)
+    _recorded(monkeypatch, ["x"])
+
+    out = await tt.export(_Channel([]), 42, max_bytes=40_000)
+    try:
+        assert out.archive_path is not None
+        assert out.archive_path.stat().st_size <= 40_000
+        with zipfile.ZipFile(out.archive_path) as zf:
+            assert zf.read("attachments/1-kept.png") == b"k" * 100
+            skipped = zf.read("SKIPPED.txt").decode()
+        text = out.path.read_text(encoding="utf-8")
+    finally:
+        out.discard()
+
+    data.assert_awaited_once_with(42, 1)  # only what fits is read, one at a time
+    assert "attachments/2-huge.mov (upload size limit)" in skipped
+    assert "attachments/3-gone.png (download failed)" in skipped
+    assert "attachments/4-big.bin (upload size limit)" in skipped
+    assert out.attachments_skipped == 3
+    assert "Attachments: 1 archived, 3 not archived" in text
+    assert not out.archive_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_export_without_attachments_has_no_archive(monkeypatch):
+    _no_gap_no_attachments(monkeypatch)
+    _recorded(monkeypatch, [])
+
+    out = await tt.export(_Channel([]), 42)
+    out.discard()
+
+    assert out.archive_path is None
+    assert out.archive_file("a.zip") is None
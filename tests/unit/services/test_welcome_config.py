@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock
+
 import pytest
 
 from services import welcome_config
@@ -105,6 +107,10 @@ async def test_load_policy_composes_typed_values(monkeypatch):
     import services.settings_resolution as sr
 
     monkeypatch.setattr(sr, "resolve_value", fake_resolve)
+    monkeypatch.setattr(
+        "utils.db.get_settings_for_guilds",
+        AsyncMock(return_value={}),
+    )
 
     pol = await welcome_config.load_policy(guild_id=123)
     assert pol.enabled is True
@@ -126,6 +132,10 @@ async def test_load_policy_blank_channel_degrades_to_none(monkeypatch):
     import services.settings_resolution as sr
 
     monkeypatch.setattr(sr, "resolve_value", fake_resolve)
+    monkeypatch.setattr(
+        "utils.db.get_settings_for_guilds",
+        AsyncMock(return_value={}),
+    )
 
     pol = await welcome_config.load_policy(guild_id=1)
     assert pol.channel_id is None
@@ -0,0 +1,42 @@
+"""Tests for utils.lazy_import.lazy_module."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from utils.lazy_import import is_loaded, lazy_module
+
+
+@pytest.fixture
+def fake_module(tmp_path, monkeypatch):
+    (tmp_path / "_lazy_target.py").write_text("VALUE = 1\n\ndef double(x):\n    return x * 2\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "_lazy_target", raising=False)
+    yield
+    sys.modules.pop("_lazy_target", None)
+
+
+def test_imports_on_first_attribute_access(fake_module):
+    proxy = lazy_module("_lazy_target")
+    assert not is_loaded(proxy)
+    assert "not loaded" in repr(proxy)
+
+    assert proxy.double(2) == 4
+    assert is_loaded(proxy)
+    assert proxy.VALUE == sys.modules["_lazy_target"].VALUE
+
+
+def test_patching_the_proxy_patches_the_real_module(fake_module, monkeypatch):
+    proxy = lazy_module("_lazy_target")
+    monkeypatch.setattr(proxy, "VALUE", 5)
+    assert sys.modules["_lazy_target"].VALUE == 5
+    monkeypatch.undo()
+    assert proxy.VALUE == 1
+
+
+def test_missing_module_raises_on_use_not_on_bind():
+    proxy = lazy_module("_no_such_module_anywhere")
+    with pytest.raises(ModuleNotFoundError):
+        proxy.anything  # noqa: B018
@@ -78,6 +78,40 @@ def test_cell_at_seed_changes_the_world():
     assert world_a != world_b
 
 
+def _reference_cell(seed, x, y, z):
+    """The original one-RNG-per-cell generator the chunk cache must reproduce."""
+    import random
+
+    rng = random.Random(grid._cell_seed(seed, x, y, z))
+    features = [f for f, _ in grid._FEATURE_WEIGHTS]
+    feature = rng.choices(
+        features, weights=[w for _, w in grid._FEATURE_WEIGHTS], k=1
+    )[0]
+    weights = ore_weights_for_depth(z)
+    ores = list(weights)
+    featured = rng.choices(ores, weights=[weights[o] for o in ores], k=1)[0]
+    return Cell(x, y, z, feature, featured, grid._RICHNESS[feature])
+
+
+def test_chunked_generation_matches_the_per_cell_generator_bit_for_bit():
+    for seed in (0, 42, -7, 2**40 + 3):
+        for z in (0, 3, 9):
+            for x in range(-9, 10, 3):
+                for y in range(-9, 10, 2):
+                    assert grid.cell_at(seed, x, y, z) == _reference_cell(seed, x, y, z)
+
+
+def test_chunk_of_and_chunk_cells_round_trip_across_the_origin():
+    for x in range(-17, 17):
+        for y in range(-17, 17):
+            cx, cy, bit = grid.chunk_of(x, y)
+            assert 0 <= bit < grid.CHUNK_SIZE**2
+            assert grid.chunk_cells(cx, cy, 1 << bit) == {(x, y)}
+            assert grid.chunk_at(5, cx, cy, 0)[bit] == grid.cell_at(5, x, y, 0)
+    assert grid.chunk_of(-1, -1) == (-1, -1, 63)
+    assert grid.chunk_of(8, 0) == (1, 0, 0)
+
+
 def test_deeper_cells_favor_richer_featured_ore():
     """z = depth band carries 'deeper = richer' (reuses ore_weights_for_depth)."""
     surface = [grid.cell_at(7, x, 0, 0).featured_resource for x in range(200)]
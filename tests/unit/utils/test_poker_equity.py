@@ -0,0 +1,63 @@
+"""Tests for Hold'em equity (utils/poker/equity)."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from utils.cards import card
+from utils.poker.equity import equity
+
+
+def cards(*codes: str) -> list:
+    return [card(c) for c in codes]
+
+
+def test_complete_board_is_exact() -> None:
+    shares = equity(
+        [cards("AS", "AH"), cards("KS", "KH")],
+        cards("2C", "7D", "9H", "JC", "3S"),
+    )
+    assert shares == [1.0, 0.0]
+
+
+def test_river_to_come_is_enumerated_exactly() -> None:
+    # 44 unseen cards; only the two remaining kings save KK.
+    shares = equity(
+        [cards("AS", "AH"), cards("KS", "KH")],
+        cards("2C", "7D", "9H", "JC"),
+    )
+    assert shares == pytest.approx([42 / 44, 2 / 44])
+
+
+def test_chopped_board_splits_the_pot() -> None:
+    shares = equity(
+        [cards("AS", "KD"), cards("AH", "KC")],
+        cards("2C", "7D", "9H"),
+    )
+    assert shares[0] == pytest.approx(shares[1])
+    assert sum(shares) == pytest.approx(1.0)
+
+
+def test_preflop_monte_carlo_is_close_to_known_odds() -> None:
+    # AA vs KK all-in preflop is ~82% / 18%.
+    shares = equity(
+        [cards("AS", "AH"), cards("KS", "KH")],
+        iterations=4000,
+        rng=random.Random(7),
+    )
+    assert shares[0] == pytest.approx(0.82, abs=0.03)
+    assert sum(shares) == pytest.approx(1.0)
+
+
+def test_seeded_rng_is_reproducible() -> None:
+    hands = [cards("QS", "JS"), cards("8D", "8C"), cards("AH", "2D")]
+    first = equity(hands, iterations=500, rng=random.Random(3))
+    second = equity(hands, iterations=500, rng=random.Random(3))
+    assert first == second
+
+
+def test_rejects_duplicate_cards() -> None:
+    with pytest.raises(ValueError, match="more than once"):
+        equity([cards("AS", "AH"), cards("AS", "KH")])
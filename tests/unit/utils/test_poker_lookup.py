@@ -0,0 +1,101 @@
+"""Tests for the table-driven poker evaluator (utils/poker/lookup).
+
+The evaluator must order hands exactly like ``best_hand``.  Verified
+exhaustively over the lookup tables' whole domain: every 5-card hand class
+directly against ``score_five``, every suited rank mask (5-7 cards) against
+``best_hand``, and every 6- and 7-card rank multiset against the best of its
+5-card sub-multisets (each already checked against ``score_five``).
+"""
+
+from __future__ import annotations
+
+import random
+from itertools import combinations
+
+import pytest
+
+from utils.cards import RANKS, SUITS, Card, card, make_deck
+from utils.poker import lookup
+from utils.poker.evaluate import HandCategory, best_hand, score_five
+
+
+def cards(*codes: str) -> list[Card]:
+    return [card(c) for c in codes]
+
+
+def _rank_lists(size: int) -> list[list[int]]:
+    """Every multiset of ``size`` ranks (each rank at most 4x), as sorted lists."""
+    out: list[list[int]] = []
+    for counts in lookup._rank_multisets(0, size, {}):
+        if sum(counts.values()) == size:
+            out.append(sorted(r for r, n in counts.items() for _ in range(n)))
+    return out
+
+
+def _offsuit(ranks: list[int]) -> list[Card]:
+    """Cards for ``ranks`` with suits dealt round-robin — never a flush."""
+    return [Card(rank=r, suit=SUITS[i % 4]) for i, r in enumerate(ranks)]
+
+
+def _product(ranks) -> int:
+    product = 1
+    for r in ranks:
+        product *= lookup._PRIMES[r]
+    return product
+
+
+def test_every_five_card_hand_class_matches_score_five() -> None:
+    five = _rank_lists(5)
+    for ranks in five:
+        hand = _offsuit(ranks)
+        assert lookup.unpack(lookup.evaluate(hand)) == score_five(hand).key, ranks
+        if len(set(ranks)) == 5:
+            suited = [Card(rank=r, suit=SUITS[0]) for r in ranks]
+            assert lookup.unpack(lookup.evaluate(suited)) == score_five(suited).key
+
+    # 7462 distinct 5-card hand values, the well-known total.
+    values = {lookup.evaluate(_offsuit(r)) for r in five}
+    values |= {
+        lookup.evaluate([Card(rank=x, suit=SUITS[0]) for x in r])
+        for r in five
+        if len(set(r)) == 5
+    }
+    assert len(values) == 7462
+
+
+def test_every_suited_mask_matches_best_hand() -> None:
+    for size in (5, 6, 7):
+        for ranks in combinations(RANKS, size):
+            hand = [Card(rank=r, suit=SUITS[1]) for r in ranks]
+            assert lookup.unpack(lookup.evaluate(hand)) == best_hand(hand).key
+
+
+@pytest.mark.parametrize("size", [6, 7])
+def test_every_rank_multiset_is_its_best_five_card_subset(size) -> None:
+    _, by_product = lookup._get_tables()
+    for ranks in _rank_lists(size):
+        best_sub = max(by_product[_product(sub)] for sub in combinations(ranks, 5))
+        assert lookup.evaluate(_offsuit(ranks)) == best_sub, ranks
+
+
+def test_random_hands_order_like_best_hand() -> None:
+    rng = random.Random(20261019)
+    deck = make_deck(shuffle=False)
+    for _ in range(2000):
+        a, b = rng.sample(deck, 7), rng.sample(deck, 7)
+        assert lookup.unpack(lookup.evaluate(a)) == best_hand(a).key
+        ka, kb = best_hand(a).key, best_hand(b).key
+        va, vb = lookup.evaluate(a), lookup.evaluate(b)
+        assert (va > vb, va == vb) == (ka > kb, ka == kb)
+
+
+def test_category_of() -> None:
+    value = lookup.evaluate(cards("3H", "4D", "5S", "6C", "7H", "KD", "AS"))
+    assert lookup.category_of(value) == HandCategory.STRAIGHT
+    wheel = lookup.evaluate(cards("AH", "2D", "3S", "4C", "5H"))
+    assert lookup.unpack(wheel) == (HandCategory.STRAIGHT, 5)
+
+
+def test_rejects_wrong_card_counts() -> None:
+    with pytest.raises(ValueError, match="5 to 7"):
+        lookup.evaluate(cards("AH", "2D", "3S", "4C"))
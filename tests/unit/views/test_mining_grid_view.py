@@ -18,6 +18,7 @@ import discord
 import pytest
 
 from services import mining_workflow
+from utils.db import MiningPlayerState
 from utils.mining import grid
 from utils.mining.workshop import WearReport
 from views.mining.grid_mine_view import MineGridView, build_grid_embed
@@ -71,17 +72,24 @@ def test_dpad_layout_rows():
 # ---------------------------------------------------------------------------
 
 
+def _state(**overrides: object) -> MiningPlayerState:
+    fields: dict[str, object] = dict(
+        x=0,
+        y=0,
+        depth=0,
+        energy=60,
+        energy_updated_at=0,
+        seed=4242,
+    )
+    fields.update(overrides)
+    return MiningPlayerState(**fields)  # type: ignore[arg-type]
+
+
 @pytest.mark.asyncio
 async def test_build_grid_embed_shows_position_depth_seed_and_map():
-    with patch.multiple(
-        "views.mining.grid_mine_view.db",
-        get_depth=AsyncMock(return_value=0),
-        get_position=AsyncMock(return_value=(0, 0)),
-        get_world_seed=AsyncMock(return_value=4242),
-        get_discovered_window=AsyncMock(return_value=set()),
-        get_energy=AsyncMock(return_value=(60, 0)),
-        get_equipment=AsyncMock(return_value={}),
-        get_skills=AsyncMock(return_value={}),
+    with patch(
+        "views.mining.grid_mine_view.db.load_mining_player_state",
+        AsyncMock(return_value=_state()),
     ):
         embed = await build_grid_embed(1, 2)
     field_names = [f.name for f in embed.fields]
@@ -95,63 +103,46 @@ async def test_build_grid_embed_shows_position_depth_seed_and_map():
 
 
 @pytest.mark.asyncio
-async def test_build_grid_embed_passes_int_user_id_to_bigint_keyed_reads():
-    """Regression: ``!mine`` crashed because ``build_grid_embed`` passed the
-    *stringified* user id to ``db.get_skills`` — but ``player_skills`` is keyed on
-    a BIGINT ``user_id`` (shared with game_xp), so asyncpg raised ``DataError`` on
-    every dig-navigator open.  The mining tables above it (``mining_player_state``,
-    ``mining_equipment``, ``mining_discovered``) use a TEXT ``user_id`` and take the
-    string.  Pin BOTH halves of that split so neither side regresses; a mocked
-    ``db`` can't surface the type mismatch, only this call-arg contract can.
+async def test_build_grid_embed_reads_state_in_one_call_with_the_int_user_id():
+    """The whole render is one state read.  It takes the raw int user id — the
+    loader derives the TEXT key for the mining tables itself (the BIGINT/TEXT
+    ``player_skills`` split is pinned in ``tests/unit/db``) — and asks for the
+    widest fog-of-war window any light can reveal.
     """
-    reads = {
-        name: AsyncMock(return_value=default)
-        for name, default in (
-            ("get_depth", 0),
-            ("get_position", (0, 0)),
-            ("get_world_seed", 4242),
-            ("get_discovered_window", set()),
-            ("get_energy", (60, 0)),
-            ("get_equipment", {}),
-            ("get_skills", {}),
-        )
-    }
-    with patch.multiple("views.mining.grid_mine_view.db", **reads):
+    load = AsyncMock(return_value=_state())
+    with patch("views.mining.grid_mine_view.db.load_mining_player_state", load):
         await build_grid_embed(1234, 5678)
-
-    # BIGINT-keyed read → the raw int user id (the exact bug).
-    assert reads["get_skills"].await_args.args[0] == 1234
-    assert isinstance(reads["get_skills"].await_args.args[0], int)
-    # TEXT-keyed mining reads → the stringified id (must stay a str).
-    for text_keyed in ("get_depth", "get_position", "get_equipment", "get_energy"):
-        arg = reads[text_keyed].await_args.args[0]
-        assert arg == "1234", f"{text_keyed} should receive the str user id, got {arg!r}"
-        assert isinstance(arg, str)
+    load.assert_awaited_once_with(1234, 5678, window=grid.MAX_REVEAL_RADIUS)
+    assert isinstance(load.await_args.args[0], int)
 
 
 @pytest.mark.asyncio
-async def test_build_grid_embed_widens_window_with_a_brighter_light():
+@pytest.mark.parametrize(("light_radius", "radius"), [(0, 2), (3, 4)])
+async def test_build_grid_embed_clips_discovered_cells_to_the_light(
+    light_radius, radius
+):
     # A diamond-lantern-grade light (light_radius 3 → reveal radius 4, BUG-0026)
-    # widens the discovered-cell query beyond the base 2 — proving the stat is wired.
+    # widens the rendered window beyond the base 2 — proving the stat is wired.
     from utils.equipment import EffectiveStats
 
-    window = AsyncMock(return_value=set())
-    with patch.multiple(
-        "views.mining.grid_mine_view.db",
-        get_depth=AsyncMock(return_value=0),
-        get_position=AsyncMock(return_value=(0, 0)),
-        get_world_seed=AsyncMock(return_value=4242),
-        get_discovered_window=window,
-        get_energy=AsyncMock(return_value=(60, 0)),
-        get_equipment=AsyncMock(return_value={"light": "diamond lantern"}),
-        get_skills=AsyncMock(return_value={}),
-    ), patch(
-        "views.mining.grid_mine_view.character_stats",
-        return_value=EffectiveStats(light_radius=3),
+    state = _state(discovered=frozenset({(1, 1), (4, 0), (-3, 2)}))
+    render = MagicMock(return_value="")
+    with (
+        patch(
+            "views.mining.grid_mine_view.db.load_mining_player_state",
+            AsyncMock(return_value=state),
+        ),
+        patch(
+            "views.mining.grid_mine_view.character_stats",
+            return_value=EffectiveStats(light_radius=light_radius),
+        ),
+        patch("views.mining.grid_mine_view.grid.render_local_map", render),
     ):
         await build_grid_embed(1, 2)
-    # get_discovered_window(suid, guild, depth, x-R, x+R, y-R, y+R) — R must be 4.
-    assert window.await_args.args[3:7] == (-4, 4, -4, 4)
+    discovered = render.call_args.args[4]
+    assert render.call_args.kwargs["radius"] == radius
+    expected = {(1, 1)} if radius == 2 else {(1, 1), (4, 0), (-3, 2)}
+    assert discovered == expected
 
 
 # ---------------------------------------------------------------------------
@@ -130,6 +130,7 @@ def test_select_values_cover_every_platform_subcommand():
         "views",
         "sessions",
         "slow",
+        "queries",
         "automation",
         # Catalogues
         "schemas",
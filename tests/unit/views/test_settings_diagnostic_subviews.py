@@ -58,6 +58,13 @@ def _isolated_state(monkeypatch):
     from utils import db as db_pkg
 
     monkeypatch.setattr(db_pkg, "get_setting", _fake_get_setting)
+
+    async def _fake_get_settings_for_guilds(guild_ids) -> dict:
+        return {
+            gid: {k: v for (g, k), v in _kv.items() if g == gid} for gid in guild_ids
+        }
+
+    monkeypatch.setattr(db_pkg, "get_settings_for_guilds", _fake_get_settings_for_guilds)
     yield {"kv": _kv}
     schema_mod._reset_for_tests()
     for schema in saved_schemas.values():
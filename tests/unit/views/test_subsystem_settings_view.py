@@ -51,6 +51,13 @@ def _isolated_state(monkeypatch):
 
     monkeypatch.setattr(db_pkg, "get_setting", _fake_get_setting)
 
+    async def _fake_get_settings_for_guilds(guild_ids) -> dict:
+        return {
+            gid: {k: v for (g, k), v in _kv.items() if g == gid} for gid in guild_ids
+        }
+
+    monkeypatch.setattr(db_pkg, "get_settings_for_guilds", _fake_get_settings_for_guilds)
+
     # Reset guild_config cache between tests so resolutions reflect _kv.
     from core.runtime import guild_config
 
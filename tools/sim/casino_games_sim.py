@@ -58,7 +58,8 @@ _REPO = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__
 sys.path.insert(0, os.path.join(_REPO, "disbot"))
 
 from utils.poker.engine import Action, Player, PokerGame  # noqa: E402
-from utils.poker.evaluate import HandCategory, best_hand  # noqa: E402
+from utils.poker.evaluate import HandCategory  # noqa: E402
+from utils.poker.lookup import category_of, evaluate  # noqa: E402
 
 # --------------------------------------------------------------------------- #
 # Part 1 — design scorecard
@@ -280,7 +281,7 @@ def simulate(hands: int, seed: int) -> None:
         if len(game.board) == 5:
             for p in game.players:
                 if p.in_hand:
-                    cat_counter[best_hand(p.hole + game.board).category] += 1
+                    cat_counter[category_of(evaluate(p.hole + game.board))] += 1
 
     print("=" * 78)
     print(f"POKER ENGINE MONTE-CARLO  ({total_hands_played} hands, {n_players}-handed)")